@@ -1,6 +1,6 @@
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import PlainTextResponse, RedirectResponse
 
 from src.api.assignments.router import router as assignment_router
 from src.api.auth.router import router as auth_router
@@ -15,10 +15,20 @@ from src.api.periods.router import router as period_router
 from src.api.assignments.router import router as assignment_router
 from src.api.dates.router import router as dates_router
 from src.api.admins.router import router as admins_router
+from src.api.assignments.dependencies import job_runner
+from src.api.emails.dependencies import start_email_worker, stop_email_worker
+from src.api.exceptions import EntityNotFound
+from src.api.groups.dependencies import close_storage_client
+from src.api.utils.server_timing import ServerTimingMiddleware
 
 from src.config.config import api_config
-from src.config.database.database import init_default_values
+from src.config.database.database import (
+    dispose_async_engine,
+    get_pool_stats,
+    init_default_values,
+)
 from src.config.logging import logger
+from src.config.metrics import metrics
 
 
 api_description = """
@@ -85,7 +95,40 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["Authorization", "Content-Type"],
+    expose_headers=["Server-Timing"],
 )
+app.add_middleware(ServerTimingMiddleware)
+
+
+@app.on_event("startup")
+async def startup_email_worker():
+    if api_config.email_worker_enabled:
+        logger.info("Starting the email outbox worker")
+        start_email_worker()
+
+
+@app.on_event("shutdown")
+def shutdown_job_runner():
+    logger.info("Shutting down the assignment job runner")
+    job_runner.shutdown()
+
+
+@app.on_event("shutdown")
+async def shutdown_async_engine():
+    logger.info("Closing the async database connections")
+    await dispose_async_engine()
+
+
+@app.on_event("shutdown")
+async def shutdown_storage_client():
+    logger.info("Closing the storage connections")
+    await close_storage_client()
+
+
+@app.on_event("shutdown")
+async def shutdown_email_worker():
+    logger.info("Stopping the email outbox worker")
+    await stop_email_worker()
 
 
 @app.get("/", description="This endpoint redirects to docs")
@@ -97,3 +140,31 @@ async def root(request: Request):
 @app.get("/version", description="Returns the current version of the api")
 async def version():
     return api_config.api_version
+
+
+def require_metrics_enabled():
+    """
+    Los endpoints de metricas no tienen autenticacion, por lo que solo
+    responden si METRICS_ENABLED esta activo
+    """
+    if not api_config.metrics_enabled:
+        raise EntityNotFound("Not Found")
+
+
+@app.get(
+    "/health/database",
+    description="Returns the usage of the database connection pool",
+    dependencies=[Depends(require_metrics_enabled)],
+)
+async def database_health():
+    return get_pool_stats()
+
+
+@app.get(
+    "/metrics",
+    description="Returns the api metrics in the Prometheus text format",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_metrics_enabled)],
+)
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
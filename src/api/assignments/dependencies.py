@@ -0,0 +1,36 @@
+# =============================================================================
+# IMPORTANTE: Este modulo de Python incluye todas las dependencias.
+# No esta destinado a contener clases; en su lugar, debe incluir funciones
+# para ser importadas.
+# Asegurate de seguir esta estructura para mantener la consistencia
+# =============================================================================
+
+
+from fastapi import Query
+
+from src.api.assignments.jobs import AssignmentJobRunner
+from src.config.config import api_config
+from src.core.algorithms.solver_options import SolverOptions
+
+# Un unico pool de procesos por worker de uvicorn
+job_runner = AssignmentJobRunner(max_workers=api_config.assignment_workers)
+
+
+def get_job_runner():
+    yield job_runner
+
+
+def get_solver_options(
+    time_limit: float | None = Query(default=None, gt=0),
+    mip_gap: float | None = Query(default=None, ge=0, le=1),
+    threads: int | None = Query(default=None, gt=0),
+    node_limit: int | None = Query(default=None, gt=0),
+):
+    # Si no se indica un limite de tiempo se usa el configurado, de forma que
+    # ningun request quede esperando al solver indefinidamente
+    return SolverOptions(
+        time_limit=time_limit or api_config.solver_time_limit,
+        mip_gap=mip_gap,
+        threads=threads,
+        node_limit=node_limit,
+    )
@@ -1,3 +1,8 @@
 class MethodNotFound(Exception):
     def __init__(self, message: str):
         super().__init__(message)
+
+
+class JobNotFound(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
@@ -0,0 +1,124 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Callable
+
+from src.api.assignments.models import JobStatus
+from src.api.assignments.repository import AssignmentJobRepository
+from src.api.assignments.telemetry import SolverRunRecorder
+from src.config.logging import logger
+from src.core.algorithms.solver_stats import collect_solver_stats
+
+
+def _solve_with_stats(solve: Callable, *args) -> tuple[Any, list[dict]]:
+    """
+    Ejecuta solve(*args) y devuelve el resultado junto con la telemetria de los
+    solvers
+    """
+    with collect_solver_stats() as collected:
+        result = solve(*args)
+    return result, [stats.to_json() for stats in collected]
+
+
+class AssignmentJobRunner:
+    """
+    Ejecuta los algoritmos de asignacion en un pool de procesos.
+
+    Los solvers (SCIP, CBC y networkx) son CPU-bound y bloquean el event loop de
+    uvicorn si se ejecutan dentro de un handler async. El pool se crea de forma
+    lazy la primera vez que se lo necesita y vive lo mismo que la aplicacion.
+    Se usa el contexto "spawn" para no hacer fork de un proceso con threads
+    (uvicorn, pool de conexiones) en curso.
+    """
+
+    def __init__(self, max_workers: int = 1) -> None:
+        self._max_workers = max_workers
+        self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers, mp_context=get_context("spawn")
+            )
+        return self._pool
+
+    async def run_solver(self, solve: Callable, *args) -> Any:
+        """Ejecuta solve(*args) en el pool sin bloquear el event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), solve, *args)
+
+    async def run_measured_solver(
+        self, recorder: SolverRunRecorder, solve: Callable, *args
+    ) -> Any:
+        """
+        Ejecuta solve(*args) en el pool y deja en el recorder la telemetria de
+        los solvers. El tiempo que no se paso dentro de los solvers (enviar
+        las entradas y el resultado entre procesos) se registra como transfer.
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        result, solver_stats = await loop.run_in_executor(
+            self._get_pool(), _solve_with_stats, solve, *args
+        )
+        elapsed = time.perf_counter() - start
+
+        solver_time = sum(sum(stats["timings"].values()) for stats in solver_stats)
+        recorder.timings.add("transfer", max(elapsed - solver_time, 0.0))
+        recorder.solver_stats.extend(solver_stats)
+        return result
+
+    async def run_job(
+        self,
+        job_id: int,
+        repository: AssignmentJobRepository,
+        solve: Callable,
+        args: tuple,
+        on_result: Callable[[Any], Any],
+        recorder: SolverRunRecorder | None = None,
+    ):
+        """
+        Ejecuta un trabajo ya registrado, actualizando su estado y progreso.
+
+        on_result recibe el resultado del solver, persiste lo que haga falta y
+        devuelve el contenido (serializable a json) que se guarda en el trabajo.
+        Si se indica un recorder, la telemetria de la corrida se guarda
+        asociada al trabajo.
+        """
+        try:
+            repository.update_job(
+                job_id, {"status": JobStatus.RUNNING.value, "progress": 10}
+            )
+            if recorder is None:
+                result = await self.run_solver(solve, *args)
+            else:
+                result = await self.run_measured_solver(recorder, solve, *args)
+
+            repository.update_job(job_id, {"progress": 90})
+            if recorder is None:
+                content = on_result(result)
+            else:
+                with recorder.phase("serialization"):
+                    content = on_result(result)
+                recorder.save(job_id)
+
+            repository.update_job(
+                job_id,
+                {
+                    "status": JobStatus.FINISHED.value,
+                    "progress": 100,
+                    "result": content,
+                },
+            )
+            logger.info(f"Assignment job {job_id} finished")
+        except Exception as e:
+            logger.error(f"Assignment job {job_id} failed because of: {str(e)}")
+            repository.update_job(
+                job_id, {"status": JobStatus.FAILED.value, "error": str(e)}
+            )
+
+    def shutdown(self):
+        """Libera los procesos del pool"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
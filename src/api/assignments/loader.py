@@ -0,0 +1,309 @@
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from src.api.dates.models import DateSlot as DateSlotModel
+from src.api.dates.models import GroupDateSlot, TutorDateSlot
+from src.api.forms.models import FormPreferences
+from src.api.groups.models import Group, association_table
+from src.api.topics.models import Category, Topic as TopicModel, TopicTutorPeriod
+from src.api.tutors.models import TutorPeriod
+from src.api.users.models import User
+from src.core.algorithms.solver_stats import PhaseTimings
+from src.core.date_slots import DateSlot
+from src.core.group import AssignedGroup, UnassignedGroup
+from src.core.group_form_answer import GroupFormAnswer
+from src.core.snapshot import PeriodSnapshot
+from src.core.topic import Topic
+from src.core.tutor import Tutor
+
+
+class PeriodSnapshotLoader:
+    """
+    Arma las entradas de los algoritmos de asignacion de un cuatrimestre con
+    pocas consultas que solo traen las columnas que usan los algoritmos, sin
+    cargar los modelos de la base ni sus relaciones.
+
+    Cada parte del cuatrimestre se carga solo si se pide:
+        - answers: respuestas del formulario (grupos incompletos).
+        - groups: grupos sin tema ni tutor, temas y tutores (grupos y tutores).
+        - dates: fechas, tutores y evaluadores con sus fechas disponibles y
+          grupos del cuatrimestre (fechas de exposicion).
+    """
+
+    def __init__(self, sess: Session, timings: Optional[PhaseTimings] = None):
+        self.Session = sess
+        # Las consultas se miden como db_fetch y el armado de los objetos como
+        # mapping, igual que cuando las entradas se armaban con los servicios
+        self._timings = timings if timings is not None else PhaseTimings()
+
+    def load(
+        self,
+        period_id: str,
+        answers: bool = False,
+        groups: bool = False,
+        dates: bool = False,
+    ) -> PeriodSnapshot:
+        snapshot = PeriodSnapshot(period_id)
+        with self.Session() as session:
+            topics = {}
+            if groups or dates:
+                topics = self._load_topics(session, period_id)
+                snapshot.topics = list(topics.values())
+                tutors = self._load_tutors(session, period_id, topics, dates)
+                snapshot.tutors = list(tutors.values())
+            if groups:
+                snapshot.unassigned_groups = self._load_unassigned_groups(
+                    session, period_id, topics
+                )
+            if dates:
+                snapshot.slots = self._load_slots(session, period_id)
+                snapshot.assigned_groups = self._load_assigned_groups(
+                    session, period_id, tutors
+                )
+            if answers:
+                snapshot.answers = self._load_answers(session, period_id, topics)
+
+        return snapshot
+
+    def _fetch(self, session, query):
+        with self._timings.phase("db_fetch"):
+            return session.execute(query).all()
+
+    def _load_topics(self, session, period_id: str) -> dict[int, Topic]:
+        """Temas del cuatrimestre indexados por id (cada tema una sola vez)"""
+        rows = self._fetch(
+            session,
+            select(TopicModel.id, TopicModel.name, Category.name)
+            .join(Category, Category.id == TopicModel.category_id)
+            .join(TopicTutorPeriod, TopicTutorPeriod.topic_id == TopicModel.id)
+            .join(TutorPeriod, TutorPeriod.id == TopicTutorPeriod.tutor_period_id)
+            .where(TutorPeriod.period_id == period_id)
+            .distinct()
+            .order_by(TopicModel.id),
+        )
+        with self._timings.phase("mapping"):
+            return {
+                id: Topic(id=id, title=name, category=category, capacity=1)
+                for id, name, category in rows
+            }
+
+    def _load_tutors(
+        self, session, period_id: str, topics: dict[int, Topic], with_dates: bool
+    ) -> dict[int, Tutor]:
+        """Tutores del cuatrimestre indexados por id, con sus temas y fechas"""
+        rows = self._fetch(
+            session,
+            select(
+                TutorPeriod.id,
+                TutorPeriod.tutor_id,
+                TutorPeriod.capacity,
+                TutorPeriod.is_evaluator,
+                User.name,
+                User.last_name,
+                User.email,
+            )
+            .join(User, User.id == TutorPeriod.tutor_id)
+            .where(TutorPeriod.period_id == period_id)
+            .order_by(TutorPeriod.tutor_id),
+        )
+        topic_rows = self._fetch(
+            session,
+            select(TopicTutorPeriod.tutor_period_id, TopicTutorPeriod.topic_id)
+            .join(TutorPeriod, TutorPeriod.id == TopicTutorPeriod.tutor_period_id)
+            .where(TutorPeriod.period_id == period_id),
+        )
+        date_rows = []
+        if with_dates:
+            # Solo las fechas sin asignar del cuatrimestre
+            date_rows = self._fetch(
+                session,
+                select(TutorDateSlot.tutor_id, TutorDateSlot.slot)
+                .where(
+                    TutorDateSlot.period_id == period_id,
+                    TutorDateSlot.assigned == False,
+                )
+                .order_by(TutorDateSlot.slot),
+            )
+
+        with self._timings.phase("mapping"):
+            topics_by_tutor_period = defaultdict(list)
+            for tutor_period_id, topic_id in topic_rows:
+                topics_by_tutor_period[tutor_period_id].append(topics[topic_id])
+            dates_by_tutor = defaultdict(list)
+            for tutor_id, slot in date_rows:
+                dates_by_tutor[tutor_id].append(DateSlot(start_time=slot))
+
+            return {
+                tutor_id: Tutor(
+                    id=tutor_id,
+                    period_id=tutor_period_id,
+                    name=name,
+                    last_name=last_name,
+                    email=email,
+                    capacity=capacity,
+                    topics=topics_by_tutor_period[tutor_period_id],
+                    available_dates=dates_by_tutor[tutor_id],
+                    is_evaluator=is_evaluator,
+                )
+                for (
+                    tutor_period_id,
+                    tutor_id,
+                    capacity,
+                    is_evaluator,
+                    name,
+                    last_name,
+                    email,
+                ) in rows
+            }
+
+    def _load_unassigned_groups(
+        self, session, period_id: str, topics: dict[int, Topic]
+    ) -> list[UnassignedGroup]:
+        """
+        Grupos sin tema ni tutor, con sus preferencias. Se excluyen los de otros
+        cuatrimestres pero no los que todavia no tienen cuatrimestre.
+        """
+        without_tutor = (
+            or_(Group.period_id == period_id, Group.period_id.is_(None)),
+            Group.assigned_topic_id.is_(None),
+            Group.tutor_period_id.is_(None),
+        )
+        rows = self._fetch(
+            session,
+            select(Group.id, Group.group_number, Group.preferred_topics)
+            .where(*without_tutor)
+            .order_by(Group.id),
+        )
+        student_rows = self._fetch(
+            session,
+            select(association_table.c.group_id, association_table.c.student_id)
+            .join(Group, Group.id == association_table.c.group_id)
+            .where(*without_tutor),
+        )
+
+        with self._timings.phase("mapping"):
+            students_by_group = defaultdict(list)
+            for group_id, student_id in student_rows:
+                students_by_group[group_id].append(student_id)
+
+            return [
+                UnassignedGroup(
+                    id=id,
+                    students=students_by_group[id],
+                    topics=[topics[topic_id] for topic_id in preferred_topics or []],
+                    group_number=group_number,
+                )
+                for id, group_number, preferred_topics in rows
+            ]
+
+    def _load_slots(self, session, period_id: str) -> list[DateSlot]:
+        """Fechas del cuatrimestre que todavia no fueron asignadas"""
+        rows = self._fetch(
+            session,
+            select(DateSlotModel.slot)
+            .where(
+                DateSlotModel.period_id == period_id,
+                DateSlotModel.assigned == False,
+            )
+            .order_by(DateSlotModel.slot),
+        )
+        with self._timings.phase("mapping"):
+            return [DateSlot(start_time=slot) for (slot,) in rows]
+
+    def _load_assigned_groups(
+        self, session, period_id: str, tutors: dict[int, Tutor]
+    ) -> list[AssignedGroup]:
+        """Grupos del cuatrimestre con su tutor y sus fechas disponibles"""
+        rows = self._fetch(
+            session,
+            select(
+                Group.id,
+                Group.group_number,
+                Group.reviewer_id,
+                Group.exhibition_date,
+                TutorPeriod.tutor_id,
+            )
+            .outerjoin(TutorPeriod, TutorPeriod.id == Group.tutor_period_id)
+            .where(Group.period_id == period_id)
+            .order_by(Group.id),
+        )
+        date_rows = self._fetch(
+            session,
+            select(GroupDateSlot.group_id, GroupDateSlot.slot)
+            .join(Group, Group.id == GroupDateSlot.group_id)
+            .where(Group.period_id == period_id)
+            .order_by(GroupDateSlot.slot),
+        )
+
+        with self._timings.phase("mapping"):
+            dates_by_group = defaultdict(list)
+            for group_id, slot in date_rows:
+                dates_by_group[group_id].append(DateSlot(start_time=slot))
+
+            return [
+                AssignedGroup(
+                    id=id,
+                    tutor=tutors.get(tutor_id),
+                    reviewer_id=reviewer_id,
+                    available_dates=dates_by_group[id],
+                    group_number=group_number,
+                    assigned_date=(
+                        DateSlot(start_time=exhibition_date)
+                        if exhibition_date
+                        else None
+                    ),
+                )
+                for id, group_number, reviewer_id, exhibition_date, tutor_id in rows
+            ]
+
+    def _load_answers(
+        self, session, period_id: str, topics: dict[int, Topic]
+    ) -> list[GroupFormAnswer]:
+        """
+        Respuestas del formulario agrupadas por respuesta. Los temas elegidos
+        que no son del cuatrimestre se traen en una sola consulta aparte.
+        """
+        rows = self._fetch(
+            session,
+            select(
+                FormPreferences.answer_id,
+                User.email,
+                FormPreferences.topic_1,
+                FormPreferences.topic_2,
+                FormPreferences.topic_3,
+            )
+            .join(User, User.id == FormPreferences.user_id)
+            .where(FormPreferences.period_id == period_id),
+        )
+        missing = {
+            topic_id for row in rows for topic_id in row[2:] if topic_id not in topics
+        }
+        topic_rows = []
+        if missing:
+            topic_rows = self._fetch(
+                session,
+                select(TopicModel.id, TopicModel.name, Category.name)
+                .join(Category, Category.id == TopicModel.category_id)
+                .where(TopicModel.id.in_(missing)),
+            )
+
+        with self._timings.phase("mapping"):
+            topics = {
+                **topics,
+                **{
+                    id: Topic(id=id, title=name, category=category)
+                    for id, name, category in topic_rows
+                },
+            }
+            answers = {}
+            for answer_id, email, *topic_ids in rows:
+                id = str(answer_id.timestamp())
+                if id not in answers:
+                    answers[id] = GroupFormAnswer(id)
+                answers[id].add_student(email)
+                answers[id].add_topics([topics[topic_id] for topic_id in topic_ids])
+
+            return list(answers.values())
@@ -0,0 +1,24 @@
+from src.api.groups.schemas import AssignedDateResult
+from src.core.date_slots import DateSlot
+from src.core.result import DateSlotAssignment, DateSlotsAssignmentResult
+
+
+class AssignmentMapper:
+
+    @staticmethod
+    def map_json_to_date_result(result: dict) -> DateSlotsAssignmentResult:
+        """Mapea el resultado guardado de un trabajo de fechas hacia clases nativas"""
+        date_result = AssignedDateResult.model_validate(result)
+        return DateSlotsAssignmentResult(
+            status=date_result.status,
+            assignments=[
+                DateSlotAssignment(
+                    group_id=assignment.group_id,
+                    group_number=assignment.group_number,
+                    tutor_id=assignment.tutor_id,
+                    evaluator_id=assignment.evaluator_id,
+                    date=DateSlot(start_time=assignment.date),
+                )
+                for assignment in date_result.assigments
+            ],
+        )
@@ -0,0 +1,73 @@
+from enum import Enum as PyEnum
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    JSON,
+    Index,
+)
+from sqlalchemy.sql import func
+
+from src.config.database.base import Base
+
+
+class JobStatus(PyEnum):
+    """Estados por los que pasa un trabajo de asignacion"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+
+
+class JobKind(PyEnum):
+    """Algoritmos de asignacion y tareas que pueden ejecutarse como trabajo"""
+
+    INCOMPLETE_GROUPS = "incomplete-groups"
+    GROUP_TOPIC_TUTOR = "group-topic-tutor"
+    DATE_ASSIGNMENT = "date-assigment"
+    DATE_NOTIFICATION = "date-notification"
+
+
+class AssignmentJob(Base):
+    __tablename__ = "assignment_jobs"
+
+    id = Column(Integer, autoincrement=True, primary_key=True)
+    period_id = Column(String, ForeignKey("periods.id", ondelete="CASCADE"))
+    kind = Column(String, nullable=False)
+    status = Column(String, nullable=False, default=JobStatus.PENDING.value)
+    progress = Column(Integer, default=0)
+    params = Column(JSON, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime(), server_default=func.now())
+    updated_at = Column(DateTime(), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (Index("ix_assignment_jobs_period_kind", "period_id", "kind"),)
+
+
+class SolverRun(Base):
+    """Telemetria de una ejecucion de un algoritmo de asignacion"""
+
+    __tablename__ = "solver_runs"
+
+    id = Column(Integer, autoincrement=True, primary_key=True)
+    period_id = Column(String, ForeignKey("periods.id", ondelete="CASCADE"))
+    job_id = Column(
+        Integer, ForeignKey("assignment_jobs.id", ondelete="SET NULL"), nullable=True
+    )
+    solver = Column(String, nullable=False)
+    status = Column(String, nullable=True)
+    gap = Column(Float, nullable=True)
+    nodes = Column(Integer, nullable=True)
+    variables = Column(Integer, nullable=True)
+    constraints = Column(Integer, nullable=True)
+    inputs = Column(JSON, nullable=False)
+    timings = Column(JSON, nullable=False)
+    total_time = Column(Float, nullable=False)
+    created_at = Column(DateTime(), server_default=func.now())
+
+    __table_args__ = (Index("ix_solver_runs_period_solver", "period_id", "solver"),)
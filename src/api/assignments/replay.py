@@ -0,0 +1,107 @@
+"""
+Reproduce una corrida de asignacion a partir de un snapshot del cuatrimestre.
+
+El snapshot se descarga de GET /assignments/snapshot y se puede correr con
+cualquier algoritmo sin acceso a la base de datos, opcionalmente midiendo con
+cProfile y escribiendo el modelo para analizarlo con otro solver:
+
+    python -m src.api.assignments.replay 1C2024.jsonl delivery-lp \\
+        --time-limit 60 --profile delivery.prof --write-model delivery.mps
+"""
+
+import argparse
+import cProfile
+import json
+import pstats
+import sys
+
+from src.api.assignments.service import AssignmentService
+from src.core.algorithms.solver_options import SolverOptions
+from src.core.algorithms.solver_stats import collect_solver_stats
+from src.core.snapshot import PeriodSnapshot
+
+SOLVERS = ("incomplete-groups-lp", "group-tutor-lp", "group-tutor-flow", "delivery-lp")
+
+
+def replay(snapshot: PeriodSnapshot, solver: str, options: SolverOptions, **params):
+    """
+    Corre el algoritmo solver con las entradas del snapshot, de la misma forma
+    que lo hace la api, y devuelve el resultado y las estadisticas del solver.
+    """
+    service = AssignmentService()
+    with collect_solver_stats() as collected:
+        if solver == "incomplete-groups-lp":
+            result = service.assignment_incomplete_groups(snapshot.answers, options)
+        elif solver in ("group-tutor-lp", "group-tutor-flow"):
+            result = service.assignment_group_topic_tutor(
+                snapshot.unassigned_groups,
+                snapshot.topics,
+                snapshot.tutors,
+                params.get("balance_limit", 5),
+                solver.split("-")[-1],
+                options,
+            )
+        else:
+            result = service.assignment_dates(
+                snapshot.slots,
+                snapshot.tutors,
+                snapshot.evaluators(),
+                snapshot.assigned_groups,
+                params.get("max_groups_per_week", 5),
+                params.get("max_dif_evaluators", 5),
+                options=options,
+            )
+
+    return result, [stats.to_json() for stats in collected]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("snapshot", help="Archivo .jsonl o .jsonl.gz del snapshot")
+    parser.add_argument("solver", choices=SOLVERS)
+    parser.add_argument("--time-limit", type=float)
+    parser.add_argument("--mip-gap", type=float)
+    parser.add_argument("--threads", type=int)
+    parser.add_argument("--node-limit", type=int)
+    parser.add_argument("--balance-limit", type=int, default=5)
+    parser.add_argument("--max-groups-per-week", type=int, default=5)
+    parser.add_argument("--max-dif-evaluators", type=int, default=5)
+    parser.add_argument("--profile", help="Archivo donde guardar la salida de cProfile")
+    parser.add_argument(
+        "--write-model", help="Archivo .mps o .lp donde escribir el modelo"
+    )
+    args = parser.parse_args(argv)
+    if args.write_model and args.solver == "group-tutor-flow":
+        parser.error("group-tutor-flow is a network flow, it has no model to write")
+
+    snapshot = PeriodSnapshot.load(args.snapshot)
+    options = SolverOptions(
+        time_limit=args.time_limit,
+        mip_gap=args.mip_gap,
+        threads=args.threads,
+        node_limit=args.node_limit,
+        model_path=args.write_model,
+    )
+    params = {
+        "balance_limit": args.balance_limit,
+        "max_groups_per_week": args.max_groups_per_week,
+        "max_dif_evaluators": args.max_dif_evaluators,
+    }
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler is not None:
+        profiler.enable()
+    _, stats = replay(snapshot, args.solver, options, **params)
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(
+            25
+        )
+
+    for solver_stats in stats:
+        print(json.dumps(solver_stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+from sqlalchemy import desc, update
+from sqlalchemy.orm import Session
+
+from src.api.assignments.exceptions import JobNotFound
+from src.api.assignments.models import AssignmentJob, JobStatus, SolverRun
+
+
+class AssignmentJobRepository:
+
+    def __init__(self, sess: Session):
+        self.Session = sess
+
+    def add_job(self, job: AssignmentJob) -> AssignmentJob:
+        """Registra un nuevo trabajo de asignacion"""
+        with self.Session() as session:
+            session.add(job)
+            session.flush()
+            session.refresh(job)
+            session.expunge(job)
+
+        return job
+
+    def update_job(self, job_id: int, attributes: dict):
+        """Actualiza el trabajo a partir de los atributos que sean provistos"""
+        stmt = (
+            update(AssignmentJob).where(AssignmentJob.id == job_id).values(**attributes)
+        )
+        with self.Session() as session:
+            session.execute(stmt)
+            session.flush()
+
+    def get_job_by_id(self, job_id: int) -> AssignmentJob:
+        """Devuelve el trabajo basado en un id"""
+        with self.Session() as session:
+            job = (
+                session.query(AssignmentJob)
+                .filter(AssignmentJob.id == job_id)
+                .one_or_none()
+            )
+            if job is None:
+                raise JobNotFound(f"Job {job_id} not found in db")
+
+            session.expunge(job)
+
+        return job
+
+    def get_jobs_by_period(
+        self, period_id: str, kind: str | None = None
+    ) -> list[AssignmentJob]:
+        """Devuelve los trabajos de un cuatrimestre, del mas nuevo al mas viejo"""
+        with self.Session() as session:
+            query = session.query(AssignmentJob).filter(
+                AssignmentJob.period_id == period_id
+            )
+            if kind:
+                query = query.filter(AssignmentJob.kind == kind)
+
+            jobs = query.order_by(desc(AssignmentJob.id)).all()
+            session.expunge_all()
+
+        return jobs
+
+    def get_last_finished_job(self, period_id: str, kind: str) -> AssignmentJob | None:
+        """Devuelve el ultimo trabajo terminado de un tipo en un cuatrimestre"""
+        with self.Session() as session:
+            job = (
+                session.query(AssignmentJob)
+                .filter(AssignmentJob.period_id == period_id)
+                .filter(AssignmentJob.kind == kind)
+                .filter(AssignmentJob.status == JobStatus.FINISHED.value)
+                .order_by(desc(AssignmentJob.id))
+                .first()
+            )
+            if job is not None:
+                session.expunge(job)
+
+        return job
+
+
+class SolverRunRepository:
+
+    def __init__(self, sess: Session):
+        self.Session = sess
+
+    def add_runs(self, runs: list[SolverRun]):
+        """
+        Registra la telemetria de las ejecuciones de los solvers dentro de un
+        savepoint: si falla solo se descarta la telemetria y no lo que el
+        request ya escribio en la misma transaccion
+        """
+        with self.Session() as session:
+            with session.begin_nested():
+                session.add_all(runs)
+
+    def get_runs_by_period(
+        self, period_id: str, solver: str | None = None
+    ) -> list[SolverRun]:
+        """
+        Devuelve las ejecuciones de un cuatrimestre, de la mas nueva a la mas
+        vieja
+        """
+        with self.Session() as session:
+            query = session.query(SolverRun).filter(SolverRun.period_id == period_id)
+            if solver:
+                query = query.filter(SolverRun.solver == solver)
+
+            runs = query.order_by(desc(SolverRun.id)).all()
+            session.expunge_all()
+
+        return runs
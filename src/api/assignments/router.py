@@ -1,18 +1,35 @@
-from fastapi import APIRouter, Depends, status, Query, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, status, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing_extensions import Annotated
 
+from src.api.assignments.dependencies import get_job_runner, get_solver_options
+from src.api.assignments.exceptions import JobNotFound
+from src.api.assignments.jobs import AssignmentJobRunner
+from src.api.assignments.loader import PeriodSnapshotLoader
+from src.api.assignments.mapper import AssignmentMapper
+from src.api.assignments.models import AssignmentJob, JobKind, JobStatus
+from src.api.assignments.repository import (
+    AssignmentJobRepository,
+    SolverRunRepository,
+)
+from src.api.assignments.schemas import (
+    AssignmentJobList,
+    AssignmentJobResponse,
+    SolverRunList,
+)
 from src.api.assignments.service import AssignmentService
+from src.api.assignments.telemetry import SolverRunRecorder
 from src.api.auth.dependencies import authorization
 from src.api.auth.jwt import InvalidJwt
 from src.api.auth.service import AuthenticationService
-from src.api.dates.mapper import DateSlotsMapper
-from src.api.dates.repository import DateSlotRepository
+from src.api.dates.repository import AsyncDateSlotRepository, DateSlotRepository
 from src.api.dates.service import DateSlotsService
-from src.api.exceptions import ServerError
-from src.api.forms.repository import FormRepository
-from src.api.forms.service import FormService
-from src.api.groups.mapper import GroupMapper
+from src.api.emails.dependencies import get_email_outbox
+from src.api.emails.service import EmailOutboxService
+from src.api.exceptions import EntityNotFound, ServerError
 from src.api.groups.repository import GroupRepository
 from src.api.groups.schemas import (
     AssignedDateResult,
@@ -21,21 +38,83 @@ from src.api.groups.schemas import (
     AssignmentResult,
 )
 from src.api.groups.service import GroupService
-from src.api.topics.mapper import TopicMapper
-from src.api.topics.repository import TopicRepository
-from src.api.topics.service import TopicService
-from src.api.tutors.mapper import TutorMapper
-from src.api.tutors.repository import TutorRepository
-from src.api.tutors.service import TutorService
 from src.api.users.exceptions import InvalidCredentials
 from src.api.utils.response_builder import ResponseBuilder
-from src.config.database.database import get_db
+from src.config.database.database import BackgroundSession, get_async_db, get_db
 from src.config.logging import logger
+from src.core.algorithms.solver_options import SolverOptions
 from src.core.date_slots import DateSlot
 
 
 router = APIRouter(prefix="/assignments", tags=["Assignments"])
 
+# Algoritmos de los que se guarda la telemetria de sus ejecuciones
+SOLVER_PATTERN = "^(incomplete-groups-lp|group-tutor-lp|group-tutor-flow|delivery-lp)$"
+
+
+def _get_incomplete_groups_inputs(session, period_id, recorder):
+    """Obtiene las respuestas del formulario de un cuatrimestre"""
+    loader = PeriodSnapshotLoader(session, recorder.timings)
+    return loader.load(period_id, answers=True).answers
+
+
+def _save_incomplete_groups_result(session, period_id):
+    """Devuelve el callback que persiste los grupos formados por el algoritmo"""
+
+    def on_result(group_result):
+        group_service = GroupService(GroupRepository(session))
+        group_service.create_basic_groups(group_result, period_id)
+        return [
+            {
+                "id": group.id,
+                "students": group.students,
+                "topics": group.get_topic_ids(),
+            }
+            for group in group_result
+        ]
+
+    return on_result
+
+
+def _get_group_topic_tutor_inputs(session, period_id, recorder):
+    """Obtiene los grupos, temas y tutores de un cuatrimestre"""
+    loader = PeriodSnapshotLoader(session, recorder.timings)
+    snapshot = loader.load(period_id, groups=True)
+    return snapshot.unassigned_groups, snapshot.topics, snapshot.tutors
+
+
+def _get_dates_inputs(session, period_id, recorder):
+    """Obtiene las fechas, tutores, evaluadores y grupos de un cuatrimestre"""
+    loader = PeriodSnapshotLoader(session, recorder.timings)
+    snapshot = loader.load(period_id, dates=True)
+    return (
+        snapshot.slots,
+        snapshot.tutors,
+        snapshot.evaluators(),
+        snapshot.assigned_groups,
+    )
+
+
+def _get_previous_dates_result(session, period_id):
+    """Obtiene el ultimo resultado de fechas de un cuatrimestre, si existe"""
+    repository = AssignmentJobRepository(session)
+    job = repository.get_last_finished_job(period_id, JobKind.DATE_ASSIGNMENT.value)
+    if job is None or job.result is None:
+        return None
+
+    return AssignmentMapper.map_json_to_date_result(job.result)
+
+
+def _get_snapshot(session, period_id):
+    """Arma el snapshot con las mismas entradas que reciben los algoritmos"""
+    loader = PeriodSnapshotLoader(session)
+    return loader.load(period_id, answers=True, groups=True, dates=True)
+
+
+def _to_json_result(result):
+    """Serializa el resultado de un algoritmo para guardarlo en el trabajo"""
+    return jsonable_encoder(result.to_json())
+
 
 @router.post(
     "/incomplete-groups",
@@ -65,22 +144,28 @@ router = APIRouter(prefix="/assignments", tags=["Assignments"])
 async def assign_incomplete_groups(
     session: Annotated[Session, Depends(get_db)],
     authorization: Annotated[dict, Depends(authorization)],
+    job_runner: Annotated[AssignmentJobRunner, Depends(get_job_runner)],
+    options: Annotated[SolverOptions, Depends(get_solver_options)],
     period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
 ):
-    """Endpoint que ejecuta el algoritmo que completa aquellos grupos que no son de a 4"""
+    """
+    Endpoint que ejecuta el algoritmo que completa aquellos grupos que no son
+    de a 4
+    """
     try:
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_only_admin(authorization["token"])
 
-        form_service = FormService(FormRepository(session))
-        topic_repository = TopicRepository(session)
-        group_service = GroupService(GroupRepository(session))
-
-        answers = form_service.get_answers(topic_repository, period_id)
+        recorder = SolverRunRecorder(SolverRunRepository(session), period_id)
+        answers = _get_incomplete_groups_inputs(session, period_id, recorder)
         service = AssignmentService()
 
-        group_result = service.assignment_incomplete_groups(answers)
-        group_service.create_basic_groups(group_result, period_id)
+        group_result = await job_runner.run_measured_solver(
+            recorder, service.assignment_incomplete_groups, answers, options
+        )
+        with recorder.phase("serialization"):
+            _save_incomplete_groups_result(session, period_id)(group_result)
+        recorder.save()
 
         return Response(status_code=status.HTTP_202_ACCEPTED, content="Created")
     except Exception as e:
@@ -117,38 +202,41 @@ async def assign_incomplete_groups(
 async def assign_group_topic_tutor(
     session: Annotated[Session, Depends(get_db)],
     authorization: Annotated[dict, Depends(authorization)],
+    job_runner: Annotated[AssignmentJobRunner, Depends(get_job_runner)],
+    options: Annotated[SolverOptions, Depends(get_solver_options)],
     period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
     balance_limit: int = Query(gt=0, default=5),
     method: str = Query(pattern="^(lp|flow)$", default="lp"),
 ):
     try:
-        """Ejecuta el algoritmo de grupos, temas y tutores aplicando un metodo preferido"""
+        """
+        Ejecuta el algoritmo de grupos, temas y tutores aplicando un metodo
+        preferido
+        """
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_only_admin(authorization["token"])
 
-        topic_service = TopicService(TopicRepository(session))
-        topics = TopicMapper.map_models_to_topics(
-            topic_service.get_topics_by_period(period_id)
-        )
-
-        tutors_service = TutorService(TutorRepository(session))
-        tutors = TutorMapper.map_tutor_period_to_tutors(
-            tutors_service.get_tutor_periods_by_period_id(period_id)
-        )
-
-        group_service = GroupService(GroupRepository(session))
-        groups = GroupMapper.map_models_to_unassigned_groups(
-            group_service.get_goups_without_tutor_and_topic(), topics
+        recorder = SolverRunRecorder(SolverRunRepository(session), period_id)
+        groups, topics, tutors = _get_group_topic_tutor_inputs(
+            session, period_id, recorder
         )
 
         service = AssignmentService()
-        assignment_result = service.assignment_group_topic_tutor(
-            groups, topics, tutors, balance_limit, method
+        assignment_result = await job_runner.run_measured_solver(
+            recorder,
+            service.assignment_group_topic_tutor,
+            groups,
+            topics,
+            tutors,
+            balance_limit,
+            method,
+            options,
         )
+        with recorder.phase("serialization"):
+            content = assignment_result.to_json()
+        recorder.save()
 
-        return ResponseBuilder.build_clear_cache_response(
-            assignment_result.to_json(), status.HTTP_200_OK
-        )
+        return ResponseBuilder.build_clear_cache_response(content, status.HTTP_200_OK)
     except InvalidJwt as e:
         raise InvalidCredentials(str(e))
     except Exception as e:
@@ -184,46 +272,63 @@ async def assign_group_topic_tutor(
 async def assign_dates(
     session: Annotated[Session, Depends(get_db)],
     authorization: Annotated[dict, Depends(authorization)],
+    job_runner: Annotated[AssignmentJobRunner, Depends(get_job_runner)],
+    options: Annotated[SolverOptions, Depends(get_solver_options)],
     period_id: str = Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
     max_groups_per_week: int = Query(default=5, gt=0),
     max_dif_evaluators: int = Query(default=5, gt=0),
+    incremental: bool = Query(default=False),
+    reopened_groups: list[int] = Query(default=[]),
 ):
     try:
         """Resuelve el algoritmo de fechas y grupos"""
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_only_admin(authorization["token"])
 
-        dates_service = DateSlotsService(DateSlotRepository(session))
-        available_dates = DateSlotsMapper.map_models_to_date_slots(
-            dates_service.get_slots(period_id, only_available=True)
-        )
-
-        tutors_service = TutorService(TutorRepository(session))
-        tutors_mapper = TutorMapper()
-        tutors = tutors_mapper.map_models_to_tutors(
-            tutors_service.get_tutors_with_dates(period_id)
-        )
-        evaluators = tutors_mapper.map_models_to_tutors(
-            tutors_service.get_evaluators_with_dates(period_id)
-        )
-
-        group_service = GroupService(GroupRepository(session))
-        groups = GroupMapper.map_models_to_assigned_groups(
-            group_service.get_groups(
-                period=period_id, load_tutor_period=True, load_dates=True
-            ),
+        recorder = SolverRunRecorder(SolverRunRepository(session), period_id)
+        available_dates, tutors, evaluators, groups = _get_dates_inputs(
+            session, period_id, recorder
         )
+        with recorder.phase("db_fetch"):
+            previous_result = (
+                _get_previous_dates_result(session, period_id) if incremental else None
+            )
 
         service = AssignmentService()
-        assignment_result = service.assignment_dates(
+        assignment_result = await job_runner.run_measured_solver(
+            recorder,
+            service.assignment_dates,
             available_dates,
             tutors,
             evaluators,
             groups,
             max_groups_per_week,
             max_dif_evaluators,
+            previous_result,
+            reopened_groups,
+            options,
         )
 
+        # Se guarda el resultado para poder usarlo como punto de partida
+        with recorder.phase("serialization"):
+            result = _to_json_result(assignment_result)
+        job = AssignmentJobRepository(session).add_job(
+            AssignmentJob(
+                period_id=period_id,
+                kind=JobKind.DATE_ASSIGNMENT.value,
+                status=JobStatus.FINISHED.value,
+                progress=100,
+                params={
+                    "max_groups_per_week": max_groups_per_week,
+                    "max_dif_evaluators": max_dif_evaluators,
+                    "incremental": incremental,
+                    "solver": options.to_json(),
+                },
+                result=result,
+            )
+        )
+        recorder.save(job.id)
+
         return ResponseBuilder.build_clear_cache_response(
             assignment_result.to_json(), status.HTTP_200_OK
         )
@@ -269,16 +374,9 @@ async def update_assignments(
         auth_service.assert_only_admin(authorization["token"])
 
         dates_service = DateSlotsService(DateSlotRepository(session))
-        group_service = GroupService(GroupRepository(session))
-
-        for assignment in assignments:
-            date = assignment.date
-            evaluator_id = assignment.evaluator_id
-            tutor_id = assignment.tutor_id
-            group_id = assignment.group_id
-
-            dates_service.assign_date(date, tutor_id, evaluator_id, group_id, period_id)
-            group_service.assign_date(group_id, date)
+        dates_service.assign_dates(
+            [assignment.model_dump() for assignment in assignments], period_id
+        )
 
         return Response(status_code=status.HTTP_202_ACCEPTED)
     except Exception as e:
@@ -315,7 +413,7 @@ async def update_assignments(
     status_code=status.HTTP_200_OK,
 )
 async def get_assigned_dates(
-    session: Annotated[Session, Depends(get_db)],
+    session: Annotated[AsyncSession, Depends(get_async_db)],
     authorization: Annotated[dict, Depends(authorization)],
     period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
 ):
@@ -324,8 +422,8 @@ async def get_assigned_dates(
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_only_admin(authorization["token"])
 
-        dates_service = DateSlotsService(DateSlotRepository(session))
-        assigned_dates = dates_service.get_assigned_dates(period_id)
+        dates_service = DateSlotsService(AsyncDateSlotRepository(session))
+        assigned_dates = await dates_service.get_assigned_dates_async(period_id)
         assignments = list()
         for assigned_date in assigned_dates:
             date = DateSlot(assigned_date[0])
@@ -343,3 +441,449 @@ async def get_assigned_dates(
     except Exception as e:
         logger.error(str(e))
         raise ServerError("Unexpected error happend")
+
+
+@router.post(
+    "/jobs/incomplete-groups",
+    response_model=AssignmentJobResponse,
+    summary="Enqueues the assignment of incomplete groups",
+    responses={
+        status.HTTP_202_ACCEPTED: {"description": "Job successfully enqueued"},
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "User not authorized to perform action"
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal Server Error - Something happened inside the \
+                backend"
+        },
+    },
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def enqueue_incomplete_groups(
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+    job_runner: Annotated[AssignmentJobRunner, Depends(get_job_runner)],
+    options: Annotated[SolverOptions, Depends(get_solver_options)],
+    background_tasks: BackgroundTasks,
+    period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+):
+    """Registra un trabajo que completa los grupos que no son de a 4"""
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_only_admin(authorization["token"])
+
+        # La telemetria se guarda cuando termina el trabajo, fuera del request
+        recorder = SolverRunRecorder(SolverRunRepository(BackgroundSession), period_id)
+        answers = _get_incomplete_groups_inputs(session, period_id, recorder)
+
+        repository = AssignmentJobRepository(session)
+        job = repository.add_job(
+            AssignmentJob(
+                period_id=period_id,
+                kind=JobKind.INCOMPLETE_GROUPS.value,
+                params={"solver": options.to_json()},
+            )
+        )
+        # El trabajo corre despues de cerrar la session del request
+        background_tasks.add_task(
+            job_runner.run_job,
+            job.id,
+            AssignmentJobRepository(BackgroundSession),
+            AssignmentService().assignment_incomplete_groups,
+            (answers, options),
+            _save_incomplete_groups_result(BackgroundSession, period_id),
+            recorder,
+        )
+
+        return ResponseBuilder.build_clear_cache_response(
+            AssignmentJobResponse.model_validate(job), status.HTTP_202_ACCEPTED
+        )
+    except InvalidJwt as e:
+        raise InvalidCredentials(str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise ServerError("Unexpected error happend")
+
+
+@router.post(
+    "/jobs/group-topic-tutor",
+    response_model=AssignmentJobResponse,
+    summary="Enqueues the assignment of topic and tutor for groups",
+    responses={
+        status.HTTP_202_ACCEPTED: {"description": "Job successfully enqueued"},
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "User not authorized to perform action"
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal Server Error - Something happened inside the \
+                backend"
+        },
+    },
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def enqueue_group_topic_tutor(
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+    job_runner: Annotated[AssignmentJobRunner, Depends(get_job_runner)],
+    options: Annotated[SolverOptions, Depends(get_solver_options)],
+    background_tasks: BackgroundTasks,
+    period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+    balance_limit: int = Query(gt=0, default=5),
+    method: str = Query(pattern="^(lp|flow)$", default="lp"),
+):
+    """Registra un trabajo que asigna temas y tutores a los grupos"""
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_only_admin(authorization["token"])
+
+        # La telemetria se guarda cuando termina el trabajo, fuera del request
+        recorder = SolverRunRecorder(SolverRunRepository(BackgroundSession), period_id)
+        groups, topics, tutors = _get_group_topic_tutor_inputs(
+            session, period_id, recorder
+        )
+
+        repository = AssignmentJobRepository(session)
+        job = repository.add_job(
+            AssignmentJob(
+                period_id=period_id,
+                kind=JobKind.GROUP_TOPIC_TUTOR.value,
+                params={
+                    "balance_limit": balance_limit,
+                    "method": method,
+                    "solver": options.to_json(),
+                },
+            )
+        )
+        # El trabajo corre despues de cerrar la session del request
+        background_tasks.add_task(
+            job_runner.run_job,
+            job.id,
+            AssignmentJobRepository(BackgroundSession),
+            AssignmentService().assignment_group_topic_tutor,
+            (groups, topics, tutors, balance_limit, method, options),
+            _to_json_result,
+            recorder,
+        )
+
+        return ResponseBuilder.build_clear_cache_response(
+            AssignmentJobResponse.model_validate(job), status.HTTP_202_ACCEPTED
+        )
+    except InvalidJwt as e:
+        raise InvalidCredentials(str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise ServerError("Unexpected error happend")
+
+
+@router.post(
+    "/jobs/date-assigment",
+    response_model=AssignmentJobResponse,
+    summary="Enqueues the assignment of presentation dates",
+    responses={
+        status.HTTP_202_ACCEPTED: {"description": "Job successfully enqueued"},
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "User not authorized to perform action"
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal Server Error - Something happened inside the \
+                backend"
+        },
+    },
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def enqueue_dates(
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+    job_runner: Annotated[AssignmentJobRunner, Depends(get_job_runner)],
+    options: Annotated[SolverOptions, Depends(get_solver_options)],
+    background_tasks: BackgroundTasks,
+    period_id: str = Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+    max_groups_per_week: int = Query(default=5, gt=0),
+    max_dif_evaluators: int = Query(default=5, gt=0),
+    incremental: bool = Query(default=False),
+    reopened_groups: list[int] = Query(default=[]),
+):
+    """Registra un trabajo que asigna fechas de exposicion a los grupos"""
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_only_admin(authorization["token"])
+
+        # La telemetria se guarda cuando termina el trabajo, fuera del request
+        recorder = SolverRunRecorder(SolverRunRepository(BackgroundSession), period_id)
+        available_dates, tutors, evaluators, groups = _get_dates_inputs(
+            session, period_id, recorder
+        )
+        with recorder.phase("db_fetch"):
+            previous_result = (
+                _get_previous_dates_result(session, period_id) if incremental else None
+            )
+
+        repository = AssignmentJobRepository(session)
+        job = repository.add_job(
+            AssignmentJob(
+                period_id=period_id,
+                kind=JobKind.DATE_ASSIGNMENT.value,
+                params={
+                    "max_groups_per_week": max_groups_per_week,
+                    "max_dif_evaluators": max_dif_evaluators,
+                    "incremental": incremental,
+                    "solver": options.to_json(),
+                },
+            )
+        )
+        # El trabajo corre despues de cerrar la session del request
+        background_tasks.add_task(
+            job_runner.run_job,
+            job.id,
+            AssignmentJobRepository(BackgroundSession),
+            AssignmentService().assignment_dates,
+            (
+                available_dates,
+                tutors,
+                evaluators,
+                groups,
+                max_groups_per_week,
+                max_dif_evaluators,
+                previous_result,
+                reopened_groups,
+                options,
+            ),
+            _to_json_result,
+            recorder,
+        )
+
+        return ResponseBuilder.build_clear_cache_response(
+            AssignmentJobResponse.model_validate(job), status.HTTP_202_ACCEPTED
+        )
+    except InvalidJwt as e:
+        raise InvalidCredentials(str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise ServerError("Unexpected error happend")
+
+
+@router.post(
+    "/jobs/date-notification",
+    response_model=AssignmentJobResponse,
+    summary="Enqueues the notification of the assigned presentation dates",
+    responses={
+        status.HTTP_202_ACCEPTED: {"description": "Job successfully enqueued"},
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "User not authorized to perform action"
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal Server Error - Something happened inside the \
+                backend"
+        },
+    },
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def enqueue_date_notification(
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+    outbox: Annotated[EmailOutboxService, Depends(get_email_outbox)],
+    period_id: str = Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+):
+    """
+    Deja en el outbox un mail para cada alumno, tutor y evaluador con sus
+    fechas de exposicion y registra el trabajo con la cantidad de mails
+    encolados. Los mails se guardan con el commit del request y los envia el
+    worker del outbox, que reintenta los que fallan.
+    """
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_only_admin(authorization["token"])
+
+        service = DateSlotsService(DateSlotRepository(session))
+        content = service.notify_assigned_dates(period_id, outbox)
+
+        repository = AssignmentJobRepository(session)
+        job = repository.add_job(
+            AssignmentJob(
+                period_id=period_id,
+                kind=JobKind.DATE_NOTIFICATION.value,
+                status=JobStatus.FINISHED.value,
+                progress=100,
+                result=content,
+            )
+        )
+
+        return ResponseBuilder.build_clear_cache_response(
+            AssignmentJobResponse.model_validate(job), status.HTTP_202_ACCEPTED
+        )
+    except InvalidJwt as e:
+        raise InvalidCredentials(str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise ServerError("Unexpected error happend")
+
+
+@router.get(
+    "/jobs",
+    response_model=AssignmentJobList,
+    summary="Returns the assignment jobs of a period",
+    responses={
+        status.HTTP_200_OK: {"description": "Successfully returns the jobs"},
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "User not authorized to perform action"
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal Server Error - Something happened inside the \
+                backend"
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def get_jobs(
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+    period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+    kind: str | None = Query(
+        default=None,
+        pattern=(
+            "^(incomplete-groups|group-topic-tutor|date-assigment"
+            "|date-notification)$"
+        ),
+    ),
+):
+    """Devuelve los trabajos de un cuatrimestre (y sus resultados), del mas nuevo
+    al mas viejo, para no tener que volver a ejecutar los algoritmos"""
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_only_admin(authorization["token"])
+
+        repository = AssignmentJobRepository(session)
+        jobs = repository.get_jobs_by_period(period_id, kind)
+
+        return AssignmentJobList.model_validate(jobs)
+    except InvalidJwt as e:
+        raise InvalidCredentials(str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise ServerError("Unexpected error happend")
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=AssignmentJobResponse,
+    summary="Returns the status, progress and result of an assignment job",
+    responses={
+        status.HTTP_200_OK: {"description": "Successfully returns the job"},
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "User not authorized to perform action"
+        },
+        status.HTTP_404_NOT_FOUND: {"description": "Job not found"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal Server Error - Something happened inside the \
+                backend"
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def get_job(
+    job_id: int,
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+):
+    """Devuelve el estado de un trabajo de asignacion"""
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_only_admin(authorization["token"])
+
+        repository = AssignmentJobRepository(session)
+        job = repository.get_job_by_id(job_id)
+
+        return AssignmentJobResponse.model_validate(job)
+    except JobNotFound as e:
+        raise EntityNotFound(str(e))
+    except InvalidJwt as e:
+        raise InvalidCredentials(str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise ServerError("Unexpected error happend")
+
+
+@router.get(
+    "/runs",
+    response_model=SolverRunList,
+    summary="Returns the telemetry of the assignment runs of a period",
+    responses={
+        status.HTTP_200_OK: {"description": "Successfully returns the runs"},
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "User not authorized to perform action"
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal Server Error - Something happened inside the \
+                backend"
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def get_runs(
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+    period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+    solver: str | None = Query(
+        default=None,
+        pattern=SOLVER_PATTERN,
+    ),
+):
+    """Devuelve la telemetria de las ejecuciones de los algoritmos de un
+    cuatrimestre (tamaños, tiempos por fase y estado del solver), de la mas
+    nueva a la mas vieja"""
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_only_admin(authorization["token"])
+
+        repository = SolverRunRepository(session)
+        runs = repository.get_runs_by_period(period_id, solver)
+
+        return SolverRunList.model_validate(runs)
+    except InvalidJwt as e:
+        raise InvalidCredentials(str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise ServerError("Unexpected error happend")
+
+
+@router.get(
+    "/snapshot",
+    summary="Exports the inputs of the assignment algorithms of a period",
+    responses={
+        status.HTTP_200_OK: {"description": "Successfully exported the period"},
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "User not authorized to perform action"
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal Server Error - Something happened inside the \
+                backend"
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def export_snapshot(
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+    period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+):
+    """
+    Descarga en json lines las entradas de los algoritmos de un cuatrimestre
+    (temas, tutores, evaluadores, fechas, grupos y respuestas del formulario)
+    para reproducir una corrida con python -m src.api.assignments.replay
+    """
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_only_admin(authorization["token"])
+
+        snapshot = _get_snapshot(session, period_id)
+
+        return StreamingResponse(
+            snapshot.lines(),
+            media_type="application/x-ndjson",
+            headers={"Content-Disposition": f"attachment; filename={period_id}.jsonl"},
+        )
+    except InvalidJwt as e:
+        raise InvalidCredentials(str(e))
+    except Exception as e:
+        logger.error(str(e))
+        raise ServerError("Unexpected error happend")
@@ -0,0 +1,52 @@
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+from typing import Any, List, Optional
+
+
+class AssignmentJobResponse(BaseModel):
+    """Representa el estado de un trabajo de asignacion"""
+
+    id: int
+    period_id: str
+    kind: str
+    status: str
+    progress: int = Field(description="Porcentaje de avance entre 0 y 100")
+    params: Optional[dict] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AssignmentJobList(RootModel):
+    """Lista de trabajos de asignacion"""
+
+    root: List[AssignmentJobResponse] = Field(default=[])
+
+
+class SolverRunResponse(BaseModel):
+    """Telemetria de una ejecucion de un algoritmo de asignacion"""
+
+    id: int
+    period_id: str
+    job_id: Optional[int] = None
+    solver: str
+    status: Optional[str] = None
+    gap: Optional[float] = None
+    nodes: Optional[int] = None
+    variables: Optional[int] = None
+    constraints: Optional[int] = None
+    inputs: dict = Field(description="Tamaño de cada entrada del algoritmo")
+    timings: dict = Field(description="Segundos que llevo cada fase de la ejecucion")
+    total_time: float
+    created_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SolverRunList(RootModel):
+    """Lista de ejecuciones de algoritmos de asignacion"""
+
+    root: List[SolverRunResponse] = Field(default=[])
@@ -10,21 +10,23 @@ from src.core.result import DateSlotsAssignmentResult, GroupTutorTopicAssignment
 
 class AssignmentService:
 
-    def assignment_incomplete_groups(self, answers):
+    def assignment_incomplete_groups(self, answers, options=None):
         """Utiliza el algoritmo de programacion lineal para asignar los grupos"""
-        assigment_model = IncompleteGroupsLPSolver(answers)
+        assigment_model = IncompleteGroupsLPSolver(answers, options)
         results = assigment_model.solve()
         return results
 
     def assignment_group_topic_tutor(
-        self, groups, topics, tutors, balance_limit, method
+        self, groups, topics, tutors, balance_limit, method, options=None
     ) -> GroupTutorTopicAssignmentResult:
         """
-        Dependiendo el method utiliza el algoritmo de programacion lineal o de red de flujo para
-        asignar grupos a temas de preferencias y a tutores
+        Dependiendo el method utiliza el algoritmo de programacion lineal o de red
+        de flujo para asignar grupos a temas de preferencias y a tutores
         """
         if method == "lp":
-            assigment_model = GroupTutorLPSolver(groups, topics, tutors, balance_limit)
+            assigment_model = GroupTutorLPSolver(
+                groups, topics, tutors, balance_limit, options
+            )
         elif method == "flow":
             assigment_model = GroupTutorFlowSolver(groups, topics, tutors)
         else:
@@ -41,9 +43,15 @@ class AssignmentService:
         groups,
         max_groups_per_week,
         max_dif_evaluators,
+        previous_result=None,
+        reopened_groups=None,
+        options=None,
     ) -> DateSlotsAssignmentResult:
         """
-        Utiliza el algoritmo de programacion lineal de fechas para asignar grupos a fechas de exposicion
+        Utiliza el algoritmo de programacion lineal de fechas para asignar grupos
+        a fechas de exposicion. Si se provee un resultado anterior, lo usa como
+        solucion inicial y solo reasigna los grupos cuya asignacion dejo de ser
+        valida o que fueron reabiertos.
         """
         filtered_groups = list(filter(lambda x: x.assigned_date is None, groups))
         for t in tutors:
@@ -61,6 +69,9 @@ class AssignmentService:
             evaluators=evaluators,
             max_groups_per_week=max_groups_per_week,
             max_dif_evaluators=max_dif_evaluators,
+            previous_result=previous_result,
+            reopened_groups=reopened_groups,
+            options=options,
         )
         results = assigment_model.solve()
         return results
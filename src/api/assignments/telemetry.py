@@ -0,0 +1,55 @@
+from src.api.assignments.models import SolverRun
+from src.api.assignments.repository import SolverRunRepository
+from src.config.logging import logger
+from src.core.algorithms.solver_stats import PhaseTimings
+
+
+class SolverRunRecorder:
+    """
+    Registra la telemetria de una corrida de asignacion en solver_runs.
+
+    Los solvers miden sus propias fases (build, solve, decode) en el proceso
+    del pool; el recorder suma las fases que ocurren en la api: lectura de la
+    base (db_fetch), armado de las entradas (mapping), envio al pool y vuelta
+    (transfer) y serializacion del resultado (serialization).
+    """
+
+    def __init__(self, repository: SolverRunRepository, period_id: str) -> None:
+        self._repository = repository
+        self.period_id = period_id
+        self.timings = PhaseTimings()
+        self.solver_stats = []
+
+    def phase(self, name: str):
+        """Suma a la fase name el tiempo que tarda el bloque"""
+        return self.timings.phase(name)
+
+    def save(self, job_id: int | None = None):
+        """
+        Guarda una fila por cada solver ejecutado. Un error al guardar la
+        telemetria no debe hacer fallar la asignacion, solo se loguea: las
+        filas se escriben en un savepoint, asi el resultado de la asignacion
+        se sigue guardando con el commit del request.
+        """
+        runs = []
+        for stats in self.solver_stats:
+            timings = {**self.timings.to_json(), **stats["timings"]}
+            runs.append(
+                SolverRun(
+                    period_id=self.period_id,
+                    job_id=job_id,
+                    solver=stats["solver"],
+                    status=stats["status"],
+                    gap=stats["gap"],
+                    nodes=stats["nodes"],
+                    variables=stats["variables"],
+                    constraints=stats["constraints"],
+                    inputs=stats["inputs"],
+                    timings=timings,
+                    total_time=sum(timings.values()),
+                )
+            )
+        try:
+            self._repository.add_runs(runs)
+        except Exception as e:
+            logger.error(f"Could not save the solver runs because of: {str(e)}")
@@ -2,12 +2,18 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from src.api.auth.jwt import JwtResolver
-from src.api.auth.schemas import oauth2_scheme
+from src.api.auth.jwt import InvalidJwt, JwtResolver, VerifiedTokenCache
+from src.api.auth.schemas import JwtDecoded, oauth2_scheme
+from src.api.users.exceptions import InvalidCredentials
+from src.config.config import api_config
+
+# Un unico resolver para toda la app, asi comparten el cache de tokens
+# verificados
+jwt_resolver = JwtResolver(cache=VerifiedTokenCache(api_config.jwt_cache_size))
 
 
 def get_jwt_resolver():
-    return JwtResolver()
+    return jwt_resolver
 
 
 def authorization(
@@ -18,3 +24,15 @@ def authorization(
     # Mas info de subdependencies en
     # https://fastapi.tiangolo.com/tutorial/dependencies/sub-dependencies/
     return {"token": token, "jwt_resolver": jwt_resolver}
+
+
+def get_claims(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    jwt_resolver: Annotated[JwtResolver, Depends(get_jwt_resolver)],
+) -> JwtDecoded:
+    # Verifica el JWT una sola vez por request: FastAPI cachea el resultado de
+    # la dependencia y todos los que la usan reciben los mismos claims tipados
+    try:
+        return jwt_resolver.decode_token(token)
+    except InvalidJwt:
+        raise InvalidCredentials("Invalid Authorization")
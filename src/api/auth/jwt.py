@@ -1,4 +1,10 @@
 import datetime
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
 import jwt as jwt_provider
 from src.api.auth.schemas import JwtDecoded, JwtEncoded
 from src.config.config import api_config
@@ -16,12 +22,59 @@ class InvalidJwt(Exception):
         return self._message
 
 
+class VerifiedTokenCache:
+    """
+    Cache LRU de tokens ya verificados.
+
+    La clave es el sha256 del token, asi no se guardan tokens en memoria, y
+    cada entrada vence en el exp del propio token. Con los dashboards que
+    consultan cada pocos segundos se evita repetir el HMAC y el parseo del
+    json en cada request.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, JwtDecoded] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[JwtDecoded]:
+        key = self._key(token)
+        with self._lock:
+            decoded = self._entries.get(key)
+            if decoded is None:
+                return None
+            if decoded.exp <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return decoded
+
+    def put(self, token: str, decoded: JwtDecoded):
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = decoded
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class JwtResolver:
 
-    def __init__(self, verify_exp: bool = True) -> None:
+    def __init__(
+        self, verify_exp: bool = True, cache: Optional[VerifiedTokenCache] = None
+    ) -> None:
         self.secret = api_config.secret_key
         self.verify_exp = verify_exp
         self.hash = api_config.hash_type
+        # Solo se cachea cuando se verifica la expiracion, porque es lo que
+        # define cuanto vive cada entrada
+        self.cache = cache if verify_exp else None
 
     def _get_exp_time(self, minutes) -> float:
         """
@@ -54,15 +107,23 @@ class JwtResolver:
         """
         Decodifica el jwt
         """
+        if self.cache is not None:
+            cached = self.cache.get(jwt)
+            if cached is not None:
+                return cached
         try:
-            jwt_decoded = jwt_provider.decode(
-                jwt,
-                str(self.secret),
-                algorithms=[self.hash],
-                options={"verify_exp": self.verify_exp},
+            jwt_decoded = JwtDecoded(
+                **jwt_provider.decode(
+                    jwt,
+                    str(self.secret),
+                    algorithms=[self.hash],
+                    options={"verify_exp": self.verify_exp},
+                )
             )
+            if self.cache is not None:
+                self.cache.put(jwt, jwt_decoded)
 
-            return JwtDecoded(**jwt_decoded)
+            return jwt_decoded
         except Exception as e:
             logger.error("Invalid Jwt")
             raise InvalidJwt(message=str(e))
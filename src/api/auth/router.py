@@ -1,4 +1,4 @@
-from fastapi import APIRouter, BackgroundTasks, Response, status, Depends
+from fastapi import APIRouter, Response, status, Depends
 from sqlalchemy.orm import Session
 
 from src.api.auth.dependencies import authorization, get_jwt_resolver
@@ -80,9 +80,8 @@ async def reset_password(
     session: Annotated[Session, Depends(get_db)],
     authorization: Annotated[dict, Depends(authorization)],
     email_sender: Annotated[object, Depends(get_email_sender)],
-    background_tasks: BackgroundTasks,
 ) -> JwtEncoded:
-    """Endpoint para resetear la contraseña del usuario enviando un mail como tarea en async"""
+    """Endpoint para resetear la contraseña del usuario dejando el mail en el outbox"""
     try:
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         jwt = auth_service.assert_multiple_role(authorization["token"])
@@ -104,9 +103,7 @@ async def reset_password(
         Si no fuiste vos, comunicate inmediatamente con algún integrante del equipo: avillores@fi.uba.ar, vlopez@fi.uba.ar, ipfaab@fi.uba.ar, cdituro@fi.uba.ar
         """
 
-        background_tasks.add_task(
-            email_sender.send_email, to=to, subject=subject, body=msg
-        )
+        email_sender.send_email(to=to, subject=subject, body=msg)
         return Response(status_code=status.HTTP_202_ACCEPTED)
     except (UserNotFound, InvalidCredentials, InvalidPasswordReset) as e:
         raise e
@@ -37,6 +37,14 @@ class JwtDecoded(BaseModel):
     name: str
     exp: float
 
+    @property
+    def user_id(self) -> int:
+        return self.sub["id"]
+
+    @property
+    def role(self) -> str:
+        return self.sub["role"]
+
 
 class PasswordResetRequest(BaseModel):
     old_password: str
@@ -4,9 +4,18 @@ from src.api.users.models import Role
 
 
 class AuthenticationService:
-    def __init__(self, jwt_resolver: JwtResolver) -> None:
+    def __init__(self, jwt_resolver: JwtResolver | None = None) -> None:
+        # Sin resolver solo se aceptan claims ya verificados (get_claims)
         self._jwt_resolver = jwt_resolver
 
+    def _decode(self, token: str | JwtDecoded) -> JwtDecoded:
+        """Decodifica el token salvo que ya venga decodificado"""
+        if isinstance(token, str):
+            if self._jwt_resolver is None:
+                raise InvalidJwt("Invalid jwt")
+            return self._jwt_resolver.decode_token(token)
+        return token
+
     def _assert_role(self, role, expected_role):
         """Assert de un rol especifico"""
         if role != expected_role:
@@ -17,25 +26,27 @@ class AuthenticationService:
         if role not in expected_roles:
             raise InvalidJwt("Invalid jwt")
 
-    def assert_student_role(self, token: str) -> JwtDecoded:
+    def assert_student_role(self, token: str | JwtDecoded) -> JwtDecoded:
         """Comprueba que el token sea un studiante o admin"""
-        token_decoded = self._jwt_resolver.decode_token(token)
+        token_decoded = self._decode(token)
         user = token_decoded.sub
         self._assert_multiple_role(user["role"], [Role.ADMIN.value, Role.STUDENT.value])
         return token_decoded
 
-    def assert_only_admin(self, token: str) -> JwtDecoded:
+    def assert_only_admin(self, token: str | JwtDecoded) -> JwtDecoded:
         """Comprueba que el token sea un admin"""
-        token_decoded = self._jwt_resolver.decode_token(token)
+        token_decoded = self._decode(token)
         user = token_decoded.sub
         self._assert_role(user["role"], Role.ADMIN.value)
         return token_decoded
 
-    def assert_tutor_rol(self, token: str, tutor_id: int | None = None) -> JwtDecoded:
+    def assert_tutor_rol(
+        self, token: str | JwtDecoded, tutor_id: int | None = None
+    ) -> JwtDecoded:
         """
         Comprueba que el token sea un tutor o admin, en caso de tutor valida contra tutor_id si esta presente el arg
         """
-        token_decoded = self._jwt_resolver.decode_token(token)
+        token_decoded = self._decode(token)
         user = token_decoded.sub
         if user["role"] == Role.TUTOR.value and tutor_id:
             if user["id"] != tutor_id:
@@ -46,9 +57,9 @@ class AuthenticationService:
             )
         return token_decoded
 
-    def assert_multiple_role(self, token: str) -> JwtDecoded:
+    def assert_multiple_role(self, token: str | JwtDecoded) -> JwtDecoded:
         """Comprueba que sea o un estudiante, admin o tutor"""
-        token_decoded = self._jwt_resolver.decode_token(token)
+        token_decoded = self._decode(token)
         user = token_decoded.sub
         self._assert_multiple_role(
             user["role"], [Role.ADMIN.value, Role.STUDENT.value, Role.TUTOR.value]
@@ -57,16 +68,14 @@ class AuthenticationService:
 
     def get_user_id(self, token: str | JwtDecoded):
         """Obtiene el id del token"""
-        if isinstance(token, str):
-            token = self._jwt_resolver.decode_token(token)
+        token = self._decode(token)
         user = token.sub
         return user["id"]
 
     def is_admin(self, token: str | JwtDecoded) -> bool:
         """Indica si que el token pertenece a un admin"""
         try:
-            if isinstance(token, str):
-                token = self._jwt_resolver.decode_token(token)
+            token = self._decode(token)
             user = token.sub
             self._assert_role(user["role"], Role.ADMIN.value)
             return True
@@ -76,18 +85,20 @@ class AuthenticationService:
     def is_student(self, token: str | JwtDecoded) -> bool:
         """Indica si que el token pertenece a un estudiante"""
         try:
-            if isinstance(token, str):
-                token = self._jwt_resolver.decode_token(token)
+            token = self._decode(token)
             user = token.sub
             self._assert_role(user["role"], Role.STUDENT.value)
             return True
         except Exception:
             return False
 
-    def assert_student_in_group(self, token: str, group_id: str, group_repository):
+    def assert_student_in_group(
+        self, token: str | JwtDecoded, group_id: str, group_repository
+    ) -> JwtDecoded:
         """Valida que un estudiante sea parte de un grupo"""
         jwt = self.assert_student_role(token=token)
         student_id = self.get_user_id(jwt)
 
         if not group_repository.student_in_group(student_id, group_id):
             raise InvalidJwt("Invalid jwt")
+        return jwt
@@ -0,0 +1,65 @@
+from src.core.date_slots import DateSlot
+
+ROLES = {
+    "student": "exposicion de tu grupo",
+    "tutor": "como tutor",
+    "evaluator": "como evaluador",
+}
+
+
+class DateSchedule:
+    """Fechas de exposicion a las que tiene que asistir una persona"""
+
+    def __init__(self, email: str, name: str) -> None:
+        self.email = email
+        self.name = name
+        self.slots = []
+
+    def add_slot(self, date, group_number: int, role: str):
+        self.slots.append((date, group_number, role))
+
+    def render(self) -> tuple[str, str]:
+        """Devuelve el asunto y el cuerpo del mail con todas sus fechas"""
+        lines = [
+            f"- {DateSlot(date).get_spanish_date()}: grupo {group_number} "
+            f"({ROLES[role]})"
+            for date, group_number, role in sorted(self.slots)
+        ]
+        subject = "Fechas de exposicion asignadas"
+        body = (
+            f"Hola {self.name},\n\n"
+            "Estas son tus fechas de exposicion del cuatrimestre:\n\n"
+            + "\n".join(lines)
+            + "\n\nGracias"
+        )
+        return subject, body
+
+
+def build_schedules(recipients: list[dict]) -> list[DateSchedule]:
+    """Agrupa las fechas asignadas por persona, un mail por destinatario"""
+    schedules = {}
+    for recipient in recipients:
+        email = recipient["email"]
+        if email not in schedules:
+            schedules[email] = DateSchedule(email, recipient["name"])
+        schedules[email].add_slot(
+            recipient["date"], recipient["group_number"], recipient["role"]
+        )
+    return list(schedules.values())
+
+
+class DateNotifier:
+    """
+    Deja en el outbox un mail por persona con su cronograma de exposicion.
+    Los mails se guardan con el commit del request y los envia el
+    EmailOutboxWorker, que reintenta los que fallan.
+    """
+
+    def __init__(self, outbox) -> None:
+        self._outbox = outbox
+
+    def notify(self, schedules: list[DateSchedule]) -> dict:
+        self._outbox.send_individual_emails(
+            [(schedule.email, *schedule.render()) for schedule in schedules]
+        )
+        return {"recipients": len(schedules), "queued": len(schedules)}
@@ -1,10 +1,47 @@
+from collections import defaultdict
 from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, aliased
-from sqlalchemy import insert, delete, and_, tuple_, update, select
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    column,
+    insert,
+    delete,
+    tuple_,
+    update,
+    select,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.api.dates.models import DateSlot, GroupDateSlot, TutorDateSlot
-from src.api.groups.models import Group
+from src.api.groups.exceptions import GroupNotFound
+from src.api.groups.models import Group, association_table
 from src.api.topics.models import Topic
+from src.api.users.models import User
+
+
+def assigned_dates_query(period_id: str):
+    """Consulta de las fechas asignadas con su tutor, evaluador y grupo"""
+    TutorDateSlotAlias = aliased(TutorDateSlot)
+    EvaluatorDateSlotAlias = aliased(TutorDateSlot)
+    return (
+        select(
+            DateSlot.slot.label("date"),
+            EvaluatorDateSlotAlias.tutor_id.label("evaluator_id"),
+            TutorDateSlotAlias.tutor_id.label("tutor_id"),
+            Group.id.label("group_id"),
+            Group.group_number.label("group_number"),
+        )
+        .join(TutorDateSlotAlias, DateSlot.slot == TutorDateSlotAlias.slot)
+        .join(EvaluatorDateSlotAlias, DateSlot.slot == EvaluatorDateSlotAlias.slot)
+        .join(Group, DateSlot.slot == Group.exhibition_date)
+        .where(DateSlot.assigned == True)
+        .where(EvaluatorDateSlotAlias.tutor_or_evaluator == "evaluator")
+        .where(TutorDateSlotAlias.tutor_or_evaluator == "tutor")
+        .where(Group.period_id == period_id)
+    )
 
 
 class DateSlotRepository:
@@ -16,7 +53,7 @@ class DateSlotRepository:
         """Agrega una nueva fecha a la tabla"""
         with self.Session() as session:
             session.add(date_slot)
-            session.commit()
+            session.flush()
             session.refresh(date_slot)
 
             session.expunge(date_slot)
@@ -29,7 +66,7 @@ class DateSlotRepository:
         """Dependiendo el modelo, agrega una lista de filas a la correspondiente tabla"""
         with self.Session() as session:
             result = session.execute(insert(model).returning(model), data)
-            session.commit()
+            session.flush()
 
             # Extract the inserted rows from the result
             rows = result.fetchall()
@@ -84,116 +121,70 @@ class DateSlotRepository:
 
         return slots
 
-    def delete_date_slots(self, slots_to_delete: list[dict], period: str):
-        """Borra los slots de un cuatrimestre"""
-        with self.Session() as session:
-            delete_stmt = delete(DateSlot).where(
-                DateSlot.period_id == period,
-                DateSlot.slot.in_([slot[0] for slot in slots_to_delete]),
-            )
-            session.execute(delete_stmt)
-            session.commit()
-
     def sync_date_slots(self, slots_to_update: list[dict], period: str):
-        """Borra aquellos slots que no estan en la lista y agrega los que faltan en un cuatrimestre"""
-        with self.Session() as session:
-            # Retrieve existing slots
-            existing_slots = session.query(DateSlot).all()
-            existing_slots_set = {(slot.slot, period) for slot in existing_slots}
-
-            # Delete existing slots
-            slots_to_update_set = set(
-                (slot["slot"], period) for slot in slots_to_update
-            )
-            slots_to_delete = existing_slots_set - slots_to_update_set
-            self.delete_date_slots(slots_to_delete, period)
-
-            # Bulk insert new slots
-            new_slots = [
-                slot
-                for slot in slots_to_update
-                if (slot["slot"], slot["period_id"]) not in existing_slots_set
-            ]
-            if new_slots:
-                self.add_bulk(DateSlot, new_slots)
-
-    def delete_group_slots(self, slots_to_delete: list[dict], group_id: int):
-        """Borra los slots de un grupo"""
+        """
+        Borra aquellos slots que no estan en la lista y agrega los que faltan en un
+        cuatrimestre. Solo se tocan las filas del cuatrimestre, en una unica
+        transaccion con un delete y un insert masivos.
+        """
+        slots = [slot["slot"] for slot in slots_to_update]
+        delete_stmt = delete(DateSlot).where(
+            DateSlot.period_id == period, DateSlot.slot.not_in(slots)
+        )
         with self.Session() as session:
-            delete_stmt = delete(GroupDateSlot).where(
-                and_(
-                    GroupDateSlot.group_id == group_id,
-                    GroupDateSlot.slot.in_(
-                        [slot for slot, group_id in slots_to_delete]
-                    ),
-                )
-            )
             session.execute(delete_stmt)
-            session.commit()
+            if slots_to_update:
+                session.execute(
+                    pg_insert(DateSlot)
+                    .values(slots_to_update)
+                    .on_conflict_do_nothing(index_elements=[DateSlot.slot])
+                )
+            session.flush()
 
     def sync_group_slots(self, slots_to_update: list[dict], group_id: int):
-        """Borra aquellos slots de un grupo que no estan en la lista y agrega los que faltan"""
-        with self.Session() as session:
-            # Retrieve existing slots
-            existing_slots = session.query(GroupDateSlot).all()
-            existing_slots_set = {(slot.slot, group_id) for slot in existing_slots}
-
-            # Delete existing slots
-            slots_to_update_set = set(
-                (slot["slot"], group_id) for slot in slots_to_update
-            )
-            slots_to_delete = existing_slots_set - slots_to_update_set
-            self.delete_group_slots(slots_to_delete, group_id)
-
-            # Bulk insert new slots
-            new_slots = [
-                slot
-                for slot in slots_to_update
-                if (slot["slot"], slot["group_id"]) not in existing_slots_set
-            ]
-            if new_slots:
-                self.add_bulk(GroupDateSlot, new_slots)
-
-    def delete_tutor_slots(
-        self, slots_to_delete: list[dict], tutor_id: int, period: str
-    ):
-        """Borra todos los slots de un tutor en un cuatrimestre especifico"""
+        """
+        Borra aquellos slots de un grupo que no estan en la lista y agrega los que
+        faltan, en una unica transaccion y leyendo solo las filas del grupo.
+        """
+        slots = [slot["slot"] for slot in slots_to_update]
+        delete_stmt = delete(GroupDateSlot).where(
+            GroupDateSlot.group_id == group_id, GroupDateSlot.slot.not_in(slots)
+        )
         with self.Session() as session:
-            delete_stmt = delete(TutorDateSlot).where(
-                and_(
-                    TutorDateSlot.period_id == period,
-                    TutorDateSlot.tutor_id == tutor_id,
-                    TutorDateSlot.slot.in_([slot for slot, _, _ in slots_to_delete]),
-                )
-            )
             session.execute(delete_stmt)
-            session.commit()
+            if slots_to_update:
+                session.execute(
+                    pg_insert(GroupDateSlot)
+                    .values(slots_to_update)
+                    .on_conflict_do_nothing(
+                        index_elements=[GroupDateSlot.group_id, GroupDateSlot.slot]
+                    )
+                )
+            session.flush()
 
     def sync_tutor_slots(self, slots_to_update: list[dict], tutor_id: int, period: str):
-        """Borra aquellos slots de un tutor que no estan en la lista y agrega los que faltan en un cuatrimestre"""
+        """
+        Borra aquellos slots de un tutor que no estan en la lista y agrega los que
+        faltan en un cuatrimestre, en una unica transaccion y leyendo solo las filas
+        del tutor en ese cuatrimestre.
+        """
+        slots = [slot["slot"] for slot in slots_to_update]
+        delete_stmt = delete(TutorDateSlot).where(
+            TutorDateSlot.period_id == period,
+            TutorDateSlot.tutor_id == tutor_id,
+            TutorDateSlot.slot.not_in(slots),
+        )
         with self.Session() as session:
-            # Retrieve existing slots
-            existing_slots = session.query(TutorDateSlot).all()
-            existing_slots_set = {
-                (slot.slot, tutor_id, period) for slot in existing_slots
-            }
-
-            # Delete existing slots
-            slots_to_update_set = set(
-                (slot["slot"], tutor_id, period) for slot in slots_to_update
-            )
-            slots_to_delete = existing_slots_set - slots_to_update_set
-            self.delete_tutor_slots(slots_to_delete, tutor_id, period)
-
-            # Bulk insert new slots
-            new_slots = [
-                slot
-                for slot in slots_to_update
-                if (slot["slot"], slot["tutor_id"], slot["period_id"])
-                not in existing_slots_set
-            ]
-            if new_slots:
-                self.add_bulk(TutorDateSlot, new_slots)
+            session.execute(delete_stmt)
+            if slots_to_update:
+                session.execute(
+                    pg_insert(TutorDateSlot)
+                    .values(slots_to_update)
+                    .on_conflict_do_nothing(
+                        index_elements=[TutorDateSlot.tutor_id, TutorDateSlot.slot]
+                    )
+                )
+            session.flush()
 
     def update_tutor_dates(self, tutor_id: int, date: datetime, attributes: dict):
         """Updatea la fila basado en la fecha y tutor_id"""
@@ -204,7 +195,7 @@ class DateSlotRepository:
         )
         with self.Session() as session:
             session.execute(stmt)
-            session.commit()
+            session.flush()
 
     def _upsert_tutor(
         self, session, date: datetime, tutor_id: int, period_id: str, type
@@ -269,34 +260,145 @@ class DateSlotRepository:
             self._upsert_tutor(session, date, tutor_id, period_id, "tutor")
             self._upsert_tutor(session, date, evaluator_id, period_id, "evaluator")
             self._upsert_group(session, date, group_id)
-            session.commit()
+            session.flush()
+
+    def assign_dates(self, assignments: list[dict], period_id: str):
+        """
+        Marca como asignadas todas las fechas en una unica transaccion (todo o
+        nada). Cada asignacion es un dict con date, tutor_id, evaluator_id y
+        group_id.
+
+        En lugar de leer y escribir fila por fila, se hace un upsert masivo por
+        tabla y un unico UPDATE de grupos a partir de una lista de VALUES.
+        """
+        if not assignments:
+            return
+
+        # Si una misma clave aparece mas de una vez gana la ultima, igual que al
+        # aplicarlas de a una
+        dates = {}
+        tutors = {}
+        groups_slots = {}
+        groups_dates = {}
+        for assignment in assignments:
+            date = assignment["date"]
+            group_id = assignment["group_id"]
+            dates[date] = {"slot": date, "assigned": True, "period_id": period_id}
+            for tutor_id, type in (
+                (assignment["tutor_id"], "tutor"),
+                (assignment["evaluator_id"], "evaluator"),
+            ):
+                tutors[(tutor_id, date)] = {
+                    "slot": date,
+                    "tutor_id": tutor_id,
+                    "period_id": period_id,
+                    "assigned": True,
+                    "tutor_or_evaluator": type,
+                }
+            groups_slots[(group_id, date)] = {"slot": date, "group_id": group_id}
+            groups_dates[group_id] = date
+
+        date_upsert = pg_insert(DateSlot).values(list(dates.values()))
+        date_upsert = date_upsert.on_conflict_do_update(
+            index_elements=[DateSlot.slot], set_={"assigned": True}
+        )
 
-    def get_assigned_dates(self, period_id):
-        """Las asignaciones dadas entre tutor,"""
-        TutorDateSlotAlias = aliased(TutorDateSlot)
-        EvaluatorDateSlotAlias = aliased(TutorDateSlot)
-        query = (
-            select(
-                DateSlot.slot.label("date"),
-                EvaluatorDateSlotAlias.tutor_id.label("evaluator_id"),
-                TutorDateSlotAlias.tutor_id.label("tutor_id"),
-                Group.id.label("group_id"),
-                Group.group_number.label("group_number"),
+        tutor_upsert = pg_insert(TutorDateSlot).values(list(tutors.values()))
+        tutor_upsert = tutor_upsert.on_conflict_do_update(
+            index_elements=[TutorDateSlot.tutor_id, TutorDateSlot.slot],
+            set_={
+                "assigned": True,
+                "tutor_or_evaluator": tutor_upsert.excluded.tutor_or_evaluator,
+            },
+        )
+
+        group_slot_insert = (
+            pg_insert(GroupDateSlot)
+            .values(list(groups_slots.values()))
+            .on_conflict_do_nothing(
+                index_elements=[GroupDateSlot.group_id, GroupDateSlot.slot]
             )
-            .join(TutorDateSlotAlias, DateSlot.slot == TutorDateSlotAlias.slot)
-            .join(EvaluatorDateSlotAlias, DateSlot.slot == EvaluatorDateSlotAlias.slot)
-            .join(Group, DateSlot.slot == Group.exhibition_date)
-            .where(DateSlot.assigned == True)
-            .where(EvaluatorDateSlotAlias.tutor_or_evaluator == "evaluator")
-            .where(TutorDateSlotAlias.tutor_or_evaluator == "tutor")
-            .where(Group.period_id == period_id)
         )
+
+        new_dates = values(
+            column("id", Integer), column("exhibition_date", DateTime), name="new_dates"
+        ).data(list(groups_dates.items()))
+        groups_update = (
+            update(Group)
+            .where(Group.id == new_dates.c.id)
+            .values(exhibition_date=new_dates.c.exhibition_date)
+            .execution_options(synchronize_session=False)
+        )
+
         with self.Session() as session:
-            result = session.execute(query)
+            session.execute(date_upsert)
+            session.execute(tutor_upsert)
+            session.execute(group_slot_insert)
+            result = session.execute(groups_update)
+            if result.rowcount != len(groups_dates):
+                raise GroupNotFound("Some of the groups were not found in db")
+            session.flush()
+
+    def get_assigned_dates(self, period_id):
+        """Las asignaciones dadas entre tutor,"""
+        with self.Session() as session:
+            result = session.execute(assigned_dates_query(period_id))
             assignments = result.fetchall()
 
         return assignments
 
+    def get_assigned_dates_recipients(self, period_id) -> list[dict]:
+        """
+        Las fechas asignadas con cada persona que tiene que asistir: los
+        alumnos del grupo, su tutor y el evaluador. Se resuelve con tres
+        consultas sin importar la cantidad de grupos.
+        """
+        with self.Session() as session:
+            assignments = session.execute(assigned_dates_query(period_id)).fetchall()
+            group_ids = {assignment.group_id for assignment in assignments}
+            tutor_ids = {assignment.tutor_id for assignment in assignments}
+            tutor_ids |= {assignment.evaluator_id for assignment in assignments}
+
+            tutors = {
+                tutor.id: tutor
+                for tutor in session.execute(
+                    select(User.id, User.name, User.last_name, User.email).where(
+                        User.id.in_(tutor_ids)
+                    )
+                )
+            }
+            students = defaultdict(list)
+            for student in session.execute(
+                select(
+                    association_table.c.group_id,
+                    User.name,
+                    User.last_name,
+                    User.email,
+                )
+                .join(User, User.id == association_table.c.student_id)
+                .where(association_table.c.group_id.in_(group_ids))
+                .order_by(User.id)
+            ):
+                students[student.group_id].append(student)
+
+        recipients = []
+        for assignment in assignments:
+            people = [(student, "student") for student in students[assignment.group_id]]
+            people.append((tutors[assignment.tutor_id], "tutor"))
+            people.append((tutors[assignment.evaluator_id], "evaluator"))
+            for person, role in people:
+                recipients.append(
+                    {
+                        "email": person.email,
+                        "name": f"{person.name} {person.last_name}",
+                        "role": role,
+                        "date": assignment.date,
+                        "group_number": assignment.group_number,
+                    }
+                )
+
+        return recipients
+
     def get_tutors_assigned_dates(self, tutor_id, period_id):
         """Obtiene todos los slots asiganados de un tutor  por cuatrimestre"""
         with self.Session() as session:
@@ -314,3 +416,18 @@ class DateSlotRepository:
             session.expunge_all()
 
         return slots
+
+
+class AsyncDateSlotRepository:
+    """Variante asincronica (asyncpg) de las consultas de fechas mas usadas"""
+
+    def __init__(self, sess: AsyncSession):
+        self.Session = sess
+
+    async def get_assigned_dates(self, period_id):
+        """Las asignaciones dadas entre tutor,"""
+        async with self.Session() as session:
+            result = await session.execute(assigned_dates_query(period_id))
+            assignments = result.fetchall()
+
+        return assignments
@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 
 from src.api.dates.exceptions import InvalidDate
 from src.api.dates.models import DateSlot, GroupDateSlot, TutorDateSlot
+from src.api.dates.notifications import DateNotifier, build_schedules
 from src.api.dates.schemas import DateSlotRequestList
 from src.config.logging import logger
 
@@ -133,6 +134,31 @@ class DateSlotsService:
             logger.error(f"Could not update the dates slots because of: {str(e)}")
             raise InvalidDate(str(e))
 
+    def assign_dates(self, assignments: list[dict], period_id: str):
+        """
+        Marca todas las fechas, tutores, evaluadores y grupos como asignados en
+        una unica transaccion. Si alguna falla no se aplica ninguna.
+        """
+        try:
+            self._repository.assign_dates(assignments, period_id)
+        except Exception as e:
+            logger.error(f"Could not update the dates slots because of: {str(e)}")
+            raise InvalidDate(str(e))
+
     def get_assigned_dates(self, period_id):
         """Busca las fechas asignadas realizando joins"""
         return self._repository.get_assigned_dates(period_id)
+
+    async def get_assigned_dates_async(self, period_id):
+        """Igual que get_assigned_dates pero con un AsyncDateSlotRepository"""
+        return await self._repository.get_assigned_dates(period_id)
+
+    def notify_assigned_dates(self, period_id, outbox) -> dict:
+        """
+        Deja en el outbox un mail para cada alumno, tutor y evaluador con todas
+        sus fechas de exposicion del cuatrimestre
+        """
+        recipients = self._repository.get_assigned_dates_recipients(period_id)
+        schedules = build_schedules(recipients)
+        logger.info(f"Notifying assigned dates of {period_id} to {len(schedules)}")
+        return DateNotifier(outbox).notify(schedules)
@@ -0,0 +1,55 @@
+# =============================================================================
+# IMPORTANTE: Este modulo de Python incluye todas las dependencias.
+# No esta destinado a contener clases; en su lugar, debe incluir funciones
+# para ser importadas.
+# Asegurate de seguir esta estructura para mantener la consistencia
+# =============================================================================
+
+
+from typing_extensions import Annotated
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from src.api.emails.repository import EmailOutboxRepository
+from src.api.emails.service import EmailOutboxService
+from src.api.emails.worker import EmailOutboxWorker
+from src.config.config import api_config
+from src.config.database.database import BackgroundSession, get_db
+from src.core.email_client import AsyncSendGridEmailClient, StubEmailClient
+
+# Worker del outbox de la app, se lanza al iniciar
+email_worker: EmailOutboxWorker | None = None
+
+
+def get_email_outbox(session: Annotated[Session, Depends(get_db)]):
+    # Usa la misma unidad de trabajo que el resto del request
+    yield EmailOutboxService(EmailOutboxRepository(session))
+
+
+def create_email_client():
+    if api_config.email_backend == "stub":
+        return StubEmailClient()
+    if api_config.email_backend == "sendgrid":
+        return AsyncSendGridEmailClient(api_key=api_config.email_key)
+    raise ValueError(f"Unknown email backend: {api_config.email_backend}")
+
+
+def start_email_worker():
+    global email_worker
+    if email_worker is None:
+        email_worker = EmailOutboxWorker(
+            repository=EmailOutboxRepository(BackgroundSession),
+            email_client=create_email_client(),
+            batch_size=api_config.email_batch_size,
+            rate_limit=api_config.email_rate_limit,
+            max_attempts=api_config.email_max_attempts,
+            poll_interval=api_config.email_poll_interval,
+        )
+        email_worker.start()
+
+
+async def stop_email_worker():
+    global email_worker
+    if email_worker is not None:
+        await email_worker.stop()
+        email_worker = None
@@ -0,0 +1,40 @@
+from enum import Enum as PyEnum
+from sqlalchemy import Column, DateTime, Index, Integer, JSON, String, Text
+from sqlalchemy.sql import func
+
+from src.config.database.base import Base
+
+
+class EmailStatus(PyEnum):
+    """Estados de un mail del outbox"""
+
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class OutboxEmail(Base):
+    """
+    Mail pendiente de envio. Se guarda en la misma transaccion que el cambio
+    que lo genera y lo envia el EmailOutboxWorker, asi no se pierde si el
+    worker de la api se reinicia.
+    """
+
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, autoincrement=True, primary_key=True)
+    to = Column(JSON, nullable=False)
+    cc = Column(JSON, nullable=False, default=[])
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    content_type = Column(String, nullable=False, default="text/plain")
+    status = Column(String, nullable=False, default=EmailStatus.PENDING.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(), nullable=False, server_default=func.now())
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime(), server_default=func.now())
+    sent_at = Column(DateTime(), nullable=True)
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
@@ -0,0 +1,106 @@
+import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from src.api.emails.models import EmailStatus, OutboxEmail
+
+
+class EmailOutboxRepository:
+
+    def __init__(self, sess: Session):
+        self.Session = sess
+
+    def enqueue(self, emails: list[OutboxEmail]):
+        """
+        Agrega los mails al outbox sin hacer commit: se guardan con el
+        proximo commit de la unidad de trabajo del request, junto con el
+        cambio que los genero. Si el request falla se descartan.
+        """
+        with self.Session() as session:
+            session.add_all(emails)
+            session.flush()
+
+    def claim_due(self, limit: int, lease: int) -> list[OutboxEmail]:
+        """
+        Toma hasta limit mails pendientes cuyo intento ya corresponde y los
+        reserva por lease segundos, sumando un intento. Con SKIP LOCKED
+        varios workers pueden reclamar a la vez sin tomar los mismos mails;
+        si un worker se cae, los mails vuelven a estar disponibles al vencer
+        la reserva.
+        """
+        due = (
+            select(OutboxEmail.id)
+            .where(
+                OutboxEmail.status == EmailStatus.PENDING.value,
+                OutboxEmail.next_attempt_at <= func.now(),
+            )
+            .order_by(OutboxEmail.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxEmail)
+            .where(OutboxEmail.id.in_(due))
+            .values(
+                attempts=OutboxEmail.attempts + 1,
+                next_attempt_at=func.now() + datetime.timedelta(seconds=lease),
+            )
+            .returning(OutboxEmail)
+            .execution_options(synchronize_session=False)
+        )
+        with self.Session() as session:
+            emails = session.scalars(stmt).all()
+            session.flush()
+            session.expunge_all()
+
+        return sorted(emails, key=lambda email: email.id)
+
+    def mark_sent(self, ids: list[int]):
+        """Marca los mails como enviados"""
+        stmt = (
+            update(OutboxEmail)
+            .where(OutboxEmail.id.in_(ids))
+            .values(status=EmailStatus.SENT.value, sent_at=func.now(), error=None)
+        )
+        with self.Session() as session:
+            session.execute(stmt)
+            session.flush()
+
+    def reschedule(self, ids: list[int], error: str, delay: float):
+        """Deja los mails pendientes para reintentarlos dentro de delay segundos"""
+        stmt = (
+            update(OutboxEmail)
+            .where(OutboxEmail.id.in_(ids))
+            .values(
+                error=error,
+                next_attempt_at=func.now() + datetime.timedelta(seconds=delay),
+            )
+        )
+        with self.Session() as session:
+            session.execute(stmt)
+            session.flush()
+
+    def mark_failed(self, ids: list[int], error: str):
+        """Marca los mails como fallidos, ya no se reintentan"""
+        stmt = (
+            update(OutboxEmail)
+            .where(OutboxEmail.id.in_(ids))
+            .values(status=EmailStatus.FAILED.value, error=error)
+        )
+        with self.Session() as session:
+            session.execute(stmt)
+            session.flush()
+
+    def get_emails(self, status: str | None = None) -> list[OutboxEmail]:
+        """Devuelve los mails del outbox, opcionalmente de un estado"""
+        with self.Session() as session:
+            query = session.query(OutboxEmail)
+            if status is not None:
+                query = query.filter(OutboxEmail.status == status)
+
+            emails = query.order_by(OutboxEmail.id).all()
+            session.expunge_all()
+
+        return emails
@@ -0,0 +1,75 @@
+from src.api.emails.models import OutboxEmail
+from src.config.config import api_config
+from src.config.logging import logger
+from src.core.email_client import attachment_email
+from src.core.group import AssignedGroup
+
+# Codigo que devuelve SendGrid al aceptar un mail, los mails del outbox
+# quedan aceptados al guardarse
+ACCEPTED = 202
+
+
+class EmailOutboxService:
+    """
+    Reemplaza al SendGridEmailClient en los endpoints: en lugar de enviar
+    los mails los deja en el outbox, y el EmailOutboxWorker los envia fuera
+    del request.
+    """
+
+    def __init__(self, repository) -> None:
+        self._repository = repository
+
+    def _filter_receivers(self, tos, ccs):
+        """Controlo que no haya un cc en los to, sino sendgrid falla"""
+        return [cc for cc in ccs if cc not in tos]
+
+    def _enqueue(
+        self, to: list[str], subject: str, body: str, cc: list[str], content_type: str
+    ) -> int:
+        to = list(dict.fromkeys(to))
+        email = OutboxEmail(
+            to=to,
+            cc=self._filter_receivers(to, list(dict.fromkeys(cc))),
+            subject=subject,
+            body=body,
+            content_type=content_type,
+        )
+        self._repository.enqueue([email])
+        logger.info(f"Email '{subject}' queued for {len(to)} recipients")
+        return ACCEPTED
+
+    def send_email(self, to: str, subject: str, body: str, cc: list[str] = []):
+        return self._enqueue([to], subject, body, cc, "text/plain")
+
+    def send_emails(self, to: list[str], subject: str, body: str, cc: list[str] = []):
+        return self._enqueue(to, subject, body, cc, "text/plain")
+
+    def send_individual_emails(self, emails: list[tuple[str, str, str]]) -> int:
+        """
+        Deja en el outbox un mail de texto por destinatario a partir de tuplas
+        (to, asunto, cuerpo), todos con un unico flush
+        """
+        self._repository.enqueue(
+            [
+                OutboxEmail(
+                    to=[to],
+                    cc=[],
+                    subject=subject,
+                    body=body,
+                    content_type="text/plain",
+                )
+                for to, subject, body in emails
+            ]
+        )
+        logger.info(f"{len(emails)} individual emails queued")
+        return ACCEPTED
+
+    def notify_attachement(self, group: AssignedGroup, type_of_attachment: str):
+        email = attachment_email(group, type_of_attachment)
+        return self._enqueue(
+            email["to"],
+            email["subject"],
+            email["body"],
+            api_config.cc_emails,
+            "text/html",
+        )
@@ -0,0 +1,156 @@
+import asyncio
+from itertools import groupby
+
+from src.api.emails.models import OutboxEmail
+from src.api.emails.repository import EmailOutboxRepository
+from src.config.logging import logger
+
+SENT = 202
+# SendGrid acepta hasta 1000 personalizations por request
+MAX_PERSONALIZATIONS = 1000
+
+
+class RateLimiter:
+    """Limita la cantidad de llamadas por segundo, espaciandolas de forma pareja"""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1 / rate if rate > 0 else 0
+        self._next = 0.0
+
+    async def wait(self):
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if self._next > now:
+            await asyncio.sleep(self._next - now)
+        self._next = max(now, self._next) + self._interval
+
+
+class EmailOutboxWorker:
+    """
+    Envia los mails del outbox fuera de los requests.
+
+    En cada vuelta reclama un lote de mails pendientes, los agrupa por
+    asunto y cuerpo y envia cada grupo en una sola llamada a SendGrid (una
+    personalization por mail), respetando rate_limit llamadas por segundo.
+    Si SendGrid falla o limita (429 o 5xx) los mails se reintentan con
+    backoff exponencial hasta max_attempts; otros errores los marcan como
+    fallidos. Corre como una tarea del event loop de la aplicacion.
+    """
+
+    def __init__(
+        self,
+        repository: EmailOutboxRepository,
+        email_client,
+        batch_size: int = 100,
+        rate_limit: float = 5,
+        max_attempts: int = 5,
+        poll_interval: float = 5,
+        backoff: float = 30,
+        lease: int = 300,
+    ) -> None:
+        self._repository = repository
+        self._email_client = email_client
+        self._batch_size = batch_size
+        self._rate_limiter = RateLimiter(rate_limit)
+        self._max_attempts = max_attempts
+        self._poll_interval = poll_interval
+        self._backoff = backoff
+        self._lease = lease
+        self._task = None
+
+    def _batches(self, emails: list[OutboxEmail]):
+        """Agrupa los mails con el mismo contenido, respetando el maximo de SendGrid"""
+
+        def content(email):
+            return email.subject, email.body, email.content_type
+
+        for key, group in groupby(sorted(emails, key=content), key=content):
+            group = list(group)
+            for i in range(0, len(group), MAX_PERSONALIZATIONS):
+                yield key, group[i : i + MAX_PERSONALIZATIONS]
+
+    def _personalization(self, email: OutboxEmail) -> dict:
+        personalization = {"to": [{"email": to} for to in email.to]}
+        if email.cc:
+            personalization["cc"] = [{"email": cc} for cc in email.cc]
+        return personalization
+
+    def _retry_delay(self, attempts: int) -> float:
+        return self._backoff * 2 ** (attempts - 1)
+
+    def _fail(self, emails: list[OutboxEmail], error: str, retryable: bool):
+        """Reprograma los mails con backoff o los marca como fallidos"""
+        failed = [
+            email.id
+            for email in emails
+            if not retryable or email.attempts >= self._max_attempts
+        ]
+        if failed:
+            logger.error(f"Emails {failed} failed: {error}")
+            self._repository.mark_failed(failed, error)
+
+        retries = sorted(
+            [email for email in emails if email.id not in failed],
+            key=lambda email: email.attempts,
+        )
+        for attempts, group in groupby(retries, key=lambda email: email.attempts):
+            ids = [email.id for email in group]
+            self._repository.reschedule(ids, error, self._retry_delay(attempts))
+
+    async def _send(self, key: tuple, emails: list[OutboxEmail]):
+        subject, body, content_type = key
+        personalizations = [self._personalization(email) for email in emails]
+        await self._rate_limiter.wait()
+        try:
+            status = await self._email_client.send_batch(
+                subject, body, content_type, personalizations
+            )
+        except Exception as e:
+            await asyncio.to_thread(self._fail, emails, str(e), True)
+            return
+
+        if status == SENT:
+            ids = [email.id for email in emails]
+            await asyncio.to_thread(self._repository.mark_sent, ids)
+            logger.info(f"Emails {ids} sent")
+        else:
+            retryable = status == 429 or status >= 500
+            error = f"Sendgrid responded {status}"
+            await asyncio.to_thread(self._fail, emails, error, retryable)
+
+    async def run_once(self) -> int:
+        """Envia un lote de mails pendientes y devuelve cuantos reclamo"""
+        emails = await asyncio.to_thread(
+            self._repository.claim_due, self._batch_size, self._lease
+        )
+        for key, batch in self._batches(emails):
+            await self._send(key, batch)
+        return len(emails)
+
+    async def run(self):
+        """Procesa el outbox hasta que se cancele la tarea"""
+        while True:
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Email outbox worker failed because of: {str(e)}")
+                claimed = 0
+            # Si el lote vino lleno es probable que haya mas, no se espera
+            if claimed < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
+
+    def start(self):
+        """Lanza el worker en el event loop actual"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """Detiene el worker y cierra el cliente de mails"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._email_client.close()
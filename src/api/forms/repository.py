@@ -1,4 +1,6 @@
 from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.api.exceptions import Duplicated
@@ -82,7 +84,7 @@ class FormRepository:
                     period_id=period,
                 )
                 session.add(answer)
-            session.commit()
+            session.flush()
             logger.info(f"New {len(answers)} introduced")
             session.expunge_all()
 
@@ -91,8 +93,7 @@ class FormRepository:
     def delete_answers_by_answer_id(self, answer_id: datetime):
         """Borra una respuesta de un grupo"""
         with self.Session() as session:
-            with session.begin():
-                session.query(FormPreferences).filter_by(answer_id=answer_id).delete()
+            session.query(FormPreferences).filter_by(answer_id=answer_id).delete()
 
     def get_answers_by_answer_id(self, answer_id: datetime):
         """Obtiene la respuesta por answer_id"""
@@ -149,3 +150,32 @@ class FormRepository:
             logger.info("Get all the answers")
 
         return answers
+
+
+class AsyncFormRepository:
+    """Variante asincronica (asyncpg) de las consultas de formularios mas usadas"""
+
+    def __init__(self, sess: AsyncSession):
+        self.Session = sess
+
+    async def get_answers_by_user_id(self, user_id, period):
+        """Obtiene todas las respuestas de un alumnos"""
+        query = (
+            select(
+                FormPreferences.answer_id,
+                User.email.label("email"),
+                FormPreferences.topic_1,
+                FormPreferences.topic_2,
+                FormPreferences.topic_3,
+            )
+            .join(User, User.id == FormPreferences.user_id)
+            .where(
+                FormPreferences.user_id == user_id,
+                FormPreferences.period_id == period,
+            )
+        )
+        async with self.Session() as session:
+            result = await session.execute(query)
+            answers = result.all()
+
+        return answers
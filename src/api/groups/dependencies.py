@@ -6,10 +6,52 @@
 # =============================================================================
 
 
+from typing_extensions import Annotated
+from fastapi import Depends
+
+from src.api.emails.dependencies import get_email_outbox
 from src.config.config import api_config
-from src.core.email_client import SendGridEmailClient
+from src.core.azure_container_client import AsyncAzureContainerClient
+from src.core.local_storage_client import LocalStorageClient
+from src.core.storage_client import StorageClient
+
+
+def get_email_sender(outbox: Annotated[object, Depends(get_email_outbox)]):
+    # Los mails se guardan en el outbox y los envia el EmailOutboxWorker
+    yield outbox
+
+
+# Cliente de storage compartido por toda la app, se crea en el primer pedido
+storage_client: StorageClient | None = None
+
+
+def create_storage_client() -> StorageClient:
+    if api_config.storage_backend == "local":
+        return LocalStorageClient(
+            root=api_config.storage_local_path,
+            container=api_config.container,
+            chunk_size=api_config.storage_chunk_size,
+        )
+    if api_config.storage_backend == "azure":
+        return AsyncAzureContainerClient(
+            access_key=api_config.storage_access_key,
+            container=api_config.container,
+            chunk_size=api_config.storage_chunk_size,
+            max_connections=api_config.storage_max_connections,
+            max_concurrency=api_config.storage_max_concurrency,
+        )
+    raise ValueError(f"Unknown storage backend: {api_config.storage_backend}")
+
+
+async def get_storage_client():
+    global storage_client
+    if storage_client is None:
+        storage_client = create_storage_client()
+    return storage_client
 
 
-def get_email_sender():
-    email_client = SendGridEmailClient(api_key=api_config.email_key)
-    yield email_client
+async def close_storage_client():
+    global storage_client
+    if storage_client is not None:
+        await storage_client.close()
+        storage_client = None
@@ -1,4 +1,15 @@
-from sqlalchemy import Column, Integer, DateTime, Boolean, ForeignKey, Table, String
+from enum import Enum as PyEnum
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Integer,
+    DateTime,
+    Boolean,
+    ForeignKey,
+    Table,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, relationship
 from typing import List
@@ -65,3 +76,36 @@ class Group(Base):
     group_dates_slots = relationship(
         "GroupDateSlot", back_populates="groups", lazy="noload"
     )
+
+
+class DeliverableKind(PyEnum):
+    """Entregas de un grupo que se guardan en el storage"""
+
+    INITIAL_PROJECT = "initial-project"
+    FINAL_PROJECT = "informe-final"
+
+
+class Deliverable(Base):
+    """
+    Indice de los archivos entregados por los grupos. Se actualiza en cada
+    subida, asi los listados no tienen que recorrer el storage.
+    """
+
+    __tablename__ = "deliverables"
+
+    id = Column(Integer, autoincrement=True, primary_key=True)
+    period_id = Column(String, ForeignKey("periods.id", ondelete="CASCADE"))
+    kind = Column(String, nullable=False)
+    group_id = Column(Integer, ForeignKey("groups.id", ondelete="CASCADE"))
+    blob_name = Column(String, nullable=False)
+    container = Column(String, nullable=False)
+    size = Column(BigInteger)
+    etag = Column(String, nullable=True)
+    created_on = Column(DateTime(timezone=True))
+    last_modified = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        UniqueConstraint(
+            "period_id", "kind", "group_id", name="uq_deliverables_period_kind_group"
+        ),
+    )
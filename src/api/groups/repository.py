@@ -1,9 +1,12 @@
-from sqlalchemy import func, bindparam, update, select, insert, asc
+from sqlalchemy import func, bindparam, update, select, insert, asc, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
 from src.api.groups.exceptions import GroupNotFound
-from src.api.groups.models import Group, association_table
+from src.api.groups.models import Deliverable, Group, association_table
 from src.api.students.exceptions import StudentNotFound
+from src.api.tutors.models import TutorPeriod
 from src.api.users.models import User
 
 
@@ -34,11 +37,11 @@ class GroupRepository:
             )
             group.students = students
             session.add(group)
-            session.commit()
+            session.flush()
             session.refresh(group)
 
             group.group_number = group.id
-            session.commit()
+            session.flush()
             session.refresh(group)
             session.expunge(group)
 
@@ -65,11 +68,11 @@ class GroupRepository:
             )
             group.students = students
             session.add(group)
-            session.commit()
+            session.flush()
             session.refresh(group)
 
             group.group_number = group.id
-            session.commit()
+            session.flush()
             session.expunge(group)
 
         return group
@@ -141,7 +144,7 @@ class GroupRepository:
         stmt = update(Group).where(Group.id == group_id).values(**attributes)
         with self.Session() as session:
             session.execute(stmt)
-            session.commit()
+            session.flush()
 
     def get_groups_by_period_id(
         self,
@@ -253,3 +256,174 @@ class GroupRepository:
             result = session.execute(query).scalar()
 
         return result
+
+    def save_deliverables(self, deliverables: list[dict]):
+        """
+        Registra las entregas subidas. Si el grupo ya tenia una entrega del
+        mismo tipo en el cuatrimestre se actualizan sus datos y se conserva
+        la fecha de creacion.
+        """
+        if not deliverables:
+            return
+        stmt = pg_insert(Deliverable).values(deliverables)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_deliverables_period_kind_group",
+            set_={
+                "blob_name": stmt.excluded.blob_name,
+                "container": stmt.excluded.container,
+                "size": stmt.excluded.size,
+                "etag": stmt.excluded.etag,
+                "last_modified": stmt.excluded.last_modified,
+            },
+        )
+        with self.Session() as session:
+            session.execute(stmt)
+            session.flush()
+
+    def get_deliverables(
+        self, period_id: str, kind: str | None = None, tutor_id: int | None = None
+    ) -> list[Deliverable]:
+        """
+        Devuelve las entregas de un cuatrimestre ordenadas por grupo, de un
+        tipo o de todos y opcionalmente solo las de los grupos de un tutor
+        """
+        with self.Session() as session:
+            query = session.query(Deliverable).filter(
+                Deliverable.period_id == period_id
+            )
+            if kind is not None:
+                query = query.filter(Deliverable.kind == kind)
+            if tutor_id is not None:
+                query = (
+                    query.join(Group, Group.id == Deliverable.group_id)
+                    .join(TutorPeriod, TutorPeriod.id == Group.tutor_period_id)
+                    .filter(TutorPeriod.tutor_id == tutor_id)
+                )
+
+            deliverables = query.order_by(
+                asc(Deliverable.group_id), asc(Deliverable.kind)
+            ).all()
+            session.expunge_all()
+        return deliverables
+
+    def delete_deliverables(self, period_id: str, kind: str, group_ids: list[int]):
+        """Borra las entregas de los grupos indicados"""
+        if not group_ids:
+            return
+        stmt = delete(Deliverable).where(
+            Deliverable.period_id == period_id,
+            Deliverable.kind == kind,
+            Deliverable.group_id.in_(group_ids),
+        )
+        with self.Session() as session:
+            session.execute(stmt)
+            session.flush()
+
+
+class AsyncGroupRepository:
+    """Variante asincronica (asyncpg) de las consultas de grupos mas usadas"""
+
+    def __init__(self, sess: AsyncSession):
+        self.Session = sess
+
+    def _with_relations(
+        self,
+        query,
+        load_topic=False,
+        load_tutor_period=False,
+        load_period=False,
+        load_students=False,
+        load_dates=False,
+    ):
+        if load_topic:
+            query = query.options(joinedload(Group.topic))
+        if load_tutor_period:
+            query = query.options(joinedload(Group.tutor_period))
+        if load_period:
+            query = query.options(joinedload(Group.period))
+        if load_students:
+            query = query.options(joinedload(Group.students))
+        if load_dates:
+            query = query.options(joinedload(Group.group_dates_slots))
+        return query
+
+    async def get_groups(
+        self,
+        period: str,
+        load_topic=False,
+        load_tutor_period=False,
+        load_period=False,
+        load_students=False,
+        load_dates: bool = False,
+    ) -> list[Group]:
+        """Devuelve los grupos a partir de un cuatrimestre y diferentes filtros"""
+        query = self._with_relations(
+            select(Group),
+            load_topic,
+            load_tutor_period,
+            load_period,
+            load_students,
+            load_dates,
+        )
+        query = query.where(Group.period_id == period).order_by(asc(Group.id))
+        async with self.Session() as session:
+            result = await session.scalars(query)
+            groups = result.unique().all()
+            session.expunge_all()
+        return groups
+
+    async def get_groups_without_preferred_topics(self, period) -> list[Group]:
+        """Devuelve todos los grupos que no tengan temas de preferencias"""
+        query = select(Group).where(
+            func.cardinality(Group.preferred_topics) == 0,
+            Group.period_id == period,
+        )
+        async with self.Session() as session:
+            result = await session.scalars(query)
+            groups = result.unique().all()
+            session.expunge_all()
+        return groups
+
+    async def get_groups_by_period_id(
+        self,
+        tutor_period_id: int,
+        load_topic=False,
+        load_period=False,
+        load_students=False,
+    ) -> list[Group]:
+        """Devuelve todos los grupo basado en un TutorPeriod id"""
+        query = self._with_relations(
+            select(Group),
+            load_topic,
+            True,
+            load_period,
+            load_students,
+        ).where(Group.tutor_period_id == tutor_period_id)
+        async with self.Session() as session:
+            result = await session.scalars(query)
+            groups = result.unique().all()
+            session.expunge_all()
+        return groups
+
+    async def get_groups_by_reviewer_id(
+        self,
+        reviewer_id: int,
+        period_id: str,
+        load_topic=False,
+        load_period=False,
+        load_students=False,
+        load_tutor_period=False,
+    ) -> list[Group]:
+        """Devuelve todos los grupos para un reviewer_id y period_id dados"""
+        query = self._with_relations(
+            select(Group),
+            load_topic,
+            load_tutor_period,
+            load_period,
+            load_students,
+        ).where(Group.period_id == period_id, Group.reviewer_id == reviewer_id)
+        async with self.Session() as session:
+            result = await session.scalars(query)
+            groups = result.unique().all()
+            session.expunge_all()
+        return groups
@@ -2,12 +2,13 @@ from typing_extensions import Annotated
 from fastapi import (
     APIRouter,
     Depends,
-    Response,
+    Header,
     UploadFile,
     status,
     Query,
-    BackgroundTasks,
 )
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -15,9 +16,9 @@ from src.api.auth.dependencies import authorization
 from src.api.auth.jwt import InvalidJwt
 from src.api.auth.service import AuthenticationService
 from src.api.exceptions import EntityNotInserted, EntityNotFound, ServerError
-from src.api.groups.dependencies import get_email_sender
+from src.api.groups.dependencies import get_email_sender, get_storage_client
 from src.api.groups.mapper import GroupMapper
-from src.api.groups.repository import GroupRepository
+from src.api.groups.repository import AsyncGroupRepository, GroupRepository
 from src.api.groups.schemas import (
     AssignedGroupConfirmationRequest,
     BlobDetailsList,
@@ -39,8 +40,8 @@ from src.api.tutors.service import TutorService
 from src.api.users.exceptions import InvalidCredentials
 from src.api.utils.response_builder import ResponseBuilder
 from src.config.config import api_config
-from src.config.database.database import get_db
-from src.core.azure_container_client import AzureContainerClient
+from src.config.database.database import get_async_db, get_db
+from src.core.storage_client import StorageClient
 
 router = APIRouter(prefix="/groups", tags=["Groups"])
 
@@ -119,7 +120,7 @@ async def post_initial_project(
     file: UploadFile,
     session: Annotated[Session, Depends(get_db)],
     authorization: Annotated[dict, Depends(authorization)],
-    background_tasks: BackgroundTasks,
+    storage_client: Annotated[StorageClient, Depends(get_storage_client)],
     email_sender: Annotated[object, Depends(get_email_sender)],
     project_title: str = Query(...),
 ):
@@ -129,22 +130,16 @@ async def post_initial_project(
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_student_role(authorization["token"])
 
-        container_name = api_config.container
-        access_key = api_config.storage_access_key
-        az_client = AzureContainerClient(
-            container=container_name, access_key=access_key
-        )
-        content_as_bytes = await file.read()
         group_service = GroupService(GroupRepository(session))
-        group_service.upload_initial_project(
-            group_id, project_title, content_as_bytes, az_client
-        )
-
         group = GroupMapper.map_model_to_assigned_group(
             group_service.get_group_by_id(group_id, True, True)
         )
-        background_tasks.add_task(
-            email_sender.notify_attachement, group, "Anteproyecto"
+        # El aviso queda en el outbox y se guarda con el commit de la entrega
+        email_sender.notify_attachement(group, "Anteproyecto")
+
+        # El archivo se sube en bloques leidos del spool del UploadFile
+        await group_service.upload_initial_project(
+            group_id, project_title, file, storage_client
         )
 
         return "File uploaded successfully"
@@ -171,7 +166,7 @@ async def post_final_project(
     file: UploadFile,
     session: Annotated[Session, Depends(get_db)],
     authorization: Annotated[dict, Depends(authorization)],
-    background_tasks: BackgroundTasks,
+    storage_client: Annotated[StorageClient, Depends(get_storage_client)],
     email_sender: Annotated[object, Depends(get_email_sender)],
     project_title: str = Query(...),
 ):
@@ -180,22 +175,16 @@ async def post_final_project(
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_student_role(authorization["token"])
 
-        container_name = api_config.container
-        access_key = api_config.storage_access_key
-        az_client = AzureContainerClient(
-            container=container_name, access_key=access_key
-        )
-        content_as_bytes = await file.read()
         group_service = GroupService(GroupRepository(session))
-        group_service.upload_final_project(
-            group_id, project_title, content_as_bytes, az_client
-        )
-
         group = GroupMapper.map_model_to_assigned_group(
             group_service.get_group_by_id(group_id, True, True)
         )
-        background_tasks.add_task(
-            email_sender.notify_attachement, group, "Informe final"
+        # El aviso queda en el outbox y se guarda con el commit de la entrega
+        email_sender.notify_attachement(group, "Informe final")
+
+        # El archivo se sube en bloques leidos del spool del UploadFile
+        await group_service.upload_final_project(
+            group_id, project_title, file, storage_client
         )
         return "File uploaded successfully"
     except InvalidJwt:
@@ -220,7 +209,6 @@ async def post_intermediate_project(
     link: IntermediateAssignmentRequest,
     session: Annotated[Session, Depends(get_db)],
     authorization: Annotated[dict, Depends(authorization)],
-    background_tasks: BackgroundTasks,
     email_sender: Annotated[object, Depends(get_email_sender)],
 ):
     """Endpoint para agregar una entrega intermedia de un grupo"""
@@ -232,14 +220,13 @@ async def post_intermediate_project(
         )
 
         group_service = GroupService(group_repository)
-        group_service.upload_intermediate_project(group_id, link.url)
-
         group = GroupMapper.map_model_to_assigned_group(
             group_service.get_group_by_id(group_id, True, True)
         )
-        background_tasks.add_task(
-            email_sender.notify_attachement, group, "Entrega Intermedia"
-        )
+        # El aviso queda en el outbox y se guarda con el commit de la entrega
+        email_sender.notify_attachement(group, "Entrega Intermedia")
+
+        group_service.upload_intermediate_project(group_id, link.url)
     except InvalidJwt as e:
         raise InvalidCredentials("Invalid Authorization")
     except EntityNotFound as e:
@@ -271,7 +258,7 @@ async def post_intermediate_project(
     status_code=status.HTTP_200_OK,
 )
 async def get_groups(
-    session: Annotated[Session, Depends(get_db)],
+    session: Annotated[AsyncSession, Depends(get_async_db)],
     authorization: Annotated[dict, Depends(authorization)],
     load_topic: bool = True,
     load_tutor_period: bool = False,
@@ -284,10 +271,10 @@ async def get_groups(
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_only_admin(authorization["token"])
 
-        group_service = GroupService(GroupRepository(session))
+        group_service = GroupService(AsyncGroupRepository(session))
 
         res = GroupCompleteList.model_validate(
-            group_service.get_groups(
+            await group_service.get_groups_async(
                 period, load_topic, load_tutor_period, load_period, load_students
             )
         )
@@ -357,7 +344,12 @@ async def get_group_by_id(
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_200_OK: {"description": "Success"},
+        status.HTTP_206_PARTIAL_CONTENT: {"description": "Requested range"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "File not modified"},
         status.HTTP_401_UNAUTHORIZED: {"description": "Invalid token"},
+        status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE: {
+            "description": "Range out of the file"
+        },
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Server Error"},
     },
 )
@@ -365,29 +357,22 @@ async def download_group_initial_project(
     group_id: int,
     session: Annotated[Session, Depends(get_db)],
     authorization: Annotated[dict, Depends(authorization)],
+    storage_client: Annotated[StorageClient, Depends(get_storage_client)],
     period=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
     try:
 
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_tutor_rol(authorization["token"])
 
-        container_name = api_config.container
-        access_key = api_config.storage_access_key
-        az_client = AzureContainerClient(
-            container=container_name, access_key=access_key
-        )
-
         group_service = GroupService(GroupRepository(session))
-        bytes = group_service.download_initial_project(period, group_id, az_client)
-
-        response = Response(
-            content=bytes, status_code=status.HTTP_200_OK, media_type="application/pdf"
-        )
-        response.headers["Content-Disposition"] = (
-            "attachment; filename=initial_project.pdf"
+        blob_stream = await group_service.download_initial_project(
+            period, group_id, storage_client, range_header, if_none_match
         )
-        return response
+
+        return await blob_stream.to_response("initial_project.pdf", "application/pdf")
     except InvalidJwt:
         raise InvalidCredentials("Invalid Authorization")
     except Exception as e:
@@ -414,14 +399,8 @@ async def list_initial_projects(
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_only_admin(authorization["token"])
 
-        container_name = api_config.container
-        access_key = api_config.storage_access_key
-        az_client = AzureContainerClient(
-            container=container_name, access_key=access_key
-        )
-
         group_service = GroupService(GroupRepository(session))
-        blobs = group_service.list_initial_project(period, az_client)
+        blobs = group_service.list_initial_project(period)
 
         return BlobDetailsList.model_validate(blobs)
 
@@ -498,7 +477,12 @@ async def gets_intermediate_assigment(
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_200_OK: {"description": "Success"},
+        status.HTTP_206_PARTIAL_CONTENT: {"description": "Requested range"},
+        status.HTTP_304_NOT_MODIFIED: {"description": "File not modified"},
         status.HTTP_401_UNAUTHORIZED: {"description": "Invalid token"},
+        status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE: {
+            "description": "Range out of the file"
+        },
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Server Error"},
     },
 )
@@ -506,29 +490,22 @@ async def download_group_final_project(
     group_id: int,
     session: Annotated[Session, Depends(get_db)],
     authorization: Annotated[dict, Depends(authorization)],
+    storage_client: Annotated[StorageClient, Depends(get_storage_client)],
     period=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
 ):
     try:
 
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_tutor_rol(authorization["token"])
 
-        container_name = api_config.container
-        access_key = api_config.storage_access_key
-        az_client = AzureContainerClient(
-            container=container_name, access_key=access_key
-        )
-
         group_service = GroupService(GroupRepository(session))
-        bytes = group_service.download_final_project(period, group_id, az_client)
-
-        response = Response(
-            content=bytes, status_code=status.HTTP_200_OK, media_type="application/pdf"
-        )
-        response.headers["Content-Disposition"] = (
-            "attachment; filename=informe-final.pdf"
+        blob_stream = await group_service.download_final_project(
+            period, group_id, storage_client, range_header, if_none_match
         )
-        return response
+
+        return await blob_stream.to_response("informe-final.pdf", "application/pdf")
     except InvalidJwt:
         raise InvalidCredentials("Invalid Authorization")
     except Exception as e:
@@ -555,14 +532,8 @@ async def list_initial_projects(
         auth_service = AuthenticationService(authorization["jwt_resolver"])
         auth_service.assert_only_admin(authorization["token"])
 
-        container_name = api_config.container
-        access_key = api_config.storage_access_key
-        az_client = AzureContainerClient(
-            container=container_name, access_key=access_key
-        )
-
         group_service = GroupService(GroupRepository(session))
-        blobs = group_service.list_final_project(period, az_client)
+        blobs = group_service.list_final_project(period)
 
         return BlobDetailsList.model_validate(blobs)
 
@@ -574,6 +545,79 @@ async def list_initial_projects(
         raise ServerError(message=str(e))
 
 
+@router.get(
+    "/deliverables/export",
+    summary="Downloads a zip with the reports of a period",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"description": "Success"},
+        status.HTTP_401_UNAUTHORIZED: {"description": "Invalid token"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Server Error"},
+    },
+)
+async def export_deliverables(
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+    storage_client: Annotated[StorageClient, Depends(get_storage_client)],
+    period=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+    tutor_id: int | None = Query(default=None),
+):
+    """
+    Endpoint para descargar en un zip los anteproyectos e informes finales
+    del cuatrimestre. Un tutor solo puede descargar los de sus grupos.
+    """
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_tutor_rol(authorization["token"], tutor_id)
+        if not auth_service.is_admin(authorization["token"]):
+            tutor_id = auth_service.get_user_id(authorization["token"])
+
+        group_service = GroupService(GroupRepository(session))
+        zip_stream = group_service.export_deliverables(
+            period, storage_client, tutor_id, api_config.storage_export_prefetch
+        )
+
+        filename = f"{period}.zip" if tutor_id is None else f"{period}-{tutor_id}.zip"
+        return StreamingResponse(
+            zip_stream.chunks(),
+            media_type="application/zip",
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
+    except InvalidJwt:
+        raise InvalidCredentials("Invalid Authorization")
+    except Exception as e:
+        raise ServerError(message=str(e))
+
+
+@router.post(
+    "/deliverables/reconcile",
+    summary="Rebuilds the deliverables index of a period from the storage",
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {"description": "Success"},
+        status.HTTP_401_UNAUTHORIZED: {"description": "Invalid token"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Server Error"},
+    },
+)
+async def reconcile_deliverables(
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+    storage_client: Annotated[StorageClient, Depends(get_storage_client)],
+    period=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+):
+    """Endpoint para volver a sincronizar el indice de entregas con el storage"""
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_only_admin(authorization["token"])
+
+        group_service = GroupService(GroupRepository(session))
+        return await group_service.reconcile_deliverables(period, storage_client)
+    except InvalidJwt:
+        raise InvalidCredentials("Invalid Authorization")
+    except Exception as e:
+        raise ServerError(message=str(e))
+
+
 # endregion
 
 
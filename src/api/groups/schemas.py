@@ -76,6 +76,7 @@ class AssignedDateResult(BaseModel):
 
     status: int
     assigments: list[AssignedDateSlotResponse]
+    gap: Optional[float] = None
 
 
 class GroupWithPreferredTopicsRequest(GroupRequest):
@@ -149,6 +150,7 @@ class AssignmentResult(BaseModel):
     status: int
     assigment: List[AssignedGroupResponse] = Field(default=[])
     dcg: Optional[float]
+    gap: Optional[float] = None
 
 
 class BlobDetails(BaseModel):
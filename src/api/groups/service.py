@@ -1,10 +1,15 @@
 import datetime
+import re
 
 from src.api.exceptions import EntityNotInserted, EntityNotFound
 from src.api.groups.exceptions import GroupNotFound
+from src.api.groups.models import DeliverableKind
 from src.api.groups.schemas import BlobDetails
 from src.api.students.exceptions import StudentNotFound
+from src.api.utils.blob_stream import BlobStream
+from src.api.utils.zip_stream import ZipEntry, ZipStream
 from src.config.logging import logger
+from src.core.storage_client import AsyncReadable, StorageClient, StoredBlob
 
 
 class GroupService:
@@ -88,6 +93,27 @@ class GroupService:
         )
         return groups
 
+    async def get_groups_async(
+        self,
+        period: str,
+        load_topic: bool = False,
+        load_tutor_period: bool = False,
+        load_period: bool = False,
+        load_students: bool = False,
+        load_dates: bool = False,
+    ):
+        """Igual que get_groups pero con un AsyncGroupRepository"""
+        logger.info("Fetching all groups")
+        groups = await self._repository.get_groups(
+            period,
+            load_topic,
+            load_tutor_period,
+            load_period,
+            load_students,
+            load_dates,
+        )
+        return groups
+
     def create_basic_groups(self, group_result, period_id):
         """Crea una lista de grupos sin temas ni tutores"""
         for group in group_result:
@@ -117,14 +143,23 @@ class GroupService:
                 id provided are correct."
             )
 
-    def upload_initial_project(
-        self, group_id: int, project_title: str, data: bytes, storage_client
+    async def upload_initial_project(
+        self,
+        group_id: int,
+        project_title: str,
+        data: AsyncReadable,
+        storage_client: StorageClient,
     ):
-        """Sube el anteproyecto de un grupo a Azure Storage"""
+        """Sube el anteproyecto de un grupo al storage"""
         try:
             group = self._repository.get_group_by_id(group_id)
-            path = f"{group.period_id}/{group.id}/initial-project.pdf"
-            blob = storage_client.upload(data=data, filename=path, overwrite=True)
+            kind = DeliverableKind.INITIAL_PROJECT
+            path = self._deliverable_path(group.period_id, group.id, kind)
+            blob = await storage_client.upload_stream(data, filename=path)
+            # Se indexa la entrega para que los listados no recorran el storage
+            self._repository.save_deliverables(
+                [self._to_deliverable(group.period_id, group.id, kind, blob)]
+            )
             self._repository.update(
                 group_id,
                 {
@@ -138,14 +173,23 @@ class GroupService:
             logger.error(f"Could not found group because of: {str(e)}")
             raise EntityNotFound(message=str(e))
 
-    def upload_final_project(
-        self, group_id: int, project_title: str, data: bytes, storage_client
+    async def upload_final_project(
+        self,
+        group_id: int,
+        project_title: str,
+        data: AsyncReadable,
+        storage_client: StorageClient,
     ):
-        """Sube el proyecto final de un grupo a Azure Storage"""
+        """Sube el proyecto final de un grupo al storage"""
         try:
             group = self._repository.get_group_by_id(group_id)
-            path = f"{group.period_id}/{group.id}/informe-final.pdf"
-            blob = storage_client.upload(data=data, filename=path, overwrite=True)
+            kind = DeliverableKind.FINAL_PROJECT
+            path = self._deliverable_path(group.period_id, group.id, kind)
+            blob = await storage_client.upload_stream(data, filename=path)
+            # Se indexa la entrega para que los listados no recorran el storage
+            self._repository.save_deliverables(
+                [self._to_deliverable(group.period_id, group.id, kind, blob)]
+            )
             self._repository.update(
                 group_id,
                 {
@@ -175,55 +219,137 @@ class GroupService:
             logger.error(f"Could not found group because of: {str(e)}")
             raise EntityNotFound(message=str(e))
 
-    def download_final_project(self, period: str, group_id: int, storage_client):
+    async def download_final_project(
+        self,
+        period: str,
+        group_id: int,
+        storage_client: StorageClient,
+        range_header: str | None = None,
+        if_none_match: str | None = None,
+    ) -> BlobStream:
         """Descarga el proyecto final de uun grupo"""
         try:
             path = f"{period}/{group_id}/informe-final.pdf"
-            file_as_bytes = storage_client.download(path)
-            return file_as_bytes
+            return await BlobStream.open(
+                storage_client, path, range_header, if_none_match
+            )
         except Exception as e:
             logger.error(f"Could not download {path}")
             raise e
 
-    def download_initial_project(self, period: str, group_id: int, storage_client):
+    async def download_initial_project(
+        self,
+        period: str,
+        group_id: int,
+        storage_client: StorageClient,
+        range_header: str | None = None,
+        if_none_match: str | None = None,
+    ) -> BlobStream:
         """Descarga el anteproyecto de uun grupo"""
         try:
             path = f"{period}/{group_id}/initial-project.pdf"
-            file_as_bytes = storage_client.download(path)
-            return file_as_bytes
+            return await BlobStream.open(
+                storage_client, path, range_header, if_none_match
+            )
         except Exception as e:
             logger.error(f"Could not download {path}")
             raise e
 
-    def list_initial_project(self, period, storage_client):
-        """Lista los anteproyectos"""
-        pattern = f"^{period}\\/[0-9]+\\/initial-project\\.pdf$"
-        blobs = storage_client.list_blobs(prefix=period, pattern=pattern)
-        blob_details_list = [
+    def _deliverable_path(self, period, group_id, kind: DeliverableKind) -> str:
+        return f"{period}/{group_id}/{kind.value}.pdf"
+
+    def _to_deliverable(
+        self, period, group_id, kind: DeliverableKind, blob: StoredBlob
+    ) -> dict:
+        return {
+            "period_id": period,
+            "kind": kind.value,
+            "group_id": group_id,
+            "blob_name": blob.name,
+            "container": blob.container,
+            "size": blob.size,
+            "etag": blob.etag,
+            "created_on": blob.creation_time,
+            "last_modified": blob.last_modified,
+        }
+
+    def _list_deliverables(self, period, kind: DeliverableKind):
+        deliverables = self._repository.get_deliverables(period, kind.value)
+        return [
             BlobDetails(
-                name=blob.name,
-                created_on=blob.creation_time,
-                last_modified=blob.last_modified,
-                container=blob.container,
+                name=deliverable.blob_name,
+                created_on=deliverable.created_on,
+                last_modified=deliverable.last_modified,
+                container=deliverable.container,
             )
-            for blob in blobs
+            for deliverable in deliverables
         ]
-        return blob_details_list
 
-    def list_final_project(self, period, storage_client):
-        """Lista los proyectos finales"""
-        pattern = f"^{period}\\/[0-9]+\\/informe-final\\.pdf$"
-        blobs = storage_client.list_blobs(prefix=period, pattern=pattern)
-        blob_details_list = [
-            BlobDetails(
-                name=blob.name,
-                created_on=blob.creation_time,
-                last_modified=blob.last_modified,
-                container=blob.container,
+    def list_initial_project(self, period):
+        """Lista los anteproyectos a partir del indice de entregas"""
+        return self._list_deliverables(period, DeliverableKind.INITIAL_PROJECT)
+
+    def list_final_project(self, period):
+        """Lista los proyectos finales a partir del indice de entregas"""
+        return self._list_deliverables(period, DeliverableKind.FINAL_PROJECT)
+
+    def export_deliverables(
+        self,
+        period,
+        storage_client: StorageClient,
+        tutor_id: int | None = None,
+        prefetch: int = 4,
+    ) -> ZipStream:
+        """
+        Arma el zip con todas las entregas del cuatrimestre, o las de los
+        grupos de un tutor, a partir del indice de entregas
+        """
+        deliverables = self._repository.get_deliverables(period, tutor_id=tutor_id)
+        entries = [
+            ZipEntry(
+                blob_name=deliverable.blob_name,
+                arcname=f"{deliverable.group_id}/{deliverable.kind}.pdf",
+                size=deliverable.size,
+                last_modified=deliverable.last_modified,
             )
-            for blob in blobs
+            for deliverable in deliverables
         ]
-        return blob_details_list
+        logger.info(f"Exporting {len(entries)} deliverables of {period}")
+        return ZipStream(storage_client, entries, prefetch)
+
+    async def reconcile_deliverables(self, period, storage_client: StorageClient):
+        """
+        Vuelve a armar el indice de entregas del cuatrimestre a partir de lo
+        que hay en el storage: agrega las que falten, actualiza las que
+        cambiaron y borra las que ya no estan. Sirve para las entregas
+        subidas antes de tener el indice o si el storage se modifico por fuera.
+        """
+        group_ids = {group.id for group in self._repository.get_groups(period)}
+        result = {"indexed": 0, "removed": 0}
+        for kind in DeliverableKind:
+            pattern = f"^{period}\\/([0-9]+)\\/{kind.value}\\.pdf$"
+            blobs = await storage_client.list_blobs(prefix=period, pattern=pattern)
+
+            deliverables = {}
+            for blob in blobs:
+                group_id = int(re.match(pattern, blob.name).group(1))
+                if group_id in group_ids:
+                    deliverables[group_id] = self._to_deliverable(
+                        period, group_id, kind, blob
+                    )
+
+            stale = [
+                deliverable.group_id
+                for deliverable in self._repository.get_deliverables(period, kind.value)
+                if deliverable.group_id not in deliverables
+            ]
+            self._repository.save_deliverables(list(deliverables.values()))
+            self._repository.delete_deliverables(period, kind.value, stale)
+            result["indexed"] += len(deliverables)
+            result["removed"] += len(stale)
+
+        logger.info(f"Deliverables of {period} reconciled: {result}")
+        return result
 
     def get_group_by_id(
         self, group_id: int, load_students: bool = False, load_tutor=False
@@ -27,7 +27,7 @@ class PeriodRepository:
         try:
             with self.Session() as session:
                 session.add(period)
-                session.commit()
+                session.flush()
                 session.refresh(period)
                 session.expunge(period)
 
@@ -64,4 +64,4 @@ class PeriodRepository:
             result = session.execute(stmt).fetchone()
             if result is None:
                 raise PeriodNotFound("The period does not exist")
-            session.commit()
+            session.flush()
@@ -1,14 +1,34 @@
-from sqlalchemy import exc, select
+from typing import Iterable
+
+from sqlalchemy import cast, column, exc, literal, select, table, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.api.groups.models import Group
 from src.api.periods.exceptions import PeriodDuplicated
 from src.api.periods.models import Period
-from src.api.students.exceptions import StudentNotFound, StudentPeriodNotInserted
+from src.api.exceptions import InvalidCsv
+from src.api.students.exceptions import (
+    StudentDuplicated,
+    StudentNotFound,
+    StudentNotInserted,
+    StudentPeriodNotInserted,
+)
 from src.api.students.models import StudentPeriod
 from src.api.topics.models import Topic
 from src.api.tutors.models import TutorPeriod
 from src.api.users.models import User, Role
+from src.api.utils.csv_stream import CopySource
+
+students_staging = table(
+    "students_staging",
+    column("id"),
+    column("name"),
+    column("last_name"),
+    column("email"),
+    column("password"),
+)
 
 
 class StudentRepository:
@@ -87,7 +107,7 @@ class StudentRepository:
         try:
             with self.Session() as session:
                 session.add(student_period)
-                session.commit()
+                session.flush()
 
             return student_period
         except exc.IntegrityError:
@@ -113,7 +133,7 @@ class StudentRepository:
         try:
             with self.Session() as session:
                 session.add_all(student_periods)
-                session.commit()
+                session.flush()
                 session.expunge_all()
 
             return student_periods
@@ -144,13 +164,13 @@ class StudentRepository:
                 # Bulk insert new student periods
                 if new_student_periods:
                     session.bulk_save_objects(new_student_periods)
-                    session.commit()
+                    session.flush()
 
                 # Bulk update existing student periods
                 if update_student_periods:
                     for sp in update_student_periods:
                         session.merge(sp)
-                    session.commit()
+                    session.flush()
 
                 return student_periods
         except Exception:
@@ -158,6 +178,79 @@ class StudentRepository:
                 "Could not insert student periods in the database"
             )
 
+    def import_students(self, rows: Iterable[tuple], period: str) -> list[User]:
+        """
+        Carga estudiantes de forma masiva: las filas (id, nombre, apellido,
+        email, password) se copian con COPY a una tabla temporal y desde ahi
+        se insertan o actualizan users y student_periods con dos sentencias.
+        Si algun id ya pertenece a un usuario que no es estudiante no se
+        guarda nada.
+        """
+        try:
+            with self.Session() as session:
+                connection = session.connection()
+                connection.execute(
+                    text(
+                        "CREATE TEMP TABLE students_staging "
+                        "(id integer, name varchar, last_name varchar, "
+                        "email varchar, password varchar) ON COMMIT DROP"
+                    )
+                )
+                source = CopySource(rows)
+                cursor = connection.connection.cursor()
+                cursor.copy_expert(
+                    "COPY students_staging (id, name, last_name, email, password) "
+                    "FROM STDIN WITH (FORMAT csv)",
+                    source,
+                )
+
+                users = pg_insert(User).from_select(
+                    ["id", "name", "last_name", "email", "password", "role"],
+                    select(
+                        students_staging.c.id,
+                        students_staging.c.name,
+                        students_staging.c.last_name,
+                        students_staging.c.email,
+                        students_staging.c.password,
+                        cast(literal(Role.STUDENT, User.role.type), User.role.type),
+                    ),
+                )
+                users = users.on_conflict_do_update(
+                    index_elements=[User.id],
+                    set_={
+                        "name": users.excluded.name,
+                        "last_name": users.excluded.last_name,
+                        "email": users.excluded.email,
+                    },
+                    where=User.role == Role.STUDENT,
+                ).returning(User)
+                students = (
+                    session.scalars(select(User).from_statement(users)).unique().all()
+                )
+                if len(students) != source.count:
+                    raise StudentNotInserted(
+                        "Some ids already belong to users that are not students"
+                    )
+
+                periods = pg_insert(StudentPeriod).from_select(
+                    ["student_id", "period_id"],
+                    select(students_staging.c.id, literal(period)),
+                )
+                session.execute(
+                    periods.on_conflict_do_update(
+                        index_elements=[StudentPeriod.student_id],
+                        set_={"period_id": periods.excluded.period_id},
+                    )
+                )
+                session.flush()
+                session.expunge_all()
+
+            return students
+        except (InvalidCsv, StudentDuplicated, StudentNotInserted):
+            raise
+        except Exception:
+            raise StudentNotInserted("Could not insert a student in the database")
+
     def delete_student_by_id(self, student_id):
         """Borra alumno por id"""
         with self.Session() as session:
@@ -170,6 +263,64 @@ class StudentRepository:
                 raise StudentNotFound(f"Student with id: {student_id} not exists")
 
             session.delete(student)
-            session.commit()
+            session.flush()
 
         return student
+
+
+class AsyncStudentRepository:
+    """Variante asincronica (asyncpg) de las consultas de estudiantes mas usadas"""
+
+    def __init__(self, sess: AsyncSession):
+        self.Session = sess
+
+    async def get_student_info(self, id: int, period):
+        """Devuelve informacion de un estudiante a partir de su id"""
+        query = (
+            select(
+                User.id.label("user_id"),
+                Group.id.label("group_id"),
+                Group.group_number.label("group_number"),
+                Topic.name.label("topic_name"),
+                TutorPeriod.tutor_id.label("tutor_id"),
+            )
+            .select_from(User)
+            .join(Group.students)
+            .join(Group.topic)
+            .join(Group.tutor_period)
+            .where(User.id == id)
+            .where(Group.period_id == period)
+        )
+        async with self.Session() as session:
+            result = await session.execute(query)
+            student_info = result.one_or_none()
+
+        return student_info
+
+    async def get_teammates(self, id: int, group_id: int):
+        """Devuelve los compañeros de grupo de un estudiante"""
+        query = (
+            select(User)
+            .select_from(User)
+            .join(Group.students)
+            .where(User.id != id)
+            .where(Group.id == group_id)
+        )
+        async with self.Session() as session:
+            result = await session.scalars(query)
+            teammates = result.all()
+            session.expunge_all()
+
+        return teammates
+
+    async def get_period_by_student_id(self, student_id: int) -> Period:
+        """Devuelve todos los cuatrimestres de un estudiante"""
+        query = (
+            select(StudentPeriod).where(StudentPeriod.student_id == student_id).limit(1)
+        )
+        async with self.Session() as session:
+            student_period = (await session.scalars(query)).first()
+            if student_period:
+                session.expunge(student_period)
+                return student_period
+            raise StudentNotFound("The student id is not registered")
@@ -1,22 +1,24 @@
 from fastapi import APIRouter, UploadFile, Depends, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing_extensions import Annotated
 
-from src.api.auth.dependencies import authorization
+from src.api.auth.dependencies import authorization, get_claims
 from src.api.auth.hasher import get_hasher, ShaHasher
 from src.api.auth.jwt import InvalidJwt
+from src.api.auth.schemas import JwtDecoded
 from src.api.auth.service import AuthenticationService
 from src.api.exceptions import Duplicated, EntityNotFound, InvalidFileType, ServerError
-from src.api.forms.repository import FormRepository
-from src.api.groups.repository import GroupRepository
-from src.api.students.repository import StudentRepository
+from src.api.forms.repository import AsyncFormRepository
+from src.api.groups.repository import AsyncGroupRepository
+from src.api.students.repository import AsyncStudentRepository, StudentRepository
 from src.api.students.schemas import PersonalInformation, StudentRequest
 from src.api.students.service import StudentService
 from src.api.users.exceptions import InvalidCredentials
-from src.api.users.repository import UserRepository
+from src.api.users.repository import AsyncUserRepository, UserRepository
 from src.api.users.schemas import UserList, UserResponse
 from src.api.utils.response_builder import ResponseBuilder
-from src.config.database.database import get_db
+from src.config.database.database import get_async_db, get_db
 from src.config.logging import logger
 
 router = APIRouter(prefix="/students", tags=["Students"])
@@ -49,12 +51,10 @@ async def upload_csv_file(
             raise InvalidFileType("CSV file must be provided")
 
         logger.info("csv contains the correct content-type")
-        content = (await file.read()).decode("utf-8")
         service = StudentService(StudentRepository(session))
 
-        res = service.create_students_from_string(
-            content, hasher, UserRepository(session), period
-        )
+        # El archivo se lee de a una fila, sin cargarlo entero en memoria
+        res = service.create_students_from_file(file.file, hasher, period)
 
         return ResponseBuilder.build_clear_cache_response(res, status.HTTP_201_CREATED)
     except (Duplicated, InvalidFileType, EntityNotFound) as e:
@@ -114,22 +114,21 @@ async def get_students_by_ids(
     status_code=status.HTTP_200_OK,
 )
 async def get_student_info(
-    session: Annotated[Session, Depends(get_db)],
-    authorization: Annotated[dict, Depends(authorization)],
+    session: Annotated[AsyncSession, Depends(get_async_db)],
+    claims: Annotated[JwtDecoded, Depends(get_claims)],
 ):
     """Endpoint para obtener informacion del estudiante logeado"""
     try:
-        auth_service = AuthenticationService(authorization["jwt_resolver"])
-        auth_service.assert_student_role(authorization["token"])
-        id = auth_service.get_user_id(authorization["token"])
+        AuthenticationService().assert_student_role(claims)
+        id = claims.user_id
 
-        service = StudentService(StudentRepository(session))
-        res = service.get_personal_info_by_id(
+        service = StudentService(AsyncStudentRepository(session))
+        res = await service.get_personal_info_by_id_async(
             id,
-            FormRepository(session),
-            UserRepository(session),
-            GroupRepository(session),
-            StudentRepository(session),
+            AsyncFormRepository(session),
+            AsyncUserRepository(session),
+            AsyncGroupRepository(session),
+            AsyncStudentRepository(session),
         )
 
         logger.info("Retrieve student info by id.")
@@ -1,6 +1,9 @@
+from io import BytesIO
+from typing import BinaryIO
+
 from src.api.auth.hasher import ShaHasher
-from src.api.forms.repository import FormRepository
-from src.api.groups.repository import GroupRepository
+from src.api.forms.repository import AsyncFormRepository, FormRepository
+from src.api.groups.repository import AsyncGroupRepository, GroupRepository
 from src.api.exceptions import Duplicated, EntityNotFound, EntityNotInserted, InvalidCsv
 from src.api.students.schemas import PersonalInformation
 from src.api.students.utils import StudentCsvFile
@@ -10,9 +13,9 @@ from src.api.students.exceptions import (
     StudentNotInserted,
 )
 from src.api.students.models import StudentPeriod
-from src.api.students.repository import StudentRepository
+from src.api.students.repository import AsyncStudentRepository, StudentRepository
 from src.api.users.models import User, Role
-from src.api.users.repository import UserRepository
+from src.api.users.repository import AsyncUserRepository, UserRepository
 from src.api.users.schemas import UserList, UserResponse
 
 
@@ -21,40 +24,23 @@ class StudentService:
     def __init__(self, repository) -> None:
         self._repository = repository
 
-    def _get_csv_rows(self, csv: str):
-        """Obtiene las filas del csv"""
-        csv_file = StudentCsvFile(csv=csv)
-        return csv_file.get_info_as_rows()
-
-    def _get_students_and_periods(self, rows, hasher: ShaHasher, period: str):
-        students = []
-        periods = []
-        for i in rows:
-            name, last_name, student_id, email = i
-            students.append(
-                User(
-                    name=name,
-                    last_name=last_name,
-                    id=int(student_id),
-                    email=email,
-                    password=hasher.hash(str(student_id)),
-                    role=Role.STUDENT,
-                )
-            )
-            periods.append(StudentPeriod(period_id=period, student_id=student_id))
-        return students, periods
-
-    def create_students_from_string(
-        self, csv: str, hasher: ShaHasher, repository: UserRepository, period: str
-    ):
-        """Crea a partir de un csv como string studiantes"""
+    def create_students_from_file(
+        self, file: BinaryIO, hasher: ShaHasher, period: str
+    ) -> UserList:
+        """
+        Crea o actualiza los estudiantes de un csv leyendolo de a una fila y
+        cargandolos en la base de forma masiva
+        """
         try:
-            rows = self._get_csv_rows(csv)
-            students, student_periods = self._get_students_and_periods(
-                rows, hasher, period
+            csv_file = StudentCsvFile(file)
+            rows = (
+                (student_id, name, last_name, email, hasher.hash(str(student_id)))
+                for name, last_name, student_id, email in csv_file.get_info_as_rows()
             )
-            students_saved = repository.upsert_students(students)
-            self._repository.upsert_student_periods(student_periods)
+            try:
+                students_saved = self._repository.import_students(rows, period)
+            finally:
+                csv_file.close()
             return UserList.model_validate(students_saved)
         except InvalidCsv as e:
             raise e
@@ -63,6 +49,14 @@ class StudentService:
         except StudentNotInserted as e:
             raise EntityNotInserted(str(e))
 
+    def create_students_from_string(
+        self, csv: str, hasher: ShaHasher, repository: UserRepository, period: str
+    ):
+        """Crea a partir de un csv como string studiantes"""
+        return self.create_students_from_file(
+            BytesIO(csv.encode("utf-8")), hasher, period
+        )
+
     def get_students_by_ids(self, ids: list[int], period_id: str):
         """Devuelve una lista de estudiante a partir de una lista de ids"""
         try:
@@ -86,6 +80,25 @@ class StudentService:
         except StudentDuplicated as e:
             raise Duplicated(str(e))
 
+    def _in_groups_without_preferred_topics(self, id: int, groups) -> bool:
+        """Indica si el estudiante esta en alguno de los grupos"""
+        for group in groups:
+            student_ids = [student.id for student in group.students]
+            if id in student_ids:
+                return True
+        return False
+
+    def _fill_group_information(
+        self, personal_information: PersonalInformation, student_info, tutor, teammates
+    ):
+        """Completa la informacion del grupo del estudiante"""
+        personal_information.group_id = student_info.group_id
+        personal_information.tutor = f"{tutor.name} {tutor.last_name}"
+        personal_information.topic = student_info.topic_name
+        personal_information.teammates = list(map(lambda x: x.email, teammates))
+        personal_information.group_number = student_info.group_number
+        return personal_information
+
     def get_personal_info_by_id(
         self,
         id: int,
@@ -103,12 +116,11 @@ class StudentService:
         groups_without_preferred_topics = (
             group_repository.get_groups_without_preferred_topics(period)
         )
-        student_in_groups_without_preferred_topics = False
-
-        for group in groups_without_preferred_topics:
-            student_ids = [student.id for student in group.students]
-            if id in student_ids:
-                student_in_groups_without_preferred_topics = True
+        student_in_groups_without_preferred_topics = (
+            self._in_groups_without_preferred_topics(
+                id, groups_without_preferred_topics
+            )
+        )
 
         personal_information = PersonalInformation(
             id=id,
@@ -132,13 +144,58 @@ class StudentService:
         tutor = repository.get_tutor_by_id(student_info_db.tutor_id)
 
         teammates = self._repository.get_teammates(id, student_info_db.group_id)
-        personal_information.group_id = student_info_db.group_id
-        personal_information.tutor = f"{tutor.name} {tutor.last_name}"
-        personal_information.topic = student_info_db.topic_name
-        personal_information.teammates = list(map(lambda x: x.email, teammates))
-        personal_information.group_number = student_info_db.group_number
+        return self._fill_group_information(
+            personal_information, student_info_db, tutor, teammates
+        )
 
-        return personal_information
+    async def get_personal_info_by_id_async(
+        self,
+        id: int,
+        form_repository: AsyncFormRepository,
+        repository: AsyncUserRepository,
+        group_repository: AsyncGroupRepository,
+        student_repository: AsyncStudentRepository,
+    ):
+        """Igual que get_personal_info_by_id pero con repositorios asincronicos"""
+        period = (await student_repository.get_period_by_student_id(id)).period_id
+        form_answers = await form_repository.get_answers_by_user_id(id, period)
+
+        form_answered = len(form_answers) > 0
+
+        groups_without_preferred_topics = (
+            await group_repository.get_groups_without_preferred_topics(period)
+        )
+        student_in_groups_without_preferred_topics = (
+            self._in_groups_without_preferred_topics(
+                id, groups_without_preferred_topics
+            )
+        )
+
+        personal_information = PersonalInformation(
+            id=id,
+            form_answered=form_answered,
+            group_id=0,
+            group_number=0,
+            tutor="",
+            topic="",
+            teammates=[],
+            period_id=period,
+        )
+
+        if (not student_in_groups_without_preferred_topics) and (not form_answered):
+            return personal_information
+
+        student_info_db = await self._repository.get_student_info(id, period)
+
+        if student_info_db is None:
+            return personal_information
+
+        tutor = await repository.get_tutor_by_id(student_info_db.tutor_id)
+
+        teammates = await self._repository.get_teammates(id, student_info_db.group_id)
+        return self._fill_group_information(
+            personal_information, student_info_db, tutor, teammates
+        )
 
     def add_student(
         self,
@@ -1,36 +1,39 @@
-from io import StringIO
-import pandas as pd
+from typing import BinaryIO, Iterator
 
 from src.api.exceptions import InvalidCsv
+from src.api.students.exceptions import StudentDuplicated
+from src.api.utils.csv_stream import CsvStream
 
 
 class StudentCsvFile:
 
-    def __init__(self, csv):
-        self._df = self._create_csv_df(csv)
+    COLUMNS = ["NOMBRE", "APELLIDO", "PADRON", "MAIL"]
 
-    def _create_csv_df(self, csv: str):
-        """A partir de un csv como string, lo trata como archivo y crea un dataframe"""
-        file = StringIO(csv)
-        df = pd.read_csv(file)
-        self._validate_csv_headers(df)
-        return df
-
-    def _validate_csv_headers(self, df):
-        """Valida que las columnas del csv sean las esperadas"""
-
-        if list(df.columns.values) != ["NOMBRE", "APELLIDO", "PADRON", "MAIL"]:
-            raise InvalidCsv("Columns don't match with expected ones")
-
-    def get_info_as_rows(self):
-        """Colecta la informacion de cada fila del csv en una lista"""
-
-        rows = []
-        self._df.apply(
-            lambda row: rows.append(
-                (row["NOMBRE"], row["APELLIDO"], row["PADRON"], row["MAIL"])
-            ),
-            axis=1,
+    def __init__(self, file: BinaryIO):
+        self._stream = CsvStream(
+            file,
+            self.COLUMNS,
+            unique_columns=["PADRON", "MAIL"],
+            duplicated_error=StudentDuplicated,
         )
 
-        return rows
+    def _parse_id(self, student_id: str) -> int:
+        """Valida que el padron sea un numero"""
+        try:
+            return int(student_id)
+        except ValueError:
+            raise InvalidCsv(f"Invalid PADRON: {student_id}")
+
+    def get_info_as_rows(self) -> Iterator[tuple]:
+        """Devuelve las filas del csv de a una, a medida que se leen"""
+        for row in self._stream.rows():
+            yield (
+                row["NOMBRE"],
+                row["APELLIDO"],
+                self._parse_id(row["PADRON"]),
+                row["MAIL"],
+            )
+
+    def close(self):
+        """Libera el archivo subido"""
+        self._stream.detach()
@@ -1,8 +1,11 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from src.api.topics.exceptions import CategoryNotFound, TopicNotFound
 from src.api.topics.models import Category, Topic, TopicTutorPeriod
 from src.api.tutors.models import TutorPeriod
+from src.api.users.models import User
 
 
 class TopicRepository:
@@ -22,7 +25,7 @@ class TopicRepository:
                 )
                 if not exists:
                     session.add(category)
-                    session.commit()
+                    session.flush()
                     session.refresh(category)
                     categories_saved.append(category)
 
@@ -42,13 +45,132 @@ class TopicRepository:
                     topics_saved.append(topic_db)
                 else:
                     session.add(topic)
-                    session.commit()
+                    session.flush()
                     session.refresh(topic)
                     session.expunge(topic)
                     topics_saved.append(topic)
 
         return topics_saved
 
+    def import_topics(self, rows: list[dict], period_id: str):
+        """
+        Carga los temas de un csv con una cantidad fija de consultas: las
+        categorias y los temas que falten se insertan de una vez, los tutores
+        y sus cuatrimestres se buscan con una consulta cada uno y las
+        capacidades se guardan con un unico INSERT ... ON CONFLICT DO UPDATE.
+
+        Devuelve los temas del archivo y los errores de las filas que no se
+        pudieron asignar a un tutor, sin cortar la carga del resto.
+        """
+        errors = []
+        with self.Session() as session:
+            category_names = list(dict.fromkeys(row["category"] for row in rows))
+            if category_names:
+                session.execute(
+                    pg_insert(Category)
+                    .values([{"name": name} for name in category_names])
+                    .on_conflict_do_nothing(index_elements=[Category.name])
+                )
+            categories = dict(
+                session.execute(
+                    select(Category.name, Category.id).where(
+                        Category.name.in_(category_names)
+                    )
+                ).all()
+            )
+
+            # Si el tema se repite, se queda con la primera categoria del csv
+            topic_categories = {}
+            for row in rows:
+                topic_categories.setdefault(row["topic"], categories[row["category"]])
+            if topic_categories:
+                session.execute(
+                    pg_insert(Topic)
+                    .values(
+                        [
+                            {"name": name, "category_id": category_id}
+                            for name, category_id in topic_categories.items()
+                        ]
+                    )
+                    .on_conflict_do_nothing(index_elements=[Topic.name])
+                )
+            topic_ids = dict(
+                session.execute(
+                    select(Topic.name, Topic.id).where(
+                        Topic.name.in_(list(topic_categories))
+                    )
+                ).all()
+            )
+
+            emails = list(dict.fromkeys(row["tutor_email"] for row in rows))
+            tutors = dict(
+                session.execute(
+                    select(User.email, User.id).where(User.email.in_(emails))
+                ).all()
+            )
+            tutor_periods = dict(
+                session.execute(
+                    select(TutorPeriod.tutor_id, TutorPeriod.id).where(
+                        TutorPeriod.period_id == period_id,
+                        TutorPeriod.tutor_id.in_(list(tutors.values())),
+                    )
+                ).all()
+            )
+
+            # Una misma fila tema-tutor solo puede actualizarse una vez por
+            # sentencia, asi que si se repite queda la ultima capacidad.
+            capacities = {}
+            for row in rows:
+                email = row["tutor_email"]
+                if email not in tutors:
+                    detail = f"Tutor '{email}' not found."
+                elif tutors[email] not in tutor_periods:
+                    detail = f"Tutor '{email}' has no period."
+                else:
+                    key = (topic_ids[row["topic"]], tutor_periods[tutors[email]])
+                    capacities[key] = row["capacity"]
+                    continue
+                errors.append(
+                    {
+                        "line": row["line"],
+                        "topic": row["topic"],
+                        "tutor_email": email,
+                        "detail": detail,
+                    }
+                )
+
+            if capacities:
+                topic_tutor_periods = pg_insert(TopicTutorPeriod).values(
+                    [
+                        {
+                            "topic_id": topic_id,
+                            "tutor_period_id": tutor_period_id,
+                            "capacity": capacity,
+                        }
+                        for (topic_id, tutor_period_id), capacity in capacities.items()
+                    ]
+                )
+                session.execute(
+                    topic_tutor_periods.on_conflict_do_update(
+                        index_elements=[
+                            TopicTutorPeriod.topic_id,
+                            TopicTutorPeriod.tutor_period_id,
+                        ],
+                        set_={"capacity": topic_tutor_periods.excluded.capacity},
+                    )
+                )
+            session.flush()
+
+            topics = {
+                topic.name: topic
+                for topic in session.scalars(
+                    select(Topic).where(Topic.id.in_(list(topic_ids.values())))
+                )
+            }
+            session.expunge_all()
+
+        return [topics[name] for name in topic_categories], errors
+
     def add_topic_with_category(self, topic: Topic, category_name: str):
         """Agrega un tema y su categoria asociada"""
         with self.Session() as session:
@@ -60,7 +182,7 @@ class TopicRepository:
 
             topic.category_id = category.id
             session.add(topic)
-            session.commit()
+            session.flush()
             session.refresh(topic)
             session.expunge(topic)
 
@@ -86,7 +208,7 @@ class TopicRepository:
         """Agrega una categoria"""
         with self.Session() as session:
             session.add(category)
-            session.commit()
+            session.flush()
             session.refresh(category)
             session.expunge(category)
         return category
@@ -95,7 +217,7 @@ class TopicRepository:
         """Agrega un tema"""
         with self.Session() as session:
             session.add(topic)
-            session.commit()
+            session.flush()
             session.refresh(topic)
             # force loading the category
             topic.category
@@ -142,4 +264,4 @@ class TopicRepository:
 
             topic_to_delete.category
             session.delete(topic_to_delete)
-            session.commit()
+            session.flush()
@@ -11,6 +11,7 @@ from src.api.topics.repository import TopicRepository
 from src.api.topics.schemas import (
     CompleteCategoryResponse,
     SimpleCategory,
+    TopicImportResponse,
     TopicList,
     TopicRequest,
     TopicResponse,
@@ -55,12 +56,9 @@ async def upload_csv_file(
         auth_service.assert_only_admin(authorization["token"])
         if file.content_type != "text/csv":
             raise InvalidFileType("CSV file must be provided.")
-        content = (await file.read()).decode("utf-8")
         service = TopicService(TopicRepository(session))
 
-        res = service.create_topics_from_string(
-            period, content, TutorRepository(session)
-        )
+        res = service.create_topics_from_file(period, file.file)
 
         return ResponseBuilder.build_clear_cache_response(res, status.HTTP_201_CREATED)
     except (
@@ -75,6 +73,55 @@ async def upload_csv_file(
         raise ServerError(str(e))
 
 
+@router.post(
+    "/import",
+    response_model=TopicImportResponse,
+    summary="Imports topics from a csv file, reporting the rows that failed.",
+    responses={
+        status.HTTP_201_CREATED: {"description": "Successfully imported topics."},
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Columns don't match with expected."
+        },
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"description": "Invalid file type."},
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"description": "Validation Error."},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "description": "Internal Server Error."
+        },
+    },
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_csv_file(
+    file: UploadFile,
+    session: Annotated[Session, Depends(get_db)],
+    authorization: Annotated[dict, Depends(authorization)],
+    period: str = Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
+):
+    """
+    Endpoint para subir los temas a partir de un archivo csv. A diferencia de
+    /upload, las filas con errores no cortan la carga y se devuelven en la
+    respuesta.
+    """
+    try:
+        auth_service = AuthenticationService(authorization["jwt_resolver"])
+        auth_service.assert_only_admin(authorization["token"])
+        if file.content_type != "text/csv":
+            raise InvalidFileType("CSV file must be provided.")
+        service = TopicService(TopicRepository(session))
+
+        res = service.import_topics_from_file(period, file.file)
+
+        return ResponseBuilder.build_clear_cache_response(res, status.HTTP_201_CREATED)
+    except (
+        InvalidFileType,
+        InvalidCsv,
+    ) as e:
+        raise e
+    except InvalidJwt:
+        raise InvalidCredentials("Invalid Authorization")
+    except Exception as e:
+        raise ServerError(str(e))
+
+
 @router.get(
     "/",
     response_model=TopicList,
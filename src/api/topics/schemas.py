@@ -50,3 +50,19 @@ class TopicList(RootModel):
 
     def __iter__(self):
         return iter(self.root)
+
+
+class TopicImportError(BaseModel):
+    """Representa una fila del csv que no se pudo asignar a un tutor"""
+
+    line: int
+    topic: str
+    tutor_email: str
+    detail: str
+
+
+class TopicImportResponse(BaseModel):
+    """Representa el resultado de cargar un csv de temas"""
+
+    topics: List[TopicResponse]
+    errors: List[TopicImportError]
@@ -1,10 +1,17 @@
+from io import BytesIO
+from typing import BinaryIO
+
 from src.api.exceptions import EntityNotFound
 from src.api.topics.exceptions import TopicNotFound
 from src.api.topics.models import Topic, Category
 from src.api.topics.repository import TopicRepository
-from src.api.topics.schemas import TopicList, TopicRequest, TopicResponse
+from src.api.topics.schemas import (
+    TopicImportResponse,
+    TopicList,
+    TopicRequest,
+    TopicResponse,
+)
 from src.api.topics.utils import TopicCsvFile
-from src.api.tutors.exceptions import TutorNotFound, TutorPeriodNotFound
 from src.api.tutors.repository import TutorRepository
 from src.config.logging import logger
 
@@ -14,95 +21,36 @@ class TopicService:
     def __init__(self, topic_repository: TopicRepository):
         self._repository = topic_repository
 
-    def _get_categories_mapped(self):
-        # Busca todas las categorías y crea un diccionario para mapear nombre:id.
-        categories = self._repository.get_categories()
-        id_by_categories = {}
-        for category in categories:
-            id_by_categories[category.name] = category.id
-
-        return id_by_categories
-
-    def _get_topics_and_capacities_by_tutor(
-        self, tutor_email: str, topics_by_tutor: dict
-    ):
+    def import_topics_from_file(self, period_id: str, file: BinaryIO):
         """
-        Dado el correo electrónico de un tutor, devuelve una tupla que contiene dos listas:
-            - Una lista de nombres de temas asignados a ese tutor.
-            - Una lista de capacidades asignadas a esos temas.
-
+        Procesa un csv de temas y crea las categorías, los temas y las
+        asignaciones tutor-tema que falten. Las filas cuyo tutor no existe o
+        no está en el cuatrimestre se informan como errores sin cortar la
+        carga del resto.
         """
-        id_by_categories = self._get_categories_mapped()
-        topics = []
-        capacities = []
-        for topic_info in topics_by_tutor[tutor_email]:
-            name = topic_info["topic"]
-            category = id_by_categories[topic_info["category"]]
-            topic = Topic(name=name, category_id=category)
-            topics.append(topic)
-            capacities.append(topic_info["capacity"])
-        return topics, capacities
-
-    def _add_topic_tutor_periods(
-        self, period_id: str, topics_by_tutor: dict, tutor_repository: TutorRepository
-    ):
-        """Añadir una entidad de periodo de tutoría de tema para cada tema de cada tutor."""
-        for tutor, _ in topics_by_tutor.items():
-            tutor_topics, tutor_capacities = self._get_topics_and_capacities_by_tutor(
-                tutor, topics_by_tutor
-            )
-            tutor_repository.add_topic_tutor_period(
-                period_id, tutor, tutor_topics, tutor_capacities
-            )
-
-    def _add_categories(self, categories):
-        """Agrega una lista de categorias"""
-        categories_db = []
-        for category in categories:
-            category_db = Category(name=category)
-            categories_db.append(category_db)
-        categories_saved = self._repository.add_categories(categories_db)
-        logger.info("Categories already created.")
-
-        return categories_saved
-
-    def _add_topics(self, topics: list[tuple[str, str]]):
-        """Agrega una lista de temas"""
-
-        id_by_categories = self._get_categories_mapped()
-
-        # Make Topic ORM objs based on the name and category
-        topics_db = []
-        for topic in topics:
-            category_id = id_by_categories[topic[1]]
-            topic_db = Topic(name=topic[0], category_id=category_id)
-            topics_db.append(topic_db)
-        topics = self._repository.add_topics(topics_db)
-        logger.info("Topics already created.")
+        csv_file = TopicCsvFile(file)
+        try:
+            rows = list(csv_file.get_rows())
+        finally:
+            csv_file.close()
 
-        return topics
+        topics, errors = self._repository.import_topics(rows, period_id)
+        logger.info(f"Topics imported for period {period_id}, {len(errors)} errors.")
+        return TopicImportResponse.model_validate({"topics": topics, "errors": errors})
 
-    def create_topics_from_string(
-        self, period_id: str, csv: str, tutor_repository: TutorRepository
-    ):
+    def create_topics_from_file(self, period_id: str, file: BinaryIO):
         """
-        Procesa una cadena CSV para crear temas, categorías y asignaciones de tutor-tema.
-        Elimina los temas existentes si aplica y devuelve la lista de temas creados.
+        Igual que import_topics_from_file, pero si alguna fila no se pudo
+        asignar lanza EntityNotFound con el primer error.
         """
-        try:
-            csv_file = TopicCsvFile(csv=csv)
-            categories = csv_file.get_categories()
-            topics = csv_file.get_topics()
-            topics_by_tutor = csv_file.get_topics_by_tutor()
-
-            self._add_categories(categories)
-            db_topics = self._add_topics(topics)
-
-            self._add_topic_tutor_periods(period_id, topics_by_tutor, tutor_repository)
-
-            return TopicList.model_validate(db_topics)
-        except (TutorNotFound, TutorPeriodNotFound) as e:
-            raise EntityNotFound(str(e))
+        result = self.import_topics_from_file(period_id, file)
+        if result.errors:
+            raise EntityNotFound(result.errors[0].detail)
+        return TopicList.model_validate(result.topics)
+
+    def create_topics_from_string(self, period_id: str, csv: str):
+        """Procesa una cadena CSV de temas, ver create_topics_from_file"""
+        return self.create_topics_from_file(period_id, BytesIO(csv.encode("utf-8")))
 
     def get_topics(self):
         """Devuelve todos los temas"""
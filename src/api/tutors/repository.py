@@ -1,5 +1,6 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import exc, exists, update
+from sqlalchemy import exc, exists, select, update
 
 from src.api.dates.models import TutorDateSlot
 from src.api.periods.exceptions import PeriodDuplicated
@@ -32,7 +33,7 @@ class TutorRepository:
             with self.Session() as session:
                 for period in tutor_periods:
                     session.add(period)
-                session.commit()
+                session.flush()
 
                 for period in tutor_periods:
                     session.refresh(period)
@@ -47,7 +48,7 @@ class TutorRepository:
         try:
             with self.Session() as session:
                 session.add(tutor_period)
-                session.commit()
+                session.flush()
                 session.expunge(tutor_period)
 
             return tutor_period
@@ -140,10 +141,7 @@ class TutorRepository:
                     for idx, topic in enumerate(topics):
                         topic = (
                             session.query(Topic)
-                            .filter(
-                                Topic.name == topic.name
-                                and Topic.category == topic.category
-                            )
+                            .filter(Topic.name == topic.name)
                             .first()
                         )
                         topic_tutor_period_exists = (
@@ -165,7 +163,7 @@ class TutorRepository:
                             )
                             session.add(topic_tutor_period)
                             topic_tutor_periods.append(topic_tutor_period)
-                    session.commit()
+                    session.flush()
 
                     for topic_tutor_period in topic_tutor_periods:
                         session.refresh(topic_tutor_period)
@@ -226,7 +224,7 @@ class TutorRepository:
                 raise TutorNotFound(f"Tutor with id: {tutor_id} not exists")
 
             session.delete(tutor)
-            session.commit()
+            session.flush()
 
         return tutor
 
@@ -236,7 +234,7 @@ class TutorRepository:
             session.query(TutorPeriod).filter(
                 TutorPeriod.period_id == period_id
             ).delete()
-            session.commit()
+            session.flush()
 
     def get_tutors_by_period_id(self, period_id):
         """Devuelve todos los tutores de un cuatrimestre puntual"""
@@ -265,7 +263,7 @@ class TutorRepository:
             session.query(TutorPeriod).filter(
                 TutorPeriod.period_id == period_id
             ).filter(TutorPeriod.tutor_id.in_(tutors_ids)).delete()
-            session.commit()
+            session.flush()
 
     def add_tutor_period(self, tutor_id, period_id) -> TutorPeriod:
         """Agrega un cuatrimestre a un tutor"""
@@ -273,7 +271,7 @@ class TutorRepository:
             with self.Session() as session:
                 period_obj = TutorPeriod(period_id=period_id, tutor_id=tutor_id)
                 session.add(period_obj)
-                session.commit()
+                session.flush()
                 tutor = session.get(User, tutor_id)
                 session.expunge_all()
 
@@ -347,4 +345,30 @@ class TutorRepository:
         )
         with self.Session() as session:
             session.execute(stmt)
-            session.commit()
+            session.flush()
+
+
+class AsyncTutorRepository:
+    """Variante asincronica (asyncpg) de las consultas de tutores mas usadas"""
+
+    def __init__(self, sess: AsyncSession):
+        self.Session = sess
+
+    async def get_tutor_period_by_tutor_id(self, period, tutor_id) -> TutorPeriod:
+        """Devuelve el cuatrimestre particulares de un tutor"""
+        query = (
+            select(TutorPeriod)
+            .join(User)
+            .where(User.id == tutor_id, TutorPeriod.period_id == period)
+        )
+        async with self.Session() as session:
+            tutor_period = (await session.scalars(query)).unique().one_or_none()
+
+            if tutor_period is None:
+                raise TutorNotFound(
+                    "The tutor does not exist or this period is not present"
+                )
+
+            session.expunge(tutor_period)
+
+        return tutor_period
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Response, UploadFile, Depends, status, Query, Path
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing_extensions import Annotated
 
 from src.api.auth.jwt import InvalidJwt
+from src.api.auth.schemas import JwtDecoded
 from src.api.auth.service import AuthenticationService
 from src.api.dates.repository import DateSlotRepository
 from src.api.dates.schemas import DateSlotResponse, DateSlotResponseList
@@ -15,7 +17,7 @@ from src.api.exceptions import (
 )
 from src.api.groups.dependencies import get_email_sender
 from src.api.groups.mapper import GroupMapper
-from src.api.groups.repository import GroupRepository
+from src.api.groups.repository import AsyncGroupRepository, GroupRepository
 from src.api.groups.schemas import GroupList
 from src.api.tutors.mapper import TutorMapper
 from src.api.tutors.service import TutorService
@@ -29,13 +31,13 @@ from src.api.tutors.schemas import (
     TutorWithTopicsList,
 )
 from src.api.auth.hasher import get_hasher, ShaHasher
-from src.api.tutors.repository import TutorRepository
+from src.api.tutors.repository import AsyncTutorRepository, TutorRepository
 from src.api.users.models import Role
 from src.api.users.repository import UserRepository
 from src.api.users.service import UserService
 from src.api.utils.response_builder import ResponseBuilder
-from src.config.database.database import get_db
-from src.api.auth.dependencies import authorization
+from src.config.database.database import get_async_db, get_db
+from src.api.auth.dependencies import authorization, get_claims
 
 router = APIRouter(prefix="/tutors")
 
@@ -70,11 +72,10 @@ async def upload_csv_file(
         # Check if content-type is a text/csv
         if file.content_type != "text/csv":
             raise InvalidFileType("CSV file must be provided")
-        content = (await file.read()).decode("utf-8")
         service = TutorService(TutorRepository(session))
         res = TutorList.model_validate(
-            service.create_tutors_from_csv(
-                content, period, hasher, UserRepository(session)
+            service.create_tutors_from_file(
+                file.file, period, hasher, UserRepository(session)
             )
         )
 
@@ -209,14 +210,13 @@ async def add_period_to_tutor(
 async def get_tutor_periods(
     session: Annotated[Session, Depends(get_db)],
     tutor_id: int,
-    authorization: Annotated[dict, Depends(authorization)],
+    claims: Annotated[JwtDecoded, Depends(get_claims)],
 ):
     """Endpoint para obtener todos los cuatrimestre en el que un tutor tutorea"""
     try:
-        auth_service = AuthenticationService(authorization["jwt_resolver"])
-        auth_service.assert_tutor_rol(authorization["token"])
+        AuthenticationService().assert_tutor_rol(claims)
 
-        user_id = auth_service.get_user_id(authorization["token"])
+        user_id = claims.user_id
         user_service = UserService(UserRepository(session))
         user = user_service.get_user_by_id(user_id)
         if user.role == Role.TUTOR:
@@ -284,21 +284,22 @@ async def get_tutors_by_period_id(
     },
 )
 async def get_groups_by_tutor(
-    session: Annotated[Session, Depends(get_db)],
-    authorization: Annotated[dict, Depends(authorization)],
+    session: Annotated[AsyncSession, Depends(get_async_db)],
+    claims: Annotated[JwtDecoded, Depends(get_claims)],
     period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
 ):
     """Endpoint para obtener los grupos de un cuatrimestre del cual uno es tutor"""
     try:
-        auth_service = AuthenticationService(authorization["jwt_resolver"])
-        auth_service.assert_tutor_rol(authorization["token"])
-        tutor_id = auth_service.get_user_id(authorization["token"])
+        AuthenticationService().assert_tutor_rol(claims)
+        tutor_id = claims.user_id
 
-        service = TutorService(TutorRepository(session))
-        group_repository = GroupRepository(session)
+        service = TutorService(AsyncTutorRepository(session))
+        group_repository = AsyncGroupRepository(session)
 
         groups = GroupList.model_validate(
-            service.get_groups_from_tutor_id(tutor_id, period_id, group_repository)
+            await service.get_groups_from_tutor_id_async(
+                tutor_id, period_id, group_repository
+            )
         )
 
         return ResponseBuilder.build_private_cache_response(groups)
@@ -323,21 +324,22 @@ async def get_groups_by_tutor(
     },
 )
 async def get_groups_by_reviewer_id(
-    session: Annotated[Session, Depends(get_db)],
-    authorization: Annotated[dict, Depends(authorization)],
+    session: Annotated[AsyncSession, Depends(get_async_db)],
+    claims: Annotated[JwtDecoded, Depends(get_claims)],
     period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
 ):
     """Endpoint para obtener los grupos de un cuatrimestre del cual uno es revisor"""
     try:
-        auth_service = AuthenticationService(authorization["jwt_resolver"])
-        auth_service.assert_tutor_rol(authorization["token"])
-        tutor_id = auth_service.get_user_id(authorization["token"])
+        AuthenticationService().assert_tutor_rol(claims)
+        tutor_id = claims.user_id
 
-        service = TutorService(TutorRepository(session))
-        group_repository = GroupRepository(session)
+        service = TutorService(AsyncTutorRepository(session))
+        group_repository = AsyncGroupRepository(session)
 
         groups = GroupList.model_validate(
-            service.get_groups_from_reviewer_id(tutor_id, period_id, group_repository)
+            await service.get_groups_from_reviewer_id_async(
+                tutor_id, period_id, group_repository
+            )
         )
 
         return ResponseBuilder.build_private_cache_response(groups)
@@ -363,15 +365,14 @@ async def get_groups_by_reviewer_id(
 async def notify_students(
     body: TutorMessage,
     session: Annotated[Session, Depends(get_db)],
-    authorization: Annotated[dict, Depends(authorization)],
+    claims: Annotated[JwtDecoded, Depends(get_claims)],
     email_sender: Annotated[object, Depends(get_email_sender)],
     group_id: int = Query(...),
 ):
     """Endpoint para enviar un mail al grupo de estudiantes"""
     try:
-        auth_service = AuthenticationService(authorization["jwt_resolver"])
-        auth_service.assert_tutor_rol(authorization["token"])
-        tutor_id = auth_service.get_user_id(authorization["token"])
+        AuthenticationService().assert_tutor_rol(claims)
+        tutor_id = claims.user_id
 
         service = TutorService(TutorRepository(session))
         group_repository = GroupRepository(session)
@@ -412,14 +413,13 @@ async def notify_students(
 )
 async def assigned_dates(
     session: Annotated[Session, Depends(get_db)],
-    authorization: Annotated[dict, Depends(authorization)],
+    claims: Annotated[JwtDecoded, Depends(get_claims)],
     period_id=Query(pattern="^[1|2]C20[0-9]{2}$", examples=["1C2024"]),
 ):
     """Endpoint para obtener los grupos de un cuatrimestre del cual uno es revisor"""
     try:
-        auth_service = AuthenticationService(authorization["jwt_resolver"])
-        auth_service.assert_tutor_rol(authorization["token"])
-        tutor_id = auth_service.get_user_id(authorization["token"])
+        AuthenticationService().assert_tutor_rol(claims)
+        tutor_id = claims.user_id
 
         service = TutorService(TutorRepository(session))
         dates = service.get_assigned_dates(
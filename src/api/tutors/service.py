@@ -1,9 +1,11 @@
 import re
+from io import BytesIO
+from typing import BinaryIO
 
 from src.api.auth.hasher import ShaHasher
 from src.api.dates.repository import DateSlotRepository
 from src.api.exceptions import Duplicated, EntityNotFound
-from src.api.groups.repository import GroupRepository
+from src.api.groups.repository import AsyncGroupRepository, GroupRepository
 from src.api.periods.exceptions import InvalidPeriod, PeriodDuplicated
 from src.api.tutors.schemas import TutorPeriodResponse, TutorRequest, TutorResponse
 from src.api.tutors.utils import TutorCsvFile
@@ -50,14 +52,24 @@ class TutorService:
         tutors = self._repository.get_tutors()
         return [tutor.email for tutor in tutors if tutor.email in tutors_emails]
 
-    def create_tutors_from_csv(
-        self, csv: str, period: str, hasher: ShaHasher, user_repository: UserRepository
+    def create_tutors_from_file(
+        self,
+        file: BinaryIO,
+        period: str,
+        hasher: ShaHasher,
+        user_repository: UserRepository,
     ):
-        """Con un archivo csv como cadena, crea nuevos tutores y sobrescribe los existentes."""
+        """
+        Crea nuevos tutores a partir de un csv leyendolo de a una fila y
+        sobrescribe los existentes
+        """
         try:
-            csv_file = TutorCsvFile(csv=csv)
+            csv_file = TutorCsvFile(file)
+            try:
+                tutors_dtos = csv_file.get_tutors()
+            finally:
+                csv_file.close()
             tutors_emails = csv_file.get_tutors_emails()
-            tutors_dtos = csv_file.get_tutors()
             existing_tutors_emails = self._get_existing_emails(tutors_emails)
 
             remaining_emails = list(
@@ -109,6 +121,14 @@ class TutorService:
         except (TutorNotFound, TutorPeriodNotInserted) as e:
             EntityNotFound(str(e))
 
+    def create_tutors_from_csv(
+        self, csv: str, period: str, hasher: ShaHasher, user_repository: UserRepository
+    ):
+        """Con un archivo csv como cadena, crea nuevos tutores"""
+        return self.create_tutors_from_file(
+            BytesIO(csv.encode("utf-8")), period, hasher, user_repository
+        )
+
     def add_tutor(
         self, tutor: TutorRequest, hasher: ShaHasher, userRepository: UserRepository
     ):
@@ -130,7 +150,7 @@ class TutorService:
                     role=Role.TUTOR,
                 )
                 userRepository.add_user(new_tutor)
-            
+
             self._repository.add_tutor_period_with_capacity(tutor_period)
             tutor_response = self._repository.get_tutor_by_tutor_id(tutor.id)
             return tutor_response
@@ -250,6 +270,33 @@ class TutorService:
         except Exception as e:
             raise EntityNotFound(message=str(e))
 
+    async def get_groups_from_tutor_id_async(
+        self, tutor_id: int, period_id: str, group_repository: AsyncGroupRepository
+    ):
+        """Igual que get_groups_from_tutor_id pero con repositorios asincronicos"""
+        try:
+            period = await self._repository.get_tutor_period_by_tutor_id(
+                period_id, tutor_id
+            )
+        except TutorNotFound as e:
+            raise EntityNotFound(message=str(e))
+        groups = await group_repository.get_groups_by_period_id(
+            tutor_period_id=period.id, load_topic=True
+        )
+        return groups
+
+    async def get_groups_from_reviewer_id_async(
+        self, reviewer_id: int, period_id: str, group_repository: AsyncGroupRepository
+    ):
+        """Igual que get_groups_from_reviewer_id pero con repositorios asincronicos"""
+        try:
+            groups = await group_repository.get_groups_by_reviewer_id(
+                reviewer_id=reviewer_id, period_id=period_id, load_topic=True
+            )
+            return groups
+        except Exception as e:
+            raise EntityNotFound(message=str(e))
+
     def notify_students(
         self, sender_id: int, group: AssignedGroup, email_sender: object, message: str
     ):
@@ -1,85 +1,67 @@
-from io import (
-    StringIO,
-)  # StringIO makes us use a string as a file, so we can call read/write methods
-import pandas as pd
+from typing import BinaryIO, Iterator
 
 from src.api.exceptions import InvalidCsv
 from src.api.tutors.exceptions import TutorDuplicated
+from src.api.utils.csv_stream import CsvStream
 from src.core.tutor import Tutor
 
 
 class TutorCsvFile:
 
-    def __init__(self, csv):
-        self._df = self._create_csv_df(csv)
+    COLUMNS = ["NOMBRE", "APELLIDO", "DNI", "MAIL", "CAPACIDAD"]
 
-    def _create_csv_df(self, csv: str):
-        """
-        crea un dataframe a partir de un csv como str
-        """
-        file = StringIO(csv)
-        df = pd.read_csv(file)
-        self._validate_csv_headers(df)
-        self._check_duplicates(df)
-        return df
+    def __init__(self, file: BinaryIO):
+        self._stream = CsvStream(file, self.COLUMNS)
+        self._tutors = None
 
-    def _validate_csv_headers(self, df):
-        """
-        Checkea las columnas del csv
-        """
-        if list(df.columns.values) != [
-            "NOMBRE",
-            "APELLIDO",
-            "DNI",
-            "MAIL",
-            "CAPACIDAD",
-        ]:
-            raise InvalidCsv("Columns don't match with expected ones")
+    def _parse_int(self, column: str, value: str) -> int:
+        """Valida que el valor de la columna sea un numero"""
+        try:
+            return int(value)
+        except ValueError:
+            raise InvalidCsv(f"Invalid {column}: {value}")
 
-    def _check_duplicates(self, df):
+    def get_info_as_rows(self) -> Iterator[tuple]:
         """
-        Verifica duplicados
+        Devuelve las filas del csv de a una, a medida que se leen. Una fila
+        repetida entera se considera un tutor duplicado
         """
-        duplicate = df[df.duplicated()]
-        if len(duplicate) > 0:
-            raise TutorDuplicated("Duplicate values inside the csv file")
+        rows_seen = set()
+        for row in self._stream.rows():
+            info = (
+                row["NOMBRE"],
+                row["APELLIDO"],
+                self._parse_int("DNI", row["DNI"]),
+                row["MAIL"],
+                self._parse_int("CAPACIDAD", row["CAPACIDAD"]),
+            )
+            if info in rows_seen:
+                raise TutorDuplicated("Duplicate values inside the csv file")
+            rows_seen.add(info)
+            yield info
+
+    def get_tutors_emails(self):
+        """Obtiene los emails de los tutores del csv"""
+        return list(self.get_tutors().keys())
 
-    def get_info_as_rows(self):
+    def get_tutors(self) -> dict[str, Tutor]:
         """
-        Arma una lista de filas con la informacion de las columnas del csv
+        Obtiene todos los tutores del csv indexados por email. El csv se lee
+        una sola vez, la primera vez que se piden los tutores
         """
-        rows = []
-        self._df.apply(
-            lambda row: rows.append(
-                (
-                    row["NOMBRE"],
-                    row["APELLIDO"],
-                    row["DNI"],
-                    row["MAIL"],
-                    row["CAPACIDAD"],
+        if self._tutors is None:
+            tutors = {}
+            for name, last_name, id, email, capacity in self.get_info_as_rows():
+                tutors[email] = Tutor(
+                    id=id,
+                    email=email,
+                    name=name,
+                    last_name=last_name,
+                    capacity=capacity,
                 )
-            ),
-            axis=1,
-        )
-
-        return rows
-
-    def get_tutors_emails(self):
-        """Obtiene los ids de los tutores del csv"""
-        return list(self._df["MAIL"].unique())
-
-    def _add_tutor(self, row, tutors):
-        """Crea tutores a partir de los datos de las columnas del csv"""
-        tutors[row["MAIL"]] = Tutor(
-            id=row["DNI"],
-            email=row["MAIL"],
-            name=row["NOMBRE"],
-            last_name=row["APELLIDO"],
-            capacity=row["CAPACIDAD"],
-        )
+            self._tutors = tutors
+        return self._tutors
 
-    def get_tutors(self) -> dict[str, Tutor]:
-        """Obtiene todos los tutores del csv"""
-        tutors = {}
-        self._df.apply(lambda row: self._add_tutor(row, tutors), axis=1)
-        return tutors
+    def close(self):
+        """Libera el archivo subido"""
+        self._stream.detach()
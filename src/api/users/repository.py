@@ -1,4 +1,5 @@
 from sqlalchemy import exc, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.api.exceptions import Duplicated
@@ -17,7 +18,7 @@ class UserRepository:
         """Agrega una lista de usuarios"""
         with self.Session() as session:
             session.add_all(new_users)
-            session.commit()
+            session.flush()
             for user in new_users:
                 session.refresh(user)
                 session.expunge(user)
@@ -29,7 +30,7 @@ class UserRepository:
         try:
             with self.Session() as session:
                 session.add(new_user)
-                session.commit()
+                session.flush()
                 session.refresh(new_user)
                 session.expunge(new_user)
             return new_user
@@ -79,7 +80,7 @@ class UserRepository:
                 # Bulk insert new students
                 if new_students:
                     session.bulk_save_objects(new_students)
-                    session.commit()
+                    session.flush()
 
                 # Bulk update existing students
                 if update_students:
@@ -94,7 +95,7 @@ class UserRepository:
                         for student in update_students
                     ]
                     session.bulk_update_mappings(User, update_mappings)
-                    session.commit()
+                    session.flush()
 
                 return students
         except Exception:
@@ -104,13 +105,13 @@ class UserRepository:
         """Borra todos los estudiantes"""
         with self.Session() as session:
             session.query(User).filter(User.role == Role.STUDENT).delete()
-            session.commit()
+            session.flush()
 
     def delete_tutors(self):
         """Borra todos los tutores"""
         with self.Session() as session:
             session.query(User).filter(User.role == Role.TUTOR).delete()
-            session.commit()
+            session.flush()
 
     def get_tutors(self):
         """Obtiene todos los tutores"""
@@ -156,7 +157,22 @@ class UserRepository:
         with self.Session() as session:
             stmt = update(User).where(User.id == user_id).values(**attributes)
             session.execute(stmt, execution_options={"synchronize_session": False})
-            session.commit()
+            session.flush()
 
             user = session.query(User).filter(User.id == user_id).one_or_none()
         return user
+
+
+class AsyncUserRepository:
+    """Variante asincronica (asyncpg) de las consultas de usuarios mas usadas"""
+
+    def __init__(self, sess: AsyncSession):
+        self.Session = sess
+
+    async def get_tutor_by_id(self, tutor_id: int):
+        """Obtiene un tutor por id"""
+        async with self.Session() as session:
+            result = await session.scalars(select(User).where(User.id == tutor_id))
+            tutor = result.one_or_none()
+
+        return tutor
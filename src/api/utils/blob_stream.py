@@ -0,0 +1,130 @@
+import re
+
+from fastapi import Response, status
+from fastapi.responses import StreamingResponse
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class BlobStream:
+    """
+    Descarga de un blob que se responde de a chunks, sin cargar el archivo
+    entero en memoria.
+
+    Se crea con open, que lee las propiedades del blob (si no existe falla
+    antes de empezar a responder). Soporta If-None-Match contra el etag del blob y un
+    unico rango de bytes en el header Range; con varios rangos se responde
+    el archivo completo y con un rango fuera del archivo se responde 416.
+    """
+
+    def __init__(
+        self,
+        storage_client,
+        blob_name: str,
+        properties: dict,
+        range_header: str | None = None,
+        if_none_match: str | None = None,
+    ) -> None:
+        self._storage_client = storage_client
+        self._blob_name = blob_name
+        self.size = properties["size"]
+        self.etag = properties["etag"]
+        self.last_modified = properties["last_modified"]
+        self.not_modified = self._matches_etag(if_none_match)
+        self.satisfiable = True
+        self.range = None if self.not_modified else self._parse_range(range_header)
+
+    @classmethod
+    async def open(
+        cls,
+        storage_client,
+        blob_name: str,
+        range_header: str | None = None,
+        if_none_match: str | None = None,
+    ) -> "BlobStream":
+        properties = await storage_client.get_properties(blob_name)
+        return cls(storage_client, blob_name, properties, range_header, if_none_match)
+
+    def _normalize_etag(self, etag: str) -> str:
+        etag = etag.strip()
+        if etag.startswith("W/"):
+            etag = etag[2:]
+        return etag.strip('"')
+
+    def _matches_etag(self, if_none_match: str | None) -> bool:
+        """Indica si el cliente ya tiene la version actual del blob"""
+        if not if_none_match or not self.etag:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        etag = self._normalize_etag(self.etag)
+        return any(
+            self._normalize_etag(candidate) == etag
+            for candidate in if_none_match.split(",")
+        )
+
+    def _parse_range(self, range_header: str | None) -> tuple[int, int] | None:
+        """Devuelve el rango (inicio, fin) pedido, con el fin inclusivo"""
+        if not range_header:
+            return None
+        match = RANGE_PATTERN.match(range_header.strip())
+        if not match or match.groups() == ("", ""):
+            return None
+
+        start, end = match.groups()
+        if start == "":
+            # bytes=-n son los ultimos n bytes
+            start, end = max(self.size - int(end), 0), self.size - 1
+        else:
+            start = int(start)
+            end = self.size - 1 if end == "" else min(int(end), self.size - 1)
+
+        if start >= self.size or start > end:
+            self.satisfiable = False
+            return None
+        return start, end
+
+    def _headers(self, filename: str) -> dict:
+        headers = {
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": f"attachment; filename={filename}",
+        }
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified.strftime(
+                "%a, %d %b %Y %H:%M:%S GMT"
+            )
+        return headers
+
+    async def to_response(self, filename: str, media_type: str) -> Response:
+        """Arma la respuesta: 304, 416, 206 con el rango pedido o 200 completa"""
+        headers = self._headers(filename)
+        if self.not_modified:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        if not self.satisfiable:
+            headers["Content-Range"] = f"bytes */{self.size}"
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers=headers,
+            )
+
+        if self.range is None:
+            chunks = await self._storage_client.download_stream(
+                self._blob_name, etag=self.etag
+            )
+            headers["Content-Length"] = str(self.size)
+            status_code = status.HTTP_200_OK
+        else:
+            start, end = self.range
+            length = end - start + 1
+            chunks = await self._storage_client.download_stream(
+                self._blob_name, offset=start, length=length, etag=self.etag
+            )
+            headers["Content-Length"] = str(length)
+            headers["Content-Range"] = f"bytes {start}-{end}/{self.size}"
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+
+        return StreamingResponse(
+            chunks, status_code=status_code, media_type=media_type, headers=headers
+        )
@@ -0,0 +1,97 @@
+import csv
+import io
+from typing import BinaryIO, Iterable, Iterator
+
+from src.api.exceptions import InvalidCsv
+
+
+class CsvStream:
+    """
+    Lee un csv fila por fila desde un archivo binario, sin cargarlo entero
+    en memoria.
+
+    Mientras se recorren las filas, line indica la linea del archivo que se
+    esta procesando. Las columnas se validan al crear el stream. Las columnas
+    de unique_columns se controlan en la misma pasada en la que se leen las
+    filas: si un valor se repite se lanza duplicated_error.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        columns: list[str],
+        unique_columns: list[str] = [],
+        duplicated_error: type[Exception] = InvalidCsv,
+        encoding: str = "utf-8-sig",
+    ) -> None:
+        self._text = io.TextIOWrapper(file, encoding=encoding, newline="")
+        self._reader = csv.reader(self._text)
+        self._columns = columns
+        self._unique_columns = unique_columns
+        self._duplicated_error = duplicated_error
+        self.line = 1
+        self._validate_csv_headers(next(self._reader, []))
+
+    def _validate_csv_headers(self, header: list[str]):
+        """Valida que las columnas del csv sean las esperadas"""
+        if [column.strip() for column in header] != self._columns:
+            raise InvalidCsv("Columns don't match with expected ones")
+
+    def rows(self) -> Iterator[dict]:
+        """Devuelve las filas como diccionarios columna -> valor"""
+        seen = {column: set() for column in self._unique_columns}
+        for line, values in enumerate(self._reader, start=2):
+            self.line = line
+            if not values:
+                continue
+            if len(values) != len(self._columns):
+                raise InvalidCsv(f"Line {line} doesn't have the expected columns")
+
+            row = dict(zip(self._columns, values))
+            for column, values_seen in seen.items():
+                value = row[column]
+                if value in values_seen:
+                    raise self._duplicated_error(
+                        f"Duplicate {column} inside the csv file: {value}"
+                    )
+                values_seen.add(value)
+            yield row
+
+    def detach(self):
+        """Libera el archivo original sin cerrarlo"""
+        self._text.detach()
+
+
+class CopySource:
+    """
+    Adapta un iterador de tuplas a un archivo de texto en formato csv, para
+    pasarlo a COPY ... FROM STDIN. Las filas se serializan a medida que el
+    driver pide datos, asi que la memoria no depende del tamaño del archivo.
+    """
+
+    def __init__(self, rows: Iterable[tuple]) -> None:
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._pending = ""
+        self.count = 0
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._pending) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._writer.writerow(row)
+            self.count += 1
+            self._pending += self._buffer.getvalue()
+            self._buffer.seek(0)
+            self._buffer.truncate(0)
+
+        if size < 0:
+            chunk, self._pending = self._pending, ""
+        else:
+            chunk, self._pending = self._pending[:size], self._pending[size:]
+        return chunk
+
+    def readline(self, size: int = -1) -> str:
+        return self.read(size)
@@ -0,0 +1,64 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.metrics import RequestTimings, record_request, request_timings
+
+# Ruta con la que se registran los requests que no matchean ningun endpoint
+UNMATCHED_ROUTE = "unmatched"
+
+
+class ServerTimingMiddleware:
+    """
+    Mide cada request: su duracion, la cantidad de sentencias SQL y el
+    tiempo que pasaron en la base y esperando una conexion del pool.
+
+    Los tiempos se devuelven en el header Server-Timing y se registran en
+    las metricas por metodo y ruta (el path del endpoint, no la url, para
+    no abrir una serie por cada id). Las metricas se registran al enviar el
+    ultimo chunk de la respuesta, sin contar las background tasks.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        start = time.perf_counter()
+        status = 500
+        recorded = False
+
+        def record():
+            nonlocal recorded
+            if not recorded:
+                recorded = True
+                route = scope.get("route")
+                path = route.path if route is not None else UNMATCHED_ROUTE
+                duration = time.perf_counter() - start
+                record_request(scope["method"], path, status, duration, timings)
+
+        async def send_with_timings(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing", timings.server_timing(time.perf_counter() - start)
+                )
+            elif message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                record()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            record()
+            request_timings.reset(token)
@@ -0,0 +1,128 @@
+import asyncio
+import datetime
+import zipfile
+from collections import deque
+from typing import AsyncIterator
+
+from src.config.logging import logger
+
+# Chunks de cada blob que se pueden adelantar mientras se escribe otro
+QUEUE_SIZE = 2
+
+
+class ZipEntry:
+    """Blob que se agrega al zip con el nombre arcname"""
+
+    def __init__(
+        self,
+        blob_name: str,
+        arcname: str,
+        size: int | None = None,
+        last_modified: datetime.datetime | None = None,
+    ) -> None:
+        self.blob_name = blob_name
+        self.arcname = arcname
+        self.size = size
+        self.last_modified = last_modified
+
+    def zip_info(self) -> zipfile.ZipInfo:
+        date_time = (self.last_modified or datetime.datetime.now()).timetuple()[:6]
+        info = zipfile.ZipInfo(self.arcname, date_time=date_time)
+        # Los pdf ya vienen comprimidos, se guardan tal cual
+        info.compress_type = zipfile.ZIP_STORED
+        # Con el tamaño conocido zipfile decide si necesita zip64
+        info.file_size = self.size or 0
+        return info
+
+
+class _ZipSink:
+    """
+    Archivo de solo escritura donde zipfile deja los bytes del zip. No
+    soporta seek, asi zipfile escribe los tamaños al final de cada archivo y
+    los bytes se pueden mandar apenas se generan.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def write(self, data) -> int:
+        self._buffer += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class ZipStream:
+    """
+    Zip de varios blobs que se genera mientras se responde, sin guardar el
+    archivo ni los blobs enteros en memoria.
+
+    Se descargan hasta prefetch blobs a la vez; cada descarga deja sus chunks
+    en una cola acotada y el zip los escribe en orden a medida que llegan,
+    asi la memoria usada depende de prefetch y del tamaño de chunk, no del
+    tamaño del zip. Los blobs que no existen se omiten.
+    """
+
+    def __init__(self, storage_client, entries: list[ZipEntry], prefetch: int = 4):
+        self._storage_client = storage_client
+        self._entries = entries
+        self._prefetch = max(prefetch, 1)
+
+    async def _fetch(self, entry: ZipEntry, queue: asyncio.Queue):
+        """Descarga el blob dejando los chunks en la cola, None al terminar"""
+        try:
+            chunks = await self._storage_client.download_stream(entry.blob_name)
+            async for chunk in chunks:
+                await queue.put(chunk)
+            await queue.put(None)
+        except Exception as e:
+            await queue.put(e)
+
+    def _start(self, entries, pending: deque):
+        entry = next(entries, None)
+        if entry is None:
+            return
+        queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        task = asyncio.create_task(self._fetch(entry, queue))
+        pending.append((entry, queue, task))
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Devuelve los bytes del zip a medida que se van generando"""
+        sink = _ZipSink()
+        entries = iter(self._entries)
+        pending = deque()
+        for _ in range(self._prefetch):
+            self._start(entries, pending)
+
+        try:
+            with zipfile.ZipFile(sink, "w") as zip_file:
+                while pending:
+                    entry, queue, _ = pending.popleft()
+                    chunk = await queue.get()
+                    if isinstance(chunk, Exception):
+                        logger.error(f"Skipping {entry.blob_name} from zip: {chunk}")
+                        self._start(entries, pending)
+                        continue
+
+                    with zip_file.open(entry.zip_info(), "w") as file:
+                        while chunk is not None:
+                            if isinstance(chunk, Exception):
+                                raise chunk
+                            file.write(chunk)
+                            if data := sink.take():
+                                yield data
+                            chunk = await queue.get()
+                    # Se libera el lugar en la ventana al terminar el blob
+                    self._start(entries, pending)
+                    if data := sink.take():
+                        yield data
+            yield sink.take()
+        finally:
+            for _, _, task in pending:
+                task.cancel()
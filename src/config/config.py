@@ -26,6 +26,14 @@ class ApiConfiguration:
     def database_url(self) -> str:
         return self.config("DATABASE_URL", default="sqlite:///test.db")
 
+    @property
+    def async_database_url(self) -> str:
+        # Por defecto es la misma base pero usando el driver asyncpg
+        default = self.database_url.replace(
+            "postgresql+psycopg2://", "postgresql://"
+        ).replace("postgresql://", "postgresql+asyncpg://")
+        return self.config("ASYNC_DATABASE_URL", default=default)
+
     @property
     def database_pool_size(self) -> int:
         return self.config("DATABASE_POOL_SIZE", cast=int, default=10)
@@ -34,6 +42,18 @@ class ApiConfiguration:
     def database_pool_timeout(self) -> int:
         return self.config("DATABASE_TIMEOUT", cast=int, default=10)
 
+    @property
+    def database_max_overflow(self) -> int:
+        return self.config("DATABASE_MAX_OVERFLOW", cast=int, default=5)
+
+    @property
+    def database_pool_recycle(self) -> int:
+        return self.config("DATABASE_POOL_RECYCLE", cast=int, default=1800)
+
+    @property
+    def database_pool_pre_ping(self) -> bool:
+        return self.config("DATABASE_POOL_PRE_PING", cast=bool, default=True)
+
     @property
     def logging_level(self) -> str:
         return self.config("LOGGIN_LEVEL", default="INFO")
@@ -47,6 +67,10 @@ class ApiConfiguration:
         # HS256 (HMAC with SHA-256)
         return self.config("HASH", cast=str, default="HS256")
 
+    @property
+    def jwt_cache_size(self) -> int:
+        return self.config("JWT_CACHE_SIZE", cast=int, default=1024)
+
     @property
     def enviroment(self) -> str:
         return self.config("ENVIRONMENT", cast=str, default="DEV")
@@ -67,6 +91,14 @@ class ApiConfiguration:
     def workers(self) -> int:
         return self.config("WORKERS", cast=int, default=1)
 
+    @property
+    def assignment_workers(self) -> int:
+        return self.config("ASSIGNMENT_WORKERS", cast=int, default=1)
+
+    @property
+    def solver_time_limit(self) -> float:
+        return self.config("SOLVER_TIME_LIMIT", cast=float, default=180)
+
     @property
     def storage_access_key(self) -> str:
         return self.config("AZURE_STORAGE_CONNECTION_STRING", cast=str)
@@ -75,10 +107,70 @@ class ApiConfiguration:
     def container(self) -> str:
         return self.config("AZURE_STORAGE_CONTAINER_NAME", cast=str)
 
+    @property
+    def storage_backend(self) -> str:
+        return self.config("STORAGE_BACKEND", cast=str, default="azure")
+
+    @property
+    def storage_local_path(self) -> str:
+        return self.config("STORAGE_LOCAL_PATH", cast=str, default="storage")
+
+    @property
+    def storage_chunk_size(self) -> int:
+        return self.config("STORAGE_CHUNK_SIZE", cast=int, default=4 * 1024 * 1024)
+
+    @property
+    def storage_max_connections(self) -> int:
+        return self.config("STORAGE_MAX_CONNECTIONS", cast=int, default=20)
+
+    @property
+    def storage_max_concurrency(self) -> int:
+        return self.config("STORAGE_MAX_CONCURRENCY", cast=int, default=4)
+
+    @property
+    def storage_export_prefetch(self) -> int:
+        return self.config("STORAGE_EXPORT_PREFETCH", cast=int, default=4)
+
     @property
     def email_key(self) -> str:
         return self.config("EMAIL_API_KEY", cast=str)
 
+    @property
+    def email_backend(self) -> str:
+        return self.config("EMAIL_BACKEND", cast=str, default="sendgrid")
+
+    @property
+    def email_worker_enabled(self) -> bool:
+        return self.config("EMAIL_WORKER_ENABLED", cast=bool, default=True)
+
+    @property
+    def email_batch_size(self) -> int:
+        return self.config("EMAIL_BATCH_SIZE", cast=int, default=100)
+
+    @property
+    def email_rate_limit(self) -> float:
+        return self.config("EMAIL_RATE_LIMIT", cast=float, default=5)
+
+    @property
+    def email_max_attempts(self) -> int:
+        return self.config("EMAIL_MAX_ATTEMPTS", cast=int, default=5)
+
+    @property
+    def email_poll_interval(self) -> float:
+        return self.config("EMAIL_POLL_INTERVAL", cast=float, default=5)
+
+    @property
+    def sql_log_sample_rate(self) -> float:
+        return self.config("SQL_LOG_SAMPLE_RATE", cast=float, default=0)
+
+    @property
+    def sql_slow_query_ms(self) -> float:
+        return self.config("SQL_SLOW_QUERY_MS", cast=float, default=0)
+
+    @property
+    def metrics_enabled(self) -> bool:
+        return self.config("METRICS_ENABLED", cast=bool, default=False)
+
     @property
     def cc_emails(self) -> str:
         return list(self.config("CC_EMAILS", cast=CommaSeparatedStrings, default=[]))
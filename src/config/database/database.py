@@ -1,9 +1,20 @@
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
 from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.config.config import api_config
 from src.config.database.models import Base
+from src.config.database.pool import MeteredQueuePool
 from src.config.logging import logger
+from src.config.metrics import gauge, instrument_engine, metrics
 
 # Solo debemos tener un engine y manejarnos con Sessions
 
@@ -11,12 +22,31 @@ from src.config.logging import logger
 database_url = api_config.database_url
 pool_size = api_config.database_pool_size
 pool_timeout = api_config.database_pool_timeout
+max_overflow = api_config.database_max_overflow
+pool_recycle = api_config.database_pool_recycle
+pool_pre_ping = api_config.database_pool_pre_ping
 
 # pool_pre_ping se asegura de que cuando se crea la instancia del engine, esta responda
 # porque sino por default, sqlalchemy tiene operaciones lazy
 engine = create_engine(
-    database_url, pool_size=pool_size, pool_timeout=pool_timeout, pool_pre_ping=True
+    database_url,
+    poolclass=MeteredQueuePool,
+    pool_size=pool_size,
+    max_overflow=max_overflow,
+    pool_timeout=pool_timeout,
+    pool_recycle=pool_recycle,
+    pool_pre_ping=pool_pre_ping,
 )
+instrument_engine(engine)
+
+# Los objetos devueltos por los repositorios se siguen usando despues del
+# commit, por eso no se expiran
+SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+
+# El engine asincronico (asyncpg) se crea recien cuando se usa, porque el
+# driver solo existe para PostgreSQL
+async_engine: Optional[AsyncEngine] = None
+AsyncSessionFactory: Optional[async_sessionmaker] = None
 
 
 def init_default_values():
@@ -58,10 +88,176 @@ def drop_tables():
         raise err
 
 
+class SessionScope:
+    """
+    Unidad de trabajo fuera de un request (trabajos en background, workers).
+
+    Los repositorios solo hacen flush de sus cambios; el commit lo hace quien
+    provee la session. Cada with abre una Session nueva y al salir hace commit,
+    o rollback si hubo un error, y la cierra.
+    """
+
+    def __init__(self, factory=SessionFactory) -> None:
+        self._factory = factory
+
+    @contextmanager
+    def __call__(self) -> Iterator[Session]:
+        session = self._factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+# Sessions de los trabajos que corren despues de cerrar el request
+BackgroundSession = SessionScope(SessionFactory)
+
+
+class RequestSession:
+    """
+    Unidad de trabajo de un request.
+
+    Los repositorios la usan igual que a un sessionmaker
+    (with self.Session() as session), pero todos reciben la misma Session, por
+    lo que el request toma una unica conexion del pool. Los repositorios solo
+    hacen flush y get_db hace un unico commit al terminar el request.
+
+    Salir del with no cierra la session ni hace rollback, aunque haya un error:
+    solo get_db descarta el request entero. Asi un error que se atrapa y del
+    que se recupera no borra lo escrito antes en el mismo request. Quien
+    necesite recuperarse de un flush fallido usa un savepoint
+    (session.begin_nested()).
+    """
+
+    def __init__(self, factory: sessionmaker = SessionFactory) -> None:
+        self._session: Session = factory()
+
+    def __call__(self) -> "RequestSession":
+        return self
+
+    def __enter__(self) -> Session:
+        return self._session
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def commit(self):
+        self._session.commit()
+
+    def rollback(self):
+        self._session.rollback()
+
+    def close(self):
+        self._session.close()
+
+
 def get_db():
-    """Retorna una instancia de una session haciendo un yield"""
-    if engine is not None:
-        Session = sessionmaker(bind=engine)
-        yield Session
-    else:
-        yield None
+    """
+    Retorna la unidad de trabajo del request haciendo un yield. Al terminar el
+    request se hace commit, o rollback si hubo un error, y se devuelve la
+    conexion al pool.
+    """
+    session = RequestSession()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Devuelve el sessionmaker asincronico, creando el engine la primera vez"""
+    global async_engine, AsyncSessionFactory
+    if AsyncSessionFactory is None:
+        async_engine = create_async_engine(
+            api_config.async_database_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
+        instrument_engine(async_engine.sync_engine)
+        AsyncSessionFactory = async_sessionmaker(
+            bind=async_engine, expire_on_commit=False
+        )
+    return AsyncSessionFactory
+
+
+class AsyncRequestSession:
+    """
+    Unidad de trabajo asincronica de un request. Es el equivalente de
+    RequestSession para los repositorios asincronicos
+    (async with self.Session() as session): el rollback lo hace solo
+    get_async_db.
+    """
+
+    def __init__(self, factory: async_sessionmaker) -> None:
+        self._session: AsyncSession = factory()
+
+    def __call__(self) -> "AsyncRequestSession":
+        return self
+
+    async def __aenter__(self) -> AsyncSession:
+        return self._session
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+    async def commit(self):
+        await self._session.commit()
+
+    async def rollback(self):
+        await self._session.rollback()
+
+    async def close(self):
+        await self._session.close()
+
+
+async def dispose_async_engine():
+    """Cierra las conexiones del engine asincronico, si fue creado"""
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+async def get_async_db():
+    """Igual que get_db pero con una session asincronica (asyncpg)"""
+    session = AsyncRequestSession(get_async_session_factory())
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+def get_pool_stats() -> dict:
+    """Devuelve el uso del pool de conexiones"""
+    return engine.pool.stats()
+
+
+def _pool_metrics() -> list[str]:
+    stats = get_pool_stats()
+    connections = [
+        ({"state": state}, stats[state])
+        for state in ("checked_out", "idle", "overflow")
+    ]
+    return gauge(
+        "db_pool_connections", "Connections of the pool by state", connections
+    ) + gauge(
+        "db_pool_timeouts",
+        "Connection requests that timed out",
+        [(None, stats["timeouts"])],
+    )
+
+
+metrics.add_collector(_pool_metrics)
@@ -11,10 +11,12 @@ Evitando que no haya tablas sin construir
 from src.config.database.base import Base
 
 from src.api.users.models import User
-from src.api.groups.models import Group, association_table
+from src.api.groups.models import Group, Deliverable, association_table
 from src.api.periods.models import Period
 from src.api.tutors.models import TutorPeriod
 from src.api.forms.models import FormPreferences
 from src.api.topics.models import Topic, Category
 from src.api.students.models import StudentPeriod
 from src.api.dates.models import DateSlot, GroupDateSlot, TutorDateSlot
+from src.api.assignments.models import AssignmentJob, SolverRun
+from src.api.emails.models import OutboxEmail
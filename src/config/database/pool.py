@@ -0,0 +1,91 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import QueuePool
+
+from src.config.metrics import record_pool_wait
+
+
+class PoolMetrics:
+    """
+    Contadores de uso del pool de conexiones.
+
+    El tiempo de espera incluye tanto la espera por una conexion libre como
+    la apertura de una nueva cuando el pool usa su overflow.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_checkout(self, wait: float):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def record_timeout(self, wait: float):
+        with self._lock:
+            self.timeouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def record_checkin(self):
+        with self._lock:
+            self.checkins += 1
+
+    def to_json(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "timeouts": self.timeouts,
+                "wait_total": self.wait_total,
+                "wait_max": self.wait_max,
+                "wait_avg": self.wait_total / attempts if attempts else 0.0,
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool que registra cuantas veces se pide una conexion y cuanto se espera"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - start)
+            raise
+        wait = time.perf_counter() - start
+        self.metrics.record_checkout(wait)
+        record_pool_wait(wait)
+        return connection
+
+    def _do_return_conn(self, record):
+        self.metrics.record_checkin()
+        super()._do_return_conn(record)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def stats(self) -> dict:
+        """Estado actual del pool junto con los contadores acumulados"""
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "idle": self.checkedin(),
+            **self.metrics.to_json(),
+        }
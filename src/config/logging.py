@@ -16,10 +16,5 @@ logger = logging.getLogger(__name__)
 logger.setLevel(api_config.logging_level)
 logger.addHandler(stdout_handler)
 
-# sql alchemy logger configuration
-sqlalchemy_logger = logging.getLogger("sqlalchemy.engine")
-sqlalchemy_logger.setLevel(logging.DEBUG)
-sqlalchemy_logger.addHandler(stdout_handler)
-
 # Optional: Previene la propagacion de logs hacia padres
 logger.propagate = False
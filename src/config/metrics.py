@@ -0,0 +1,230 @@
+import bisect
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable
+
+from sqlalchemy import event
+
+from src.config.config import api_config
+from src.config.logging import logger
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    values = [f'{name}="{_escape(value)}"' for name, value in labels.items()]
+    return "{" + ",".join(values) + "}"
+
+
+class Histogram:
+    """Histograma de Prometheus con etiquetas, seguro entre threads"""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: tuple = (),
+        buckets: tuple = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self._labels = labels
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels.get(label, "") for label in self._labels)
+        with self._lock:
+            if key not in self._series:
+                # Cuenta por bucket (sin acumular), suma y cantidad
+                self._series[key] = [[0] * len(self._buckets), 0.0, 0]
+            series = self._series[key]
+            index = bisect.bisect_left(self._buckets, value)
+            if index < len(self._buckets):
+                series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = [
+                (key, list(counts), total, count)
+                for key, (counts, total, count) in self._series.items()
+            ]
+
+        for key, bucket_counts, total, count in sorted(series):
+            labels = dict(zip(self._labels, key))
+            accumulated = 0
+            for bucket, bucket_count in zip(self._buckets, bucket_counts):
+                accumulated += bucket_count
+                bucket_labels = _format_labels({**labels, "le": bucket})
+                lines.append(f"{self.name}_bucket{bucket_labels} {accumulated}")
+            inf_labels = _format_labels({**labels, "le": "+Inf"})
+            lines.append(f"{self.name}_bucket{inf_labels} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Metricas de la aplicacion en el formato de texto de Prometheus. Los
+    collectors devuelven lineas ya formateadas, para valores que se leen al
+    momento de exponerlas (por ejemplo el estado del pool).
+    """
+
+    def __init__(self) -> None:
+        self._histograms = []
+        self._collectors = []
+
+    def histogram(self, *args, **kwargs) -> Histogram:
+        histogram = Histogram(*args, **kwargs)
+        self._histograms.append(histogram)
+        return histogram
+
+    def add_collector(self, collector: Callable[[], list[str]]):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for histogram in self._histograms:
+            lines.extend(histogram.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+def gauge(name: str, description: str, values: list[tuple]) -> list[str]:
+    """Formatea un gauge, values son pares (etiquetas o None, valor)"""
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} gauge"]
+    for labels, value in values:
+        lines.append(f"{name}{_format_labels(labels or {})} {value}")
+    return lines
+
+
+metrics = MetricsRegistry()
+
+request_duration = metrics.histogram(
+    "http_request_duration_seconds",
+    "Latency of the http requests",
+    labels=("method", "route", "status"),
+)
+request_queries = metrics.histogram(
+    "http_request_db_queries",
+    "SQL statements executed by each http request",
+    labels=("method", "route"),
+    buckets=QUERY_BUCKETS,
+)
+request_sql_time = metrics.histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL statements by each http request",
+    labels=("method", "route"),
+)
+pool_wait = metrics.histogram(
+    "db_pool_wait_seconds",
+    "Time waited to get a connection from the pool",
+)
+
+
+class RequestTimings:
+    """Tiempos acumulados durante un request, se informan en Server-Timing"""
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.sql_time = 0.0
+        self.pool_wait = 0.0
+
+    def server_timing(self, total: float) -> str:
+        return (
+            f"app;dur={total * 1000:.1f}, "
+            f'db;dur={self.sql_time * 1000:.1f};desc="{self.queries} queries", '
+            f"pool;dur={self.pool_wait * 1000:.1f}"
+        )
+
+
+# Tiempos del request en curso, lo setea el ServerTimingMiddleware
+request_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def record_pool_wait(wait: float):
+    """Registra la espera por una conexion del pool"""
+    pool_wait.observe(wait)
+    timings = request_timings.get()
+    if timings is not None:
+        timings.pool_wait += wait
+
+
+def record_request(
+    method: str, route: str, status: int, duration: float, timings: RequestTimings
+):
+    """Registra las metricas de un request terminado"""
+    request_duration.observe(duration, method=method, route=route, status=status)
+    request_queries.observe(timings.queries, method=method, route=route)
+    request_sql_time.observe(timings.sql_time, method=method, route=route)
+
+
+class SqlLogSampler:
+    """
+    Loguea una muestra de las sentencias SQL en lugar de todas: cada
+    sentencia se loguea con probabilidad sample_rate, y las que tardan mas
+    de slow_ms siempre. Con ambos en 0 no se loguea nada.
+    """
+
+    def __init__(self, sample_rate: float = 0, slow_ms: float = 0) -> None:
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+
+    def log(self, statement: str, elapsed: float):
+        slow = self.slow_ms > 0 and elapsed * 1000 >= self.slow_ms
+        if slow or (self.sample_rate > 0 and random.random() < self.sample_rate):
+            label = "Slow SQL" if slow else "SQL"
+            logger.info(f"{label} ({elapsed * 1000:.1f}ms): {statement}")
+
+
+sql_log_sampler = SqlLogSampler(
+    api_config.sql_log_sample_rate, api_config.sql_slow_query_ms
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    timings = request_timings.get()
+    if timings is not None:
+        timings.queries += 1
+        timings.sql_time += elapsed
+    sql_log_sampler.log(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    # Si la sentencia falla no se llama a after_cursor_execute, asi que se
+    # descarta el inicio que quedo en la conexion
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start"):
+        connection.info["query_start"].pop()
+
+
+def instrument_engine(engine):
+    """Cuenta y mide las sentencias que ejecuta el engine (sincronico)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
@@ -1,5 +1,11 @@
+import time
+from collections import defaultdict
+from typing import Optional
+
 import pyscipopt as scip
 from src.constants import DATE_ID, EVALUATOR_ID, GROUP_ID, TUTOR_ID
+from src.core.algorithms.solver_options import SolverOptions
+from src.core.algorithms.solver_stats import SolverStats
 from src.core.date_slots import DateSlot
 from src.core.delivery_date import DeliveryDate
 from src.core.group import AssignedGroup
@@ -27,8 +33,35 @@ class DeliveryLPSolver:
         Variables de decisión para la asignación.
     _evaluator_day_vars : dict
         Variables para minimizar los días de asistencia de los evaluadores.
+    _vars_by_group : dict
+        Indice de variables de decisión por grupo.
+    _dates_by_group : dict
+        Fechas (semana, día, hora) posibles de cada grupo, sin repetir.
+    _vars_by_group_date : dict
+        Indice de variables de decisión por (grupo, semana, día, hora).
+    _vars_by_date : dict
+        Indice de variables de decisión por (semana, día, hora).
+    _vars_by_evaluator : dict
+        Indice de variables de decisión por evaluador.
+    _vars_by_evaluator_day : dict
+        Indice de variables de decisión por (evaluador, semana, día).
+    _vars_by_evaluator_week : dict
+        Indice de variables de decisión por (evaluador, semana).
     _model : scip.Model
         Modelo SCIP para resolver el problema.
+    build_time : float
+        Segundos que llevó construir el modelo (variables y restricciones).
+    solve_time : float
+        Segundos que llevó resolver el modelo.
+    previous_result : DateSlotsAssignmentResult
+        Resultado de una ejecución anterior usado como solución inicial.
+    reopened_groups : set
+        Grupos que se vuelven a asignar aunque su asignación anterior siga
+        siendo factible.
+    fixed_groups : set
+        Grupos cuya asignación anterior quedó fija en el modelo.
+    options : SolverOptions
+        Límites de tiempo, gap, threads y nodos con los que se ejecuta SCIP.
     """
 
     def __init__(
@@ -39,6 +72,9 @@ class DeliveryLPSolver:
         available_dates: list[DateSlot] = [],
         max_groups_per_week: int = 5,
         max_dif_evaluators: int = 5,
+        previous_result: Optional[DateSlotsAssignmentResult] = None,
+        reopened_groups: Optional[set[int]] = None,
+        options: Optional[SolverOptions] = None,
     ):
         """
         Inicializa la clase con los períodos de tutores y fechas.
@@ -49,6 +85,15 @@ class DeliveryLPSolver:
             Lista de fechas disponibles.
         tutor_periods : list
             Lista de tutores.
+        previous_result : DateSlotsAssignmentResult
+            Si se provee, se resuelve de forma incremental a partir de este
+            resultado.
+        reopened_groups : set
+            Ids de grupos que deben reasignarse aunque su fecha anterior siga
+            siendo válida.
+        options : SolverOptions
+            Límites del solver. Si se alcanza alguno se devuelve la mejor
+            solución encontrada junto con su gap.
         """
 
         self._evaluators = evaluators
@@ -57,10 +102,32 @@ class DeliveryLPSolver:
         self._available_dates = available_dates
         self._decision_variables = {}
         self._evaluator_day_vars = {}
+        self._vars_by_group = defaultdict(list)
+        self._dates_by_group = defaultdict(list)
+        self._vars_by_group_date = defaultdict(list)
+        self._vars_by_date = defaultdict(list)
+        self._vars_by_evaluator = defaultdict(list)
+        self._vars_by_evaluator_day = defaultdict(list)
+        self._vars_by_evaluator_week = defaultdict(list)
         self._model = scip.Model()
         self._model.setIntParam("display/verblevel", 0)
         self.max_groups_per_week = max_groups_per_week
         self.max_dif_evaluators = max_dif_evaluators
+        self.build_time = 0.0
+        self.solve_time = 0.0
+        self.previous_result = previous_result
+        self.reopened_groups = set(reopened_groups or [])
+        self.fixed_groups = set()
+        self._fixed_vars = []
+        self.options = options if options is not None else SolverOptions()
+        self.options.apply_to_scip(self._model)
+        self.stats = SolverStats(
+            "delivery-lp",
+            groups=len(groups),
+            tutors=len(tutors),
+            evaluators=len(evaluators),
+            slots=len(available_dates),
+        )
 
     def create_decision_variables(self):
         """
@@ -72,28 +139,34 @@ class DeliveryLPSolver:
         crea una variable de decisión para representar si el evaluador está asignado
         al grupo en esa fecha.
         """
+        evaluators_dates = {
+            e_date.date
+            for evaluator in self._evaluators
+            for e_date in evaluator.available_dates
+        }
+        groups_by_tutor = defaultdict(list)
+        for group in self._groups:
+            groups_by_tutor[group.tutor_id()].append(group)
+
         for tutor in self._tutors:
             # Verificar si el tutor tiene fechas en común con algún evaluador
             has_common_dates = any(
-                any(t_date.date == e_date.date for t_date in tutor.available_dates)
-                for evaluator in self._evaluators
-                for e_date in evaluator.available_dates
+                t_date.date in evaluators_dates for t_date in tutor.available_dates
             )
 
             # Si no hay fechas en común, asignar todas las fechas disponibles al tutor
             if not has_common_dates:
                 tutor.available_dates = self._available_dates
 
-            for group in self._groups:
-                if group.tutor_id() == tutor.id:
-                    if group.available_dates:
+            for group in groups_by_tutor.get(tutor.id, []):
+                if group.available_dates:
 
-                        group_tutor_possible_dates = self._find_common_dates(group, tutor)
-                        if group_tutor_possible_dates:
-                            for evaluator in self._evaluators:
-                                self._create_evaluator_decision_variables(
-                                    group, tutor, evaluator, group_tutor_possible_dates
-                                )
+                    group_tutor_possible_dates = self._find_common_dates(group, tutor)
+                    if group_tutor_possible_dates:
+                        for evaluator in self._evaluators:
+                            self._create_evaluator_decision_variables(
+                                group, tutor, evaluator, group_tutor_possible_dates
+                            )
 
     def _find_common_dates(self, group: AssignedGroup, tutor: Tutor):
         """
@@ -112,10 +185,11 @@ class DeliveryLPSolver:
             Lista de tuplas que representan fechas comunes (semana, día, hora).
         """
 
+        tutor_dates = {t_date.date for t_date in tutor.available_dates}
         return [
             (g_date.get_week(), g_date.get_day_of_week(), g_date.get_hour())
             for g_date in group.available_dates
-            if any(t_date.date == g_date.date for t_date in tutor.available_dates)
+            if g_date.date in tutor_dates
         ]
 
     def _create_evaluator_decision_variables(
@@ -146,13 +220,12 @@ class DeliveryLPSolver:
         """
 
         if evaluator.id != tutor.id:
-            group_tutor_evaluator_possible_dates = [
-                (week, day, hour)
-                for (week, day, hour) in group_tutor_possible_dates
+            evaluator_dates = {
+                (e_date.get_week(), e_date.get_day_of_week(), e_date.get_hour())
                 for e_date in evaluator.available_dates
-                if day == e_date.get_day_of_week()
-                and week == e_date.get_week()
-                and hour == e_date.get_hour()
+            }
+            group_tutor_evaluator_possible_dates = [
+                date for date in group_tutor_possible_dates if date in evaluator_dates
             ]
             if group_tutor_evaluator_possible_dates:
                 for week, day, hour in group_tutor_evaluator_possible_dates:
@@ -220,6 +293,26 @@ class DeliveryLPSolver:
                 day_var_name, vtype="B", obj=0, lb=0, ub=1
             )
 
+    def _build_indexes(self):
+        """
+        Construye, en una sola pasada sobre las variables de decisión, los índices
+        secundarios que usan las restricciones. De esta forma cada restricción se
+        genera en tiempo lineal en vez de recorrer todas las variables por cada
+        grupo, fecha, evaluador o semana.
+        """
+
+        for key, var in self._decision_variables.items():
+            group_id, evaluator_id = key[GROUP], key[EVALUATOR]
+            week, day, hour = key[WEEK], key[DAY], key[HOUR]
+            if (group_id, week, day, hour) not in self._vars_by_group_date:
+                self._dates_by_group[group_id].append((week, day, hour))
+            self._vars_by_group[group_id].append(var)
+            self._vars_by_group_date[(group_id, week, day, hour)].append(var)
+            self._vars_by_date[(week, day, hour)].append(var)
+            self._vars_by_evaluator[evaluator_id].append(var)
+            self._vars_by_evaluator_day[(evaluator_id, week, day)].append(var)
+            self._vars_by_evaluator_week[(evaluator_id, week)].append(var)
+
     def add_group_assignment_constraints(self):
         """
         Agrega restricciones de asignación de grupos al modelo.
@@ -242,11 +335,7 @@ class DeliveryLPSolver:
             Un grupo que necesita un evaluador.
         """
 
-        group_possible_dates = [
-            (week, day, hour)
-            for (g, _, _, week, day, hour) in self._decision_variables
-            if g == group.id
-        ]
+        group_possible_dates = self._dates_by_group.get(group.id, [])
         if group_possible_dates:
             group_date_vars = self._create_group_date_variables(
                 group, group_possible_dates, tutor
@@ -291,26 +380,7 @@ class DeliveryLPSolver:
             self._model.addCons(
                 group_date_var
                 >= scip.quicksum(
-                    self._decision_variables[
-                        (
-                            group.id,
-                            tutor.id,
-                            evaluator.id,
-                            date[0],
-                            date[1],
-                            date[2],
-                        )
-                    ]
-                    for evaluator in self._evaluators
-                    if (
-                        group.id,
-                        tutor.id,
-                        evaluator.id,
-                        date[0],
-                        date[1],
-                        date[2],
-                    )
-                    in self._decision_variables
+                    self._vars_by_group_date[(group.id, date[0], date[1], date[2])]
                 )
                 / len(self._evaluators),
                 name=f"{GROUP_ID}-{group.id}-{DATE_ID}-{date[0]}-{date[1]}-{date[2]}",
@@ -327,11 +397,7 @@ class DeliveryLPSolver:
             Un grupo que necesita un evaluador.
         """
 
-        variables = [
-            self._decision_variables[var]
-            for var in self._decision_variables
-            if var[GROUP] == group.id
-        ]
+        variables = self._vars_by_group.get(group.id, [])
         if variables:
             self._model.addCons(
                 scip.quicksum(variables) == 1,
@@ -343,15 +409,7 @@ class DeliveryLPSolver:
         Agrega la restricción de que cada fecha puede tener solo un grupo asignado.
         """
 
-        dates = set(
-            (week, day, hour) for _, _, _, week, day, hour in self._decision_variables
-        )
-        for date in dates:
-            variables = [
-                self._decision_variables[var]
-                for var in self._decision_variables
-                if (var[WEEK], var[DAY], var[HOUR]) == date
-            ]
+        for date, variables in self._vars_by_date.items():
             if variables:
                 self._model.addCons(
                     scip.quicksum(variables) <= 1, name=f"unique-group-date-{date}"
@@ -366,11 +424,7 @@ class DeliveryLPSolver:
             self._model.addCons(
                 self._evaluator_day_vars[(evaluator_id, week, day)]
                 >= scip.quicksum(
-                    self._decision_variables[var]
-                    for var in self._decision_variables
-                    if var[EVALUATOR] == evaluator_id
-                    and var[WEEK] == week
-                    and var[DAY] == day
+                    self._vars_by_evaluator_day.get((evaluator_id, week, day), [])
                 )
                 / len(self._available_dates)
             )
@@ -381,6 +435,7 @@ class DeliveryLPSolver:
         los grupos presentes en un día dado, hasta un máximo de 5 grupos por semana.
         """
 
+        self._weeks = set(date.get_week() for date in self._available_dates)
         for evaluator in self._evaluators:
             self._add_weekly_group_limit_constraint(evaluator)
 
@@ -395,13 +450,10 @@ class DeliveryLPSolver:
             Un evaluador disponible para la asignación.
         """
 
-        weeks = set(date.get_week() for date in self._available_dates)
-        for week in weeks:
+        for week in self._weeks:
             self._model.addCons(
                 scip.quicksum(
-                    self._decision_variables[var]
-                    for var in self._decision_variables
-                    if var[EVALUATOR] == evaluator.id and var[WEEK] == week
+                    self._vars_by_evaluator_week.get((evaluator.id, week), [])
                 )
                 <= self.max_groups_per_week,
                 name=f"max-10-groups-week-{EVALUATOR_ID}-{evaluator.id}-{week}",
@@ -441,11 +493,7 @@ class DeliveryLPSolver:
         for evaluator in self._evaluators:
             self._model.addCons(
                 self._evaluator_assignment_vars[evaluator.id]
-                == scip.quicksum(
-                    self._decision_variables[var]
-                    for var in self._decision_variables
-                    if var[EVALUATOR] == evaluator.id
-                ),
+                == scip.quicksum(self._vars_by_evaluator.get(evaluator.id, [])),
                 name=f"count-assignments-{EVALUATOR_ID}-{evaluator.id}",
             )
 
@@ -485,6 +533,82 @@ class DeliveryLPSolver:
 
         return substitutes
 
+    def _previous_assignment_keys(self) -> dict:
+        """
+        Traduce las asignaciones del resultado anterior a claves de variables de
+        decisión, descartando las que ya no existen en el modelo (por ejemplo,
+        porque el grupo, el tutor o el evaluador ya no tienen esa fecha).
+        """
+
+        keys = {}
+        for assignment in self.previous_result.assignments:
+            date = assignment.date
+            key = (
+                assignment.group_id,
+                assignment.tutor_id,
+                assignment.evaluator_id,
+                date.get_week(),
+                date.get_day_of_week(),
+                date.get_hour(),
+            )
+            if key in self._decision_variables:
+                keys[assignment.group_id] = key
+        return keys
+
+    def warm_start(self):
+        """
+        Usa el resultado anterior como punto de partida del modelo.
+
+        Las asignaciones que siguen siendo factibles se fijan, salvo las de los
+        grupos reabiertos, y todas se cargan en SCIP como solución parcial para
+        que el solver sólo tenga que completar los grupos cuyas restricciones
+        cambiaron.
+        """
+
+        previous_keys = self._previous_assignment_keys()
+        # La solución parcial sólo cubre las asignaciones, SCIP completa el resto
+        self._model.setParam("heuristics/completesol/maxunknownrate", 1.0)
+        solution = self._model.createPartialSol()
+        for group_id, key in previous_keys.items():
+            var = self._decision_variables[key]
+            self._model.setSolVal(solution, var, 1.0)
+            if group_id not in self.reopened_groups:
+                self._model.chgVarLb(var, 1.0)
+                self._fixed_vars.append(var)
+                self.fixed_groups.add(group_id)
+        self._model.addSol(solution)
+
+    def _release_fixed_assignments(self):
+        """Libera las asignaciones fijadas para volver a resolver desde cero"""
+
+        self._model.freeTransform()
+        for var in self._fixed_vars:
+            self._model.chgVarLb(var, 0.0)
+        self._fixed_vars = []
+        self.fixed_groups = set()
+
+    def build_model(self):
+        """
+        Construye el modelo completo (variables, índices, restricciones y objetivo)
+        y registra en build_time los segundos que llevó hacerlo.
+        """
+        with self.stats.phase("build"):
+            self.create_decision_variables()
+            self._build_indexes()
+            self.create_auxiliary_variables()
+
+            self.add_group_assignment_constraints()
+            self.add_evaluator_minimization_constraints()
+            self.add_evaluator_group_assignment_constraints()
+            self.add_unique_group_per_date_constraint()
+            self.add_assignment_count_constraints()
+            self.add_balance_constraints()
+            self.define_objective()
+
+        self.build_time = self.stats.timings.get("build")
+        self.stats.variables = self._model.getNVars(transformed=False)
+        self.stats.constraints = self._model.getNConss(transformed=False)
+
     def solve(self):
         """
         Resuelve el modelo de programación lineal.
@@ -494,21 +618,36 @@ class DeliveryLPSolver:
         list
             Lista de variables de decisión activadas.
         """
-        self.create_decision_variables()
-        self.create_auxiliary_variables()
-
-        self.add_group_assignment_constraints()
-        self.add_evaluator_minimization_constraints()
-        self.add_evaluator_group_assignment_constraints()
-        self.add_unique_group_per_date_constraint()
-        self.add_assignment_count_constraints()
-        self.add_balance_constraints()
-        self.define_objective()
-        self._model.optimize()
+        self.build_model()
+        self.options.write_scip_model(self._model)
+        if self.previous_result is not None:
+            with self.stats.phase("warm_start"):
+                self.warm_start()
+
+        start = time.perf_counter()
+        self.options.optimize_scip(self._model)
+        has_incumbent = SolverOptions.scip_has_incumbent(self._model)
+        if not has_incumbent and self._fixed_vars:
+            # Las asignaciones fijas hacen infactible el modelo, se reabren todas
+            self._release_fixed_assignments()
+            if self.options.time_limit is not None:
+                elapsed = time.perf_counter() - start
+                remaining = max(self.options.time_limit - elapsed, 1.0)
+                self._model.setParam("limits/time", remaining)
+            self.options.optimize_scip(self._model)
+            has_incumbent = SolverOptions.scip_has_incumbent(self._model)
+        self.solve_time = time.perf_counter() - start
+        self.stats.timings.add("solve", self.solve_time)
+        self.stats.status = self._model.getStatus()
+        self.stats.nodes = self._model.getNTotalNodes()
 
         results = DateSlotsAssignmentResult(status=-1, assignments=[])
-        if self._model.getStatus() == "optimal":
-            return self._get_results(results)
+        if has_incumbent:
+            # Optima o la mejor encontrada antes de alcanzar algún límite
+            results.gap = self._model.getGap()
+            self.stats.gap = results.gap
+            with self.stats.phase("decode"):
+                return self._get_results(results)
 
         return results
 
@@ -527,23 +666,17 @@ class DeliveryLPSolver:
             for var in self._decision_variables
         }
 
+        dates = {}
+        for dt in self._available_dates:
+            dates.setdefault((dt.get_week(), dt.get_day_of_week(), dt.get_hour()), dt)
+        group_numbers = {group.id: group.group_number for group in self._groups}
+
         results.status = 1
         for var in rounded_decision_vars:
             if rounded_decision_vars[var] > 0:
                 group_id, tutor_id, evaluator_id, week, day, hour = var
-                date = next(
-                    dt
-                    for dt in self._available_dates
-                    if dt.is_same_date(week, day, hour)
-                )
-                group_number = next(
-                    (
-                        group.group_number
-                        for group in self._groups
-                        if group.id == group_id
-                    ),
-                    0,
-                )
+                date = dates[(week, day, hour)]
+                group_number = group_numbers.get(group_id, 0)
                 assignment = DateSlotAssignment(
                     group_id=group_id,
                     group_number=group_number,
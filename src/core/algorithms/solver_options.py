@@ -0,0 +1,138 @@
+from typing import Optional
+
+import pyscipopt as scip
+from pulp import (
+    PULP_CBC_CMD,
+    LpProblem,
+    LpSolutionIntegerFeasible,
+    LpSolutionOptimal,
+)
+
+# Estados de SCIP en los que, si hay una solucion, es la mejor encontrada
+# hasta que se corto la ejecucion
+SCIP_LIMIT_STATUSES = {
+    "timelimit",
+    "gaplimit",
+    "nodelimit",
+    "totalnodelimit",
+    "stallnodelimit",
+    "sollimit",
+    "bestsollimit",
+    "memlimit",
+    "userinterrupt",
+}
+
+
+class SolverOptions:
+    """
+    Limites comunes a todos los algoritmos de asignacion.
+
+    Attributes:
+        time_limit (float): Segundos maximos de ejecucion del solver.
+        mip_gap (float): Gap relativo con el que se da por buena una solucion.
+        threads (int): Cantidad de threads que puede usar el solver. CBC los
+            usa en el branch and bound; SCIP, con mas de uno, resuelve en modo
+            concurrente (ver optimize_scip).
+        node_limit (int): Cantidad maxima de nodos del branch and bound.
+        model_path (str): Si se indica, el solver escribe ahi el modelo antes
+            de resolverlo (formato MPS, o LP si termina en .lp). Se usa para
+            reproducir corridas fuera de la api.
+    """
+
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        mip_gap: Optional[float] = None,
+        threads: Optional[int] = None,
+        node_limit: Optional[int] = None,
+        model_path: Optional[str] = None,
+    ) -> None:
+        self.time_limit = time_limit
+        self.mip_gap = mip_gap
+        self.threads = threads
+        self.node_limit = node_limit
+        self.model_path = model_path
+
+    def to_cbc(self, msg: bool = False) -> PULP_CBC_CMD:
+        """Crea el comando de CBC (PuLP) con los limites configurados"""
+        options = []
+        if self.node_limit is not None:
+            options.append(f"maxNodes {self.node_limit}")
+        return PULP_CBC_CMD(
+            msg=msg,
+            timeLimit=self.time_limit,
+            gapRel=self.mip_gap,
+            threads=self.threads,
+            options=options,
+        )
+
+    def apply_to_scip(self, model: scip.Model):
+        """Configura los limites en un modelo de SCIP"""
+        if self.time_limit is not None:
+            model.setParam("limits/time", self.time_limit)
+        if self.mip_gap is not None:
+            model.setParam("limits/gap", self.mip_gap)
+        if self.threads is not None:
+            model.setParam("parallel/maxnthreads", self.threads)
+        if self.node_limit is not None:
+            model.setParam("limits/nodes", self.node_limit)
+
+    def optimize_scip(self, model: scip.Model):
+        """
+        Resuelve el modelo de SCIP. SoPlex resuelve los LP con un solo thread,
+        asi que para usar mas de uno se corre SCIP en modo concurrente (si SCIP
+        se compilo sin soporte de paralelismo, pyscipopt avisa y usa optimize)
+        """
+        if self.threads is not None and self.threads > 1:
+            model.solveConcurrent()
+        else:
+            model.optimize()
+
+    def write_pulp_model(self, prob: LpProblem):
+        """Escribe el modelo de PuLP en model_path, si se configuro"""
+        if self.model_path is None:
+            return
+        if self.model_path.endswith(".lp"):
+            prob.writeLP(self.model_path)
+        else:
+            prob.writeMPS(self.model_path)
+
+    def write_scip_model(self, model: scip.Model):
+        """Escribe el modelo de SCIP en model_path, si se configuro"""
+        if self.model_path is not None:
+            model.writeProblem(self.model_path, verbose=False)
+
+    @staticmethod
+    def scip_has_incumbent(model: scip.Model) -> bool:
+        """
+        Indica si SCIP termino con una solucion utilizable: la optima o la mejor
+        encontrada antes de alcanzar algun limite.
+        """
+        status = model.getStatus()
+        if status == "optimal":
+            return True
+        return status in SCIP_LIMIT_STATUSES and model.getNSols() > 0
+
+    @staticmethod
+    def cbc_gap(sol_status: int) -> Optional[float]:
+        """
+        CBC (a traves de PuLP) no informa la cota dual, por lo que el gap solo se
+        conoce cuando la solucion es optima. Para una solucion factible cortada
+        por algun limite se devuelve None.
+        """
+        if sol_status == LpSolutionOptimal:
+            return 0.0
+        return None
+
+    @staticmethod
+    def cbc_has_incumbent(sol_status: int) -> bool:
+        """Indica si CBC devolvio una solucion entera (optima o no)"""
+        return sol_status in (LpSolutionOptimal, LpSolutionIntegerFeasible)
+
+    def to_json(self) -> dict:
+        return {
+            "time_limit": self.time_limit,
+            "mip_gap": self.mip_gap,
+            "threads": self.threads,
+            "node_limit": self.node_limit,
+        }
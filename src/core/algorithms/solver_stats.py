@@ -0,0 +1,91 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+# Stats de los solvers creados dentro de collect_solver_stats
+_collected: ContextVar[Optional[list]] = ContextVar("solver_stats", default=None)
+
+
+class PhaseTimings:
+    """Segundos acumulados en cada fase de una ejecucion"""
+
+    def __init__(self) -> None:
+        self._timings = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float):
+        self._timings[name] = self._timings.get(name, 0.0) + seconds
+
+    def get(self, name: str) -> float:
+        return self._timings.get(name, 0.0)
+
+    def total(self) -> float:
+        return sum(self._timings.values())
+
+    def to_json(self) -> dict:
+        return dict(self._timings)
+
+
+class SolverStats:
+    """
+    Telemetria de una ejecucion de un solver.
+
+    Attributes:
+        solver (str): Nombre del algoritmo.
+        inputs (dict): Tamaño de cada entrada (grupos, tutores, fechas, etc).
+        variables (int): Variables del modelo, o aristas de la red de flujo.
+        constraints (int): Restricciones del modelo, o nodos de la red de flujo.
+        status (str): Estado con el que termino el solver.
+        gap (float): Gap de la solucion, si el solver lo informa.
+        nodes (int): Nodos del branch and bound, si el solver lo informa.
+        timings (PhaseTimings): Segundos de cada fase (build, solve, decode).
+    """
+
+    def __init__(self, solver: str, **inputs) -> None:
+        self.solver = solver
+        self.inputs = inputs
+        self.variables = None
+        self.constraints = None
+        self.status = None
+        self.gap = None
+        self.nodes = None
+        self.timings = PhaseTimings()
+
+        collected = _collected.get()
+        if collected is not None:
+            collected.append(self)
+
+    def phase(self, name: str):
+        """Suma a la fase name el tiempo que tarda el bloque"""
+        return self.timings.phase(name)
+
+    def to_json(self) -> dict:
+        return {
+            "solver": self.solver,
+            "inputs": self.inputs,
+            "variables": self.variables,
+            "constraints": self.constraints,
+            "status": self.status,
+            "gap": self.gap,
+            "nodes": self.nodes,
+            "timings": self.timings.to_json(),
+        }
+
+
+@contextmanager
+def collect_solver_stats():
+    """Junta los SolverStats de todos los solvers creados dentro del bloque"""
+    collected = []
+    token = _collected.set(collected)
+    try:
+        yield collected
+    finally:
+        _collected.reset(token)
@@ -1,12 +1,18 @@
 from typing import Optional
-import networkx as nx
 
-from src.constants import SOURCE_NODE_ID, SINK_NODE_ID, GROUP_ID, TOPIC_ID, TUTOR_ID
+from src.core.algorithms.solver_stats import SolverStats
+from src.core.algorithms.topic_tutor.min_cost_flow import (
+    FlowNetwork,
+    get_flow_backend,
+)
 from src.core.group import UnassignedGroup
 from src.core.result import GroupTutorTopicAssignmentResult, GroupTutorTopicAssignment
 from src.core.topic import Topic
 from src.core.tutor import Tutor
 
+SOURCE_NODE = 0
+SINK_NODE = 1
+
 
 class GroupTutorFlowSolver:
 
@@ -15,6 +21,7 @@ class GroupTutorFlowSolver:
         groups: Optional[list[UnassignedGroup]] = None,
         topics: Optional[list[Topic]] = None,
         tutors: Optional[list[Tutor]] = None,
+        backend: Optional[str] = None,
     ):
         """
         Inicializa el solucionador con los grupos, temas y tutores proporcionados.
@@ -23,44 +30,68 @@ class GroupTutorFlowSolver:
             groups (list[Group]): Una lista de objetos de grupo que se van a asignar.
             tutors (list[Tutor]): Una lista de objetos de tutor que se van a asignar a
             temas.
+            backend (str): El algoritmo de flujo a utilizar, "native" (por defecto)
+            o "networkx" como implementacion de referencia.
         """
 
         self._groups = groups if groups is not None else []
         self._tutors = tutors if tutors is not None else []
         self._topics = topics if topics is not None else []
+        self._backend = get_flow_backend(backend)
+
+        # Los nodos son enteros: 0 es la fuente, 1 el sumidero y luego vienen
+        # los grupos, los temas y los tutores en el orden de las listas.
+        self._group_offset = SINK_NODE + 1
+        self._topic_offset = self._group_offset + len(self._groups)
+        self._tutor_offset = self._topic_offset + len(self._topics)
+        self._nodes = self._tutor_offset + len(self._tutors)
+        self.stats = SolverStats(
+            "group-tutor-flow",
+            groups=len(self._groups),
+            topics=len(self._topics),
+            tutors=len(self._tutors),
+        )
+
+    def _group_node(self, index: int) -> int:
+        return self._group_offset + index
+
+    def _topic_node(self, index: int) -> int:
+        return self._topic_offset + index
+
+    def _tutor_node(self, index: int) -> int:
+        return self._tutor_offset + index
 
-    def _create_source_groups_edges(self) -> list[tuple[str, str, dict[str, int]]]:
+    def _create_source_groups_edges(self) -> list[tuple[int, int, dict[str, int]]]:
         """
         Define las aristas desde el nodo fuente hasta los nodos de grupo.
 
         Returns:
-            list[tuple[str, str, dict[str, int]]]: Una lista de aristas con capacidades
+            list[tuple[int, int, dict[str, int]]]: Una lista de aristas con capacidades
             y costos.
         """
 
         return [
-            (SOURCE_NODE_ID, f"{GROUP_ID}-{group.id}", {"capacity": 1, "cost": 1})
-            for group in self._groups
+            (SOURCE_NODE, self._group_node(g), {"capacity": 1, "cost": 1})
+            for g in range(len(self._groups))
         ]
 
-    def _create_groups_topics_edges(self) -> list[tuple[str, str, dict[str, int]]]:
+    def _create_groups_topics_edges(self) -> list[tuple[int, int, dict[str, int]]]:
         """
         Define las aristas desde los nodos de grupo hasta los nodos de tema.
 
         Returns:
-            list[tuple[str, str, dict[str, int]]]: Una lista de aristas con capacidades
+            list[tuple[int, int, dict[str, int]]]: Una lista de aristas con capacidades
             y costos.
         """
 
         group_topic_edges = []
 
-        for group in self._groups:
-            for topic in self._topics:
-                topic_id = topic.id
+        for g, group in enumerate(self._groups):
+            for t, topic in enumerate(self._topics):
                 group_topic_edges.append(
                     (
-                        f"{GROUP_ID}-{group.id}",
-                        f"{TOPIC_ID}-{topic_id}",
+                        self._group_node(g),
+                        self._topic_node(t),
                         {
                             "capacity": 1,
                             "cost": group.preference_of(topic),
@@ -69,24 +100,24 @@ class GroupTutorFlowSolver:
                 )
         return group_topic_edges
 
-    def _create_topics_tutors_edges(self) -> list[tuple[str, str, dict[str, int]]]:
+    def _create_topics_tutors_edges(self) -> list[tuple[int, int, dict[str, int]]]:
         """
         Define las aristas desde los nodos de tema hasta los nodos de tutor.
 
         Returns:
-            list[tuple[str, str, dict[str, int]]]: Una lista de aristas con capacidades
+            list[tuple[int, int, dict[str, int]]]: Una lista de aristas con capacidades
             y costos.
         """
 
         topic_tutor_edges = []
-        for tutor in self._tutors:
-            for topic in self._topics:
+        for u, tutor in enumerate(self._tutors):
+            for t, topic in enumerate(self._topics):
                 capacity = tutor.capacity_of(topic)
                 if capacity > 0:
                     topic_tutor_edges.append(
                         (
-                            f"{TOPIC_ID}-{topic.id}",
-                            f"{TUTOR_ID}-{tutor.id}",
+                            self._topic_node(t),
+                            self._tutor_node(u),
                             {
                                 "capacity": capacity,
                                 "cost": 1,
@@ -95,34 +126,36 @@ class GroupTutorFlowSolver:
                     )
         return topic_tutor_edges
 
-    def _create_tutors_sink_edges(self) -> list[tuple[str, str, dict[str, int]]]:
+    def _create_tutors_sink_edges(self) -> list[tuple[int, int, dict[str, int]]]:
         """
         Define las aristas desde los nodos de tutor hasta el nodo sumidero.
 
         Returns:
-            list[tuple[str, str, dict[str, int]]]: Una lista de aristas con capacidades
+            list[tuple[int, int, dict[str, int]]]: Una lista de aristas con capacidades
             y costos.
         """
 
         tutor_sink_edges = [
             (
-                f"{TUTOR_ID}-{tutor.id}",
-                SINK_NODE_ID,
+                self._tutor_node(u),
+                SINK_NODE,
                 {"capacity": tutor.capacity, "cost": 1},
             )
-            for tutor in self._tutors
+            for u, tutor in enumerate(self._tutors)
         ]
         return tutor_sink_edges
 
-    def _create_edges(self) -> list[tuple[str, str, dict[str, int]]]:
+    def _create_edges(self) -> list[tuple[int, int, dict[str, int]]]:
         """
-        Crea todas las aristas necesarias para construir el digrafo.
+        Crea todas las aristas necesarias para construir la red.
 
-        Las aristas conectan el nodo fuente a los nodos de grupo, los nodos de grupo a los nodos de tema,
-        los nodos de tema a los nodos de tutor y los nodos de tutor al nodo sumidero.
+        Las aristas conectan el nodo fuente a los nodos de grupo, los nodos de grupo
+        a los nodos de tema, los nodos de tema a los nodos de tutor y los nodos de
+        tutor al nodo sumidero.
 
         Returns:
-            list[tuple[str, str, dict[str, int]]]: Una lista de todas las aristas en el grafo.
+            list[tuple[int, int, dict[str, int]]]: Una lista de todas las aristas en
+            el grafo.
         """
 
         source_groups_edges = self._create_source_groups_edges()
@@ -136,49 +169,54 @@ class GroupTutorFlowSolver:
             + tutor_sink_edges
         )
 
-    def _create_graph(self, edges: list[tuple[str, str, dict[str, int]]]) -> nx.DiGraph:
+    def _create_network(
+        self, edges: list[tuple[int, int, dict[str, int]]]
+    ) -> FlowNetwork:
+        """
+        Crea la red de flujo con las aristas dadas, guardando capacidades y costos
+        en arreglos planos.
         """
-        Crea un grafo dirigido (digrafo) con las aristas dadas, incluyendo costos
-        y capacidades.
 
-        Args:
-            edges (list[tuple[str, str, dict[str, int]]]): Las aristas a agregar al
-            grafo.
+        network = FlowNetwork(self._nodes)
+        for tail, head, attributes in edges:
+            network.add_edge(tail, head, attributes["capacity"], attributes["cost"])
+        return network
 
-        Returns:
-            nx.DiGraph: El grafo dirigido creado.
-        """
-
-        graph = nx.DiGraph()
-        graph.add_edges_from(edges)
-        return graph
-
-    def _convert_result(self, graph: nx.DiGraph, result: dict):
-        if sum(result[SOURCE_NODE_ID].values()) == len(self._groups):
-            assigment_result = GroupTutorTopicAssignmentResult(status=1, assignments=[])
-            group_ids = list()
-            for key in result[SOURCE_NODE_ID].keys():
-                group_id = key.split("-")[1]
-                group_ids.append(int(group_id))
-
-            for i in group_ids:
-                path = nx.shortest_path(graph, f"{GROUP_ID}-{i}", f"{SINK_NODE_ID}")
-                _, topic_id, tutor_id, _ = path
-                topic = next(
-                    (t for t in self._topics if t.id == int(topic_id.split("-")[1])),
-                    None,
-                )
-                tutor = next(
-                    (t for t in self._tutors if t.id == int(tutor_id.split("-")[1])),
-                    None,
+    def _convert_result(self, edges, flow) -> GroupTutorTopicAssignmentResult:
+        """
+        Decodifica las asignaciones directamente del flujo de cada arista.
+
+        Cada grupo toma el tema por el que sale su unidad de flujo. Luego, el
+        flujo que sale de cada tema se reparte entre los grupos que llegaron a
+        ese tema, respetando cuanto flujo recibio cada tutor.
+        """
+
+        topic_of_group = {}
+        tutors_of_topic = {t: [] for t in range(len(self._topics))}
+        assigned = 0
+
+        for (tail, head, _), amount in zip(edges, flow.tolist()):
+            if amount <= 0:
+                continue
+            if tail == SOURCE_NODE:
+                assigned += amount
+            elif self._group_offset <= tail < self._topic_offset:
+                topic_of_group[tail - self._group_offset] = head - self._topic_offset
+            elif self._topic_offset <= tail < self._tutor_offset:
+                tutors_of_topic[tail - self._topic_offset].extend(
+                    [head - self._tutor_offset] * amount
                 )
-                group = next((g for g in self._groups if g.id == i), None)
-                assigment_result.add_assignment(
-                    GroupTutorTopicAssignment(group=group, tutor=tutor, topic=topic)
+
+        if assigned != len(self._groups):
+            return GroupTutorTopicAssignmentResult(status=-1, assignments=[])
+
+        assigment_result = GroupTutorTopicAssignmentResult(status=1, assignments=[])
+        for g, t in sorted(topic_of_group.items()):
+            u = tutors_of_topic[t].pop()
+            assigment_result.add_assignment(
+                GroupTutorTopicAssignment(
+                    group=self._groups[g], tutor=self._tutors[u], topic=self._topics[t]
                 )
-        else:
-            assigment_result = GroupTutorTopicAssignmentResult(
-                status=-1, assignments=[]
             )
 
         return assigment_result
@@ -192,14 +230,23 @@ class GroupTutorFlowSolver:
         luego calcula el flujo óptimo desde el nodo fuente hasta el nodo sumidero.
 
         Returns:
-            dict[str, dict[str, int]]: Un diccionario que representa el flujo
-            desde cada nodo a sus nodos conectados.
-        """
-
-        edges = self._create_edges()
-        graph = self._create_graph(edges)
-        result = nx.max_flow_min_cost(
-            graph, SOURCE_NODE_ID, SINK_NODE_ID, capacity="capacity", weight="cost"
-        )
-        group_tutor_assigment_results = self._convert_result(graph, result)
-        return group_tutor_assigment_results
+            GroupTutorTopicAssignmentResult: El resultado con la asignacion de
+            cada grupo a un tema y un tutor.
+        """
+
+        with self.stats.phase("build"):
+            edges = self._create_edges()
+            network = self._create_network(edges)
+        # En la red de flujo las variables son las aristas y las restricciones
+        # la conservacion del flujo en cada nodo
+        self.stats.variables = len(edges)
+        self.stats.constraints = self._nodes
+
+        with self.stats.phase("solve"):
+            flow = self._backend.solve(network, SOURCE_NODE, SINK_NODE)
+
+        with self.stats.phase("decode"):
+            result = self._convert_result(edges, flow)
+        self.stats.status = "optimal" if result.status == 1 else "infeasible"
+        self.stats.gap = 0.0 if result.status == 1 else None
+        return result
@@ -1,6 +1,10 @@
-from pulp import LpProblem, LpVariable, lpSum, LpMaximize, LpBinary, PULP_CBC_CMD
+from typing import Optional
+
+from pulp import LpProblem, LpStatus, LpVariable, lpSum, LpMaximize, LpBinary
 
 from src.constants import GROUP_ID, TOPIC_ID, TUTOR_ID
+from src.core.algorithms.solver_options import SolverOptions
+from src.core.algorithms.solver_stats import SolverStats
 from src.core.group import UnassignedGroup
 from src.core.result import (
     GroupTutorTopicAssignmentResult,
@@ -17,6 +21,7 @@ class GroupTutorLPSolver:
         topics: list[Topic],
         tutors: list[Tutor],
         balance_limit,
+        options: Optional[SolverOptions] = None,
     ):
         """
         Constructor de la clase.
@@ -26,12 +31,20 @@ class GroupTutorLPSolver:
             - tutors: lista de tutores.
             - topics: lista de temas.
             - balance_limit: diferencia máxima entre los grupos asociados a un tutor.
+            - options: límites del solver (tiempo, gap, threads y nodos).
 
         """
         self._groups = groups
         self._topics = topics
         self._tutors = tutors
         self._balance_limit = balance_limit
+        self._options = options if options is not None else SolverOptions()
+        self.stats = SolverStats(
+            "group-tutor-lp",
+            groups=len(groups),
+            topics=len(topics),
+            tutors=len(tutors),
+        )
 
     def _create_decision_variables(self) -> dict:
         """
@@ -242,12 +255,30 @@ class GroupTutorLPSolver:
         Devuelve una lista de variables seleccionadas y la lista de grupos creados.
         """
 
-        prob.solve(PULP_CBC_CMD(msg=0))
+        self._options.write_pulp_model(prob)
+        with self.stats.phase("solve"):
+            prob.solve(self._options.to_cbc())
 
-        result = GroupTutorTopicAssignmentResult(status=prob.status, assignments=[])
-        if prob.status > 0:
+        # Si se alcanzo algun limite, CBC devuelve la mejor solucion entera que
+        # encontro (sol_status factible) y se informa como tal
+        result = GroupTutorTopicAssignmentResult(
+            status=prob.status,
+            assignments=[],
+            gap=SolverOptions.cbc_gap(prob.sol_status),
+        )
+        # CBC (a traves de PuLP) no informa los nodos del branch and bound
+        self.stats.status = LpStatus[prob.status]
+        self.stats.gap = result.gap
+        with self.stats.phase("decode"):
+            self._decode_result(prob, result)
+
+        return result
+
+    def _decode_result(self, prob: LpProblem, result: GroupTutorTopicAssignmentResult):
+        """Agrega al resultado las asignaciones de las variables activadas"""
+        if prob.status > 0 and SolverOptions.cbc_has_incumbent(prob.sol_status):
             for var in prob.variables():
-                if var.varValue == 1:
+                if var.varValue is not None and round(var.varValue) == 1:
                     # Extraer el id del grupo, tutor y topic del nombre de la variable
                     group_id, tutor_id, topic_id = self._parse_variable_name(var.name)
 
@@ -262,8 +293,6 @@ class GroupTutorLPSolver:
 
                     result.add_assignment(assignment)
 
-        return result
-
     def _parse_variable_name(self, name):
         """
         Analiza el nombre de la variable para extraer el group_id, tutor_id y topic_id.
@@ -329,9 +358,13 @@ class GroupTutorLPSolver:
         Devuelve un diccionario que representa el resultado de la asignación.
         """
 
-        assignment_vars = self._create_decision_variables()
-        prob = self._create_optimization_problem()
-        self._add_objective_function(prob, assignment_vars)
-        self._add_constraints(prob, assignment_vars)
+        with self.stats.phase("build"):
+            assignment_vars = self._create_decision_variables()
+            prob = self._create_optimization_problem()
+            self._add_objective_function(prob, assignment_vars)
+            self._add_constraints(prob, assignment_vars)
+        self.stats.variables = prob.numVariables()
+        self.stats.constraints = prob.numConstraints()
+
         result = self._solve_optimization_problem(prob)
         return result
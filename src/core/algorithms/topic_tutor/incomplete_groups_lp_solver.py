@@ -1,23 +1,42 @@
-import re
+from itertools import combinations, product
+
+import numpy as np
 from pulp import (
+    LpAffineExpression,
     LpProblem,
+    LpStatus,
     LpVariable,
     lpSum,
     LpMaximize,
     LpBinary,
-    PULP_CBC_CMD,
 )
 
 
+from src.core.algorithms.solver_options import SolverOptions
+from src.core.algorithms.solver_stats import SolverStats
 from src.core.group_form_answer import GroupFormAnswer
 
+# Puntaje por cada tema en comun entre dos grupos y, si no comparten temas,
+# por cada categoria en comun.
+TOPIC_MATCH_WEIGHT = 10
+CATEGORY_MATCH_WEIGHT = 5
+DEFAULT_TIME_LIMIT = 180
+
 
 class IncompleteGroupsLPSolver:
-    def __init__(self, groups):
+    def __init__(self, groups, options: SolverOptions = None):
         self.groups = groups
+        self.options = (
+            options
+            if options is not None
+            else SolverOptions(time_limit=DEFAULT_TIME_LIMIT)
+        )
         self.formed_groups = []
         self.filtered_groups = self._filter_groups_with_4_students()
         self.remaining_groups = []
+        self._groups_by_id = {group.id: group for group in groups}
+        self.build_time = 0.0
+        self.stats = SolverStats("incomplete-groups-lp", groups=len(groups))
 
     def _filter_groups_with_4_students(self):
         """
@@ -31,169 +50,134 @@ class IncompleteGroupsLPSolver:
         """
         return [group for group in self.groups if len(group.students) < 4]
 
-    def solve(self):
-        # Filter incomplete groups
-        filtered_groups = self.filter_groups()
-        group_ids = [group.id for group in filtered_groups]
-
-        # Define the optimization problem
-        prob = LpProblem("Asignación de Grupos", LpMaximize)
-
-        # Decision variables: if two groups merge
-        x_vars_2 = LpVariable.dicts(
-            "Union",
-            [
-                tuple(sorted((i, j)))
-                for i in group_ids
-                for j in group_ids
-                if i != j
-                and len(self._get_group_by_id(i).students)
-                + len(self._get_group_by_id(j).students)
-                == 4
-            ],
-            0,
-            1,
-            LpBinary,
-        )
+    def _score_matrix(self, groups):
+        """
+        Calcula, una unica vez, el puntaje de afinidad de cada par de grupos.
 
-        # Decision variables: if three groups merge
-        x_vars_3 = LpVariable.dicts(
-            "Union",
-            [
-                tuple(sorted((i, j, k)))
-                for i in group_ids
-                for j in group_ids
-                for k in group_ids
-                if i != j
-                and j != k
-                and i != k
-                and len(self._get_group_by_id(i).students)
-                + len(self._get_group_by_id(j).students)
-                + len(self._get_group_by_id(k).students)
-                == 4
-            ],
-            0,
-            1,
-            LpBinary,
-        )
+        match[i, j] cuenta los temas de i que tambien eligio j y category[i, j]
+        las categorias. El puntaje del par es match * 10 si comparten algun tema
+        y category * 5 en caso contrario. La matriz resultante es simetrica.
+        """
+        n = len(groups)
+        if n == 0:
+            return np.zeros((0, 0))
 
-        # Decision variables: if four groups merge
-        x_vars_4 = LpVariable.dicts(
-            "Union",
-            [
-                tuple(sorted((i, j, k, l)))
-                for i in group_ids
-                for j in group_ids
-                for k in group_ids
-                for l in group_ids
-                if i != j
-                and j != k
-                and i != k
-                and i != l
-                and j != l
-                and k != l
-                and len(self._get_group_by_id(i).students)
-                + len(self._get_group_by_id(j).students)
-                + len(self._get_group_by_id(k).students)
-                + len(self._get_group_by_id(l).students)
-                == 4
-            ],
-            0,
-            1,
-            LpBinary,
+        topic_index = {}
+        category_index = {}
+        for group in groups:
+            for topic in group.topics:
+                topic_index.setdefault(topic.id, len(topic_index))
+                category_index.setdefault(topic.category, len(category_index))
+
+        topic_counts = np.zeros((n, len(topic_index)))
+        category_counts = np.zeros((n, len(category_index)))
+        for row, group in enumerate(groups):
+            for topic in group.topics:
+                topic_counts[row, topic_index[topic.id]] += 1
+                category_counts[row, category_index[topic.category]] += 1
+
+        match = topic_counts @ (topic_counts > 0).T
+        category = category_counts @ (category_counts > 0).T
+        scores = np.where(
+            match > 0, match * TOPIC_MATCH_WEIGHT, category * CATEGORY_MATCH_WEIGHT
         )
 
-        # Constraint: each group can merge only once
-        for i in group_ids:
-            related_vars_2 = [var for var in x_vars_2 if i in var]
-            related_vars_3 = [var for var in x_vars_3 if i in var]
-            related_vars_4 = [var for var in x_vars_4 if i in var]
-
-            prob += (
-                lpSum(x_vars_2[var] for var in related_vars_2)
-                + lpSum(x_vars_3[var] for var in related_vars_3)
-                + lpSum(x_vars_4[var] for var in related_vars_4)
-                <= 1
-            )
+        upper = np.triu(scores, k=1)
+        return upper + upper.T
 
-        # Objective function: maximize the number of complete groups formed
-        # and consider topic preferences
-        obj = lpSum(x_vars_2) + lpSum(x_vars_3) + lpSum(x_vars_4)
-
-        # Adjust the objective function according to topic matches
-        for i in group_ids:
-            for j in group_ids:
-                if i < j:
-                    match_count = sum(
-                        1
-                        for topic in self._get_group_by_id(i).topics
-                        if topic.id in [t.id for t in self._get_group_by_id(j).topics]
-                    )
-                    category_match_count = sum(
-                        1
-                        for topic in self._get_group_by_id(i).topics
-                        if topic.category
-                        in [t.category for t in self._get_group_by_id(j).topics]
-                    )
-                    if match_count > 0:
-                        if (i, j) in x_vars_2:
-                            obj += match_count * 10 * x_vars_2[(i, j)]
-                        for k in group_ids:
-                            if i != k and j != k:
-                                if (i, j, k) in x_vars_3:
-                                    obj += match_count * 10 * x_vars_3[(i, j, k)]
-                        for k in group_ids:
-                            for l in group_ids:
-                                if i != k and j != k and i != l and j != l and k != l:
-                                    if (i, j, k, l) in x_vars_4:
-                                        obj += match_count * 10 * x_vars_4[(i, j, k, l)]
-                    elif category_match_count > 0:
-                        if (i, j) in x_vars_2:
-                            obj += category_match_count * 5 * x_vars_2[(i, j)]
-                        for k in group_ids:
-                            if i != k and j != k:
-                                if (i, j, k) in x_vars_3:
-                                    obj += (
-                                        category_match_count * 5 * x_vars_3[(i, j, k)]
-                                    )
-                        for k in group_ids:
-                            for l in group_ids:
-                                if i != k and j != k and i != l and j != l and k != l:
-                                    if (i, j, k, l) in x_vars_4:
-                                        obj += (
-                                            category_match_count
-                                            * 5
-                                            * x_vars_4[(i, j, k, l)]
-                                        )
-
-        prob += obj
-        # Solve the optimization problem
-        solver = PULP_CBC_CMD(timeLimit=180, msg=False)
-        # solver = GLPK_CMD(timeLimit=180, msg=True)
-        # solver = COIN_CMD(timeLimit=180, msg=True)
-        prob.solve(solver)
-
-        # Identify the groups that were not merged
-        assigned_groups = set()
-        for var in prob.variables():
-            if var.varValue == 1:
-                group_indices = re.findall(r"'([\d\.]+)'", var.name)
-                assigned_groups.update(group_indices)
-                self.formed_groups.append(
-                    self._create_group_topic_preferences(group_indices)
-                )
-
-        self.remaining_groups = [
-            group for group in filtered_groups if group.id not in assigned_groups
+    def _candidate_combinations(self, groups):
+        """
+        Genera solo las combinaciones (sin orden) de grupos que suman exactamente
+        4 estudiantes: 1+3, 2+2, 1+1+2 y 1+1+1+1.
+
+        Devuelve una lista de matrices de indices, una por cada tamaño de
+        combinacion, evitando recorrer todas las n^4 tuplas posibles.
+        """
+        buckets = {1: [], 2: [], 3: []}
+        for index, group in enumerate(groups):
+            buckets.setdefault(len(group.students), []).append(index)
+        ones, twos, threes = buckets[1], buckets[2], buckets[3]
+
+        candidates = [
+            list(product(ones, threes)) + list(combinations(twos, 2)),
+            [(i, j, k) for (i, j), k in product(combinations(ones, 2), twos)],
+            list(combinations(ones, 4)),
+        ]
+
+        return [
+            np.array(combos, dtype=int).reshape(-1, size)
+            for size, combos in zip((2, 3, 4), candidates)
         ]
 
-        # Merge the remaining groups into as many teams as possible
-        self._merge_remaining_groups()
+    def _combination_scores(self, combos, scores):
+        """Suma el puntaje de todos los pares que forman cada combinacion"""
+        total = np.ones(len(combos))
+        for first, second in combinations(range(combos.shape[1]), 2):
+            total += scores[combos[:, first], combos[:, second]]
+        return total
+
+    def solve(self):
+        with self.stats.phase("build"):
+            # Filter incomplete groups
+            filtered_groups = self.filter_groups()
+            scores = self._score_matrix(filtered_groups)
+
+            # Define the optimization problem
+            prob = LpProblem("Asignación de Grupos", LpMaximize)
+
+            # Decision variables: if two, three or four groups merge
+            unions = []
+            objective = []
+            vars_by_group = {index: [] for index in range(len(filtered_groups))}
+            for combos in self._candidate_combinations(filtered_groups):
+                weights = self._combination_scores(combos, scores)
+                for combo, weight in zip(combos.tolist(), weights.tolist()):
+                    var = LpVariable(f"Union_{len(unions)}", 0, 1, LpBinary)
+                    unions.append((combo, var))
+                    objective.append((var, weight))
+                    for index in combo:
+                        vars_by_group[index].append(var)
+
+            # Constraint: each group can merge only once
+            for related_vars in vars_by_group.values():
+                if related_vars:
+                    prob += lpSum(related_vars) <= 1
+
+            # Objective function: maximize the number of complete groups formed
+            # and consider topic preferences
+            prob += LpAffineExpression(objective)
+        self.build_time = self.stats.timings.get("build")
+        self.stats.inputs["incomplete_groups"] = len(filtered_groups)
+        self.stats.variables = len(unions)
+        self.stats.constraints = len(prob.constraints)
+
+        # Solve the optimization problem
+        self.options.write_pulp_model(prob)
+        solver = self.options.to_cbc()
+        with self.stats.phase("solve"):
+            if unions:
+                prob.solve(solver)
+        # CBC (a traves de PuLP) no informa los nodos del branch and bound
+        self.stats.status = LpStatus[prob.status]
+        self.stats.gap = SolverOptions.cbc_gap(prob.sol_status) if unions else None
+
+        with self.stats.phase("decode"):
+            # Identify the groups that were not merged
+            assigned_groups = set()
+            for combo, var in unions:
+                if var.varValue is not None and round(var.varValue) == 1:
+                    group_indices = [filtered_groups[index].id for index in combo]
+                    assigned_groups.update(group_indices)
+                    self.formed_groups.append(
+                        self._create_group_topic_preferences(group_indices)
+                    )
+
+            self.remaining_groups = [
+                group for group in filtered_groups if group.id not in assigned_groups
+            ]
 
-        print("Variables de decisión con valor 1:")
-        for var in prob.variables():
-            if "Union" in var.name and var.varValue == 1:
-                print(f"{var.name}: {var.varValue}")
+            # Merge the remaining groups into as many teams as possible
+            self._merge_remaining_groups()
 
         return self.formed_groups + self.filtered_groups
 
@@ -308,7 +292,4 @@ class IncompleteGroupsLPSolver:
         :return: El grupo correspondiente al ID, o None si no se encuentra.
 
         """
-        for group in self.groups:
-            if group.id == id:
-                return group
-        return None
+        return self._groups_by_id.get(id)
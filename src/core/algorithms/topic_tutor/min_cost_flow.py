@@ -0,0 +1,299 @@
+import heapq
+from typing import Optional
+
+import networkx as nx
+import numpy as np
+
+INF = float("inf")
+
+
+class FlowNetwork:
+    """
+    Red de flujo con nodos enteros y aristas guardadas en arreglos planos.
+
+    Cada arista i va de tails[i] a heads[i] con capacity[i] y cost[i]. Los
+    backends devuelven el flujo de cada arista en el mismo orden en el que
+    fueron agregadas, por lo que no es necesario codificar ids en strings.
+    """
+
+    def __init__(self, nodes: int = 0) -> None:
+        self.nodes = nodes
+        self._tails = []
+        self._heads = []
+        self._capacity = []
+        self._cost = []
+
+    def add_node(self) -> int:
+        self.nodes += 1
+        return self.nodes - 1
+
+    def add_edge(self, tail: int, head: int, capacity: int, cost: int) -> int:
+        self._tails.append(tail)
+        self._heads.append(head)
+        self._capacity.append(capacity)
+        self._cost.append(cost)
+        return len(self._tails) - 1
+
+    @property
+    def tails(self) -> np.ndarray:
+        return np.asarray(self._tails, dtype=np.int64)
+
+    @property
+    def heads(self) -> np.ndarray:
+        return np.asarray(self._heads, dtype=np.int64)
+
+    @property
+    def capacity(self) -> np.ndarray:
+        return np.asarray(self._capacity, dtype=np.int64)
+
+    @property
+    def cost(self) -> np.ndarray:
+        return np.asarray(self._cost, dtype=np.int64)
+
+    @property
+    def edges(self) -> int:
+        return len(self._tails)
+
+
+class MinCostFlowBackend:
+    """Interfaz comun de los algoritmos de flujo maximo de costo minimo"""
+
+    def solve(self, network: FlowNetwork, source: int, sink: int) -> np.ndarray:
+        """Devuelve el flujo de cada arista de la red"""
+        raise NotImplementedError
+
+
+class NetworkxBackend(MinCostFlowBackend):
+    """
+    Backend de referencia que delega en nx.max_flow_min_cost (network simplex).
+
+    nx.DiGraph pisa las aristas paralelas y max_flow_min_cost no acepta un
+    MultiDiGraph, por lo que cada arista repetida entre los mismos nodos se
+    parte en dos pasando por un nodo intermedio: asi cada una conserva su
+    capacidad, su costo y su propio flujo.
+    """
+
+    def solve(self, network: FlowNetwork, source: int, sink: int) -> np.ndarray:
+        graph = nx.DiGraph()
+        graph.add_nodes_from(range(network.nodes))
+        # Arco del grafo del que se lee el flujo de cada arista de la red
+        arcs = []
+        for tail, head, capacity, cost in zip(
+            network._tails, network._heads, network._capacity, network._cost
+        ):
+            if graph.has_edge(tail, head):
+                middle = graph.number_of_nodes()
+                graph.add_edge(tail, middle, capacity=capacity, cost=cost)
+                graph.add_edge(middle, head, capacity=capacity, cost=0)
+                arcs.append((tail, middle))
+            else:
+                graph.add_edge(tail, head, capacity=capacity, cost=cost)
+                arcs.append((tail, head))
+
+        result = nx.max_flow_min_cost(
+            graph, source, sink, capacity="capacity", weight="cost"
+        )
+        return np.array([result[tail][head] for tail, head in arcs], dtype=np.int64)
+
+
+class SuccessiveShortestPathBackend(MinCostFlowBackend):
+    """
+    Flujo maximo de costo minimo por caminos minimos sucesivos (primal-dual).
+
+    En cada fase se calculan con Dijkstra las distancias reducidas desde la
+    fuente, se actualizan los potenciales y luego se satura, con una busqueda
+    en profundidad, el subgrafo de arcos con costo reducido cero. Como los
+    costos del problema toman pocos valores distintos, la cantidad de fases es
+    chica y no depende de la cantidad de grupos.
+
+    El grafo residual se guarda en arreglos planos: el arco 2i es la arista i
+    y el arco 2i + 1 su reversa.
+    """
+
+    def solve(self, network: FlowNetwork, source: int, sink: int) -> np.ndarray:
+        n = network.nodes
+        m = network.edges
+        if m == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        tails = network.tails
+        heads = network.heads
+        capacity = network.capacity
+        cost = network.cost
+        if (cost < 0).any():
+            raise ValueError("Negative costs are not supported")
+
+        arc_tail = np.empty(2 * m, dtype=np.int64)
+        arc_tail[0::2], arc_tail[1::2] = tails, heads
+        arc_head = np.empty(2 * m, dtype=np.int64)
+        arc_head[0::2], arc_head[1::2] = heads, tails
+        arc_cap = np.zeros(2 * m, dtype=np.int64)
+        arc_cap[0::2] = capacity
+        arc_cost = np.empty(2 * m, dtype=np.int64)
+        arc_cost[0::2], arc_cost[1::2] = cost, -cost
+
+        # Adyacencia en formato CSR: los arcos que salen de v son
+        # order[start[v]:start[v + 1]]
+        order = np.argsort(arc_tail, kind="stable")
+        start = np.searchsorted(arc_tail[order], np.arange(n + 1))
+        adjacency = [
+            order[start[v] : start[v + 1]].tolist() for v in range(n)  # noqa: E203
+        ]
+
+        head = arc_head.tolist()
+        residual = arc_cap.tolist()
+        arc_costs = arc_cost.tolist()
+        potential = [0] * n
+
+        while True:
+            distance = self._dijkstra(
+                n, source, adjacency, head, residual, arc_costs, potential
+            )
+            if distance[sink] == INF:
+                break
+
+            for v in range(n):
+                if distance[v] < INF:
+                    potential[v] += distance[v]
+
+            self._augment_admissible(
+                n, source, sink, adjacency, head, residual, arc_costs, potential
+            )
+
+        flow = np.asarray(residual[1::2], dtype=np.int64)
+        return flow
+
+    def _dijkstra(self, n, source, adjacency, head, residual, costs, potential):
+        """Distancias desde la fuente usando costos reducidos (no negativos)"""
+        distance = [INF] * n
+        distance[source] = 0
+        heap = [(0, source)]
+        while heap:
+            d, v = heapq.heappop(heap)
+            if d > distance[v]:
+                continue
+            pv = potential[v]
+            for arc in adjacency[v]:
+                if residual[arc] <= 0:
+                    continue
+                w = head[arc]
+                nd = d + costs[arc] + pv - potential[w]
+                if nd < distance[w]:
+                    distance[w] = nd
+                    heapq.heappush(heap, (nd, w))
+        return distance
+
+    def _augment_admissible(
+        self, n, source, sink, adjacency, head, residual, costs, potential
+    ):
+        """
+        Envia todo el flujo posible por los arcos de costo reducido cero
+        (flujo bloqueante al estilo Dinic sobre el subgrafo admisible).
+        """
+        level = self._admissible_levels(
+            n, source, adjacency, head, residual, costs, potential
+        )
+        if level[sink] < 0:
+            return
+
+        pointer = [0] * n
+        while True:
+            pushed = self._push(
+                source,
+                sink,
+                INF,
+                level,
+                pointer,
+                adjacency,
+                head,
+                residual,
+                costs,
+                potential,
+            )
+            if not pushed:
+                break
+
+    def _admissible_levels(
+        self, n, source, adjacency, head, residual, costs, potential
+    ):
+        """BFS por arcos admisibles para evitar ciclos de costo cero"""
+        level = [-1] * n
+        level[source] = 0
+        queue = [source]
+        for v in queue:
+            pv = potential[v]
+            for arc in adjacency[v]:
+                w = head[arc]
+                if (
+                    residual[arc] > 0
+                    and level[w] < 0
+                    and costs[arc] + pv - potential[w] == 0
+                ):
+                    level[w] = level[v] + 1
+                    queue.append(w)
+        return level
+
+    def _push(
+        self,
+        source,
+        sink,
+        limit,
+        level,
+        pointer,
+        adjacency,
+        head,
+        residual,
+        costs,
+        potential,
+    ) -> int:
+        """Busca iterativamente un camino admisible y lo aumenta"""
+        path = []
+        v = source
+        while True:
+            if v == sink:
+                amount = min(residual[arc] for arc in path) if path else 0
+                amount = min(amount, limit)
+                for arc in path:
+                    residual[arc] -= amount
+                    residual[arc ^ 1] += amount
+                return amount
+
+            arcs = adjacency[v]
+            advanced = False
+            while pointer[v] < len(arcs):
+                arc = arcs[pointer[v]]
+                w = head[arc]
+                if (
+                    residual[arc] > 0
+                    and level[w] == level[v] + 1
+                    and costs[arc] + potential[v] - potential[w] == 0
+                ):
+                    path.append(arc)
+                    v = w
+                    advanced = True
+                    break
+                pointer[v] += 1
+
+            if advanced:
+                continue
+            if not path:
+                return 0
+
+            # Callejon sin salida: se retrocede y se descarta el arco
+            arc = path.pop()
+            v = head[arc ^ 1]
+            pointer[v] += 1
+
+
+FLOW_BACKENDS = {
+    "native": SuccessiveShortestPathBackend,
+    "networkx": NetworkxBackend,
+}
+
+
+def get_flow_backend(name: Optional[str] = None) -> MinCostFlowBackend:
+    """Devuelve una instancia del backend de flujo, por defecto el nativo"""
+    backend = FLOW_BACKENDS.get(name or "native")
+    if backend is None:
+        raise ValueError(f"Unknown flow backend: {name}")
+    return backend()
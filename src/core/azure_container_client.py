@@ -1,7 +1,17 @@
-from azure.storage.blob import BlobClient, ContainerClient, BlobPrefix
-from typing import IO, Any, Iterable
+from azure.core import MatchConditions
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.storage.blob import BlobBlock, BlobClient, ContainerClient, BlobPrefix
+from azure.storage.blob.aio import ContainerClient as AsyncContainerClient
+from typing import IO, Any, AsyncIterator, Iterable
+import aiohttp
+import asyncio
+import base64
 import re
 
+from src.core.storage_client import AsyncReadable, StoredBlob
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
 
 class AzureContainerClient:
 
@@ -52,7 +62,7 @@ class AzureContainerClient:
         blobs: list,
         prefix: str | None = None,
         pattern: str | None = None,
-        **kwargs: Any
+        **kwargs: Any,
     ):
         """Itera recursivamente sobre los archivos"""
         for blob in container_client.walk_blobs(name_starts_with=prefix, **kwargs):
@@ -76,3 +86,155 @@ class AzureContainerClient:
         )
 
         return blobs
+
+
+class AsyncAzureContainerClient:
+    """
+    Cliente del container que vive lo mismo que la aplicacion.
+
+    Usa el SDK asincronico de azure sobre una unica sesion de aiohttp, asi
+    todas las operaciones reutilizan las conexiones abiertas (sin un nuevo
+    handshake TLS por pedido) y no frenan el event loop. max_connections
+    limita las conexiones abiertas y max_concurrency los bloques que una
+    misma subida o descarga transfiere en paralelo.
+    """
+
+    def __init__(
+        self,
+        access_key: str,
+        container: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_connections: int = 20,
+        max_concurrency: int = 4,
+    ) -> None:
+        self._access_key = access_key
+        self._container = container
+        self._chunk_size = chunk_size
+        self._max_connections = max_connections
+        self._max_concurrency = max_concurrency
+        self._container_client: AsyncContainerClient | None = None
+
+    def _get_container_client(self) -> AsyncContainerClient:
+        """
+        Crea el cliente la primera vez que se usa, ya dentro del event loop
+        donde va a correr la sesion de aiohttp.
+        """
+        if self._container_client is None:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_connections)
+            )
+            self._container_client = AsyncContainerClient.from_connection_string(
+                conn_str=self._access_key,
+                container_name=self._container,
+                transport=AioHttpTransport(session=session, session_owner=True),
+                max_single_get_size=self._chunk_size,
+                max_chunk_get_size=self._chunk_size,
+            )
+
+        return self._container_client
+
+    def _matches_pattern(self, blobname: str, pattern: str | None = None) -> bool:
+        """Valida que el nombre sea valido al patron"""
+        return pattern is None or bool(re.match(pattern, blobname))
+
+    def _block_id(self, index: int) -> str:
+        """Todos los ids de bloque de un blob deben tener el mismo largo"""
+        return base64.b64encode(f"{index:08d}".encode()).decode()
+
+    async def exists(self) -> bool:
+        """Valida que exista el container"""
+        return await self._get_container_client().exists()
+
+    async def upload_stream(self, stream: AsyncReadable, filename: str) -> StoredBlob:
+        """
+        Sube el archivo en bloques de chunk_size leidos directamente del
+        stream. Se suben hasta max_concurrency bloques en paralelo, asi en
+        memoria hay como mucho esa cantidad de bloques por subida. El blob se
+        reemplaza recien cuando se confirma la lista completa de bloques.
+        """
+        blob = self._get_container_client().get_blob_client(filename)
+        blocks = []
+        pending = set()
+        size = 0
+        try:
+            while chunk := await stream.read(self._chunk_size):
+                if len(pending) >= self._max_concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        task.result()
+                size += len(chunk)
+                block_id = self._block_id(len(blocks))
+                pending.add(
+                    asyncio.ensure_future(
+                        blob.stage_block(
+                            block_id=block_id, data=chunk, length=len(chunk)
+                        )
+                    )
+                )
+                blocks.append(BlobBlock(block_id=block_id))
+            await asyncio.gather(*pending)
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            raise
+        committed = await blob.commit_block_list(blocks)
+
+        return StoredBlob(
+            name=filename,
+            container=self._container,
+            size=size,
+            creation_time=committed["last_modified"],
+            last_modified=committed["last_modified"],
+            etag=committed["etag"],
+        )
+
+    async def get_properties(self, blob_name: str) -> dict:
+        """Devuelve el tamaño, el etag y la fecha de modificacion del blob"""
+        blob = self._get_container_client().get_blob_client(blob_name)
+        properties = await blob.get_blob_properties()
+        return {
+            "size": properties.size,
+            "etag": properties.etag,
+            "last_modified": properties.last_modified,
+        }
+
+    async def download_stream(
+        self,
+        blob_name: str,
+        offset: int | None = None,
+        length: int | None = None,
+        etag: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Descarga el blob (o el rango offset, length) de a chunks de
+        chunk_size. El primer pedido se hace al esperar el metodo, asi los
+        errores aparecen antes de empezar a responder. Si se indica el etag,
+        la descarga falla cuando el blob cambio despues de leer sus
+        propiedades.
+        """
+        kwargs = {"etag": etag, "match_condition": MatchConditions.IfNotModified}
+        stream_downloader = await self._get_container_client().download_blob(
+            blob=blob_name,
+            offset=offset,
+            length=length,
+            max_concurrency=self._max_concurrency,
+            **(kwargs if etag else {}),
+        )
+        return stream_downloader.chunks()
+
+    async def list_blobs(self, prefix: str | None = None, pattern: str | None = None):
+        """Lista los blobs que empiezan con el prefijo y cumplen el patron"""
+        container_client = self._get_container_client()
+        return [
+            blob
+            async for blob in container_client.list_blobs(name_starts_with=prefix)
+            if self._matches_pattern(blob.name, pattern)
+        ]
+
+    async def close(self):
+        """Cierra las conexiones abiertas"""
+        if self._container_client is not None:
+            await self._container_client.close()
+            self._container_client = None
@@ -1,3 +1,4 @@
+import aiohttp
 import sendgrid
 from sendgrid.helpers.mail import Mail, Email, To, Content, HtmlContent
 from src.config.logging import logger
@@ -99,9 +100,17 @@ class SendGridEmailClient:
         return response.status_code
 
     def notify_attachement(self, group: AssignedGroup, type_of_attachment: str):
-        to = group.emails() + [group.tutor_email()]
-        subject = f"Grupo {group.group_number} ha subido una nueva entrega!"
-        email_body = f"""
+        email = attachment_email(group, type_of_attachment)
+        cc = self._filter_receivers(email["to"], api_config.cc_emails)
+
+        self._send_html_mail(email["to"], email["subject"], email["body"], cc)
+
+
+def attachment_email(group: AssignedGroup, type_of_attachment: str) -> dict:
+    """Arma el mail que avisa que un grupo subio una entrega"""
+    to = group.emails() + [group.tutor_email()]
+    subject = f"Grupo {group.group_number} ha subido una nueva entrega!"
+    email_body = f"""
         <p>Hola,</p>
         
         <p>Queríamos informarte que el grupo <strong>{group.group_number}</strong> ha subido su <strong>{type_of_attachment}</strong> al sistema.</p>
@@ -112,6 +121,90 @@ class SendGridEmailClient:
         
         <p>Gracias.</p>
         """
-        cc = self._filter_receivers(to, api_config.cc_emails)
+    return {"to": to, "subject": subject, "body": email_body}
+
+
+class AsyncSendGridEmailClient:
+    """
+    Cliente asincronico de la API de SendGrid usado por el worker del outbox.
+
+    Reutiliza una unica sesion HTTP (aiohttp) para todos los envios y manda
+    cada lote como un solo request, con una personalization por mail: los
+    mails con el mismo asunto y cuerpo salen en una llamada.
+    """
+
+    URL = "https://api.sendgrid.com/v3/mail/send"
 
-        self._send_html_mail(to, subject, email_body, cc)
+    def __init__(self, api_key: str = None, timeout: float = 30) -> None:
+        self.api_key = api_key
+        self.sender = "fiuba.tpp.notificaciones@gmail.com"
+        self.name = "FIUBA Trabajo Profesional"
+        self._timeout = timeout
+        self._session = None
+
+    def _get_session(self):
+        if self.api_key is None:
+            raise Exception("No api key provided")
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+            )
+        return self._session
+
+    def _payload(
+        self, subject: str, body: str, content_type: str, personalizations: list
+    ) -> dict:
+        return {
+            "personalizations": personalizations,
+            "from": {"email": self.sender, "name": self.name},
+            "subject": subject,
+            "content": [{"type": content_type, "value": body}],
+        }
+
+    async def send_batch(
+        self, subject: str, body: str, content_type: str, personalizations: list
+    ) -> int:
+        """Envia el lote y devuelve el status code de SendGrid (202 si acepto)"""
+        payload = self._payload(subject, body, content_type, personalizations)
+        async with self._get_session().post(self.URL, json=payload) as response:
+            if response.status != 202:
+                logger.info(
+                    f"Sendgrid send email had a problem, the response code status is: \
+                    {response.status} {await response.text()}"
+                )
+            return response.status
+
+    async def close(self):
+        """Cierra la sesion HTTP"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class StubEmailClient:
+    """
+    Cliente que no envia nada: registra los lotes en memoria y en el log.
+    Se usa en los tests y en desarrollo (EMAIL_BACKEND=stub).
+    """
+
+    def __init__(self, status: int = 202) -> None:
+        self.status = status
+        self.batches = []
+
+    async def send_batch(
+        self, subject: str, body: str, content_type: str, personalizations: list
+    ) -> int:
+        self.batches.append(
+            {
+                "subject": subject,
+                "body": body,
+                "content_type": content_type,
+                "personalizations": personalizations,
+            }
+        )
+        logger.info(f"Stub email '{subject}' to {len(personalizations)} recipients")
+        return self.status
+
+    async def close(self):
+        pass
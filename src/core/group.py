@@ -26,6 +26,10 @@ class Group:
     def group_number(self) -> str:
         return self._group_number
 
+    @property
+    def students(self) -> List[Student]:
+        return self._students
+
 
 class UnassignedGroup(Group):
     """Representacion de un grupo que aun no tiene ni tema ni tutor asignados"""
@@ -0,0 +1,188 @@
+import asyncio
+import datetime
+import mmap
+import os
+import re
+import tempfile
+from typing import AsyncIterator
+
+from src.core.storage_client import AsyncReadable, StoredBlob
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class BlobNotFound(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class BlobModified(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class LocalStorageClient:
+    """
+    Storage de entregas sobre el sistema de archivos local, para
+    instalaciones on-prem y para medir los endpoints sin depender de Azure.
+
+    Cada blob es un archivo en root/container/<nombre del blob>, asi los
+    directorios por cuatrimestre y grupo funcionan como indice: listar un
+    prefijo solo recorre su directorio. Las escrituras van a un archivo
+    temporal que se renombra al terminar, por lo que nunca se lee un archivo
+    a medio escribir. Las lecturas se hacen sobre el archivo mapeado en
+    memoria, sin copiarlo entero.
+    """
+
+    def __init__(
+        self, root: str, container: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        self._container = container
+        self._base = os.path.realpath(os.path.join(root, container))
+        self._chunk_size = chunk_size
+
+    def _path(self, blob_name: str) -> str:
+        """Ruta del blob, validando que no se salga del container"""
+        path = os.path.realpath(os.path.join(self._base, blob_name))
+        if os.path.commonpath([self._base, path]) != self._base or path == self._base:
+            raise ValueError(f"Invalid blob name: {blob_name}")
+        return path
+
+    def _etag(self, stat: os.stat_result) -> str:
+        return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+    def _stat(self, blob_name: str) -> os.stat_result:
+        try:
+            return os.stat(self._path(blob_name))
+        except FileNotFoundError:
+            raise BlobNotFound(f"Blob {blob_name} not found")
+
+    def _to_blob(self, name: str, stat: os.stat_result) -> StoredBlob:
+        return StoredBlob(
+            name=name,
+            container=self._container,
+            size=stat.st_size,
+            creation_time=datetime.datetime.fromtimestamp(
+                stat.st_ctime, tz=datetime.timezone.utc
+            ),
+            last_modified=datetime.datetime.fromtimestamp(
+                stat.st_mtime, tz=datetime.timezone.utc
+            ),
+            etag=self._etag(stat),
+        )
+
+    async def exists(self) -> bool:
+        """Valida que exista el container"""
+        return os.path.isdir(self._base)
+
+    async def upload_stream(self, stream: AsyncReadable, filename: str) -> StoredBlob:
+        """
+        Escribe el archivo de a bloques de chunk_size en un temporal del
+        mismo directorio y lo renombra al final, que reemplaza al anterior de
+        forma atomica. Si la subida falla el blob anterior queda intacto.
+        """
+        path = self._path(filename)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                while chunk := await stream.read(self._chunk_size):
+                    await asyncio.to_thread(file.write, chunk)
+                await asyncio.to_thread(file.flush)
+                await asyncio.to_thread(os.fsync, file.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        return self._to_blob(filename, os.stat(path))
+
+    async def get_properties(self, blob_name: str) -> dict:
+        """Devuelve el tamaño, el etag y la fecha de modificacion del blob"""
+        stat = self._stat(blob_name)
+        return {
+            "size": stat.st_size,
+            "etag": self._etag(stat),
+            "last_modified": datetime.datetime.fromtimestamp(
+                stat.st_mtime, tz=datetime.timezone.utc
+            ),
+        }
+
+    async def download_stream(
+        self,
+        blob_name: str,
+        offset: int | None = None,
+        length: int | None = None,
+        etag: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Devuelve los chunks del blob (o del rango offset, length) leidos del
+        archivo mapeado en memoria. El archivo se abre al esperar el metodo,
+        asi los errores aparecen antes de empezar a responder. Si se indica
+        el etag y el archivo cambio, falla con BlobModified.
+        """
+        try:
+            file = open(self._path(blob_name), "rb")
+        except FileNotFoundError:
+            raise BlobNotFound(f"Blob {blob_name} not found")
+
+        stat = os.fstat(file.fileno())
+        if etag is not None and self._etag(stat) != etag:
+            file.close()
+            raise BlobModified(f"Blob {blob_name} was modified")
+
+        start = offset or 0
+        end = stat.st_size if length is None else min(start + length, stat.st_size)
+        return self._read_chunks(file, start, end)
+
+    async def _read_chunks(self, file, start: int, end: int) -> AsyncIterator[bytes]:
+        """Lee el rango [start, end) de a chunks, cerrando el archivo al final"""
+        try:
+            if start >= end:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for position in range(start, end, self._chunk_size):
+                    stop = min(position + self._chunk_size, end)
+                    yield await asyncio.to_thread(
+                        mapped.__getitem__, slice(position, stop)
+                    )
+        finally:
+            file.close()
+
+    def _walk(self, directory: str):
+        """Recorre los archivos de un directorio y sus subdirectorios"""
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._walk(entry.path)
+            elif entry.is_file(follow_symlinks=False) and not entry.name.startswith(
+                ".upload-"
+            ):
+                yield entry
+
+    async def list_blobs(self, prefix: str | None = None, pattern: str | None = None):
+        """
+        Lista los blobs que empiezan con el prefijo y cumplen el patron,
+        recorriendo solo el directorio que contiene al prefijo.
+        """
+        prefix = prefix or ""
+        directory = os.path.realpath(os.path.join(self._base, prefix))
+        if not os.path.isdir(directory):
+            directory = os.path.dirname(directory)
+        if os.path.commonpath([self._base, directory]) != self._base:
+            raise ValueError(f"Invalid prefix: {prefix}")
+
+        blobs = []
+        for entry in self._walk(directory):
+            name = os.path.relpath(entry.path, self._base).replace(os.sep, "/")
+            if name.startswith(prefix) and (pattern is None or re.match(pattern, name)):
+                blobs.append(self._to_blob(name, entry.stat()))
+
+        return sorted(blobs, key=lambda blob: blob.name)
+
+    async def close(self):
+        """No hay conexiones que cerrar"""
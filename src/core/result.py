@@ -1,5 +1,6 @@
 from enum import Enum
 import math
+from typing import Optional
 
 from src.api.groups.schemas import (
     AssignedDateResult,
@@ -53,10 +54,14 @@ class GroupTutorTopicAssignment:
 
 class GroupTutorTopicAssignmentResult:
     def __init__(
-        self, status: int, assignments: list[GroupTutorTopicAssignment]
+        self,
+        status: int,
+        assignments: list[GroupTutorTopicAssignment],
+        gap: Optional[float] = None,
     ) -> None:
         self.status = status
         self.assignments = assignments
+        self.gap = gap
 
     def calculate_dcg(self):
         """Calcula https://en.m.wikipedia.org/wiki/Discounted_cumulative_gain
@@ -84,6 +89,7 @@ class GroupTutorTopicAssignmentResult:
             status=self.status,
             assigment=[assignment.to_json() for assignment in self.assignments],
             dcg=self.calculate_dcg(),
+            gap=self.gap,
         )
 
 
@@ -115,9 +121,15 @@ class DateSlotAssignment:
 
 
 class DateSlotsAssignmentResult:
-    def __init__(self, status: int, assignments: list[DateSlotAssignment]) -> None:
+    def __init__(
+        self,
+        status: int,
+        assignments: list[DateSlotAssignment],
+        gap: Optional[float] = None,
+    ) -> None:
         self.status = status
         self.assignments = assignments
+        self.gap = gap
 
     def add_assignment(self, assigment: DateSlotAssignment):
         self.assignments.append(assigment)
@@ -126,4 +138,5 @@ class DateSlotsAssignmentResult:
         return AssignedDateResult(
             status=self.status,
             assigments=[assignment.to_json() for assignment in self.assignments],
+            gap=self.gap,
         )
@@ -0,0 +1,256 @@
+import gzip
+import json
+from datetime import datetime
+from typing import Iterable, Iterator, Optional, TextIO
+
+from src.core.date_slots import DateSlot
+from src.core.group import AssignedGroup, UnassignedGroup
+from src.core.group_form_answer import GroupFormAnswer
+from src.core.topic import Topic
+from src.core.tutor import Tutor
+
+SNAPSHOT_VERSION = 1
+
+
+class InvalidSnapshot(Exception):
+
+    def __init__(self, message) -> None:
+        super().__init__(message)
+
+
+def _date(slot: Optional[DateSlot]) -> Optional[str]:
+    return slot.date.isoformat() if slot is not None else None
+
+
+def _slot(date: Optional[str]) -> Optional[DateSlot]:
+    return DateSlot(start_time=datetime.fromisoformat(date)) if date else None
+
+
+class PeriodSnapshot:
+    """
+    Las entradas de los algoritmos de asignacion de un cuatrimestre, tal como
+    se las pasa la api, para poder reproducir una corrida sin la base de datos.
+
+    Se guarda como json lines: la primera linea tiene la version del formato y
+    el resto un registro por tema, fecha, tutor, grupo o respuesta del
+    formulario. Las relaciones se guardan por id y no se exportan datos
+    personales (nombres ni emails), solo lo que usan los algoritmos.
+    """
+
+    def __init__(
+        self,
+        period_id: str,
+        topics: Optional[list[Topic]] = None,
+        tutors: Optional[list[Tutor]] = None,
+        unassigned_groups: Optional[list[UnassignedGroup]] = None,
+        assigned_groups: Optional[list[AssignedGroup]] = None,
+        slots: Optional[list[DateSlot]] = None,
+        answers: Optional[list[GroupFormAnswer]] = None,
+    ) -> None:
+        self.period_id = period_id
+        self.topics = topics if topics is not None else []
+        self.tutors = tutors if tutors is not None else []
+        self.unassigned_groups = unassigned_groups if unassigned_groups else []
+        self.assigned_groups = assigned_groups if assigned_groups else []
+        self.slots = slots if slots is not None else []
+        self.answers = answers if answers is not None else []
+
+    def evaluators(self) -> list[Tutor]:
+        """
+        Los evaluadores son tutores del cuatrimestre, pero los algoritmos los
+        reciben como instancias separadas
+        """
+        return [
+            Tutor(
+                id=tutor.id,
+                name=tutor.name,
+                last_name=tutor.last_name,
+                email=tutor.email,
+                capacity=tutor.capacity,
+                period_id=tutor.period_id,
+                topics=tutor.topics,
+                available_dates=list(tutor.available_dates),
+                is_evaluator=True,
+            )
+            for tutor in self.tutors
+            if tutor.is_evaluator
+        ]
+
+    def _all_topics(self) -> list[Topic]:
+        """
+        Los temas del cuatrimestre mas los que solo aparecen en los tutores, en
+        las respuestas del formulario o en las preferencias de los grupos
+        """
+        topics = {topic.id: topic for topic in self.topics}
+        for owner in [*self.tutors, *self.answers, *self.unassigned_groups]:
+            for topic in owner.topics:
+                topics.setdefault(topic.id, topic)
+        return list(topics.values())
+
+    def records(self) -> Iterator[dict]:
+        yield {
+            "kind": "snapshot",
+            "version": SNAPSHOT_VERSION,
+            "period_id": self.period_id,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        period_topics = {topic.id for topic in self.topics}
+        for topic in self._all_topics():
+            yield {
+                "kind": "topic",
+                "id": topic.id,
+                "title": topic.name,
+                "category": topic.category,
+                "capacity": topic.capacity,
+                "period": topic.id in period_topics,
+            }
+        for slot in self.slots:
+            yield {"kind": "slot", "date": _date(slot)}
+        for tutor in self.tutors:
+            yield {
+                "kind": "tutor",
+                "id": tutor.id,
+                "period_id": tutor.period_id,
+                "capacity": tutor.capacity,
+                "is_evaluator": tutor.is_evaluator,
+                "topics": [[topic.id, topic.capacity] for topic in tutor.topics],
+                "dates": [_date(slot) for slot in tutor.available_dates],
+            }
+        for group in self.unassigned_groups:
+            yield {
+                "kind": "unassigned_group",
+                "id": group.id,
+                "group_number": group.group_number,
+                "students": len(group.students),
+                "topics": [topic.id for topic in group.topics],
+            }
+        for group in self.assigned_groups:
+            yield {
+                "kind": "assigned_group",
+                "id": group.id,
+                "group_number": group.group_number,
+                "tutor_id": group.tutor_id(),
+                "dates": [_date(slot) for slot in group.available_dates],
+                "assigned_date": _date(group.assigned_date),
+            }
+        for answer in self.answers:
+            yield {
+                "kind": "form_answer",
+                "id": answer.id,
+                "students": len(answer.students),
+                "topics": answer.get_topic_ids(),
+            }
+
+    def lines(self) -> Iterator[str]:
+        for record in self.records():
+            yield json.dumps(record, separators=(",", ":")) + "\n"
+
+    def write(self, file: TextIO):
+        file.writelines(self.lines())
+
+    def save(self, path: str):
+        """Guarda el snapshot, comprimido con gzip si path termina en .gz"""
+        with _open(path, "wt") as file:
+            self.write(file)
+
+    @staticmethod
+    def from_records(records: Iterable[dict]) -> "PeriodSnapshot":
+        records = iter(records)
+        header = next(records, None)
+        if header is None or header.get("kind") != "snapshot":
+            raise InvalidSnapshot("The file is not a period snapshot")
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise InvalidSnapshot(
+                f"Unsupported snapshot version {header.get('version')}, "
+                f"expected {SNAPSHOT_VERSION}"
+            )
+
+        snapshot = PeriodSnapshot(header["period_id"])
+        topics = {}
+        tutors = {}
+        for record in records:
+            kind = record["kind"]
+            if kind == "topic":
+                topic = Topic(
+                    id=record["id"],
+                    title=record["title"],
+                    capacity=record["capacity"],
+                    category=record["category"],
+                )
+                topics[topic.id] = topic
+                if record["period"]:
+                    snapshot.topics.append(topic)
+            elif kind == "slot":
+                snapshot.slots.append(_slot(record["date"]))
+            elif kind == "tutor":
+                tutor = Tutor(
+                    id=record["id"],
+                    name=f"Tutor {record['id']}",
+                    last_name="",
+                    email=f"tutor{record['id']}",
+                    capacity=record["capacity"],
+                    period_id=record["period_id"],
+                    topics=[
+                        Topic(
+                            id=topic_id,
+                            title=topics[topic_id].name,
+                            capacity=capacity,
+                            category=topics[topic_id].category,
+                        )
+                        for topic_id, capacity in record["topics"]
+                    ],
+                    available_dates=[_slot(date) for date in record["dates"]],
+                    is_evaluator=record["is_evaluator"],
+                )
+                tutors[tutor.id] = tutor
+                snapshot.tutors.append(tutor)
+            elif kind == "unassigned_group":
+                snapshot.unassigned_groups.append(
+                    UnassignedGroup(
+                        id=record["id"],
+                        students=list(range(record["students"])),
+                        topics=[topics[topic_id] for topic_id in record["topics"]],
+                        group_number=record["group_number"],
+                    )
+                )
+            elif kind == "assigned_group":
+                snapshot.assigned_groups.append(
+                    AssignedGroup(
+                        id=record["id"],
+                        tutor=tutors.get(record["tutor_id"]),
+                        available_dates=[_slot(date) for date in record["dates"]],
+                        group_number=record["group_number"],
+                        assigned_date=_slot(record["assigned_date"]),
+                    )
+                )
+            elif kind == "form_answer":
+                snapshot.answers.append(
+                    GroupFormAnswer(
+                        record["id"],
+                        topics=[topics[topic_id] for topic_id in record["topics"]],
+                        students=[
+                            f"{record['id']}-{i}" for i in range(record["students"])
+                        ],
+                    )
+                )
+            else:
+                raise InvalidSnapshot(f"Unknown snapshot record {kind}")
+
+        return snapshot
+
+    @staticmethod
+    def read(file: TextIO) -> "PeriodSnapshot":
+        return PeriodSnapshot.from_records(
+            json.loads(line) for line in file if line.strip()
+        )
+
+    @staticmethod
+    def load(path: str) -> "PeriodSnapshot":
+        with _open(path, "rt") as file:
+            return PeriodSnapshot.read(file)
+
+
+def _open(path: str, mode: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode[0], encoding="utf-8")
@@ -0,0 +1,65 @@
+import datetime
+from typing import AsyncIterator, Awaitable, Protocol
+
+
+class AsyncReadable(Protocol):
+    """Archivo con lectura asincronica, por ejemplo un UploadFile"""
+
+    def read(self, size: int = -1) -> Awaitable[bytes]: ...
+
+
+class StoredBlob:
+    """Archivo guardado en el storage, con los datos que se indexan al subirlo"""
+
+    def __init__(
+        self,
+        name: str,
+        container: str,
+        size: int,
+        creation_time: datetime.datetime,
+        last_modified: datetime.datetime,
+        etag: str | None = None,
+    ) -> None:
+        self.name = name
+        self.container = container
+        self.size = size
+        self.creation_time = creation_time
+        self.last_modified = last_modified
+        self.etag = etag
+
+
+class StorageClient(Protocol):
+    """
+    Operaciones que el servicio de grupos necesita del storage de entregas.
+    Las implementan AsyncAzureContainerClient y LocalStorageClient.
+    """
+
+    async def exists(self) -> bool:
+        """Valida que exista el container"""
+        ...
+
+    async def upload_stream(self, stream: AsyncReadable, filename: str) -> StoredBlob:
+        """Sube el archivo leyendolo de a bloques y devuelve el blob guardado"""
+        ...
+
+    async def get_properties(self, blob_name: str) -> dict:
+        """Devuelve el size, el etag y el last_modified del blob"""
+        ...
+
+    async def download_stream(
+        self,
+        blob_name: str,
+        offset: int | None = None,
+        length: int | None = None,
+        etag: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Descarga el blob, o el rango offset, length, de a chunks"""
+        ...
+
+    async def list_blobs(self, prefix: str | None = None, pattern: str | None = None):
+        """Lista los blobs que empiezan con el prefijo y cumplen el patron"""
+        ...
+
+    async def close(self):
+        """Libera los recursos del cliente"""
+        ...
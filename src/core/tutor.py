@@ -68,6 +68,10 @@ class Tutor:
     def last_name(self) -> str:
         return self._last_name
 
+    @property
+    def is_evaluator(self) -> bool:
+        return self._is_evaluator
+
     @property
     def groups(self) -> List[AssignedGroup]:
         return self._groups
@@ -1,3 +1,4 @@
+import io
 import pytest
 import datetime as dt
 
@@ -7,6 +8,7 @@ from fastapi.testclient import TestClient
 from src.config.database.database import create_tables, drop_tables
 from tests.integration.api.helper import ApiHelper
 from src.api.assignments.router import router as assignment_router
+from src.core.snapshot import PeriodSnapshot
 
 
 @pytest.fixture(scope="function")
@@ -828,3 +830,77 @@ def test_if_tutor_does_not_send_dates_all_avaible_dates_are_taken(fastapi, table
     data = response.json()
     assert data["status"] == 1
     assert len(data["assigments"]) == 3
+
+
+@pytest.mark.integration
+def test_assignment_runs_are_recorded_by_period(fastapi, tables):
+    helper = ApiHelper()
+    helper.create_period("2C2024")
+    helper.create_student("Ana", "Gomez", "100001", "anagomez@example.com")
+    helper.create_student("Luis", "Martinez", "100002", "luismartinez@example.com")
+    helper.create_tutor("Tutor1", "Apellido", "1010", "email@fi.uba.ar")
+    helper.create_tutor_period(1010, "2C2024", 5)
+    helper.create_default_topics(["t1", "t2", "t3"])
+    helper.add_tutor_to_topic(
+        "2C2024", "email@fi.uba.ar", ["t1", "t2", "t3"], [1, 1, 1]
+    )
+    helper.create_basic_group([100001], [1, 2, 3])
+    helper.create_basic_group([100002], [3, 2, 1])
+    admin_token = helper.create_admin_token()
+    headers = {"Authorization": f"Bearer {admin_token.access_token}"}
+
+    fastapi.post(
+        f"{PREFIX}/group-topic-tutor?period_id=2C2024&method=flow", headers=headers
+    )
+    fastapi.post(
+        f"{PREFIX}/group-topic-tutor?period_id=2C2024&method=lp", headers=headers
+    )
+    response = fastapi.get(
+        f"{PREFIX}/runs", params={"period_id": "2C2024"}, headers=headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    runs = response.json()
+    assert [run["solver"] for run in runs] == ["group-tutor-lp", "group-tutor-flow"]
+    flow = runs[1]
+    assert flow["inputs"] == {"groups": 2, "topics": 3, "tutors": 1}
+    assert flow["status"] == "optimal"
+    assert {"db_fetch", "mapping", "build", "solve", "decode"} <= set(flow["timings"])
+    assert {"transfer", "serialization"} <= set(flow["timings"])
+
+    response = fastapi.get(
+        f"{PREFIX}/runs",
+        params={"period_id": "2C2024", "solver": "group-tutor-flow"},
+        headers=headers,
+    )
+    assert len(response.json()) == 1
+
+
+@pytest.mark.integration
+def test_export_period_snapshot(fastapi, tables):
+    helper = ApiHelper()
+    helper.create_period("2C2024")
+    helper.create_student("Ana", "Gomez", "100001", "anagomez@example.com")
+    helper.create_student("Luis", "Martinez", "100002", "luismartinez@example.com")
+    helper.create_tutor("Tutor1", "Apellido", "1010", "email@fi.uba.ar")
+    helper.create_tutor_period(1010, "2C2024", 5)
+    helper.create_default_topics(["t1", "t2", "t3"])
+    helper.add_tutor_to_topic(
+        "2C2024", "email@fi.uba.ar", ["t1", "t2", "t3"], [1, 1, 1]
+    )
+    helper.create_basic_group([100001], [1, 2, 3])
+    helper.create_basic_group([100002], [3, 2, 1])
+    admin_token = helper.create_admin_token()
+    headers = {"Authorization": f"Bearer {admin_token.access_token}"}
+
+    response = fastapi.get(
+        f"{PREFIX}/snapshot", params={"period_id": "2C2024"}, headers=headers
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    snapshot = PeriodSnapshot.read(io.StringIO(response.text))
+    assert snapshot.period_id == "2C2024"
+    assert [topic.name for topic in snapshot.topics] == ["t1", "t2", "t3"]
+    assert [tutor.id for tutor in snapshot.tutors] == [1010]
+    assert len(snapshot.unassigned_groups) == 2
+    assert "email@fi.uba.ar" not in response.text
@@ -1,16 +1,22 @@
 import pytest
+import time
 import datetime as dt
 from sqlalchemy.orm import sessionmaker, scoped_session
 
 from src.api.dates.models import DateSlot, GroupDateSlot, TutorDateSlot
 from src.api.dates.repository import DateSlotRepository
-from src.config.database.database import create_tables, drop_tables, engine
+from src.config.database.database import (
+    SessionScope,
+    create_tables,
+    drop_tables,
+    engine,
+)
 from tests.integration.api.helper import ApiHelper
 
 
 class TestDateRepository:
-    SessionFactory = sessionmaker(bind=engine)
-    Session = scoped_session(SessionFactory)
+    SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+    Session = SessionScope(scoped_session(SessionFactory))
 
     @pytest.fixture(scope="module")
     def tables(self):
@@ -167,3 +173,107 @@ class TestDateRepository:
         assert dates_saved[0].slot == dt.datetime(2024, 10, 15, 10, 0)
         assert dates_saved[0].assigned == False
         assert dates_saved[0].tutor_or_evaluator == None
+
+    @pytest.mark.integration
+    @pytest.mark.performance
+    def test_sync_tutor_slots_latency_does_not_grow_with_history(self, tables):
+        helper = ApiHelper()
+        tutor_id = 1010
+        date_repository = DateSlotRepository(self.Session)
+        slots = [
+            dt.datetime(2024, 11, 4, 9, 0) + dt.timedelta(hours=h) for h in range(8)
+        ]
+
+        def sync(period):
+            data = [
+                {"period_id": period, "slot": slot, "tutor_id": tutor_id}
+                for slot in slots
+            ]
+            start = time.perf_counter()
+            date_repository.sync_tutor_slots(data, tutor_id, period)
+            return time.perf_counter() - start
+
+        date_repository.add_bulk(
+            DateSlot, [{"period_id": "2C2024", "slot": slot} for slot in slots]
+        )
+        before = sync("2C2024")
+
+        # Se agregan cuatrimestres historicos con sus fechas y disponibilidades
+        for year in range(2010, 2020):
+            for term in (1, 2):
+                period = f"{term}C{year}"
+                helper.create_period(period)
+                history = [
+                    dt.datetime(year, 3 + 6 * (term - 1), 1, 9, 0)
+                    + dt.timedelta(hours=h)
+                    for h in range(500)
+                ]
+                date_repository.add_bulk(
+                    DateSlot, [{"period_id": period, "slot": s} for s in history]
+                )
+                date_repository.add_bulk(
+                    TutorDateSlot,
+                    [
+                        {"period_id": period, "slot": s, "tutor_id": tutor_id}
+                        for s in history
+                    ],
+                )
+        after = sync("2C2024")
+
+        print(f"Sync tutor slots - before: {before:.4f}s, after: {after:.4f}s")
+        dates_saved = date_repository.get_tutor_slots_by_id(tutor_id, "2C2024")
+        assert len(dates_saved) == len(slots)
+        assert after < max(before * 5, 0.1)
+
+    @pytest.mark.integration
+    def test_assign_dates_in_a_single_transaction(self, tables):
+        helper = ApiHelper()
+        helper.create_tutor("Evaluador", "Apellido", "2020", "evaluador@fi.uba.ar")
+        date = dt.datetime(2024, 10, 16, 9, 0)
+        assignments = [
+            {"date": date, "tutor_id": 1010, "evaluator_id": 2020, "group_id": 1}
+        ]
+
+        date_repository = DateSlotRepository(self.Session)
+        date_repository.assign_dates(assignments, "2C2024")
+
+        slots = date_repository.get_slots_by_period("2C2024", False)
+        assert any(slot.slot == date and slot.assigned for slot in slots)
+        evaluator_slots = date_repository.get_tutor_slots_by_id(2020, "2C2024")
+        assert len(evaluator_slots) == 1
+        assert evaluator_slots[0].assigned == True
+        assert evaluator_slots[0].tutor_or_evaluator == "evaluator"
+        assert len(date_repository.get_groups_slots_by_id(1)) == 2
+
+    @pytest.mark.integration
+    def test_assign_dates_is_all_or_nothing(self, tables):
+        date = dt.datetime(2024, 10, 17, 9, 0)
+        assignments = [
+            {"date": date, "tutor_id": 1010, "evaluator_id": 2020, "group_id": 1},
+            {"date": date, "tutor_id": 1010, "evaluator_id": 2020, "group_id": 999},
+        ]
+
+        date_repository = DateSlotRepository(self.Session)
+        with pytest.raises(Exception):
+            date_repository.assign_dates(assignments, "2C2024")
+
+        slots = date_repository.get_slots_by_period("2C2024", False)
+        assert all(slot.slot != date for slot in slots)
+
+    @pytest.mark.integration
+    def test_assigned_dates_recipients_include_tutor_and_evaluator(self, tables):
+        date_repository = DateSlotRepository(self.Session)
+
+        assignments = date_repository.get_assigned_dates("2C2024")
+        recipients = date_repository.get_assigned_dates_recipients("2C2024")
+
+        for assignment in assignments:
+            slot = [
+                (r["role"], r["group_number"])
+                for r in recipients
+                if r["date"] == assignment.date
+            ]
+            assert ("tutor", assignment.group_number) in slot
+            assert ("evaluator", assignment.group_number) in slot
+        evaluators = [r for r in recipients if r["role"] == "evaluator"]
+        assert all(r["email"] == "evaluador@fi.uba.ar" for r in evaluators)
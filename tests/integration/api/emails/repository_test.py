@@ -0,0 +1,98 @@
+import asyncio
+import pytest
+
+from sqlalchemy.orm import sessionmaker
+
+from src.api.emails.models import EmailStatus, OutboxEmail
+from src.api.emails.repository import EmailOutboxRepository
+from src.api.emails.worker import EmailOutboxWorker
+from src.config.database.database import (
+    RequestSession,
+    SessionScope,
+    create_tables,
+    drop_tables,
+    engine,
+)
+from src.core.email_client import StubEmailClient
+
+
+@pytest.fixture(scope="function")
+def tables():
+    # Create all tables
+    create_tables()
+    yield
+    # Drop all tables
+    drop_tables()
+
+
+Session = SessionScope(sessionmaker(bind=engine, expire_on_commit=False))
+
+
+def email(to: str, subject: str = "Asunto") -> OutboxEmail:
+    return OutboxEmail(to=[to], cc=[], subject=subject, body="Cuerpo")
+
+
+@pytest.mark.integration
+def test_enqueued_emails_are_saved_with_the_request_commit(tables):
+    session = RequestSession()
+    EmailOutboxRepository(session).enqueue([email("a@fi.uba.ar")])
+    session.rollback()
+    session.close()
+
+    session = RequestSession()
+    EmailOutboxRepository(session).enqueue([email("b@fi.uba.ar")])
+    session.commit()
+    session.close()
+
+    emails = EmailOutboxRepository(Session).get_emails()
+    assert [e.to for e in emails] == [["b@fi.uba.ar"]]
+    assert emails[0].status == EmailStatus.PENDING.value
+
+
+@pytest.mark.integration
+def test_claimed_emails_are_not_claimed_again_until_the_lease_ends(tables):
+    session = RequestSession()
+    EmailOutboxRepository(session).enqueue([email(f"{i}@fi.uba.ar") for i in range(5)])
+    session.commit()
+    session.close()
+    repository = EmailOutboxRepository(Session)
+
+    first = repository.claim_due(limit=3, lease=300)
+    second = repository.claim_due(limit=3, lease=300)
+
+    assert len(first) == 3 and len(second) == 2
+    assert {e.id for e in first}.isdisjoint({e.id for e in second})
+    assert all(e.attempts == 1 for e in first + second)
+    assert repository.claim_due(limit=3, lease=300) == []
+
+
+@pytest.mark.integration
+def test_worker_sends_and_reschedules_emails(tables):
+    session = RequestSession()
+    EmailOutboxRepository(session).enqueue(
+        [email("a@fi.uba.ar"), email("b@fi.uba.ar"), email("c@fi.uba.ar", "Otro")]
+    )
+    session.commit()
+    session.close()
+    repository = EmailOutboxRepository(Session)
+    client = StubEmailClient()
+    worker = EmailOutboxWorker(repository, client, rate_limit=0)
+
+    asyncio.run(worker.run_once())
+
+    assert len(client.batches) == 2
+    sent = repository.get_emails(EmailStatus.SENT.value)
+    assert len(sent) == 3 and all(e.sent_at is not None for e in sent)
+
+    session = RequestSession()
+    EmailOutboxRepository(session).enqueue([email("d@fi.uba.ar")])
+    session.commit()
+    session.close()
+    client.status = 503
+
+    asyncio.run(worker.run_once())
+
+    [pending] = repository.get_emails(EmailStatus.PENDING.value)
+    assert pending.error == "Sendgrid responded 503"
+    assert pending.attempts == 1
+    assert repository.claim_due(limit=10, lease=300) == []
@@ -4,8 +4,15 @@ from sqlalchemy.orm import sessionmaker, scoped_session
 
 from src.api.students.exceptions import StudentNotFound
 from src.api.topics.exceptions import TopicNotFound
-from src.config.database.database import create_tables, drop_tables, engine
+from src.config.database.database import (
+    RequestSession,
+    SessionScope,
+    create_tables,
+    drop_tables,
+    engine,
+)
 from src.api.forms.repository import FormRepository
+from src.api.forms.service import FormService
 from src.api.exceptions import Duplicated
 from src.api.topics.repository import TopicRepository
 from src.api.topics.models import Topic, Category
@@ -17,8 +24,8 @@ from tests.integration.api.helper import ApiHelper
 
 class TestFormRepository:
 
-    SessionFactory = sessionmaker(bind=engine)
-    Session = scoped_session(SessionFactory)
+    SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+    Session = SessionScope(scoped_session(SessionFactory))
 
     @pytest.fixture(scope="module")
     def tables(self):
@@ -244,3 +251,30 @@ class TestFormRepository:
 
         answers = repository.get_answers_by_user_id(101010, "1C2024")
         assert len(answers) == 3
+
+    @pytest.mark.integration
+    def test_delete_answers_by_answer_id_with_the_request_session(self, tables):
+        # Todos los repositorios de un request comparten la misma Session y el
+        # commit lo hace get_db al terminar el request
+        session = RequestSession()
+        repository = FormRepository(session)
+        answer_id = dt.datetime.today().isoformat()
+        answers = [
+            StudentFormAnswer(
+                id=105001, answer_id=answer_id, topics=["topic 1", "topic 2", "topic 3"]
+            ),
+            StudentFormAnswer(
+                id=105002, answer_id=answer_id, topics=["topic 1", "topic 2", "topic 3"]
+            ),
+        ]
+        repository.add_answers(
+            answers, ["topic 1", "topic 2", "topic 3"], [105001, 105002], "1C2024"
+        )
+        assert len(repository.get_answers_by_answer_id(answer_id)) == 2
+
+        FormService(repository).delete_answers_by_answer_id(answer_id)
+        session.commit()
+        session.close()
+
+        result = FormRepository(self.Session).get_answers_by_answer_id(answer_id)
+        assert len(result) == 0
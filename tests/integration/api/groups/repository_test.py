@@ -1,16 +1,29 @@
+import asyncio
+import io
+import os
+import time
 import pytest
 
 from src.api.exceptions import EntityNotInserted, EntityNotFound
 from src.api.groups.service import GroupService
-from src.api.groups.repository import GroupRepository
+from src.api.groups.repository import AsyncGroupRepository, GroupRepository
 from src.api.topics.models import Category, Topic
 from src.api.topics.repository import TopicRepository
 from src.api.periods.models import Period
 from src.api.tutors.repository import TutorRepository
 from src.api.users.repository import UserRepository
 from src.api.users.models import User, Role
-
-from src.config.database.database import create_tables, drop_tables, engine
+from src.core.local_storage_client import LocalStorageClient
+
+from src.config.database.database import (
+    AsyncRequestSession,
+    SessionScope,
+    create_tables,
+    dispose_async_engine,
+    drop_tables,
+    engine,
+    get_async_session_factory,
+)
 from sqlalchemy.orm import sessionmaker, scoped_session
 from src.api.periods.repository import PeriodRepository
 
@@ -24,8 +37,8 @@ def tables():
     drop_tables()
 
 
-SessionFactory = sessionmaker(bind=engine)
-Session = scoped_session(SessionFactory)
+SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+Session = SessionScope(scoped_session(SessionFactory))
 
 
 @pytest.mark.integration
@@ -413,3 +426,115 @@ def test_get_groups_leaning_path(tables):
         assert group.final_report_approved is False
         assert group.exhibition_date is None
         assert group.group_number == group.id
+
+
+@pytest.mark.integration
+@pytest.mark.performance
+def test_async_get_groups_serves_concurrent_requests(tables):
+    requests = 50
+
+    async def sync_handler():
+        # Como los handlers actuales: async def llamando a un repositorio
+        # sincronico que bloquea el event loop
+        return GroupRepository(Session).get_groups("1C2025", load_students=True)
+
+    async def async_handler():
+        session = AsyncRequestSession(get_async_session_factory())
+        try:
+            repository = AsyncGroupRepository(session)
+            return await repository.get_groups("1C2025", load_students=True)
+        finally:
+            await session.close()
+
+    async def throughput(handler):
+        start = time.perf_counter()
+        results = await asyncio.gather(*[handler() for _ in range(requests)])
+        return requests / (time.perf_counter() - start), results
+
+    async def benchmark():
+        try:
+            return await throughput(sync_handler), await throughput(async_handler)
+        finally:
+            await dispose_async_engine()
+
+    (sync_rps, sync_results), (async_rps, async_results) = asyncio.run(benchmark())
+
+    print(
+        f"{requests} concurrent GET /groups - sync: {sync_rps:.1f} req/s, "
+        f"async: {async_rps:.1f} req/s"
+    )
+    assert [g.id for g in async_results[0]] == [g.id for g in sync_results[0]]
+
+
+class AsyncBytes:
+    def __init__(self, data: bytes):
+        self._data = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._data.read(size)
+
+
+@pytest.mark.integration
+def test_uploaded_deliverables_are_listed_from_the_index(tables, tmp_path):
+    PeriodRepository(Session).add_period(Period(id="2C2025"))
+    repository = GroupRepository(Session)
+    group = repository.add_group(ids=[], period_id="2C2025")
+    storage_client = LocalStorageClient(str(tmp_path), "entregas")
+    service = GroupService(repository)
+
+    blob = asyncio.run(
+        service.upload_initial_project(
+            group.id, "Titulo", AsyncBytes(b"v1"), storage_client
+        )
+    )
+    asyncio.run(
+        service.upload_initial_project(
+            group.id, "Titulo", AsyncBytes(b"version 2"), storage_client
+        )
+    )
+
+    deliverables = repository.get_deliverables("2C2025", "initial-project")
+    assert len(deliverables) == 1
+    assert deliverables[0].group_id == group.id
+    assert deliverables[0].blob_name == f"2C2025/{group.id}/initial-project.pdf"
+    assert deliverables[0].size == len(b"version 2")
+    assert deliverables[0].created_on == blob.creation_time
+
+    listed = service.list_initial_project("2C2025")
+    assert [blob.name for blob in listed] == [deliverables[0].blob_name]
+    assert service.list_final_project("2C2025") == []
+
+
+@pytest.mark.integration
+def test_reconcile_deliverables_syncs_the_index_with_the_storage(tables, tmp_path):
+    PeriodRepository(Session).add_period(Period(id="1C2026"))
+    repository = GroupRepository(Session)
+    group = repository.add_group(ids=[], period_id="1C2026")
+    other = repository.add_group(ids=[], period_id="1C2026")
+    storage_client = LocalStorageClient(str(tmp_path), "entregas")
+    service = GroupService(repository)
+
+    asyncio.run(
+        service.upload_final_project(
+            group.id, "Titulo", AsyncBytes(b"final"), storage_client
+        )
+    )
+    # Entregas que no pasaron por el servicio o se borraron del storage
+    asyncio.run(
+        storage_client.upload_stream(
+            AsyncBytes(b"pre"), f"1C2026/{other.id}/initial-project.pdf"
+        )
+    )
+    asyncio.run(
+        storage_client.upload_stream(
+            AsyncBytes(b"x"), "1C2026/999999/informe-final.pdf"
+        )
+    )
+    os.remove(tmp_path / "entregas" / "1C2026" / str(group.id) / "informe-final.pdf")
+
+    result = asyncio.run(service.reconcile_deliverables("1C2026", storage_client))
+
+    assert result == {"indexed": 1, "removed": 1}
+    initial_projects = repository.get_deliverables("1C2026", "initial-project")
+    assert [deliverable.group_id for deliverable in initial_projects] == [other.id]
+    assert repository.get_deliverables("1C2026", "informe-final") == []
@@ -4,7 +4,12 @@ from fastapi.testclient import TestClient
 
 from src.api.groups.dependencies import get_email_sender
 from src.api.groups.router import router
-from src.config.database.database import create_tables, drop_tables, engine
+from src.config.database.database import (
+    SessionScope,
+    create_tables,
+    drop_tables,
+    engine,
+)
 from sqlalchemy.orm import sessionmaker, scoped_session
 
 from tests.integration.api.helper import ApiHelper
@@ -31,8 +36,8 @@ def tables():
     drop_tables()
 
 
-SessionFactory = sessionmaker(bind=engine)
-Session = scoped_session(SessionFactory)
+SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+Session = SessionScope(scoped_session(SessionFactory))
 
 
 @pytest.fixture(scope="module")
@@ -5,7 +5,7 @@ from src.api.forms.repository import FormRepository
 from src.api.groups.repository import GroupRepository
 from src.api.topics.models import Category, Topic
 from src.api.topics.repository import TopicRepository
-from src.config.database.database import engine
+from src.config.database.database import SessionScope, engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 
 from src.api.tutors.repository import TutorRepository
@@ -24,8 +24,8 @@ from src.api.periods.repository import PeriodRepository
 
 
 class ApiHelper:
-    SessionFactory = sessionmaker(bind=engine)
-    Session = scoped_session(SessionFactory)
+    SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+    Session = SessionScope(scoped_session(SessionFactory))
     hasher = ShaHasher()
 
     def __init__(self):
@@ -1,3 +1,4 @@
+import time
 import pytest
 
 from sqlalchemy.orm import sessionmaker, scoped_session
@@ -5,11 +6,20 @@ from sqlalchemy.orm import sessionmaker, scoped_session
 from src.api.users.repository import UserRepository
 from src.api.users.models import User, Role
 
-from src.config.database.database import create_tables, drop_tables, engine
+from src.config.database.database import (
+    SessionScope,
+    create_tables,
+    drop_tables,
+    engine,
+)
 
 from src.api.students.repository import StudentRepository
 from src.api.students.models import StudentPeriod
-from src.api.students.exceptions import StudentNotFound, StudentPeriodNotInserted
+from src.api.students.exceptions import (
+    StudentNotFound,
+    StudentNotInserted,
+    StudentPeriodNotInserted,
+)
 
 from tests.integration.api.helper import ApiHelper
 
@@ -25,8 +35,8 @@ def tables():
 
 class TestStudentRepository:
 
-    SessionFactory = sessionmaker(bind=engine)
-    Session = scoped_session(SessionFactory)
+    SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+    Session = SessionScope(scoped_session(SessionFactory))
 
     @pytest.mark.integration
     def test_add_students(self, tables):
@@ -219,3 +229,48 @@ class TestStudentRepository:
 
         with pytest.raises(StudentPeriodNotInserted):
             s_repository.upsert_student_periods(periods)
+
+    def _roster(self, size: int, first_id: int = 200000):
+        return (
+            (i, f"Nombre{i}", f"Apellido{i}", f"{i}@fi.uba.ar", f"hash{i}")
+            for i in range(first_id, first_id + size)
+        )
+
+    @pytest.mark.integration
+    def test_import_students_inserts_and_updates_in_bulk(self, tables):
+        s_repository = StudentRepository(self.Session)
+
+        students = s_repository.import_students(self._roster(10), "2C2025")
+        assert len(students) == 10
+
+        updated = [(200000, "Otro", "Nombre", "otro@fi.uba.ar", "hash")]
+        students = s_repository.import_students(updated, "2C2025")
+
+        assert students[0].name == "Otro"
+        assert students[0].password == "hash200000"
+        assert s_repository.get_period_by_student_id(200000).period_id == "2C2025"
+
+    @pytest.mark.integration
+    def test_import_students_does_not_override_other_roles(self, tables):
+        helper = ApiHelper()
+        helper.create_tutor("Tutor", "Apellido", "300000", "tutor300000@fi.uba.ar")
+        s_repository = StudentRepository(self.Session)
+        roster = [(300000, "Juan", "Perez", "juan300000@fi.uba.ar", "hash")]
+
+        with pytest.raises(StudentNotInserted):
+            s_repository.import_students(roster, "2C2025")
+
+    @pytest.mark.integration
+    @pytest.mark.performance
+    def test_import_students_time_with_large_rosters(self, tables):
+        s_repository = StudentRepository(self.Session)
+
+        for size in [1000, 10000, 50000]:
+            start = time.perf_counter()
+            students = s_repository.import_students(
+                self._roster(size, first_id=1000000), "2C2025"
+            )
+            elapsed = time.perf_counter() - start
+
+            print(f"{size} students imported in {elapsed:.3f} seconds")
+            assert len(students) == size
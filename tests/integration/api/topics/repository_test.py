@@ -1,10 +1,17 @@
 import pytest
 
-from src.config.database.database import create_tables, drop_tables, engine
+from src.config.database.database import (
+    SessionScope,
+    create_tables,
+    drop_tables,
+    engine,
+)
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker, scoped_session
 
 from src.api.topics.repository import TopicRepository
-from src.api.topics.models import Topic, Category
+from src.api.topics.models import Topic, Category, TopicTutorPeriod
+from tests.integration.api.helper import ApiHelper
 
 
 @pytest.fixture(scope="function")
@@ -18,8 +25,8 @@ def tables():
 
 class TestTopicRepository:
 
-    SessionFactory = sessionmaker(bind=engine)
-    Session = scoped_session(SessionFactory)
+    SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+    Session = SessionScope(scoped_session(SessionFactory))
 
     @pytest.mark.integration
     def test_add_category_with_success(self, tables):
@@ -62,3 +69,111 @@ class TestTopicRepository:
         result = t_repository.add_topics(topics)
         result = t_repository.get_topic_by_id(1)
         assert result.name == "topic 1"
+
+    def _rows(self, tutors: int, topics_per_tutor: int):
+        return [
+            {
+                "line": line,
+                "topic": f"topic {line}",
+                "category": f"category {line % 5}",
+                "tutor_email": f"tutor{line % tutors}@fi.uba.ar",
+                "capacity": 2,
+            }
+            for line in range(2, tutors * topics_per_tutor + 2)
+        ]
+
+    @pytest.mark.integration
+    def test_import_topics_reports_rows_without_tutor(self, tables):
+        helper = ApiHelper()
+        helper.create_period("1C2024")
+        helper.create_tutor("Juan", "Perez", "1000", "juan.perez@fi.uba.ar")
+        helper.create_tutor("Maria", "Gomez", "1001", "maria.gomez@fi.uba.ar")
+        tutor_period = helper.create_tutor_period(1000, "1C2024")
+        rows = [
+            {
+                "line": 2,
+                "topic": "topic 1",
+                "category": "category 1",
+                "tutor_email": "juan.perez@fi.uba.ar",
+                "capacity": 1,
+            },
+            {
+                "line": 3,
+                "topic": "topic 2",
+                "category": "category 1",
+                "tutor_email": "maria.gomez@fi.uba.ar",
+                "capacity": 1,
+            },
+            {
+                "line": 4,
+                "topic": "topic 2",
+                "category": "category 2",
+                "tutor_email": "carlos@fi.uba.ar",
+                "capacity": 1,
+            },
+        ]
+
+        t_repository = TopicRepository(self.Session)
+        topics, errors = t_repository.import_topics(rows, "1C2024")
+
+        assert [(t.name, t.category.name) for t in topics] == [
+            ("topic 1", "category 1"),
+            ("topic 2", "category 1"),
+        ]
+        assert [(e["line"], e["detail"]) for e in errors] == [
+            (3, "Tutor 'maria.gomez@fi.uba.ar' has no period."),
+            (4, "Tutor 'carlos@fi.uba.ar' not found."),
+        ]
+        with self.Session() as session:
+            saved = session.query(TopicTutorPeriod).all()
+        assert [(s.tutor_period_id, s.capacity) for s in saved] == [
+            (tutor_period.id, 1)
+        ]
+
+    @pytest.mark.integration
+    def test_import_topics_updates_capacities(self, tables):
+        helper = ApiHelper()
+        helper.create_period("1C2024")
+        helper.create_tutor("Juan", "Perez", "1000", "juan.perez@fi.uba.ar")
+        helper.create_tutor_period(1000, "1C2024")
+        row = {
+            "line": 2,
+            "topic": "topic 1",
+            "category": "category 1",
+            "tutor_email": "juan.perez@fi.uba.ar",
+            "capacity": 1,
+        }
+
+        t_repository = TopicRepository(self.Session)
+        t_repository.import_topics([row], "1C2024")
+        t_repository.import_topics([{**row, "capacity": 3}], "1C2024")
+
+        with self.Session() as session:
+            saved = session.query(TopicTutorPeriod).all()
+        assert [s.capacity for s in saved] == [3]
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("tutors", [10, 100])
+    def test_import_topics_runs_a_fixed_number_of_queries(self, tables, tutors):
+        helper = ApiHelper()
+        helper.create_period("1C2024")
+        for i in range(tutors):
+            helper.create_tutor("Tutor", str(i), str(1000 + i), f"tutor{i}@fi.uba.ar")
+            helper.create_tutor_period(1000 + i, "1C2024")
+        rows = self._rows(tutors, topics_per_tutor=3)
+
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            topics, errors = TopicRepository(self.Session).import_topics(rows, "1C2024")
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+
+        print(f"{len(rows)} rows - {len(statements)} queries")
+        assert len(topics) == len(rows)
+        assert errors == []
+        assert len(statements) <= 10
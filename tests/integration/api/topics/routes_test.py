@@ -150,6 +150,33 @@ def test_add_existing_topic_with_success(fastapi, tables, tutors, topics):
     assert len(response.json()) == 2
 
 
+@pytest.mark.integration
+@pytest.mark.parametrize("topics", ["test_data"], indirect=True)
+def test_import_topics_reports_rows_with_errors(fastapi, tables, topics):
+    helper = ApiHelper()
+    token = helper.create_admin_token()
+    helper.create_period("1C2024")
+    helper.create_tutor("Juan", "Perez", "1000", "juan.perez@fi.uba.ar")
+    helper.create_tutor_period(1000, "1C2024")
+
+    response = fastapi.post(
+        f"{PREFIX}/import",
+        files=topics,
+        params={"period": "1C2024"},
+        headers={"Authorization": f"Bearer {token.access_token}"},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(response.json()["topics"]) == 3
+    assert response.json()["errors"] == [
+        {
+            "line": 4,
+            "topic": "topic 3",
+            "tutor_email": "maria.gomez@fi.uba.ar",
+            "detail": "Tutor 'maria.gomez@fi.uba.ar' not found.",
+        }
+    ]
+
+
 @pytest.mark.integration
 def test_upload_wrong_type_file(fastapi, tables):
     # add topics
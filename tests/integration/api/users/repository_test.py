@@ -1,6 +1,11 @@
 import pytest
 
-from src.config.database.database import create_tables, drop_tables, engine
+from src.config.database.database import (
+    SessionScope,
+    create_tables,
+    drop_tables,
+    engine,
+)
 from sqlalchemy.orm import sessionmaker, scoped_session
 
 from src.api.users.repository import UserRepository
@@ -10,8 +15,8 @@ from src.api.users.models import User, Role
 
 class TestUserRepository:
 
-    SessionFactory = sessionmaker(bind=engine)
-    Session = scoped_session(SessionFactory)
+    SessionFactory = sessionmaker(bind=engine, expire_on_commit=False)
+    Session = SessionScope(scoped_session(SessionFactory))
 
     @pytest.fixture(scope="module")
     def tables(self):
@@ -0,0 +1,261 @@
+"""
+Benchmark de los algoritmos de asignacion sobre cuatrimestres sinteticos.
+
+Corre cada solver sobre una escalera de tamaños, hasta el maximo de cada
+solver (MAX_GROUPS), y registra el tiempo de construccion y de resolucion, la
+memoria pico y el objetivo alcanzado. Cada resultado se guarda como una linea
+json junto con el commit, de forma que se puedan comparar corridas de
+distintos commits:
+
+    python -m tests.performance.benchmark --output benchmarks.jsonl
+    python -m tests.performance.benchmark --compare benchmarks.jsonl
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import tracemalloc
+
+from src.core.algorithms.date.delivery_lp_solver import DeliveryLPSolver
+from src.core.algorithms.solver_options import SolverOptions
+from src.core.algorithms.topic_tutor.group_tutor_flow_solver import GroupTutorFlowSolver
+from src.core.algorithms.topic_tutor.group_tutor_lp_solver import GroupTutorLPSolver
+from src.core.algorithms.topic_tutor.incomplete_groups_lp_solver import (
+    IncompleteGroupsLPSolver,
+)
+from tests.performance.synthetic import SyntheticPeriod
+
+SIZES = (50, 100, 200, 1000)
+DEFAULT_TIME_LIMIT = 60
+# Mayor cantidad de grupos con la que cada solver encuentra una solucion
+# dentro de DEFAULT_TIME_LIMIT. Con 200 grupos delivery-lp llega al limite de
+# tiempo sin ninguna asignacion y group-tutor-lp tarda casi un minuto en armar
+# el modelo y usa 1.4 GB, por lo que esas corridas no sirven para comparar
+MAX_GROUPS = {
+    "incomplete-groups-lp": 200,
+    "group-tutor-lp": 100,
+    "group-tutor-flow": 1000,
+    "delivery-lp": 100,
+}
+BALANCE_LIMIT = 5
+
+
+def _incomplete_groups(period: SyntheticPeriod, options: SolverOptions):
+    answers = period.form_answers()
+
+    def run():
+        solver = IncompleteGroupsLPSolver(answers, options)
+        groups = solver.solve()
+        complete = sum(1 for group in groups if len(group.students) == 4)
+        return solver.stats, {"complete_groups": complete, "groups": len(groups)}
+
+    return run
+
+
+def _group_tutor(solver_class):
+    def inputs(period: SyntheticPeriod, options: SolverOptions):
+        topics = period.topics()
+        tutors = period.tutors(topics)
+        groups = period.unassigned_groups(topics)
+
+        def run():
+            if solver_class is GroupTutorLPSolver:
+                solver = solver_class(groups, topics, tutors, BALANCE_LIMIT, options)
+            else:
+                solver = solver_class(groups, topics, tutors)
+            result = solver.solve()
+            return solver.stats, {
+                "assigned": len(result.assignments),
+                "dcg": result.calculate_dcg(),
+            }
+
+        return run
+
+    return inputs
+
+
+def _delivery(period: SyntheticPeriod, options: SolverOptions):
+    tutors = period.tutors()
+    evaluators = period.evaluators(tutors)
+    groups = period.assigned_groups(tutors)
+    slots = period.slots()
+
+    def run():
+        solver = DeliveryLPSolver(
+            groups=groups,
+            tutors=tutors,
+            evaluators=evaluators,
+            available_dates=slots,
+            options=options,
+        )
+        result = solver.solve()
+        return solver.stats, {"assigned": len(result.assignments)}
+
+    return run
+
+
+# Cada solver arma sus entradas (fuera de la medicion) y devuelve la corrida
+SOLVERS = {
+    "incomplete-groups-lp": _incomplete_groups,
+    "group-tutor-lp": _group_tutor(GroupTutorLPSolver),
+    "group-tutor-flow": _group_tutor(GroupTutorFlowSolver),
+    "delivery-lp": _delivery,
+}
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_benchmark(
+    solver: str,
+    groups: int,
+    seed: int = 42,
+    time_limit: float = DEFAULT_TIME_LIMIT,
+    commit: str | None = None,
+) -> dict:
+    """
+    Corre un solver sobre un cuatrimestre sintetico de groups grupos.
+
+    La memoria pico es la de los objetos de Python (tracemalloc) durante la
+    construccion y la resolucion: no incluye la memoria nativa de SCIP ni la
+    de CBC, que corre en otro proceso.
+    """
+    period = SyntheticPeriod(groups=groups, seed=seed)
+    run = SOLVERS[solver](period, SolverOptions(time_limit=time_limit))
+
+    tracemalloc.start()
+    try:
+        stats, objective = run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "commit": commit or current_commit(),
+        "python": platform.python_version(),
+        "solver": solver,
+        "groups": groups,
+        "seed": seed,
+        "time_limit": time_limit,
+        "inputs": stats.inputs,
+        "variables": stats.variables,
+        "constraints": stats.constraints,
+        "build_time": stats.timings.get("build"),
+        "solve_time": stats.timings.get("solve"),
+        "peak_memory_mb": round(peak / 2**20, 2),
+        "status": stats.status,
+        "gap": stats.gap,
+        "nodes": stats.nodes,
+        "objective": objective,
+    }
+
+
+def compare(baseline: list[dict], results: list[dict]) -> list[dict]:
+    """
+    Compara cada resultado con la ultima corrida del mismo solver, tamaño y
+    semilla en baseline. Los ratios mayores a 1 indican que el commit actual
+    es mas lento o usa mas memoria.
+    """
+    previous = {(r["solver"], r["groups"], r["seed"]): r for r in baseline}
+    comparison = []
+    for result in results:
+        before = previous.get((result["solver"], result["groups"], result["seed"]))
+        if before is None:
+            continue
+        row = {
+            "solver": result["solver"],
+            "groups": result["groups"],
+            "baseline": before["commit"],
+        }
+        for metric in ("build_time", "solve_time", "peak_memory_mb"):
+            row[metric] = (
+                round(result[metric] / before[metric], 2) if before[metric] else None
+            )
+        row["objective"] = (before["objective"], result["objective"])
+        comparison.append(row)
+    return comparison
+
+
+def _print_table(rows: list[dict], columns: list[str]):
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join(str(row.get(column)) for column in columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--solvers", nargs="+", choices=list(SOLVERS), default=None)
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--time-limit", type=float, default=DEFAULT_TIME_LIMIT)
+    parser.add_argument("--output", help="Archivo jsonl al que se agregan resultados")
+    parser.add_argument("--compare", help="Archivo jsonl con una corrida anterior")
+    parser.add_argument(
+        "--all-sizes",
+        action="store_true",
+        help="Corre tambien los tamaños por encima de MAX_GROUPS",
+    )
+    args = parser.parse_args(argv)
+
+    commit = current_commit()
+    results = []
+    for solver in args.solvers or list(SOLVERS):
+        for groups in args.sizes:
+            if groups > MAX_GROUPS[solver] and not args.all_sizes:
+                print(
+                    f"{solver}: se omiten {groups} grupos (maximo {MAX_GROUPS[solver]})"
+                )
+                continue
+            result = run_benchmark(solver, groups, args.seed, args.time_limit, commit)
+            results.append(result)
+            if args.output:
+                with open(args.output, "a", encoding="utf-8") as output:
+                    output.write(json.dumps(result) + "\n")
+
+    _print_table(
+        results,
+        [
+            "solver",
+            "groups",
+            "build_time",
+            "solve_time",
+            "peak_memory_mb",
+            "status",
+            "objective",
+        ],
+    )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = [
+                json.loads(line)
+                for line in file
+                if line.strip() and json.loads(line)["commit"] != commit
+            ]
+        print()
+        _print_table(
+            compare(baseline, results),
+            [
+                "solver",
+                "groups",
+                "baseline",
+                "build_time",
+                "solve_time",
+                "peak_memory_mb",
+                "objective",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import pytest
+
+from src.core.algorithms.solver_options import SCIP_LIMIT_STATUSES
+from tests.performance.benchmark import MAX_GROUPS, SOLVERS, compare, run_benchmark
+from tests.performance.synthetic import SyntheticPeriod
+
+
+class TestSyntheticPeriod:
+
+    @pytest.mark.unit
+    def test_same_seed_generates_the_same_period(self):
+        first, second = SyntheticPeriod(60, seed=7), SyntheticPeriod(60, seed=7)
+
+        def preferences(period):
+            return [g.get_topic_ids() for g in period.form_answers()]
+
+        assert preferences(first) == preferences(second)
+        assert [t.topics_ids() for t in first.tutors()] == [
+            t.topics_ids() for t in second.tutors()
+        ]
+        assert preferences(first) != preferences(SyntheticPeriod(60, seed=8))
+
+    @pytest.mark.unit
+    def test_topic_popularity_is_skewed(self):
+        period = SyntheticPeriod(400)
+        counts = {}
+        for group in period.unassigned_groups():
+            for topic in group.topics:
+                counts[topic.id] = counts.get(topic.id, 0) + 1
+
+        popular = sorted(counts.values(), reverse=True)
+        # El 10% de los temas concentra mas de un tercio de las preferencias
+        top = popular[: len(period.topics()) // 10]
+        assert sum(top) > sum(popular) / 3
+
+    @pytest.mark.unit
+    def test_availability_is_sparse_and_groups_fit_their_tutor(self):
+        period = SyntheticPeriod(80, availability=0.25)
+        tutors = period.tutors()
+        slots = period.slots()
+
+        assert all(
+            0 < len(tutor.available_dates) <= len(slots) // 3 for tutor in tutors
+        )
+        assert sum(tutor.capacity for tutor in tutors) >= 80
+        assert {topic.id for t in tutors for topic in t.topics} == {
+            topic.id for topic in period.topics()
+        }
+        for group in period.assigned_groups(tutors):
+            tutor_dates = {slot.date for slot in group._tutor.available_dates}
+            assert {slot.date for slot in group.available_dates} <= tutor_dates
+
+
+class TestBenchmark:
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("solver", list(SOLVERS))
+    def test_every_solver_runs_on_the_smallest_size(self, solver):
+        result = run_benchmark(solver, groups=50, time_limit=30, commit="test")
+
+        print(
+            f"{solver} with 50 groups - build: {result['build_time']:.3f}s, "
+            f"solve: {result['solve_time']:.3f}s, "
+            f"peak memory: {result['peak_memory_mb']} MB"
+        )
+        assert result["status"].lower() == "optimal" or (
+            result["status"] in SCIP_LIMIT_STATUSES
+        )
+        # incomplete-groups-lp informa los grupos armados, el resto los asignados
+        objective = result["objective"]
+        assert objective.get("assigned", objective.get("groups")) > 0
+        assert result["build_time"] > 0
+        assert result["peak_memory_mb"] > 0
+
+    @pytest.mark.unit
+    def test_every_solver_has_a_size_limit_that_includes_the_smallest_size(self):
+        assert set(MAX_GROUPS) == set(SOLVERS)
+        assert all(limit >= 50 for limit in MAX_GROUPS.values())
+
+    @pytest.mark.unit
+    def test_compare_against_the_same_solver_size_and_seed(self):
+        before = {
+            "commit": "abc",
+            "solver": "group-tutor-flow",
+            "groups": 50,
+            "seed": 42,
+            "build_time": 2.0,
+            "solve_time": 1.0,
+            "peak_memory_mb": 10.0,
+            "objective": {"dcg": 90.0},
+        }
+        after = {
+            **before,
+            "commit": "def",
+            "build_time": 1.0,
+            "solve_time": 3.0,
+            "objective": {"dcg": 91.0},
+        }
+        other_size = {**after, "groups": 200}
+
+        [row] = compare([before], [after, other_size])
+
+        assert row["baseline"] == "abc"
+        assert row["build_time"] == 0.5
+        assert row["solve_time"] == 3.0
+        assert row["peak_memory_mb"] == 1.0
+        assert row["objective"] == ({"dcg": 90.0}, {"dcg": 91.0})
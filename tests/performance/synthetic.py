@@ -0,0 +1,196 @@
+"""Generador de cuatrimestres sinteticos para medir los algoritmos de asignacion."""
+
+import random
+from datetime import datetime, timedelta
+
+from src.core.date_slots import DateSlot
+from src.core.group import AssignedGroup, UnassignedGroup
+from src.core.group_form_answer import GroupFormAnswer
+from src.core.topic import Topic
+from src.core.tutor import Tutor
+
+# Las exposiciones son de lunes a viernes, de 9 a 17hs
+FIRST_DAY = datetime(2024, 10, 7, 9, 0, 0)
+HOURS_PER_DAY = 9
+DAYS_PER_WEEK = 5
+CATEGORIES = 8
+
+
+class SyntheticPeriod:
+    """
+    Un cuatrimestre generado a partir de una semilla, con los mismos datos en
+    cada ejecucion para poder comparar los resultados entre commits.
+
+    Las proporciones imitan a los cuatrimestres reales: un tema cada dos
+    grupos, un tutor cada ocho grupos y la mitad de los tutores evaluan. La
+    popularidad de los temas sigue una ley de Zipf (topic_skew), de forma que
+    pocos temas concentran la mayoria de las preferencias, y cada tutor esta
+    disponible solo en algunos dias (availability) del periodo de entregas.
+
+    Attributes:
+        groups (int): Cantidad de grupos.
+        seed (int): Semilla del generador.
+        topic_skew (float): Exponente de la ley de Zipf de los temas.
+        availability (float): Fraccion de los dias en la que cada tutor esta
+            disponible.
+        weeks (int): Semanas del periodo de entregas. Como cada fecha admite
+            una sola exposicion, por defecto se generan unas dos fechas por grupo.
+    """
+
+    def __init__(
+        self,
+        groups: int = 50,
+        seed: int = 42,
+        topic_skew: float = 1.1,
+        availability: float = 0.3,
+        weeks: int | None = None,
+    ) -> None:
+        self.groups = groups
+        self.seed = seed
+        self.topic_skew = topic_skew
+        self.availability = availability
+        slots_per_week = DAYS_PER_WEEK * HOURS_PER_DAY
+        self.weeks = (
+            weeks if weeks is not None else max(4, -(-2 * groups // slots_per_week))
+        )
+
+    def _rng(self, name: str) -> random.Random:
+        # Un generador por entidad: agregar datos a una no cambia las demas
+        return random.Random(f"{self.seed}-{name}")
+
+    def topics(self) -> list[Topic]:
+        rng = self._rng("topics")
+        return [
+            Topic(
+                id=i,
+                title=f"Tema {i}",
+                capacity=rng.randint(2, 4),
+                category=f"Categoria {rng.randrange(CATEGORIES)}",
+            )
+            for i in range(1, max(self.groups // 2, 3) + 1)
+        ]
+
+    def _topic_weights(self, topics: list[Topic]) -> list[float]:
+        return [1 / (rank**self.topic_skew) for rank in range(1, len(topics) + 1)]
+
+    def _preferences(self, rng: random.Random, topics: list[Topic]) -> list[Topic]:
+        """Tres temas distintos, elegidos segun su popularidad"""
+        weights = self._topic_weights(topics)
+        preferences = []
+        while len(preferences) < 3:
+            topic = rng.choices(topics, weights=weights)[0]
+            if topic not in preferences:
+                preferences.append(topic)
+        return preferences
+
+    def slots(self) -> list[DateSlot]:
+        slots = []
+        for week in range(self.weeks):
+            for day in range(DAYS_PER_WEEK):
+                start = FIRST_DAY + timedelta(weeks=week, days=day)
+                slots.extend(
+                    DateSlot(start_time=start + timedelta(hours=hour))
+                    for hour in range(HOURS_PER_DAY)
+                )
+        return slots
+
+    def _available_dates(self, rng: random.Random, slots: list[DateSlot]):
+        """Algunos dias completos del periodo, al menos uno"""
+        days = [
+            slots[i : i + HOURS_PER_DAY] for i in range(0, len(slots), HOURS_PER_DAY)
+        ]
+        amount = max(1, round(len(days) * self.availability))
+        return [slot for day in rng.sample(days, amount) for slot in day]
+
+    def tutors(self, topics: list[Topic] | None = None) -> list[Tutor]:
+        """
+        Tutores con entre 3 y 8 temas (cada tema tiene al menos un tutor) y
+        capacidad suficiente para todos los grupos.
+        """
+        rng = self._rng("tutors")
+        topics = topics if topics is not None else self.topics()
+        slots = self.slots()
+        amount = max(self.groups // 8, 2)
+        capacity = -(-self.groups // amount)
+
+        topics_by_tutor = [[] for _ in range(amount)]
+        for index, topic in enumerate(topics):
+            topics_by_tutor[index % amount].append(topic)
+        for tutor_topics in topics_by_tutor:
+            extra = rng.sample(topics, min(rng.randint(3, 8), len(topics)))
+            tutor_topics.extend(t for t in extra if t not in tutor_topics)
+
+        return [
+            Tutor(
+                id=i,
+                name=f"Tutor {i}",
+                last_name="Sintetico",
+                email=f"tutor{i}@fi.uba.ar",
+                capacity=capacity + rng.randint(0, 2),
+                topics=[
+                    Topic(t.id, t.name, capacity=rng.randint(1, 4), category=t.category)
+                    for t in tutor_topics
+                ],
+                available_dates=self._available_dates(rng, slots),
+                is_evaluator=i % 2 == 0,
+            )
+            for i, tutor_topics in enumerate(topics_by_tutor, start=1)
+        ]
+
+    def evaluators(self, tutors: list[Tutor] | None = None) -> list[Tutor]:
+        tutors = tutors if tutors is not None else self.tutors()
+        return [tutor for tutor in tutors if tutor.id % 2 == 0]
+
+    def unassigned_groups(self, topics: list[Topic] | None = None):
+        rng = self._rng("unassigned-groups")
+        topics = topics if topics is not None else self.topics()
+        return [
+            UnassignedGroup(
+                id=i,
+                topics=self._preferences(rng, topics),
+                students=[],
+                group_number=i,
+            )
+            for i in range(1, self.groups + 1)
+        ]
+
+    def assigned_groups(self, tutors: list[Tutor] | None = None):
+        """
+        Grupos con tutor, disponibles en la mitad de las fechas de su tutor
+        (o en todas si el tutor tiene pocas).
+        """
+        rng = self._rng("assigned-groups")
+        tutors = tutors if tutors is not None else self.tutors()
+        groups = []
+        for i in range(1, self.groups + 1):
+            tutor = tutors[(i - 1) % len(tutors)]
+            dates = tutor.available_dates
+            amount = max(len(dates) // 2, min(len(dates), HOURS_PER_DAY))
+            groups.append(
+                AssignedGroup(
+                    id=i,
+                    tutor=tutor,
+                    available_dates=rng.sample(dates, amount),
+                    group_number=i,
+                )
+            )
+        return groups
+
+    def form_answers(self, topics: list[Topic] | None = None):
+        """
+        Respuestas del formulario: la mitad de los grupos ya viene completa y
+        el resto tiene entre 1 y 3 alumnos.
+        """
+        rng = self._rng("form-answers")
+        topics = topics if topics is not None else self.topics()
+        answers = []
+        for i in range(1, self.groups + 1):
+            size = 4 if rng.random() < 0.5 else rng.choice([1, 2, 2, 3, 3])
+            answers.append(
+                GroupFormAnswer(
+                    str(i),
+                    topics=self._preferences(rng, topics),
+                    students=[f"alumno{i}_{j}@fi.uba.ar" for j in range(size)],
+                )
+            )
+        return answers
@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.api.assignments.jobs import AssignmentJobRunner
+from src.api.assignments.models import JobStatus
+from src.api.assignments.repository import (
+    AssignmentJobRepository,
+    SolverRunRepository,
+)
+from src.api.assignments.telemetry import SolverRunRecorder
+from src.core.algorithms.solver_stats import SolverStats
+
+
+def solve_with_stats(groups):
+    stats = SolverStats("test-solver", groups=len(groups))
+    with stats.phase("solve"):
+        stats.status = "optimal"
+    return [group * 2 for group in groups]
+
+
+class TestAssignmentJobRunner:
+
+    @pytest.mark.unit
+    def test_finished_job_saves_result(self, mocker):
+        repo = AssignmentJobRepository(None)
+        update = mocker.patch.object(repo, "update_job", return_value=None)
+        runner = AssignmentJobRunner()
+
+        async def solve(*args):
+            return [1, 2]
+
+        runner.run_solver = solve
+        asyncio.run(runner.run_job(1, repo, None, (), lambda result: result))
+
+        last_update = update.call_args_list[-1].args
+        assert last_update == (
+            1,
+            {"status": JobStatus.FINISHED.value, "progress": 100, "result": [1, 2]},
+        )
+
+    @pytest.mark.unit
+    def test_failed_job_saves_error(self, mocker):
+        repo = AssignmentJobRepository(None)
+        update = mocker.patch.object(repo, "update_job", return_value=None)
+        runner = AssignmentJobRunner()
+
+        async def solve(*args):
+            raise Exception("Infeasible")
+
+        runner.run_solver = solve
+        asyncio.run(runner.run_job(1, repo, None, (), lambda result: result))
+
+        last_update = update.call_args_list[-1].args
+        assert last_update == (
+            1,
+            {"status": JobStatus.FAILED.value, "error": "Infeasible"},
+        )
+
+    @pytest.mark.unit
+    def test_measured_job_saves_solver_runs_with_api_phases(self, mocker):
+        repo = AssignmentJobRepository(None)
+        mocker.patch.object(repo, "update_job", return_value=None)
+        runs_repo = SolverRunRepository(None)
+        add_runs = mocker.patch.object(runs_repo, "add_runs", return_value=None)
+        recorder = SolverRunRecorder(runs_repo, "1C2025")
+        with recorder.phase("db_fetch"):
+            groups = [1, 2, 3]
+        runner = AssignmentJobRunner()
+        runner._pool = ThreadPoolExecutor(max_workers=1)
+
+        asyncio.run(
+            runner.run_job(
+                7, repo, solve_with_stats, (groups,), lambda result: result, recorder
+            )
+        )
+        runner.shutdown()
+
+        [run] = add_runs.call_args.args[0]
+        assert run.job_id == 7 and run.period_id == "1C2025"
+        assert run.solver == "test-solver" and run.status == "optimal"
+        assert run.inputs == {"groups": 3}
+        assert set(run.timings) == {"db_fetch", "solve", "transfer", "serialization"}
+        assert run.total_time == pytest.approx(sum(run.timings.values()))
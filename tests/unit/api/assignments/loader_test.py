@@ -0,0 +1,102 @@
+import pytest
+from datetime import datetime
+
+from src.api.assignments.loader import PeriodSnapshotLoader
+from src.core.algorithms.solver_stats import PhaseTimings
+
+
+class TestPeriodSnapshotLoader:
+
+    MONDAY = datetime(2024, 10, 7, 9, 0, 0)
+    TUESDAY = datetime(2024, 10, 8, 9, 0, 0)
+
+    def _loader(self, mocker, *results):
+        timings = PhaseTimings()
+        loader = PeriodSnapshotLoader(mocker.MagicMock(), timings)
+        fetch = mocker.patch.object(loader, "_fetch", side_effect=list(results))
+        return loader, fetch, timings
+
+    def _period_rows(self):
+        topics = [(1, "Tema 1", "Categoria A"), (2, "Tema 2", "Categoria B")]
+        tutors = [
+            (10, 100, 3, False, "Juan", "Perez", "juan@fi.uba.ar"),
+            (11, 101, 2, True, "Ana", "Lopez", "ana@fi.uba.ar"),
+        ]
+        tutor_topics = [(10, 1), (10, 2), (11, 2)]
+        return topics, tutors, tutor_topics
+
+    @pytest.mark.unit
+    def test_groups_and_tutors_share_the_period_topics(self, mocker):
+        topics, tutors, tutor_topics = self._period_rows()
+        unassigned = [(1, 1, [2, 1]), (2, 2, [1])]
+        students = [(1, 1000), (1, 1001), (2, 1002)]
+        loader, fetch, timings = self._loader(
+            mocker, topics, tutors, tutor_topics, unassigned, students
+        )
+
+        snapshot = loader.load("1C2024", groups=True)
+
+        assert fetch.call_count == 5
+        assert [topic.id for topic in snapshot.topics] == [1, 2]
+        juan, ana = snapshot.tutors
+        assert (juan.id, juan.capacity, juan.topics_ids()) == (100, 3, [1, 2])
+        assert ana.topics[0] is snapshot.topics[1]
+        first, second = snapshot.unassigned_groups
+        assert first.topics == [snapshot.topics[1], snapshot.topics[0]]
+        assert first.students == [1000, 1001]
+        assert second.students == [1002]
+        assert snapshot.slots == [] and snapshot.answers == []
+        assert timings.get("mapping") > 0
+
+    @pytest.mark.unit
+    def test_dates_are_indexed_by_tutor_and_group(self, mocker):
+        topics, tutors, tutor_topics = self._period_rows()
+        tutor_dates = [(100, self.MONDAY), (101, self.MONDAY), (101, self.TUESDAY)]
+        slots = [(self.MONDAY,), (self.TUESDAY,)]
+        groups = [(1, 1, None, None, 100), (2, 2, 101, self.TUESDAY, 100)]
+        group_dates = [(1, self.MONDAY), (2, self.TUESDAY)]
+        loader, _, _ = self._loader(
+            mocker,
+            topics,
+            tutors,
+            tutor_topics,
+            tutor_dates,
+            slots,
+            groups,
+            group_dates,
+        )
+
+        snapshot = loader.load("1C2024", dates=True)
+
+        juan, ana = snapshot.tutors
+        assert [slot.date for slot in juan.available_dates] == [self.MONDAY]
+        assert len(ana.available_dates) == 2
+        [evaluator] = snapshot.evaluators()
+        assert evaluator.id == 101 and evaluator is not ana
+        assert [slot.date for slot in snapshot.slots] == [self.MONDAY, self.TUESDAY]
+        first, second = snapshot.assigned_groups
+        assert first.tutor_id() == 100 and first.assigned_date is None
+        assert [slot.date for slot in first.available_dates] == [self.MONDAY]
+        assert second.reviewer_id == 101
+        assert second.assigned_date.date == self.TUESDAY
+
+    @pytest.mark.unit
+    def test_answers_are_grouped_and_fetch_only_missing_topics(self, mocker):
+        answer = datetime(2024, 9, 1, 10, 0, 0)
+        answers = [
+            (answer, "alumno1@fi.uba.ar", 1, 2, 3),
+            (answer, "alumno2@fi.uba.ar", 1, 2, 3),
+        ]
+        loader, fetch, _ = self._loader(
+            mocker,
+            answers,
+            [(1, "Tema 1", "A"), (2, "Tema 2", "A"), (3, "Tema 3", "B")],
+        )
+
+        snapshot = loader.load("1C2024", answers=True)
+
+        assert fetch.call_count == 2
+        [group] = snapshot.answers
+        assert group.id == str(answer.timestamp())
+        assert group.students == ["alumno1@fi.uba.ar", "alumno2@fi.uba.ar"]
+        assert group.get_topic_ids() == [1, 2, 3]
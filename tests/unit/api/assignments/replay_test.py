@@ -0,0 +1,65 @@
+import pytest
+
+from src.api.assignments.replay import main, replay
+from src.core.algorithms.solver_options import SolverOptions
+from src.core.group import UnassignedGroup
+from src.core.snapshot import PeriodSnapshot
+from src.core.topic import Topic
+from src.core.tutor import Tutor
+
+
+class TestReplay:
+
+    @pytest.fixture
+    def snapshot_path(self, tmp_path):
+        topics = [
+            Topic(id=i, title=f"Tema {i}", capacity=1, category="Categoria A")
+            for i in range(1, 4)
+        ]
+        tutors = [
+            Tutor(1, "Name", "Lastname", "Email", capacity=2, topics=topics[:2]),
+            Tutor(2, "Name", "Lastname", "Email", capacity=2, topics=topics[2:]),
+        ]
+        groups = [
+            UnassignedGroup(1, students=[1], topics=topics),
+            UnassignedGroup(2, students=[2], topics=list(reversed(topics))),
+        ]
+        path = str(tmp_path / "1C2024.jsonl")
+        PeriodSnapshot(
+            "1C2024", topics=topics, tutors=tutors, unassigned_groups=groups
+        ).save(path)
+        return path
+
+    @pytest.mark.unit
+    def test_replay_runs_the_solver_with_the_snapshot_inputs(self, snapshot_path):
+        snapshot = PeriodSnapshot.load(snapshot_path)
+
+        result, [stats] = replay(snapshot, "group-tutor-flow", SolverOptions())
+
+        assert len(result.assignments) == 2
+        assert stats["solver"] == "group-tutor-flow"
+        assert stats["inputs"] == {"groups": 2, "topics": 3, "tutors": 2}
+
+    @pytest.mark.unit
+    def test_replay_writes_the_model_and_the_profile(self, snapshot_path, tmp_path):
+        model = tmp_path / "model.mps"
+        profile = tmp_path / "replay.prof"
+
+        main(
+            [
+                snapshot_path,
+                "group-tutor-lp",
+                "--write-model",
+                str(model),
+                "--profile",
+                str(profile),
+            ]
+        )
+
+        assert model.read_text().startswith("*SENSE:Maximize")
+        assert profile.stat().st_size > 0
+
+    @pytest.mark.unit
+    def test_flow_solver_has_no_model_to_write(self, snapshot_path):
+        with pytest.raises(SystemExit):
+            main([snapshot_path, "group-tutor-flow", "--write-model", "flow.mps"])
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from src.api.assignments.models import SolverRun
+from src.api.assignments.repository import SolverRunRepository
+from src.api.assignments.telemetry import SolverRunRecorder
+from src.config.database.database import RequestSession
+
+
+def solver_stats(solver):
+    return {
+        "solver": solver,
+        "status": "optimal",
+        "gap": None,
+        "nodes": None,
+        "variables": 10,
+        "constraints": 5,
+        "inputs": {"groups": 3},
+        "timings": {"solve": 0.5},
+    }
+
+
+class TestSolverRunRecorder:
+
+    def _request_session(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path}/test.db")
+        SolverRun.__table__.create(engine)
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE results (id INTEGER PRIMARY KEY)"))
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        return engine, RequestSession(factory)
+
+    def _count(self, engine, table):
+        with engine.connect() as connection:
+            return connection.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+
+    @pytest.mark.unit
+    def test_runs_are_saved_with_the_request_commit(self, tmp_path):
+        engine, request_session = self._request_session(tmp_path)
+        recorder = SolverRunRecorder(SolverRunRepository(request_session), "1C2025")
+        recorder.solver_stats.append(solver_stats("delivery-lp"))
+
+        recorder.save()
+        request_session.commit()
+        request_session.close()
+
+        assert self._count(engine, "solver_runs") == 1
+
+    @pytest.mark.unit
+    def test_failed_runs_do_not_discard_the_assignment_result(self, tmp_path):
+        engine, request_session = self._request_session(tmp_path)
+        with request_session() as session:
+            session.execute(text("INSERT INTO results (id) VALUES (1)"))
+            session.flush()
+        recorder = SolverRunRecorder(SolverRunRepository(request_session), "1C2025")
+        # solver no acepta nulos, el flush de la telemetria falla
+        recorder.solver_stats.append(solver_stats(None))
+
+        recorder.save()
+        request_session.commit()
+        request_session.close()
+
+        assert self._count(engine, "results") == 1
+        assert self._count(engine, "solver_runs") == 0
@@ -0,0 +1,29 @@
+import pytest
+
+from src.api.auth.dependencies import get_claims
+from src.api.auth.jwt import JwtResolver
+from src.api.auth.schemas import JwtDecoded
+from src.api.auth.service import AuthenticationService
+from src.api.users.exceptions import InvalidCredentials
+
+
+class TestGetClaims:
+
+    @pytest.mark.unit
+    def test_get_claims_returns_the_typed_claims_of_the_token(self):
+        jwt_resolver = JwtResolver()
+        jwt = jwt_resolver.create_token({"id": 105001, "role": "student"}, "Juan")
+
+        claims = get_claims(jwt.access_token, jwt_resolver)
+
+        assert isinstance(claims, JwtDecoded)
+        assert claims.user_id == 105001
+        assert claims.role == "student"
+        assert AuthenticationService().assert_student_role(claims) is claims
+
+    @pytest.mark.unit
+    def test_get_claims_raises_invalid_credentials_if_token_is_invalid(self):
+        with pytest.raises(InvalidCredentials) as e:
+            get_claims("not a jwt", JwtResolver())
+
+        assert e.value.status_code == 401
@@ -1,7 +1,11 @@
 import pytest
 import datetime
+import time
 
-from src.api.auth.jwt import JwtResolver, InvalidJwt
+import jwt as jwt_provider
+
+from src.api.auth.jwt import JwtResolver, InvalidJwt, VerifiedTokenCache
+from src.api.auth.schemas import JwtDecoded
 
 
 class TestJwtResolver:
@@ -46,3 +50,52 @@ class TestJwtResolver:
 
         with pytest.raises(InvalidJwt):
             _ = jwt_resolver.decode_token(jwt_expired)
+
+    @pytest.mark.unit
+    def test_jwt_resolver_verifies_each_token_once_with_cache(self, mocker):
+
+        jwt_resolver = JwtResolver(cache=VerifiedTokenCache())
+        jwt = jwt_resolver.create_token({"id": 1, "role": "student"}, "Juan Perez")
+        decode = mocker.spy(jwt_provider, "decode")
+
+        first = jwt_resolver.decode_token(jwt.access_token)
+        second = jwt_resolver.decode_token(jwt.access_token)
+
+        assert decode.call_count == 1
+        assert first is second
+        assert first.user_id == 1
+        assert first.role == "student"
+
+    @pytest.mark.unit
+    def test_jwt_resolver_does_not_cache_invalid_tokens(self):
+
+        cache = VerifiedTokenCache()
+        jwt_resolver = JwtResolver(cache=cache)
+
+        with pytest.raises(InvalidJwt):
+            jwt_resolver.decode_token("not-a-jwt")
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_verified_token_cache_expires_at_token_exp(self):
+
+        cache = VerifiedTokenCache()
+        expired = JwtDecoded(sub={"id": 1}, name="Juan", exp=time.time() - 1)
+        cache.put("token", expired)
+
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    def test_verified_token_cache_evicts_least_recently_used(self):
+
+        cache = VerifiedTokenCache(max_size=2)
+        exp = time.time() + 60
+        for token in ["a", "b"]:
+            cache.put(token, JwtDecoded(sub={"id": token}, name=token, exp=exp))
+        cache.get("a")
+        cache.put("c", JwtDecoded(sub={"id": "c"}, name="c", exp=exp))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
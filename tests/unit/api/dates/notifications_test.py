@@ -0,0 +1,56 @@
+import datetime as dt
+import pytest
+
+from src.api.dates.notifications import DateNotifier, build_schedules
+from src.api.emails.repository import EmailOutboxRepository
+from src.api.emails.service import EmailOutboxService
+
+
+def recipient(email, role, day, group_number):
+    return {
+        "email": email,
+        "name": email.split("@")[0],
+        "role": role,
+        "date": dt.datetime(2024, 12, day, 10, 0, 0),
+        "group_number": group_number,
+    }
+
+
+class TestDateNotifications:
+
+    @pytest.mark.unit
+    def test_each_person_gets_one_schedule_with_all_of_their_slots(self):
+        recipients = [
+            recipient("alumno@fi.uba.ar", "student", 3, 1),
+            recipient("tutor@fi.uba.ar", "tutor", 3, 1),
+            recipient("tutor@fi.uba.ar", "evaluator", 2, 7),
+        ]
+
+        schedules = build_schedules(recipients)
+
+        assert [s.email for s in schedules] == ["alumno@fi.uba.ar", "tutor@fi.uba.ar"]
+        subject, body = schedules[1].render()
+        assert subject == "Fechas de exposicion asignadas"
+        assert body.index("grupo 7 (como evaluador)") < body.index(
+            "grupo 1 (como tutor)"
+        )
+        assert "Hola tutor," in body
+
+    @pytest.mark.unit
+    def test_notifier_queues_one_email_per_person_in_the_outbox(self, mocker):
+        recipients = [recipient(f"{i}@fi.uba.ar", "student", 3, i) for i in range(20)]
+        recipients.append(recipient("0@fi.uba.ar", "student", 4, 21))
+        repo = EmailOutboxRepository(None)
+        enqueue = mocker.patch.object(repo, "enqueue", return_value=None)
+
+        result = DateNotifier(EmailOutboxService(repo)).notify(
+            build_schedules(recipients)
+        )
+
+        assert result == {"recipients": 20, "queued": 20}
+        # Todos los mails se agregan al outbox con un unico flush
+        [call] = enqueue.call_args_list
+        emails = call.args[0]
+        assert [email.to for email in emails] == [[f"{i}@fi.uba.ar"] for i in range(20)]
+        assert all(email.cc == [] for email in emails)
+        assert "grupo 21" in emails[0].body
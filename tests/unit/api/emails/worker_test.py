@@ -0,0 +1,141 @@
+import asyncio
+import pytest
+
+from src.api.emails.repository import EmailOutboxRepository
+from src.api.emails.service import EmailOutboxService
+from src.api.emails.worker import EmailOutboxWorker, RateLimiter
+from src.config.database.models import OutboxEmail
+from src.core.email_client import StubEmailClient
+
+
+def outbox_email(id, to, subject="Asunto", attempts=1, cc=[]):
+    return OutboxEmail(
+        id=id,
+        to=to,
+        cc=cc,
+        subject=subject,
+        body="Cuerpo",
+        content_type="text/plain",
+        attempts=attempts,
+    )
+
+
+class FailingEmailClient(StubEmailClient):
+
+    async def send_batch(self, subject, body, content_type, personalizations):
+        raise ConnectionError("Connection reset")
+
+
+class TestEmailOutboxWorker:
+
+    def _repository(self, mocker, emails):
+        repo = EmailOutboxRepository(None)
+        mocker.patch.object(repo, "claim_due", return_value=emails)
+        mocker.patch.object(repo, "mark_sent", return_value=None)
+        mocker.patch.object(repo, "reschedule", return_value=None)
+        mocker.patch.object(repo, "mark_failed", return_value=None)
+        return repo
+
+    @pytest.mark.unit
+    def test_emails_with_same_content_are_sent_in_one_call(self, mocker):
+        emails = [
+            outbox_email(1, ["a@fi.uba.ar"], cc=["admin@fi.uba.ar"]),
+            outbox_email(2, ["b@fi.uba.ar", "c@fi.uba.ar"]),
+            outbox_email(3, ["d@fi.uba.ar"], subject="Otro asunto"),
+        ]
+        repo = self._repository(mocker, emails)
+        client = StubEmailClient()
+        worker = EmailOutboxWorker(repo, client, rate_limit=0)
+
+        claimed = asyncio.run(worker.run_once())
+
+        assert claimed == 3
+        assert len(client.batches) == 2
+        batch = next(b for b in client.batches if b["subject"] == "Asunto")
+        assert batch["personalizations"] == [
+            {"to": [{"email": "a@fi.uba.ar"}], "cc": [{"email": "admin@fi.uba.ar"}]},
+            {"to": [{"email": "b@fi.uba.ar"}, {"email": "c@fi.uba.ar"}]},
+        ]
+        sent = sorted(
+            id for call in repo.mark_sent.call_args_list for id in call.args[0]
+        )
+        assert sent == [1, 2, 3]
+
+    @pytest.mark.unit
+    def test_failed_calls_are_retried_with_backoff(self, mocker):
+        emails = [outbox_email(1, ["a@fi.uba.ar"], attempts=1)]
+        emails += [outbox_email(2, ["b@fi.uba.ar"], attempts=3)]
+        repo = self._repository(mocker, emails)
+        worker = EmailOutboxWorker(
+            repo, FailingEmailClient(), rate_limit=0, backoff=10, max_attempts=5
+        )
+
+        asyncio.run(worker.run_once())
+
+        delays = {
+            tuple(call.args[0]): call.args[2] for call in repo.reschedule.call_args_list
+        }
+        assert delays == {(1,): 10, (2,): 40}
+        repo.mark_failed.assert_not_called()
+
+    @pytest.mark.unit
+    def test_emails_fail_after_max_attempts(self, mocker):
+        emails = [outbox_email(1, ["a@fi.uba.ar"], attempts=5)]
+        repo = self._repository(mocker, emails)
+        worker = EmailOutboxWorker(
+            repo, StubEmailClient(status=503), rate_limit=0, max_attempts=5
+        )
+
+        asyncio.run(worker.run_once())
+
+        repo.mark_failed.assert_called_once_with([1], "Sendgrid responded 503")
+        repo.reschedule.assert_not_called()
+
+    @pytest.mark.unit
+    def test_rejected_emails_are_not_retried(self, mocker):
+        emails = [outbox_email(1, ["invalid"], attempts=1)]
+        repo = self._repository(mocker, emails)
+        worker = EmailOutboxWorker(repo, StubEmailClient(status=400), rate_limit=0)
+
+        asyncio.run(worker.run_once())
+
+        repo.mark_failed.assert_called_once_with([1], "Sendgrid responded 400")
+        repo.reschedule.assert_not_called()
+
+
+class TestRateLimiter:
+
+    @pytest.mark.unit
+    def test_calls_are_spaced_by_the_rate(self):
+        limiter = RateLimiter(rate=20)
+
+        async def calls():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for _ in range(5):
+                await limiter.wait()
+            return loop.time() - start
+
+        assert asyncio.run(calls()) >= 4 / 20
+
+
+class TestEmailOutboxService:
+
+    @pytest.mark.unit
+    def test_send_emails_queues_one_email_without_repeated_receivers(self, mocker):
+        repo = EmailOutboxRepository(None)
+        enqueue = mocker.patch.object(repo, "enqueue", return_value=None)
+        service = EmailOutboxService(repo)
+
+        response = service.send_emails(
+            ["a@fi.uba.ar", "b@fi.uba.ar", "a@fi.uba.ar"],
+            "Asunto",
+            "Cuerpo",
+            cc=["b@fi.uba.ar", "admin@fi.uba.ar"],
+        )
+
+        assert response == 202
+        [email] = enqueue.call_args.args[0]
+        assert email.to == ["a@fi.uba.ar", "b@fi.uba.ar"]
+        assert email.cc == ["admin@fi.uba.ar"]
+        assert email.content_type == "text/plain"
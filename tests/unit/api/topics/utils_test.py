@@ -0,0 +1,58 @@
+import io
+import pytest
+
+from src.api.exceptions import InvalidCsv
+from src.api.topics.utils import TopicCsvFile
+
+
+class TestTopicCsvFile:
+
+    def _file(self, content: str):
+        return io.BytesIO(content.encode("utf-8"))
+
+    @pytest.mark.unit
+    def test_rows_keep_their_line_number(self):
+        csv_file = TopicCsvFile(
+            self._file(
+                "TEMA,CATEGORIA,TUTOR,CAPACIDAD\n"
+                "topic 1,category 1,tutor1@fi.uba.ar,1\n"
+                "\n"
+                " topic 2 ,category 1,tutor2@fi.uba.ar,3"
+            )
+        )
+
+        rows = list(csv_file.get_rows())
+
+        assert rows == [
+            {
+                "line": 2,
+                "topic": "topic 1",
+                "category": "category 1",
+                "tutor_email": "tutor1@fi.uba.ar",
+                "capacity": 1,
+            },
+            {
+                "line": 4,
+                "topic": "topic 2",
+                "category": "category 1",
+                "tutor_email": "tutor2@fi.uba.ar",
+                "capacity": 3,
+            },
+        ]
+
+    @pytest.mark.unit
+    def test_invalid_headers_raise_invalid_csv(self):
+        with pytest.raises(InvalidCsv):
+            TopicCsvFile(self._file("TEMA,TUTOR\ntopic 1,tutor1@fi.uba.ar\n"))
+
+    @pytest.mark.unit
+    def test_invalid_capacity_raises_invalid_csv(self):
+        csv_file = TopicCsvFile(
+            self._file(
+                "TEMA,CATEGORIA,TUTOR,CAPACIDAD\n"
+                "topic 1,category 1,tutor1@fi.uba.ar,uno\n"
+            )
+        )
+
+        with pytest.raises(InvalidCsv):
+            list(csv_file.get_rows())
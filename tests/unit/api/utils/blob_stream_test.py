@@ -0,0 +1,124 @@
+import asyncio
+import datetime
+import pytest
+
+from src.api.utils.blob_stream import BlobStream
+
+
+class FakeStorageClient:
+
+    def __init__(self, content: bytes, etag: str = '"0x8DC"'):
+        self.content = content
+        self.etag = etag
+        self.downloads = []
+
+    async def get_properties(self, blob_name):
+        return {
+            "size": len(self.content),
+            "etag": self.etag,
+            "last_modified": datetime.datetime(2024, 10, 7, 9, 0, 0),
+        }
+
+    async def download_stream(self, blob_name, offset=None, length=None, etag=None):
+        self.downloads.append((offset, length, etag))
+        start = offset or 0
+        end = len(self.content) if length is None else start + length
+
+        async def chunks():
+            for i in range(start, end, 4):
+                yield self.content[i : min(i + 4, end)]
+
+        return chunks()
+
+
+class TestBlobStream:
+
+    def _response(self, client, range_header=None, if_none_match=None):
+        async def build():
+            blob_stream = await BlobStream.open(
+                client, "blob", range_header=range_header, if_none_match=if_none_match
+            )
+            return await blob_stream.to_response("file.pdf", "application/pdf")
+
+        return asyncio.run(build())
+
+    def _body(self, response):
+        async def read():
+            return [chunk async for chunk in response.body_iterator]
+
+        return b"".join(asyncio.run(read()))
+
+    @pytest.mark.unit
+    def test_full_download_is_streamed_in_chunks(self):
+        client = FakeStorageClient(b"0123456789")
+
+        response = self._response(client)
+
+        assert response.status_code == 200
+        assert response.headers["content-length"] == "10"
+        assert response.headers["etag"] == '"0x8DC"'
+        assert response.headers["accept-ranges"] == "bytes"
+        assert self._body(response) == b"0123456789"
+        assert client.downloads == [(None, None, '"0x8DC"')]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "range_header, content_range, body",
+        [
+            ("bytes=2-5", "bytes 2-5/10", b"2345"),
+            ("bytes=7-", "bytes 7-9/10", b"789"),
+            ("bytes=-3", "bytes 7-9/10", b"789"),
+            ("bytes=8-100", "bytes 8-9/10", b"89"),
+        ],
+    )
+    def test_range_returns_partial_content(self, range_header, content_range, body):
+        client = FakeStorageClient(b"0123456789")
+
+        response = self._response(client, range_header=range_header)
+
+        assert response.status_code == 206
+        assert response.headers["content-range"] == content_range
+        assert response.headers["content-length"] == str(len(body))
+        assert self._body(response) == body
+
+    @pytest.mark.unit
+    def test_range_out_of_the_file_is_not_satisfiable(self):
+        client = FakeStorageClient(b"0123456789")
+
+        response = self._response(client, range_header="bytes=10-")
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+        assert client.downloads == []
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("range_header", ["bytes=1-2,4-5", "items=0-1", "bytes=-"])
+    def test_unsupported_ranges_return_the_whole_file(self, range_header):
+        client = FakeStorageClient(b"0123456789")
+
+        response = self._response(client, range_header=range_header)
+
+        assert response.status_code == 200
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "if_none_match", ['"0x8DC"', 'W/"0x8DC"', '"a", "0x8DC"', "*"]
+    )
+    def test_matching_etag_returns_not_modified(self, if_none_match):
+        client = FakeStorageClient(b"0123456789")
+
+        response = self._response(
+            client, range_header="bytes=0-1", if_none_match=if_none_match
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"0x8DC"'
+        assert client.downloads == []
+
+    @pytest.mark.unit
+    def test_different_etag_downloads_the_file(self):
+        client = FakeStorageClient(b"0123456789")
+
+        response = self._response(client, if_none_match='"old"')
+
+        assert response.status_code == 200
@@ -0,0 +1,98 @@
+import csv
+import io
+import pytest
+
+from src.api.exceptions import InvalidCsv
+from src.api.students.exceptions import StudentDuplicated
+from src.api.students.utils import StudentCsvFile
+from src.api.tutors.exceptions import TutorDuplicated
+from src.api.tutors.utils import TutorCsvFile
+from src.api.utils.csv_stream import CopySource, CsvStream
+
+
+class TestCsvStream:
+
+    def _file(self, content: str):
+        return io.BytesIO(content.encode("utf-8"))
+
+    @pytest.mark.unit
+    def test_invalid_headers_raise_before_reading_rows(self):
+        with pytest.raises(InvalidCsv):
+            CsvStream(self._file("A,B\n1,2\n"), ["A", "C"])
+
+    @pytest.mark.unit
+    def test_rows_are_read_lazily(self):
+        stream = CsvStream(self._file("\ufeffA,B\n1,2\n3,4\n"), ["A", "B"])
+        rows = stream.rows()
+
+        assert next(rows) == {"A": "1", "B": "2"}
+        assert next(rows) == {"A": "3", "B": "4"}
+        assert next(rows, None) is None
+
+    @pytest.mark.unit
+    def test_duplicates_raise_the_given_error(self):
+        stream = CsvStream(
+            self._file("A,B\n1,2\n1,3\n"),
+            ["A", "B"],
+            unique_columns=["A"],
+            duplicated_error=StudentDuplicated,
+        )
+
+        with pytest.raises(StudentDuplicated):
+            list(stream.rows())
+
+    @pytest.mark.unit
+    def test_student_csv_rejects_non_numeric_ids(self):
+        csv_file = StudentCsvFile(
+            self._file("NOMBRE,APELLIDO,PADRON,MAIL\nJuan,Perez,abc,j@fi.uba.ar\n")
+        )
+
+        with pytest.raises(InvalidCsv):
+            list(csv_file.get_info_as_rows())
+
+    @pytest.mark.unit
+    def test_tutor_csv_reads_the_tutors_once_by_email(self):
+        csv_file = TutorCsvFile(
+            self._file(
+                "NOMBRE,APELLIDO,DNI,MAIL,CAPACIDAD\n"
+                "Juan,Perez,1,j@fi.uba.ar,3\n"
+                "Ana,Gomez,2,a@fi.uba.ar,2\n"
+            )
+        )
+
+        tutors = csv_file.get_tutors()
+
+        assert csv_file.get_tutors_emails() == ["j@fi.uba.ar", "a@fi.uba.ar"]
+        assert tutors["a@fi.uba.ar"].id == 2
+        assert tutors["a@fi.uba.ar"].capacity == 2
+
+    @pytest.mark.unit
+    def test_tutor_csv_rejects_repeated_rows(self):
+        csv_file = TutorCsvFile(
+            self._file(
+                "NOMBRE,APELLIDO,DNI,MAIL,CAPACIDAD\n"
+                "Juan,Perez,1,j@fi.uba.ar,3\n"
+                "Juan,Perez,1,j@fi.uba.ar,3\n"
+            )
+        )
+
+        with pytest.raises(TutorDuplicated):
+            csv_file.get_tutors()
+
+
+class TestCopySource:
+
+    @pytest.mark.unit
+    def test_read_in_chunks_returns_every_row_as_csv(self):
+        rows = [(i, f"name, {i}", None) for i in range(1000)]
+        source = CopySource(iter(rows))
+
+        chunks = []
+        while chunk := source.read(100):
+            assert len(chunk) <= 100
+            chunks.append(chunk)
+
+        parsed = list(csv.reader(io.StringIO("".join(chunks))))
+        assert source.count == 1000
+        assert parsed[0] == ["0", "name, 0", ""]
+        assert len(parsed) == 1000
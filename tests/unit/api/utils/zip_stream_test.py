@@ -0,0 +1,89 @@
+import asyncio
+import datetime
+import io
+import zipfile
+import pytest
+
+from src.api.utils.zip_stream import ZipEntry, ZipStream
+from src.core.local_storage_client import BlobNotFound
+
+
+class FakeStorageClient:
+
+    def __init__(self, blobs: dict[str, bytes]):
+        self.blobs = blobs
+        self.active = 0
+        self.max_active = 0
+
+    async def download_stream(self, blob_name, offset=None, length=None, etag=None):
+        if blob_name not in self.blobs:
+            raise BlobNotFound(f"Blob {blob_name} not found")
+        content = self.blobs[blob_name]
+
+        async def chunks():
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            try:
+                for i in range(0, len(content), 4):
+                    await asyncio.sleep(0)
+                    yield content[i : i + 4]
+            finally:
+                self.active -= 1
+
+        return chunks()
+
+
+class TestZipStream:
+
+    def _entries(self, names):
+        return [
+            ZipEntry(
+                blob_name=f"1C2024/{name}",
+                arcname=name,
+                size=len(name),
+                last_modified=datetime.datetime(2024, 10, 7, 9, 0, 0),
+            )
+            for name in names
+        ]
+
+    def _read(self, zip_stream):
+        async def read():
+            return [chunk async for chunk in zip_stream.chunks()]
+
+        chunks = asyncio.run(read())
+        return chunks, zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+    @pytest.mark.unit
+    def test_zip_contains_every_blob_in_order(self):
+        blobs = {f"1C2024/{i}/informe-final.pdf": bytes([i]) * 10 for i in range(5)}
+        client = FakeStorageClient(blobs)
+        names = [f"{i}/informe-final.pdf" for i in range(5)]
+
+        chunks, archive = self._read(ZipStream(client, self._entries(names)))
+
+        assert archive.namelist() == names
+        for i, name in enumerate(names):
+            assert archive.read(name) == bytes([i]) * 10
+        assert archive.testzip() is None
+        assert len(chunks) > len(names)
+
+    @pytest.mark.unit
+    def test_downloads_are_bounded_by_prefetch(self):
+        blobs = {f"1C2024/{i}/informe-final.pdf": b"x" * 40 for i in range(10)}
+        client = FakeStorageClient(blobs)
+        names = [f"{i}/informe-final.pdf" for i in range(10)]
+
+        _, archive = self._read(ZipStream(client, self._entries(names), prefetch=3))
+
+        assert len(archive.namelist()) == 10
+        assert 1 < client.max_active <= 3
+
+    @pytest.mark.unit
+    def test_missing_blobs_are_skipped(self):
+        client = FakeStorageClient({"1C2024/2/informe-final.pdf": b"final"})
+        names = ["1/informe-final.pdf", "2/informe-final.pdf"]
+
+        _, archive = self._read(ZipStream(client, self._entries(names)))
+
+        assert archive.namelist() == ["2/informe-final.pdf"]
+        assert archive.read("2/informe-final.pdf") == b"final"
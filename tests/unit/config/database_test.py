@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from src.config.database.database import RequestSession
+from src.config.database.pool import MeteredQueuePool
+
+
+class TestRequestSession:
+
+    def _factory(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path}/test.db", poolclass=MeteredQueuePool, pool_size=2
+        )
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        return engine, sessionmaker(bind=engine, expire_on_commit=False)
+
+    @pytest.mark.unit
+    def test_repositories_share_one_session_and_connection(self, tmp_path):
+        engine, factory = self._factory(tmp_path)
+        request_session = RequestSession(factory)
+
+        with request_session() as first:
+            first.execute(text("INSERT INTO items (id) VALUES (1)"))
+        with request_session() as second:
+            second.execute(text("INSERT INTO items (id) VALUES (2)"))
+        request_session.commit()
+        request_session.close()
+
+        assert first is second
+        assert engine.pool.stats()["checkouts"] == 2
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT count(*) FROM items")).scalar() == 2
+
+    @pytest.mark.unit
+    def test_caught_error_does_not_discard_earlier_writes(self, tmp_path):
+        engine, factory = self._factory(tmp_path)
+        request_session = RequestSession(factory)
+
+        with request_session() as session:
+            session.execute(text("INSERT INTO items (id) VALUES (1)"))
+        with pytest.raises(ValueError):
+            with request_session() as session:
+                session.execute(text("INSERT INTO items (id) VALUES (2)"))
+                raise ValueError()
+        request_session.commit()
+        request_session.close()
+
+        with engine.connect() as connection:
+            ids = connection.execute(text("SELECT id FROM items")).scalars().all()
+        assert ids == [1, 2]
+
+    @pytest.mark.unit
+    def test_failed_statement_inside_a_savepoint_keeps_the_request(self, tmp_path):
+        engine, factory = self._factory(tmp_path)
+        request_session = RequestSession(factory)
+
+        with request_session() as session:
+            session.execute(text("INSERT INTO items (id) VALUES (1)"))
+        with pytest.raises(IntegrityError):
+            with request_session() as session:
+                with session.begin_nested():
+                    session.execute(text("INSERT INTO items (id) VALUES (1)"))
+        with request_session() as session:
+            session.execute(text("INSERT INTO items (id) VALUES (2)"))
+        request_session.commit()
+        request_session.close()
+
+        with engine.connect() as connection:
+            ids = connection.execute(text("SELECT id FROM items")).scalars().all()
+        assert ids == [1, 2]
+
+    @pytest.mark.unit
+    def test_pool_stats_track_checkouts_and_checkins(self, tmp_path):
+        engine, _ = self._factory(tmp_path)
+
+        with engine.connect():
+            stats = engine.pool.stats()
+            assert stats["checked_out"] == 1
+        stats = engine.pool.stats()
+
+        assert stats["checked_out"] == 0
+        assert stats["checkins"] == stats["checkouts"]
+        assert stats["wait_max"] >= stats["wait_avg"] >= 0
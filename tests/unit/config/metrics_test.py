@@ -0,0 +1,121 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from src.api.utils.server_timing import ServerTimingMiddleware
+from src.config.metrics import (
+    Histogram,
+    RequestTimings,
+    SqlLogSampler,
+    instrument_engine,
+    metrics,
+    request_timings,
+)
+
+
+class TestHistogram:
+
+    @pytest.mark.unit
+    def test_render_accumulates_buckets_by_labels(self):
+        histogram = Histogram(
+            "latency_seconds", "Latency", labels=("route",), buckets=(0.1, 1)
+        )
+        histogram.observe(0.05, route="/a")
+        histogram.observe(0.5, route="/a")
+        histogram.observe(3, route="/a")
+        histogram.observe(0.5, route='/b"')
+
+        lines = histogram.render()
+
+        assert lines[:2] == [
+            "# HELP latency_seconds Latency",
+            "# TYPE latency_seconds histogram",
+        ]
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{route="/a",le="1"} 2' in lines
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+        assert 'latency_seconds_sum{route="/a"} 3.55' in lines
+        assert 'latency_seconds_count{route="/a"} 3' in lines
+        assert 'latency_seconds_count{route="/b\\""} 1' in lines
+
+
+class TestSqlInstrumentation:
+
+    @pytest.mark.unit
+    def test_queries_are_counted_in_the_current_request(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path}/test.db")
+        instrument_engine(engine)
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+        finally:
+            request_timings.reset(token)
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 3"))
+
+        assert timings.queries == 2
+        assert timings.sql_time > 0
+
+    @pytest.mark.unit
+    def test_failed_statements_do_not_leave_their_start_time(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path}/test.db")
+        instrument_engine(engine)
+
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing_table"))
+            connection.execute(text("SELECT 1"))
+
+            assert connection.connection.info["query_start"] == []
+
+    @pytest.mark.unit
+    def test_only_sampled_and_slow_statements_are_logged(self, mocker):
+        info = mocker.patch("src.config.metrics.logger.info")
+
+        SqlLogSampler(sample_rate=0, slow_ms=0).log("SELECT 1", 10)
+        SqlLogSampler(sample_rate=0, slow_ms=100).log("SELECT 2", 0.05)
+        SqlLogSampler(sample_rate=0, slow_ms=100).log("SELECT 3", 0.2)
+        SqlLogSampler(sample_rate=1).log("SELECT 4", 0.001)
+
+        logged = [call.args[0] for call in info.call_args_list]
+        assert len(logged) == 2
+        assert logged[0].startswith("Slow SQL") and logged[0].endswith("SELECT 3")
+        assert logged[1].endswith("SELECT 4")
+
+
+class TestServerTimingMiddleware:
+
+    @pytest.mark.unit
+    def test_response_has_timings_and_route_is_recorded(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path}/test.db")
+        instrument_engine(engine)
+        app = FastAPI()
+        app.add_middleware(ServerTimingMiddleware)
+
+        @app.get("/timed/items/{item_id}")
+        def item(item_id: int):
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            return item_id
+
+        response = TestClient(app).get("/timed/items/7")
+
+        assert response.status_code == 200
+        server_timing = response.headers["Server-Timing"]
+        assert server_timing.startswith("app;dur=")
+        assert 'desc="1 queries"' in server_timing
+        rendered = metrics.render()
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="/timed/items/{item_id}",status="200"} 1'
+        ) in rendered
+        assert (
+            'http_request_db_queries_bucket{method="GET",'
+            'route="/timed/items/{item_id}",le="1"} 1'
+        ) in rendered
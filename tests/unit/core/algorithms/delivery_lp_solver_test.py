@@ -0,0 +1,251 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+
+from src.core.algorithms.date.delivery_lp_solver import DeliveryLPSolver
+from src.core.algorithms.solver_options import SolverOptions
+from src.core.date_slots import DateSlot
+from src.core.group import AssignedGroup
+from src.core.tutor import Tutor
+
+
+class TestDeliveryLPSolver:
+
+    def _create_slots(self, amount: int) -> list[DateSlot]:
+        """Crea slots de lunes a viernes de 9 a 18hs a partir del 7/10/2024"""
+        slots = []
+        day = datetime(2024, 10, 7, 9, 0, 0)
+        while len(slots) < amount:
+            if day.isoweekday() <= 5:
+                for hour in range(9):
+                    slots.append(DateSlot(start_time=day + timedelta(hours=hour)))
+            day += timedelta(days=1)
+
+        return slots[:amount]
+
+    @pytest.mark.unit
+    def test_each_group_gets_one_date_and_evaluator(self):
+        slots = self._create_slots(4)
+        tutor = Tutor(1, "Tutor", "Uno", "tutor@fi.uba.ar", available_dates=slots)
+        evaluators = [
+            Tutor(2, "Eval", "Dos", "eval2@fi.uba.ar", available_dates=slots),
+            Tutor(3, "Eval", "Tres", "eval3@fi.uba.ar", available_dates=slots),
+        ]
+        groups = [
+            AssignedGroup(1, tutor=tutor, available_dates=slots[:2], group_number=1),
+            AssignedGroup(2, tutor=tutor, available_dates=slots[1:3], group_number=2),
+        ]
+
+        solver = DeliveryLPSolver(
+            groups=groups,
+            tutors=[tutor],
+            evaluators=evaluators,
+            available_dates=slots,
+        )
+        result = solver.solve()
+
+        assert result.status == 1
+        assert len(result.assignments) == 2
+        assert {a.group_id for a in result.assignments} == {1, 2}
+        assert len({a.date.date for a in result.assignments}) == 2
+        assert all(a.evaluator_id != a.tutor_id for a in result.assignments)
+
+    @pytest.mark.unit
+    def test_indexes_cover_every_decision_variable(self):
+        slots = self._create_slots(6)
+        tutor = Tutor(1, "Tutor", "Uno", "tutor@fi.uba.ar", available_dates=slots)
+        evaluator = Tutor(2, "Eval", "Dos", "eval@fi.uba.ar", available_dates=slots)
+        groups = [
+            AssignedGroup(1, tutor=tutor, available_dates=slots[:3]),
+            AssignedGroup(2, tutor=tutor, available_dates=slots[3:]),
+        ]
+
+        solver = DeliveryLPSolver(
+            groups=groups,
+            tutors=[tutor],
+            evaluators=[evaluator],
+            available_dates=slots,
+        )
+        solver.build_model()
+
+        total = len(solver._decision_variables)
+        assert total == 6
+        assert sum(len(v) for v in solver._vars_by_group.values()) == total
+        assert sum(len(v) for v in solver._vars_by_date.values()) == total
+        assert sum(len(v) for v in solver._vars_by_evaluator_week.values()) == total
+        assert len(solver._dates_by_group[1]) == 3
+        assert solver.build_time > 0
+
+    def _create_instance(self):
+        slots = self._create_slots(8)
+        tutor = Tutor(1, "Tutor", "Uno", "tutor@fi.uba.ar", available_dates=slots)
+        evaluators = [
+            Tutor(2, "Eval", "Dos", "eval2@fi.uba.ar", available_dates=slots),
+            Tutor(3, "Eval", "Tres", "eval3@fi.uba.ar", available_dates=slots),
+        ]
+        groups = [
+            AssignedGroup(i, tutor=tutor, available_dates=slots[i - 1 : i + 4])
+            for i in range(1, 5)
+        ]
+        return slots, tutor, evaluators, groups
+
+    @pytest.mark.unit
+    def test_incremental_solve_keeps_feasible_assignments(self):
+        slots, tutor, evaluators, groups = self._create_instance()
+        previous = DeliveryLPSolver(
+            groups=groups, tutors=[tutor], evaluators=evaluators, available_dates=slots
+        ).solve()
+        dates = {a.group_id: a.date.date for a in previous.assignments}
+
+        # El grupo 1 ya no puede en la fecha que tenia asignada
+        slots, tutor, evaluators, groups = self._create_instance()
+        groups[0]._available_dates = [
+            d for d in groups[0].available_dates if d.date != dates[1]
+        ]
+        solver = DeliveryLPSolver(
+            groups=groups,
+            tutors=[tutor],
+            evaluators=evaluators,
+            available_dates=slots,
+            previous_result=previous,
+        )
+        result = solver.solve()
+
+        new_dates = {a.group_id: a.date.date for a in result.assignments}
+        assert result.status == 1
+        assert solver.fixed_groups == {2, 3, 4}
+        assert all(new_dates[g] == dates[g] for g in [2, 3, 4])
+        assert new_dates[1] != dates[1]
+
+    @pytest.mark.unit
+    def test_incremental_solve_releases_fixed_assignments_when_infeasible(self):
+        slots, tutor, evaluators, groups = self._create_instance()
+        previous = DeliveryLPSolver(
+            groups=groups, tutors=[tutor], evaluators=evaluators, available_dates=slots
+        ).solve()
+        dates = {a.group_id: a.date.date for a in previous.assignments}
+
+        # El grupo 1 solo puede en fechas que ya tienen otros grupos
+        slots, tutor, evaluators, groups = self._create_instance()
+        groups[0]._available_dates = [
+            d for d in slots if d.date in dates.values() and d.date != dates[1]
+        ]
+        solver = DeliveryLPSolver(
+            groups=groups,
+            tutors=[tutor],
+            evaluators=evaluators,
+            available_dates=slots,
+            previous_result=previous,
+        )
+        result = solver.solve()
+
+        assert result.status == 1
+        assert solver.fixed_groups == set()
+        assert len(result.assignments) == 4
+
+    @pytest.mark.unit
+    def test_incremental_solve_reopens_requested_groups(self):
+        slots, tutor, evaluators, groups = self._create_instance()
+        previous = DeliveryLPSolver(
+            groups=groups, tutors=[tutor], evaluators=evaluators, available_dates=slots
+        ).solve()
+
+        slots, tutor, evaluators, groups = self._create_instance()
+        solver = DeliveryLPSolver(
+            groups=groups,
+            tutors=[tutor],
+            evaluators=evaluators,
+            available_dates=slots,
+            previous_result=previous,
+            reopened_groups={1, 2},
+        )
+        result = solver.solve()
+
+        assert result.status == 1
+        assert solver.fixed_groups == {3, 4}
+        assert len(result.assignments) == 4
+
+    @pytest.mark.unit
+    def test_time_limited_solve_returns_best_incumbent_with_gap(self):
+        rng = random.Random(42)
+        slots = self._create_slots(30)
+        tutors = [
+            Tutor(i, "Tutor", str(i), f"tutor{i}@fi.uba.ar", available_dates=slots)
+            for i in range(1, 11)
+        ]
+        evaluators = [
+            Tutor(
+                100 + i,
+                "Eval",
+                str(i),
+                f"eval{i}@fi.uba.ar",
+                available_dates=rng.sample(slots, 15),
+            )
+            for i in range(10)
+        ]
+        groups = [
+            AssignedGroup(
+                i,
+                tutor=tutors[i % len(tutors)],
+                available_dates=rng.sample(slots, 8),
+                group_number=i,
+            )
+            for i in range(1, 16)
+        ]
+
+        solver = DeliveryLPSolver(
+            groups=groups,
+            tutors=tutors,
+            evaluators=evaluators,
+            available_dates=slots,
+            max_groups_per_week=15,
+            options=SolverOptions(time_limit=1),
+        )
+        result = solver.solve()
+
+        assert result.status == 1
+        assert len(result.assignments) == 15
+        assert result.gap is not None and result.gap >= 0
+
+    @pytest.mark.performance
+    def test_build_time_with_two_hundred_groups(self):
+        rng = random.Random(42)
+        slots = self._create_slots(300)
+        tutors = [
+            Tutor(i, "Tutor", str(i), f"tutor{i}@fi.uba.ar", available_dates=slots)
+            for i in range(1, 21)
+        ]
+        evaluators = [
+            Tutor(
+                100 + i,
+                "Eval",
+                str(i),
+                f"eval{i}@fi.uba.ar",
+                available_dates=rng.sample(slots, 60),
+            )
+            for i in range(40)
+        ]
+        groups = [
+            AssignedGroup(
+                i,
+                tutor=tutors[i % len(tutors)],
+                available_dates=rng.sample(slots, 10),
+                group_number=i,
+            )
+            for i in range(1, 201)
+        ]
+
+        solver = DeliveryLPSolver(
+            groups=groups,
+            tutors=tutors,
+            evaluators=evaluators,
+            available_dates=slots,
+        )
+        solver.build_model()
+
+        print(
+            f"200 groups, 40 evaluators, 300 slots, "
+            f"{len(solver._decision_variables)} variables - "
+            f"Build time: {solver.build_time:.3f} seconds"
+        )
+        assert len(solver._decision_variables) > 0
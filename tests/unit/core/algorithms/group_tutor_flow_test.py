@@ -1,3 +1,5 @@
+import random
+import time
 import pytest
 
 from src.core.algorithms.topic_tutor.group_tutor_flow_solver import GroupTutorFlowSolver
@@ -116,3 +118,77 @@ class TestGroupTutorFlowSolver:
         solver = GroupTutorFlowSolver(groups, topics, tutors)
         result = solver.solve()
         assert len(result.assignments) == 2
+
+    def _create_instance(self, groups, topics, tutors, seed=42):
+        rng = random.Random(seed)
+        topics = [
+            Topic(id=i, title=f"Tema {i}", capacity=rng.randint(1, 3), category="A")
+            for i in range(topics)
+        ]
+        groups = [
+            UnassignedGroup(i, topics=rng.sample(topics, 3), students=[])
+            for i in range(1, groups + 1)
+        ]
+        tutors = [
+            Tutor(
+                i,
+                "Email",
+                "Name",
+                "Lastname",
+                capacity=rng.randint(4, 10),
+                topics=rng.sample(topics, 6),
+            )
+            for i in range(1, tutors + 1)
+        ]
+        return groups, topics, tutors
+
+    def _cost(self, result):
+        return sum(a.group.preference_of(a.topic) for a in result.assignments)
+
+    @pytest.mark.unit
+    def test_native_and_networkx_backends_find_the_same_cost(self):
+        groups, topics, tutors = self._create_instance(40, 10, 12)
+
+        native = GroupTutorFlowSolver(groups, topics, tutors, backend="native")
+        reference = GroupTutorFlowSolver(groups, topics, tutors, backend="networkx")
+        native_result = native.solve()
+        reference_result = reference.solve()
+
+        assert native_result.status == reference_result.status == 1
+        assert self._cost(native_result) == self._cost(reference_result)
+
+    @pytest.mark.unit
+    def test_assignments_are_decoded_from_the_flow(self):
+        groups, topics, tutors = self._create_instance(40, 10, 12)
+
+        result = GroupTutorFlowSolver(groups, topics, tutors).solve()
+
+        assert {a.group.id for a in result.assignments} == {g.id for g in groups}
+        load = {}
+        for assignment in result.assignments:
+            assert assignment.tutor.capacity_of(assignment.topic) > 0
+            key = (assignment.tutor.id, assignment.topic.id)
+            load[key] = load.get(key, 0) + 1
+        for tutor in tutors:
+            assigned = sum(v for (u, _), v in load.items() if u == tutor.id)
+            assert assigned <= tutor.capacity
+            for topic in tutor.topics:
+                assert load.get((tutor.id, topic.id), 0) <= topic.capacity
+
+    @pytest.mark.performance
+    def test_backends_with_500_groups_60_topics_80_tutors(self):
+        groups, topics, tutors = self._create_instance(500, 60, 80)
+
+        costs = {}
+        for backend in ["native", "networkx"]:
+            solver = GroupTutorFlowSolver(groups, topics, tutors, backend=backend)
+            start = time.perf_counter()
+            result = solver.solve()
+            elapsed = time.perf_counter() - start
+            costs[backend] = self._cost(result)
+            print(
+                f"500 groups, 60 topics, 80 tutors - {backend} backend: "
+                f"{elapsed:.3f} seconds"
+            )
+
+        assert costs["native"] == costs["networkx"]
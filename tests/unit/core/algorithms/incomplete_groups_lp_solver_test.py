@@ -1,3 +1,4 @@
+import random
 import pytest
 from src.core.algorithms.topic_tutor.incomplete_groups_lp_solver import (
     IncompleteGroupsLPSolver,
@@ -301,3 +302,28 @@ class TestIncompleteGroupsLPSolver:
         formed_groups = solver.solve()
 
         assert len(formed_groups) > 0
+
+    @pytest.mark.performance
+    def test_build_time_with_one_hundred_and_fifty_groups(self):
+        rng = random.Random(42)
+        topics = [
+            Topic(id=i, title=f"Tema_{i}", capacity=0, category=f"Category_{i % 5}")
+            for i in range(1, 31)
+        ]
+        sizes = [1] * 30 + [2] * 70 + [3] * 50
+        groups = [
+            GroupFormAnswer(
+                str(i),
+                topics=rng.sample(topics, 3),
+                students=[f"Student_{i}_{j}" for j in range(size)],
+            )
+            for i, size in enumerate(sizes, start=1)
+        ]
+
+        solver = IncompleteGroupsLPSolver(groups)
+        formed_groups = solver.solve()
+
+        print(f"150 incomplete groups - Build time: {solver.build_time:.3f} seconds")
+        students = [student for group in formed_groups for student in group.students]
+        assert len(students) == len(set(students))
+        assert all(len(group.students) <= 4 for group in formed_groups)
@@ -0,0 +1,28 @@
+import pytest
+
+from src.core.algorithms.topic_tutor.min_cost_flow import (
+    FlowNetwork,
+    get_flow_backend,
+)
+
+
+class TestMinCostFlowBackends:
+
+    def _network_with_parallel_edges(self):
+        network = FlowNetwork(3)
+        source, middle, sink = 0, 1, 2
+        network.add_edge(source, middle, capacity=2, cost=1)
+        network.add_edge(source, middle, capacity=2, cost=5)
+        network.add_edge(source, middle, capacity=1, cost=3)
+        network.add_edge(middle, sink, capacity=4, cost=0)
+        return network, source, sink
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("backend", ["native", "networkx"])
+    def test_parallel_edges_keep_their_own_flow(self, backend):
+        network, source, sink = self._network_with_parallel_edges()
+
+        flow = get_flow_backend(backend).solve(network, source, sink)
+
+        assert flow.tolist() == [2, 1, 1, 4]
+        assert int((flow * network.cost).sum()) == 10
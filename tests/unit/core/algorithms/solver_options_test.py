@@ -0,0 +1,54 @@
+import pyscipopt as scip
+import pytest
+
+from src.core.algorithms.solver_options import SolverOptions
+
+
+class TestSolverOptions:
+
+    @pytest.mark.unit
+    def test_cbc_command_uses_the_configured_limits(self):
+        options = SolverOptions(time_limit=10, mip_gap=0.05, threads=2, node_limit=500)
+
+        command = options.to_cbc()
+
+        assert command.timeLimit == 10
+        assert command.optionsDict["gapRel"] == 0.05
+        assert command.optionsDict["threads"] == 2
+        assert "maxNodes 500" in command.options
+
+    @pytest.mark.unit
+    def test_scip_model_uses_the_configured_limits(self):
+        options = SolverOptions(time_limit=10, mip_gap=0.05, threads=4, node_limit=500)
+        model = scip.Model()
+
+        options.apply_to_scip(model)
+
+        assert model.getParam("limits/time") == 10
+        assert model.getParam("limits/gap") == 0.05
+        assert model.getParam("parallel/maxnthreads") == 4
+        assert model.getParam("limits/nodes") == 500
+
+    @pytest.mark.unit
+    def test_empty_options_keep_solver_defaults(self):
+        model = scip.Model()
+
+        SolverOptions().apply_to_scip(model)
+
+        assert model.getParam("limits/time") == scip.Model().getParam("limits/time")
+
+    @pytest.mark.unit
+    @pytest.mark.filterwarnings("ignore:SCIP was compiled without")
+    def test_scip_with_several_threads_solves_concurrently(self):
+        options = SolverOptions(threads=2)
+        model = scip.Model()
+        model.hideOutput()
+        x = model.addVar(vtype="I", ub=5)
+        model.addCons(2 * x <= 7)
+        model.setObjective(x, "maximize")
+        options.apply_to_scip(model)
+
+        options.optimize_scip(model)
+
+        assert model.getStatus() == "optimal"
+        assert model.getObjVal() == 3
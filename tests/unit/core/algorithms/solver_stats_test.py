@@ -0,0 +1,110 @@
+import pytest
+from datetime import datetime, timedelta
+
+from src.core.algorithms.date.delivery_lp_solver import DeliveryLPSolver
+from src.core.algorithms.solver_stats import PhaseTimings, collect_solver_stats
+from src.core.algorithms.topic_tutor.group_tutor_flow_solver import GroupTutorFlowSolver
+from src.core.algorithms.topic_tutor.group_tutor_lp_solver import GroupTutorLPSolver
+from src.core.date_slots import DateSlot
+from src.core.group import AssignedGroup, UnassignedGroup
+from src.core.topic import Topic
+from src.core.tutor import Tutor
+
+
+class TestSolverStats:
+
+    def _topic_instance(self):
+        topics = [
+            Topic(id=i, title=f"Tema {i}", capacity=10, category="Category A")
+            for i in range(4)
+        ]
+        groups = [
+            UnassignedGroup(1, topics=topics[:3], students=[]),
+            UnassignedGroup(2, topics=topics[1:], students=[]),
+        ]
+        tutors = [
+            Tutor(1, "Email", "Name", "Lastname", capacity=2, topics=topics[:2]),
+            Tutor(2, "Email", "Name", "Lastname", capacity=2, topics=topics[2:]),
+        ]
+        return groups, topics, tutors
+
+    @pytest.mark.unit
+    def test_phases_are_accumulated(self):
+        timings = PhaseTimings()
+        with timings.phase("build"):
+            pass
+        timings.add("build", 1.0)
+        timings.add("solve", 2.0)
+
+        assert timings.get("build") >= 1.0
+        assert timings.get("decode") == 0.0
+        assert timings.total() >= 3.0
+
+    @pytest.mark.unit
+    def test_only_solvers_created_inside_the_block_are_collected(self):
+        groups, topics, tutors = self._topic_instance()
+        GroupTutorFlowSolver(groups, topics, tutors)
+
+        with collect_solver_stats() as collected:
+            solver = GroupTutorFlowSolver(groups, topics, tutors)
+
+        assert collected == [solver.stats]
+
+    @pytest.mark.unit
+    def test_flow_solver_records_network_size_and_phases(self):
+        groups, topics, tutors = self._topic_instance()
+        solver = GroupTutorFlowSolver(groups, topics, tutors)
+
+        solver.solve()
+        stats = solver.stats.to_json()
+
+        assert stats["solver"] == "group-tutor-flow"
+        assert stats["inputs"] == {"groups": 2, "topics": 4, "tutors": 2}
+        assert stats["status"] == "optimal"
+        assert stats["variables"] > 0 and stats["constraints"] == 10
+        assert set(stats["timings"]) == {"build", "solve", "decode"}
+
+    @pytest.mark.unit
+    def test_lp_solver_records_model_size_and_status(self):
+        groups, topics, tutors = self._topic_instance()
+        solver = GroupTutorLPSolver(groups, topics, tutors, balance_limit=5)
+
+        solver.solve()
+        stats = solver.stats.to_json()
+
+        assert stats["status"] == "Optimal"
+        assert stats["gap"] == 0.0
+        # Un grupo puede ir a cada tema de cada tutor
+        assert stats["variables"] == 2 * 4
+        assert stats["constraints"] > 0
+        assert set(stats["timings"]) == {"build", "solve", "decode"}
+
+    @pytest.mark.unit
+    def test_delivery_solver_records_branch_and_bound_stats(self):
+        day = datetime(2024, 10, 7, 9, 0, 0)
+        slots = [DateSlot(start_time=day + timedelta(hours=h)) for h in range(4)]
+        tutor = Tutor(1, "Tutor", "Uno", "tutor@fi.uba.ar", available_dates=slots)
+        evaluator = Tutor(2, "Eval", "Dos", "eval@fi.uba.ar", available_dates=slots)
+        groups = [
+            AssignedGroup(1, tutor=tutor, available_dates=slots[:2], group_number=1),
+            AssignedGroup(2, tutor=tutor, available_dates=slots[2:], group_number=2),
+        ]
+        solver = DeliveryLPSolver(
+            groups=groups, tutors=[tutor], evaluators=[evaluator], available_dates=slots
+        )
+
+        solver.solve()
+        stats = solver.stats.to_json()
+
+        assert stats["inputs"] == {
+            "groups": 2,
+            "tutors": 1,
+            "evaluators": 1,
+            "slots": 4,
+        }
+        assert stats["status"] == "optimal"
+        assert stats["gap"] == 0.0
+        assert stats["nodes"] is not None
+        assert stats["variables"] >= 4 and stats["constraints"] > 0
+        assert stats["timings"]["build"] == solver.build_time
+        assert set(stats["timings"]) == {"build", "solve", "decode"}
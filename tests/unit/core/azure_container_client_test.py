@@ -0,0 +1,118 @@
+import asyncio
+import datetime
+import io
+import pytest
+
+from src.core.azure_container_client import AsyncAzureContainerClient
+
+
+class FakeUploadFile:
+
+    def __init__(self, content: bytes):
+        self._file = io.BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+
+class FakeBlobClient:
+
+    def __init__(self):
+        self.staged = {}
+        self.committed = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def stage_block(self, block_id, data, length):
+        assert len(data) == length
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.staged[block_id] = data
+
+    async def commit_block_list(self, blocks):
+        self.committed = [self.staged[block.id] for block in blocks]
+        return {"etag": '"0x8DC"', "last_modified": datetime.datetime(2024, 10, 7)}
+
+
+class FailingBlobClient(FakeBlobClient):
+
+    async def stage_block(self, block_id, data, length):
+        raise ConnectionError("storage unavailable")
+
+
+class FakeContainerClient:
+
+    def __init__(self, blob):
+        self.blob = blob
+
+    def get_blob_client(self, name):
+        return self.blob
+
+
+class TestAsyncAzureContainerClient:
+
+    def _client(self, chunk_size: int, max_concurrency: int = 4, blob=None):
+        client = AsyncAzureContainerClient(
+            "access-key",
+            "container",
+            chunk_size=chunk_size,
+            max_concurrency=max_concurrency,
+        )
+        blob = blob or FakeBlobClient()
+        client._container_client = FakeContainerClient(blob)
+        return client, blob
+
+    @pytest.mark.unit
+    def test_upload_stream_stages_blocks_of_chunk_size_in_order(self):
+        client, blob = self._client(chunk_size=4)
+
+        stored = asyncio.run(
+            client.upload_stream(FakeUploadFile(b"0123456789"), "1C2024/1/a.pdf")
+        )
+
+        assert blob.committed == [b"0123", b"4567", b"89"]
+        assert (stored.name, stored.size, stored.etag) == (
+            "1C2024/1/a.pdf",
+            10,
+            '"0x8DC"',
+        )
+        assert len({len(block_id) for block_id in blob.staged}) == 1
+
+    @pytest.mark.unit
+    def test_upload_stream_bounds_blocks_in_flight(self):
+        client, blob = self._client(chunk_size=1, max_concurrency=2)
+
+        asyncio.run(client.upload_stream(FakeUploadFile(b"0123456789"), "a.pdf"))
+
+        assert blob.max_in_flight == 2
+        assert b"".join(blob.committed) == b"0123456789"
+
+    @pytest.mark.unit
+    def test_failed_block_does_not_commit_the_blob(self):
+        client, blob = self._client(chunk_size=4, blob=FailingBlobClient())
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(client.upload_stream(FakeUploadFile(b"0123456789"), "a.pdf"))
+
+        assert blob.committed is None
+
+    @pytest.mark.unit
+    def test_container_client_is_reused_between_operations(self):
+        client = AsyncAzureContainerClient(
+            "DefaultEndpointsProtocol=https;AccountName=test;"
+            "AccountKey=dGVzdA==;EndpointSuffix=core.windows.net",
+            "container",
+        )
+
+        async def get_twice():
+            first = client._get_container_client()
+            second = client._get_container_client()
+            await client.close()
+            return first, second
+
+        first, second = asyncio.run(get_twice())
+
+        assert first is second
+        assert client._container_client is None
@@ -0,0 +1,131 @@
+import asyncio
+import io
+import os
+import pytest
+
+from src.api.utils.blob_stream import BlobStream
+from src.core.local_storage_client import (
+    BlobModified,
+    BlobNotFound,
+    LocalStorageClient,
+)
+
+
+class FakeUploadFile:
+
+    def __init__(self, content: bytes, fail_after: int | None = None):
+        self._file = io.BytesIO(content)
+        self._reads = 0
+        self._fail_after = fail_after
+
+    async def read(self, size: int = -1) -> bytes:
+        if self._fail_after is not None and self._reads == self._fail_after:
+            raise ConnectionError("client disconnected")
+        self._reads += 1
+        return self._file.read(size)
+
+
+class TestLocalStorageClient:
+
+    def _client(self, tmp_path, chunk_size: int = 4):
+        return LocalStorageClient(str(tmp_path), "dev", chunk_size=chunk_size)
+
+    def _download(self, client, blob_name, **kwargs):
+        async def read():
+            chunks = await client.download_stream(blob_name, **kwargs)
+            return [chunk async for chunk in chunks]
+
+        return asyncio.run(read())
+
+    @pytest.mark.unit
+    def test_upload_and_download_in_chunks(self, tmp_path):
+        client = self._client(tmp_path)
+        path = "1C2024/1/initial-project.pdf"
+
+        asyncio.run(client.upload_stream(FakeUploadFile(b"0123456789"), path))
+
+        assert (tmp_path / "dev" / path).read_bytes() == b"0123456789"
+        assert self._download(client, path) == [b"0123", b"4567", b"89"]
+        assert self._download(client, path, offset=3, length=4) == [b"3456"]
+
+    @pytest.mark.unit
+    def test_failed_upload_keeps_the_previous_file(self, tmp_path):
+        client = self._client(tmp_path)
+        path = "1C2024/1/informe-final.pdf"
+        asyncio.run(client.upload_stream(FakeUploadFile(b"version 1"), path))
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(
+                client.upload_stream(FakeUploadFile(b"version 2", fail_after=1), path)
+            )
+
+        assert (tmp_path / "dev" / path).read_bytes() == b"version 1"
+        assert os.listdir(tmp_path / "dev" / "1C2024" / "1") == ["informe-final.pdf"]
+
+    @pytest.mark.unit
+    def test_download_fails_when_the_file_changed(self, tmp_path):
+        client = self._client(tmp_path)
+        path = "1C2024/1/initial-project.pdf"
+        asyncio.run(client.upload_stream(FakeUploadFile(b"version 1"), path))
+        etag = asyncio.run(client.get_properties(path))["etag"]
+        asyncio.run(client.upload_stream(FakeUploadFile(b"version 22"), path))
+
+        with pytest.raises(BlobModified):
+            self._download(client, path, etag=etag)
+
+    @pytest.mark.unit
+    def test_missing_blob_raises_blob_not_found(self, tmp_path):
+        client = self._client(tmp_path)
+
+        with pytest.raises(BlobNotFound):
+            asyncio.run(client.get_properties("1C2024/1/initial-project.pdf"))
+        with pytest.raises(BlobNotFound):
+            self._download(client, "1C2024/1/initial-project.pdf")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", ["../secret.pdf", "1C2024/../../secret.pdf"])
+    def test_blob_names_cannot_leave_the_container(self, tmp_path, name):
+        client = self._client(tmp_path)
+
+        with pytest.raises(ValueError):
+            asyncio.run(client.upload_stream(FakeUploadFile(b"data"), name))
+
+    @pytest.mark.unit
+    def test_list_blobs_by_prefix_and_pattern(self, tmp_path):
+        client = self._client(tmp_path)
+        for name in [
+            "1C2024/1/initial-project.pdf",
+            "1C2024/2/initial-project.pdf",
+            "1C2024/2/informe-final.pdf",
+            "2C2024/1/initial-project.pdf",
+        ]:
+            asyncio.run(client.upload_stream(FakeUploadFile(b"pdf"), name))
+
+        blobs = asyncio.run(
+            client.list_blobs(
+                prefix="1C2024", pattern="^1C2024\\/[0-9]+\\/initial-project\\.pdf$"
+            )
+        )
+
+        assert [blob.name for blob in blobs] == [
+            "1C2024/1/initial-project.pdf",
+            "1C2024/2/initial-project.pdf",
+        ]
+        assert all(blob.container == "dev" for blob in blobs)
+        assert asyncio.run(client.list_blobs(prefix="1C2025")) == []
+
+    @pytest.mark.unit
+    def test_blob_stream_serves_ranges_from_local_storage(self, tmp_path):
+        client = self._client(tmp_path)
+        path = "1C2024/1/initial-project.pdf"
+        asyncio.run(client.upload_stream(FakeUploadFile(b"0123456789"), path))
+
+        async def download():
+            blob_stream = await BlobStream.open(client, path, "bytes=2-5")
+            response = await blob_stream.to_response("file.pdf", "application/pdf")
+            return response, [chunk async for chunk in response.body_iterator]
+
+        response, chunks = asyncio.run(download())
+
+        assert response.status_code == 206
+        assert b"".join(chunks) == b"2345"
@@ -0,0 +1,117 @@
+import io
+import pytest
+from datetime import datetime, timedelta
+
+from src.core.date_slots import DateSlot
+from src.core.group import AssignedGroup, UnassignedGroup
+from src.core.group_form_answer import GroupFormAnswer
+from src.core.snapshot import InvalidSnapshot, PeriodSnapshot
+from src.core.topic import Topic
+from src.core.tutor import Tutor
+
+
+class TestPeriodSnapshot:
+
+    @pytest.fixture
+    def snapshot(self):
+        day = datetime(2024, 10, 7, 9, 0, 0)
+        slots = [DateSlot(start_time=day + timedelta(hours=h)) for h in range(3)]
+        topics = [
+            Topic(id=i, title=f"Tema {i}", capacity=1, category="Categoria A")
+            for i in range(1, 4)
+        ]
+        other = Topic(id=9, title="Tema de otro cuatrimestre", category="B")
+        tutor = Tutor(
+            1,
+            "Juan",
+            "Perez",
+            "juan@fi.uba.ar",
+            capacity=3,
+            topics=[Topic(1, "Tema 1", capacity=2, category="Categoria A")],
+            available_dates=slots,
+        )
+        evaluator = Tutor(
+            2,
+            "Ana",
+            "Lopez",
+            "ana@fi.uba.ar",
+            available_dates=slots[:1],
+            is_evaluator=True,
+        )
+        return PeriodSnapshot(
+            "1C2024",
+            topics=topics,
+            tutors=[tutor, evaluator],
+            unassigned_groups=[
+                UnassignedGroup(1, students=[10, 11], topics=topics, group_number=1)
+            ],
+            assigned_groups=[
+                AssignedGroup(
+                    2,
+                    tutor=tutor,
+                    available_dates=slots[1:],
+                    group_number=2,
+                    assigned_date=slots[2],
+                )
+            ],
+            slots=slots,
+            answers=[
+                GroupFormAnswer(
+                    "1728300000.0",
+                    topics=[other, topics[0], topics[1]],
+                    students=["alumno@fi.uba.ar"],
+                )
+            ],
+        )
+
+    @pytest.mark.unit
+    def test_snapshot_is_read_back_with_the_same_inputs(self, snapshot, tmp_path):
+        path = str(tmp_path / "1C2024.jsonl.gz")
+        snapshot.save(path)
+
+        loaded = PeriodSnapshot.load(path)
+
+        assert loaded.period_id == "1C2024"
+        assert [topic.id for topic in loaded.topics] == [1, 2, 3]
+        assert [slot.date for slot in loaded.slots] == [s.date for s in snapshot.slots]
+        tutor = loaded.tutors[0]
+        assert tutor.capacity == 3
+        assert [(t.id, t.capacity) for t in tutor.topics] == [(1, 2)]
+        assert len(tutor.available_dates) == 3
+        [group] = loaded.unassigned_groups
+        assert len(group.students) == 2
+        assert [topic.id for topic in group.topics] == [1, 2, 3]
+        [assigned] = loaded.assigned_groups
+        assert assigned.tutor_id() == 1
+        assert assigned.assigned_date.date == snapshot.slots[2].date
+        assert [slot.date for slot in assigned.available_dates] == [
+            s.date for s in snapshot.slots[1:]
+        ]
+        [answer] = loaded.answers
+        assert answer.get_topic_ids() == [9, 1, 2]
+        assert len(answer.students) == 1
+
+    @pytest.mark.unit
+    def test_evaluators_are_separate_instances(self, snapshot):
+        [evaluator] = snapshot.evaluators()
+
+        assert evaluator.id == 2
+        assert evaluator is not snapshot.tutors[1]
+        evaluator.available_dates.clear()
+        assert len(snapshot.tutors[1].available_dates) == 1
+
+    @pytest.mark.unit
+    def test_personal_data_is_not_exported(self, snapshot):
+        file = io.StringIO()
+        snapshot.write(file)
+
+        content = file.getvalue()
+        assert "fi.uba.ar" not in content
+        assert "Juan" not in content
+
+    @pytest.mark.unit
+    def test_unsupported_versions_are_rejected(self):
+        file = io.StringIO('{"kind": "snapshot", "version": 99, "period_id": "1C2024"}')
+
+        with pytest.raises(InvalidSnapshot):
+            PeriodSnapshot.read(file)